@@ -9,7 +9,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal, Optional
 
-from vertice_core.agui.protocol import AGUIEvent, AGUIEventType, sse_encode_event
+from vertice_core.agui.protocol import AGUIEvent, AGUIEventType, coalesce_deltas, sse_encode_event
 from vertice_core.memory.cortex.cortex import MemoryCortex
 
 STREAM_HEADERS = {
@@ -24,6 +24,21 @@ def _truthy_env(name: str, default: str = "0") -> bool:
     return os.getenv(name, default).strip().lower() in {"1", "true", "yes", "on"}
 
 
+def coalesce_settings() -> tuple[float, int]:
+    """
+    Delta coalescing knobs for SSE streams: (window_ms, max_bytes).
+
+    Off by default; set VERTICE_AGUI_COALESCE_MS / VERTICE_AGUI_COALESCE_BYTES
+    to trade a few ms of latency for far fewer envelopes at high token rates.
+    """
+    try:
+        window_ms = float(os.getenv("VERTICE_AGUI_COALESCE_MS", "0") or 0)
+        max_bytes = int(os.getenv("VERTICE_AGUI_COALESCE_BYTES", "0") or 0)
+    except ValueError:
+        return 0.0, 0
+    return max(window_ms, 0.0), max(max_bytes, 0)
+
+
 _THOUGHT_OPEN = "<thought>"
 _THOUGHT_CLOSE = "</thought>"
 
@@ -329,6 +344,11 @@ async def stream_agui_sse_bytes(
     # Emit intent as soon as streaming starts (gateway-level "Understanding Frame").
     yield sse_encode_event(translator._intent_event()).encode("utf-8")
 
-    async for raw in upstream_events:
-        for ev in translator.translate(raw):
-            yield sse_encode_event(ev).encode("utf-8")
+    async def _events() -> AsyncIterator[AGUIEvent]:
+        async for raw in upstream_events:
+            for ev in translator.translate(raw):
+                yield ev
+
+    window_ms, max_bytes = coalesce_settings()
+    async for ev in coalesce_deltas(_events(), window_ms=window_ms, max_bytes=max_bytes):
+        yield sse_encode_event(ev).encode("utf-8")
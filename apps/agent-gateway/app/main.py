@@ -15,7 +15,7 @@ from fastapi import Depends, FastAPI, Header, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from vertice_core.agui.protocol import AGUIEvent, sse_encode_event
+from vertice_core.agui.protocol import AGUIEvent, coalesce_deltas, sse_encode_event
 from vertice_core.agui.vertex_agent_engine import (
     VertexAgentEngineSpec,
     stream_vertex_agent_engine_adk_events,
@@ -37,7 +37,7 @@ if _app_dir in sys.path:
     sys.path.remove(_app_dir)
 sys.path.insert(1 if len(sys.path) > 0 else 0, _app_dir)
 
-from api.stream import STREAM_HEADERS, AGUIStreamTranslator  # noqa: E402
+from api.stream import STREAM_HEADERS, AGUIStreamTranslator, coalesce_settings  # noqa: E402
 import auth as _auth_mod  # noqa: E402
 import store as _store_mod  # noqa: E402
 import tenancy as _tenancy_mod  # noqa: E402
@@ -455,26 +455,29 @@ async def agui_stream(
         intent.data.setdefault("org_id", tenant.org.org_id)
         yield sse_encode_event(intent).encode("utf-8")
 
-        final_text_accum: list[str] = []
-        status = "running"
-        try:
+        async def _events() -> AsyncIterator[AGUIEvent]:
             async for raw in _upstream_adk_events(
                 prompt=prompt, session_id=session_id, agent=agent, tool=tool
             ):
                 for ev in translator.translate(raw):
-                    if ev.type.value == "delta":
-                        t = str(ev.data.get("text") or "")
-                        if t:
-                            final_text_accum.append(t)
-                    if ev.type.value in {"final"}:
-                        final_text_accum.append(str(ev.data.get("text") or ""))
-                        status = "completed"
-                    if ev.type.value in {"error"}:
-                        status = "error"
-                    yield sse_encode_event(ev).encode("utf-8")
-                    if ev.type.value in {"final", "error"}:
-                        break
-                if status in {"completed", "error"}:
+                    yield ev
+
+        final_text_accum: list[str] = []
+        status = "running"
+        window_ms, max_bytes = coalesce_settings()
+        try:
+            async for ev in coalesce_deltas(_events(), window_ms=window_ms, max_bytes=max_bytes):
+                if ev.type.value == "delta":
+                    t = str(ev.data.get("text") or "")
+                    if t:
+                        final_text_accum.append(t)
+                if ev.type.value in {"final"}:
+                    final_text_accum.append(str(ev.data.get("text") or ""))
+                    status = "completed"
+                if ev.type.value in {"error"}:
+                    status = "error"
+                yield sse_encode_event(ev).encode("utf-8")
+                if ev.type.value in {"final", "error"}:
                     break
         except Exception as exc:
             status = "error"
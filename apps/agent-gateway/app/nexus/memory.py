@@ -7,15 +7,20 @@ Implements the 1M token memory hierarchy for Gemini 3 Pro:
 - L3: Semantic Memory (256K) - Extracted patterns
 - L4: Procedural Memory (128K) - Learned procedures
 
+Each level keeps a running token total and a heap-ordered eviction index,
+so storing, evicting and moving blocks between levels cost O(log n) rather
+than a rescan of the level.
+
 Persistence: Google Cloud Firestore
 """
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import logging
-from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from nexus.config import NexusConfig
 from nexus.types import MemoryBlock, MemoryLevel
@@ -31,6 +36,79 @@ except ImportError:
     logger.warning("google-cloud-firestore not available, using in-memory storage")
 
 
+class _LevelIndex:
+    """
+    Blocks of one memory level with a running token total and an eviction heap.
+
+    The heap follows the heapq priority-queue recipe: re-ranking or removing
+    a block marks its old entry as removed instead of searching the heap,
+    and removed entries are discarded when they reach the top (lazy
+    deletion). The heap is rebuilt when removed entries outnumber live ones.
+    """
+
+    def __init__(self) -> None:
+        self.blocks: Dict[str, MemoryBlock] = {}
+        self.tokens = 0
+        self._heap: List[list] = []
+        self._entries: Dict[str, list] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.blocks)
+
+    def __iter__(self) -> Iterator[MemoryBlock]:
+        return iter(self.blocks.values())
+
+    @staticmethod
+    def _priority(block: MemoryBlock) -> Tuple[float, int, float]:
+        """Eviction order: least important, then least used, then least recent."""
+        return (block.importance, block.access_count, block.last_accessed.timestamp())
+
+    def _push(self, block: MemoryBlock) -> None:
+        entry = [self._priority(block), next(self._counter), block]
+        self._entries[block.block_id] = entry
+        heapq.heappush(self._heap, entry)
+        if len(self._heap) > 2 * len(self.blocks) + 64:
+            self._heap = [e for e in self._heap if e[-1] is not None]
+            heapq.heapify(self._heap)
+
+    def add(self, block: MemoryBlock) -> None:
+        self.remove(block.block_id)
+        self.blocks[block.block_id] = block
+        self.tokens += block.token_count
+        self._push(block)
+
+    def touch(self, block: MemoryBlock) -> None:
+        """Re-rank a block after its importance or access data changed."""
+        if block.block_id in self._entries:
+            self._entries[block.block_id][-1] = None
+            self._push(block)
+
+    def remove(self, block_id: str) -> Optional[MemoryBlock]:
+        block = self.blocks.pop(block_id, None)
+        if block is not None:
+            self.tokens -= block.token_count
+            self._entries.pop(block_id)[-1] = None
+        return block
+
+    def pop_lowest(self) -> Optional[MemoryBlock]:
+        """Remove and return the block to evict next."""
+        while self._heap:
+            block = heapq.heappop(self._heap)[-1]
+            if block is not None:
+                del self._entries[block.block_id]
+                del self.blocks[block.block_id]
+                self.tokens -= block.token_count
+                return block
+        return None
+
+    def clear(self) -> None:
+        self.blocks.clear()
+        self._entries.clear()
+        self._heap.clear()
+        self.tokens = 0
+
+
 class HierarchicalMemory:
     """
     Hierarchical Memory System for NEXUS Meta-Agent.
@@ -41,7 +119,9 @@ class HierarchicalMemory:
 
     def __init__(self, config: NexusConfig):
         self.config = config
-        self._local_memory: Dict[MemoryLevel, List[MemoryBlock]] = defaultdict(list)
+        self._levels: Dict[MemoryLevel, _LevelIndex] = {
+            level: _LevelIndex() for level in MemoryLevel
+        }
         self._token_limits = {
             MemoryLevel.L1_WORKING: config.l1_working_memory_tokens,
             MemoryLevel.L2_EPISODIC: config.l2_episodic_memory_tokens,
@@ -66,8 +146,8 @@ class HierarchicalMemory:
         return len(text) // 4
 
     def _current_level_tokens(self, level: MemoryLevel) -> int:
-        """Calculate current token usage for a memory level."""
-        return sum(block.token_count for block in self._local_memory[level])
+        """Current token usage for a memory level (kept as a running total)."""
+        return self._levels[level].tokens
 
     async def store(
         self,
@@ -91,7 +171,7 @@ class HierarchicalMemory:
         await self._evict_if_needed(level, token_count)
 
         # Store locally
-        self._local_memory[level].append(block)
+        self._levels[level].add(block)
 
         # Persist to Firestore
         if self._collection:
@@ -108,22 +188,11 @@ class HierarchicalMemory:
     async def _evict_if_needed(self, level: MemoryLevel, new_tokens: int) -> None:
         """Evict old/low-importance blocks if capacity exceeded."""
         limit = self._token_limits[level]
-        current = self._current_level_tokens(level)
-
-        while current + new_tokens > limit and self._local_memory[level]:
-            # Sort by importance (ascending) and age (oldest first)
-            blocks = sorted(
-                self._local_memory[level],
-                key=lambda b: (b.importance, -b.access_count, b.created_at.timestamp()),
-            )
+        index = self._levels[level]
 
-            if not blocks:
-                break
-
-            # Evict lowest priority block
-            evicted = blocks[0]
-            self._local_memory[level].remove(evicted)
-            current -= evicted.token_count
+        while index.tokens + new_tokens > limit and index:
+            # Evict lowest priority block (least important, least used, oldest)
+            evicted = index.pop_lowest()
 
             # Remove from Firestore
             if self._collection:
@@ -141,21 +210,21 @@ class HierarchicalMemory:
         min_importance: float = 0.0,
     ) -> List[MemoryBlock]:
         """Retrieve memory blocks from a specific level."""
-        blocks = [b for b in self._local_memory[level] if b.importance >= min_importance]
-
-        # Sort by importance and recency
-        blocks.sort(
+        index = self._levels[level]
+        blocks = heapq.nlargest(
+            limit,
+            (b for b in index if b.importance >= min_importance),
             key=lambda b: (b.importance, b.last_accessed.timestamp()),
-            reverse=True,
         )
 
         # Update access metadata
         now = datetime.now(timezone.utc)
-        for block in blocks[:limit]:
+        for block in blocks:
             block.last_accessed = now
             block.access_count += 1
+            index.touch(block)
 
-        return blocks[:limit]
+        return blocks
 
     async def retrieve_all_levels(
         self,
@@ -175,6 +244,23 @@ class HierarchicalMemory:
 
         return result
 
+    async def move_block(self, block: MemoryBlock, level: MemoryLevel) -> MemoryBlock:
+        """Promote or demote a stored block to another level, evicting there if needed."""
+        if self._levels[block.level].remove(block.block_id) is None:
+            raise KeyError(f"Memory block {block.block_id} is not stored in {block.level.value}")
+
+        await self._evict_if_needed(level, block.token_count)
+        block.level = level
+        self._levels[level].add(block)
+
+        if self._collection:
+            try:
+                await self._collection.document(block.block_id).set(block.to_dict())
+            except Exception as e:
+                logger.warning(f"Failed to persist moved memory block: {e}")
+
+        return block
+
     async def promote_to_semantic(
         self,
         episodic_blocks: List[MemoryBlock],
@@ -260,8 +346,8 @@ class HierarchicalMemory:
         }
 
         for level in MemoryLevel:
-            blocks = self._local_memory[level]
-            tokens = self._current_level_tokens(level)
+            blocks = self._levels[level]
+            tokens = blocks.tokens
             limit = self._token_limits[level]
 
             stats["by_level"][level.value] = {
@@ -286,7 +372,7 @@ class HierarchicalMemory:
             async for doc in docs:
                 data = doc.to_dict()
                 block = MemoryBlock.from_dict(data)
-                self._local_memory[block.level].append(block)
+                self._levels[block.level].add(block)
                 loaded += 1
         except Exception as e:
             logger.warning(f"Failed to load from Firestore: {e}")
@@ -296,10 +382,11 @@ class HierarchicalMemory:
 
     async def clear_level(self, level: MemoryLevel) -> int:
         """Clear all memory blocks from a specific level."""
-        count = len(self._local_memory[level])
-        block_ids = [b.block_id for b in self._local_memory[level]]
+        index = self._levels[level]
+        count = len(index)
+        block_ids = list(index.blocks)
 
-        self._local_memory[level].clear()
+        index.clear()
 
         if self._collection:
             for block_id in block_ids:
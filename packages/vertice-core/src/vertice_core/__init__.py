@@ -4,60 +4,71 @@
 
 Core types, protocols, and domain logic for AI-powered development tools.
 Temporal Awareness: MICROSECOND PRECISION
+
+Public names are resolved lazily via __getattr__ so that ``import vertice_core``
+does not pull in pydantic models or the A2A gRPC stack until they are used.
 """
 
-from vertice_core.types import (
-    # Enums
-    AgentRole,
-    AgentCapability,
-    # Exceptions
-    CapabilityViolationError,
-    QwenCoreError,
-)
-
-from vertice_core.types.models import (
-    AgentTask,
-    AgentResponse,
-    TaskResult,
-)
-
-from vertice_core.protocols import (
-    LLMClientProtocol,
-    MCPClientProtocol,
-    AgentProtocol,
-    ToolProtocol,
-)
-
-from vertice_core.language_detector import (
-    LanguageDetector,
-    LANGUAGE_NAMES,
-)
-
-# Moved modules from core
-from vertice_core.a2a import (
-    TaskStatus,
-)
-
-__all__ = [
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from vertice_core.types import (
+        AgentRole,
+        AgentCapability,
+        CapabilityViolationError,
+        QwenCoreError,
+    )
+    from vertice_core.types.models import AgentTask, AgentResponse, TaskResult
+    from vertice_core.protocols import (
+        LLMClientProtocol,
+        MCPClientProtocol,
+        AgentProtocol,
+        ToolProtocol,
+    )
+    from vertice_core.language_detector import LanguageDetector, LANGUAGE_NAMES
+    from vertice_core.a2a.types import TaskStatus
+
+# Mapping of public names to their (module, attribute) for lazy loading
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
     # Enums
-    "AgentRole",
-    "AgentCapability",
-    "TaskStatus",
+    "AgentRole": ("vertice_core.types", "AgentRole"),
+    "AgentCapability": ("vertice_core.types", "AgentCapability"),
+    "TaskStatus": ("vertice_core.a2a.types", "TaskStatus"),
     # Models
-    "AgentTask",
-    "AgentResponse",
-    "TaskResult",
+    "AgentTask": ("vertice_core.types.models", "AgentTask"),
+    "AgentResponse": ("vertice_core.types.models", "AgentResponse"),
+    "TaskResult": ("vertice_core.types.models", "TaskResult"),
     # Exceptions
-    "CapabilityViolationError",
-    "QwenCoreError",
+    "CapabilityViolationError": ("vertice_core.types", "CapabilityViolationError"),
+    "QwenCoreError": ("vertice_core.types", "QwenCoreError"),
     # Protocols
-    "LLMClientProtocol",
-    "MCPClientProtocol",
-    "AgentProtocol",
-    "ToolProtocol",
+    "LLMClientProtocol": ("vertice_core.protocols", "LLMClientProtocol"),
+    "MCPClientProtocol": ("vertice_core.protocols", "MCPClientProtocol"),
+    "AgentProtocol": ("vertice_core.protocols", "AgentProtocol"),
+    "ToolProtocol": ("vertice_core.protocols", "ToolProtocol"),
     # Utilities
-    "LanguageDetector",
-    "LANGUAGE_NAMES",
-]
+    "LanguageDetector": ("vertice_core.language_detector", "LanguageDetector"),
+    "LANGUAGE_NAMES": ("vertice_core.language_detector", "LANGUAGE_NAMES"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        module_path, attr_name = _LAZY_IMPORTS[name]
+        value = getattr(importlib.import_module(module_path), attr_name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+__all__ = list(_LAZY_IMPORTS.keys())
 
 __version__ = "1.0.0"
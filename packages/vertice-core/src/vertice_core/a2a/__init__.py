@@ -21,6 +21,11 @@ Author: JuanCS Dev
 Date: 2025-12-30
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .types import (
     MessageRole,
     TaskStatus,
@@ -42,11 +47,35 @@ from .jsonrpc import (
     JSONRPC_INVALID_PARAMS,
     JSONRPC_INTERNAL_ERROR,
 )
-from .grpc_server import (
-    TaskStore,
-    A2AServiceImpl,
-    create_grpc_server,
-)
+
+if TYPE_CHECKING:
+    from .grpc_server import TaskStore, A2AServiceImpl, create_grpc_server
+    from .grpc_task_store import BaseTaskStore, TaskPage, TaskQuery, TaskStoreConfig
+    from .sqlite_task_store import SqliteTaskStore
+
+# The gRPC service pulls in grpcio and the generated protobuf modules;
+# load it on first access so importing the A2A types stays cheap.
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "TaskStore": (".grpc_server", "TaskStore"),
+    "BaseTaskStore": (".grpc_task_store", "BaseTaskStore"),
+    "TaskStoreConfig": (".grpc_task_store", "TaskStoreConfig"),
+    "TaskQuery": (".grpc_task_store", "TaskQuery"),
+    "TaskPage": (".grpc_task_store", "TaskPage"),
+    "SqliteTaskStore": (".sqlite_task_store", "SqliteTaskStore"),
+    "A2AServiceImpl": (".grpc_server", "A2AServiceImpl"),
+    "create_grpc_server": (".grpc_server", "create_grpc_server"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        module_path, attr_name = _LAZY_IMPORTS[name]
+        value = getattr(importlib.import_module(module_path, __name__), attr_name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     # Types
@@ -73,6 +102,11 @@ __all__ = [
     "JSONRPC_INTERNAL_ERROR",
     # gRPC (Phase 4)
     "TaskStore",
+    "BaseTaskStore",
+    "TaskStoreConfig",
+    "TaskQuery",
+    "TaskPage",
+    "SqliteTaskStore",
     "A2AServiceImpl",
     "create_grpc_server",
 ]
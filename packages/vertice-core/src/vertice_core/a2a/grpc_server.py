@@ -36,7 +36,7 @@ from .proto import (
     AgentCard,
     add_A2AServiceServicer_to_server,
 )
-from .grpc_task_store import TaskStore
+from .grpc_task_store import BaseTaskStore, TaskStore
 from .grpc_service import A2AServiceImpl
 
 logger = logging.getLogger(__name__)
@@ -47,6 +47,7 @@ async def create_grpc_server(
     task_processor: Optional[Callable[[Task], AsyncIterator[StreamChunk]]] = None,
     port: int = 50051,
     max_workers: int = 10,
+    task_store: Optional[BaseTaskStore] = None,
 ) -> grpc.aio.Server:
     """Create and configure gRPC server for A2A protocol.
 
@@ -55,6 +56,7 @@ async def create_grpc_server(
         task_processor: Custom task processor (optional)
         port: Server port (default: 50051)
         max_workers: Maximum worker threads (default: 10)
+        task_store: Task storage (default: in-memory TaskStore)
 
     Returns:
         Configured gRPC server (not started)
@@ -80,7 +82,7 @@ async def create_grpc_server(
         ],
     )
 
-    service = A2AServiceImpl(agent_card, task_processor)
+    service = A2AServiceImpl(agent_card, task_processor, task_store=task_store)
     add_A2AServiceServicer_to_server(service, server)
 
     server.add_insecure_port(f"[::]:{port}")
@@ -90,6 +92,7 @@ async def create_grpc_server(
 
 
 __all__ = [
+    "BaseTaskStore",
     "TaskStore",
     "A2AServiceImpl",
     "create_grpc_server",
@@ -53,7 +53,7 @@ from .proto import (
     HealthStatus,
     A2AServiceServicer,
 )
-from .grpc_task_store import TaskStore
+from .grpc_task_store import BaseTaskStore, TaskQuery, TaskStore
 
 logger = logging.getLogger(__name__)
 
@@ -78,16 +78,18 @@ class A2AServiceImpl(A2AServiceServicer):
         self,
         agent_card: AgentCard,
         task_processor: Optional[Callable[[Task], AsyncIterator[StreamChunk]]] = None,
+        task_store: Optional[BaseTaskStore] = None,
     ) -> None:
         """Initialize A2A service.
 
         Args:
             agent_card: Agent card for discovery
             task_processor: Async generator that processes tasks
+            task_store: Task storage (default: in-memory TaskStore)
         """
         self._agent_card = agent_card
         self._task_processor = task_processor or self._default_processor
-        self._task_store = TaskStore()
+        self._task_store = task_store or TaskStore()
         self._start_time = time.time()
 
         logger.info(f"[A2A] Service initialized: {agent_card.name}")
@@ -230,13 +232,24 @@ class A2AServiceImpl(A2AServiceServicer):
         request: ListTasksRequest,
         context: grpc.aio.ServicerContext,
     ) -> ListTasksResponse:
-        """List tasks with filtering."""
-        tasks = await self._task_store.list_tasks(
-            states=list(request.states) if request.states else None,
-            agent_id=request.agent_id or None,
-            limit=request.limit or 100,
+        """List tasks with filtering and cursor pagination."""
+        query = TaskQuery(
+            states=list(request.states),
+            agent_id=request.agent_id,
+            context_id=request.context_id,
+        )
+        try:
+            page = await self._task_store.list_tasks_page(
+                query, limit=request.limit or 100, cursor=request.cursor
+            )
+        except ValueError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+            return ListTasksResponse()
+        return ListTasksResponse(
+            tasks=page.tasks,
+            next_cursor=page.next_cursor,
+            total_count=len(page.tasks),
         )
-        return ListTasksResponse(tasks=tasks, total_count=len(tasks))
 
     async def CancelTask(
         self,
@@ -2,9 +2,19 @@
 A2A Protocol Task Store
 =======================
 
-In-memory task storage with pub/sub for gRPC streaming.
+Task storage with pub/sub for gRPC streaming.
 
-For production, replace with persistent storage (Redis, PostgreSQL).
+BaseTaskStore is the interface A2AServiceImpl depends on; it implements
+task lifecycle, subscriptions, cursor pagination and eviction on top of a
+few storage primitives. TaskStore keeps tasks in memory; SqliteTaskStore
+(sqlite_task_store.py) keeps them across restarts.
+
+Every write gives the task a new revision from a store-wide counter, so
+revision order is update order. Listings walk an index newest-first and
+resume from an opaque cursor naming the last revision returned. Terminal
+tasks (completed, failed, cancelled, rejected) are evicted once older than
+the configured TTL, or oldest-first when the store exceeds its size limit;
+active tasks are never evicted.
 
 Reference:
 - A2A Spec: https://a2a-protocol.org/latest/specification/
@@ -16,9 +26,16 @@ Date: 2025-12-30
 from __future__ import annotations
 
 import asyncio
+import base64
+import bisect
+import heapq
 import logging
+import time
 import uuid
-from typing import Dict, List, Optional
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 from google.protobuf import timestamp_pb2
 
@@ -34,25 +51,120 @@ from .proto import (
 
 logger = logging.getLogger(__name__)
 
+TERMINAL_STATES = frozenset(
+    {
+        TaskState.TASK_STATE_COMPLETED,
+        TaskState.TASK_STATE_FAILED,
+        TaskState.TASK_STATE_CANCELLED,
+        TaskState.TASK_STATE_REJECTED,
+    }
+)
+
+_CURSOR_PREFIX = "r1:"
+
+
+@dataclass
+class TaskStoreConfig:
+    """Retention limits for terminal tasks."""
+
+    terminal_ttl: Optional[float] = 24 * 3600.0  # Seconds; None keeps them until size eviction
+    max_tasks: Optional[int] = 100_000  # Evict oldest terminal tasks beyond this many tasks
+
+
+@dataclass
+class TaskQuery:
+    """Filters for listing tasks (empty filters match everything)."""
+
+    states: Sequence[int] = ()
+    agent_id: str = ""
+    context_id: str = ""
+
+    def matches(self, task: Task) -> bool:
+        return (
+            (not self.states or task.state in self.states)
+            and (not self.agent_id or task.agent_id == self.agent_id)
+            and (not self.context_id or task.context_id == self.context_id)
+        )
+
+
+@dataclass
+class TaskPage:
+    """One page of a task listing, newest update first."""
 
-class TaskStore:
-    """In-memory task storage with event subscription support.
+    tasks: List[Task] = field(default_factory=list)
+    next_cursor: str = ""  # Empty on the last page
 
-    Thread-safe storage for tasks with pub/sub for updates.
+
+def encode_cursor(revision: int) -> str:
+    """Opaque page cursor resuming after ``revision``."""
+    return base64.urlsafe_b64encode(f"{_CURSOR_PREFIX}{revision}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    """Revision named by a cursor; raises ValueError for malformed cursors."""
+    try:
+        text = base64.urlsafe_b64decode(cursor.encode()).decode()
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid page cursor: {cursor!r}") from e
+    if not text.startswith(_CURSOR_PREFIX) or not text[len(_CURSOR_PREFIX) :].isdigit():
+        raise ValueError(f"Invalid page cursor: {cursor!r}")
+    return int(text[len(_CURSOR_PREFIX) :])
+
+
+def _now() -> timestamp_pb2.Timestamp:
+    now = timestamp_pb2.Timestamp()
+    now.GetCurrentTime()
+    return now
+
+
+class BaseTaskStore(ABC):
+    """Task storage interface with event subscription support.
+
+    Subclasses provide storage (``_get``, ``_put``, ``_page``, ``_evict``,
+    ``count``); subscriptions are in-process and shared by all backends.
 
     Example:
         >>> store = TaskStore()
         >>> task = await store.create_task(message)
         >>> await store.update_task(task.id, state=TaskState.TASK_STATE_WORKING)
+        >>> page = await store.list_tasks_page(TaskQuery(context_id="ctx"), limit=50)
+        >>> more = await store.list_tasks_page(TaskQuery(context_id="ctx"), cursor=page.next_cursor)
     """
 
-    def __init__(self) -> None:
+    def __init__(self, config: Optional[TaskStoreConfig] = None) -> None:
         """Initialize task store."""
-        self._tasks: Dict[str, Task] = {}
+        self.config = config or TaskStoreConfig()
         self._subscribers: Dict[str, List[asyncio.Queue[StreamChunk]]] = {}
         self._lock = asyncio.Lock()
         self._sequence_counters: Dict[str, int] = {}
 
+    # -- storage primitives ---------------------------------------------------
+
+    @abstractmethod
+    async def _get(self, task_id: str) -> Optional[Task]:
+        """Load a task."""
+
+    @abstractmethod
+    async def _put(self, task: Task) -> None:
+        """Insert or replace a task, giving it the next revision."""
+
+    @abstractmethod
+    async def _page(
+        self, query: TaskQuery, before: Optional[int], limit: int
+    ) -> List[Tuple[int, Task]]:
+        """Up to ``limit`` matching (revision, task) pairs with revision < ``before``, newest first."""
+
+    @abstractmethod
+    async def _evict(self, expired_before: Optional[float], max_tasks: Optional[int]) -> List[str]:
+        """Drop terminal tasks updated before ``expired_before`` (epoch seconds) and,
+        while more than ``max_tasks`` remain, the oldest terminal tasks; return their ids."""
+
+    @abstractmethod
+    async def count(self) -> int:
+        """Number of stored tasks."""
+
+    # -- public API -------------------------------------------------------------
+
     async def create_task(self, message: Message) -> Task:
         """Create a new task from an initial message.
 
@@ -64,19 +176,20 @@ class TaskStore:
         """
         async with self._lock:
             task_id = str(uuid.uuid4())
-            now = timestamp_pb2.Timestamp()
-            now.GetCurrentTime()
+            now = _now()
 
             task = Task(
                 id=task_id,
                 state=TaskState.TASK_STATE_SUBMITTED,
                 created_at=now,
                 updated_at=now,
+                context_id=message.context_id,
             )
             task.messages.append(message)
 
-            self._tasks[task_id] = task
+            await self._put(task)
             self._sequence_counters[task_id] = 0
+            await self._evict_locked()
 
             logger.info(f"[A2A] Created task: {task_id}")
             return task
@@ -90,7 +203,7 @@ class TaskStore:
         Returns:
             Task if found, None otherwise
         """
-        return self._tasks.get(task_id)
+        return await self._get(task_id)
 
     async def update_task(
         self,
@@ -109,15 +222,15 @@ class TaskStore:
             Updated Task if found, None otherwise
         """
         async with self._lock:
-            task = self._tasks.get(task_id)
+            task = await self._get(task_id)
             if not task:
                 return None
 
-            now = timestamp_pb2.Timestamp()
-            now.GetCurrentTime()
+            now = _now()
             task.updated_at.CopyFrom(now)
 
-            if state is not None and state != task.state:
+            changed_state = state is not None and state != task.state
+            if changed_state:
                 transition = TaskStateTransition(
                     from_state=task.state,
                     to_state=state,
@@ -125,11 +238,16 @@ class TaskStore:
                 )
                 task.history.append(transition)
                 task.state = state
-                await self._notify_status_update(task_id, state)
 
             if message is not None:
                 task.messages.append(message)
 
+            await self._put(task)
+            if changed_state:
+                await self._notify_status_update(task_id, state)
+                if state in TERMINAL_STATES:
+                    await self._evict_locked()
+
             return task
 
     async def list_tasks(
@@ -137,6 +255,7 @@ class TaskStore:
         states: Optional[List[TaskState]] = None,
         agent_id: Optional[str] = None,
         limit: int = 100,
+        context_id: Optional[str] = None,
     ) -> List[Task]:
         """List tasks with optional filtering.
 
@@ -144,24 +263,60 @@ class TaskStore:
             states: Filter by states (optional)
             agent_id: Filter by agent ID (optional)
             limit: Maximum tasks to return
+            context_id: Filter by context ID (optional)
 
         Returns:
             List of tasks sorted by updated_at descending
         """
-        tasks = list(self._tasks.values())
+        query = TaskQuery(states=states or (), agent_id=agent_id or "", context_id=context_id or "")
+        return (await self.list_tasks_page(query, limit=limit)).tasks
 
-        if states:
-            tasks = [t for t in tasks if t.state in states]
+    async def list_tasks_page(
+        self,
+        query: Optional[TaskQuery] = None,
+        limit: int = 100,
+        cursor: str = "",
+    ) -> TaskPage:
+        """List one page of tasks, most recently updated first.
 
-        if agent_id:
-            tasks = [t for t in tasks if t.agent_id == agent_id]
+        Pages follow update order, so a task updated while a client is paging
+        moves ahead of the cursor: later pages skip it (it is at the top of a
+        fresh listing) and no task is ever returned twice.
 
-        tasks.sort(
-            key=lambda t: t.updated_at.ToDatetime(),
-            reverse=True,
-        )
+        Args:
+            query: Filters (optional)
+            limit: Maximum tasks to return
+            cursor: ``next_cursor`` of the previous page (empty for the first page)
 
-        return tasks[:limit]
+        Returns:
+            TaskPage whose ``next_cursor`` is empty on the last page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        before = decode_cursor(cursor) if cursor else None
+        rows = await self._page(query or TaskQuery(), before, limit + 1)
+        page = TaskPage(tasks=[task for _, task in rows[:limit]])
+        if len(rows) > limit:
+            page.next_cursor = encode_cursor(rows[limit - 1][0])
+        return page
+
+    async def evict_expired(self) -> int:
+        """Apply the TTL and size limits now; returns the number of tasks evicted."""
+        async with self._lock:
+            return await self._evict_locked()
+
+    async def _evict_locked(self) -> int:
+        ttl = self.config.terminal_ttl
+        expired_before = time.time() - ttl if ttl is not None else None
+        evicted = await self._evict(expired_before, self.config.max_tasks)
+        for task_id in evicted:
+            self._sequence_counters.pop(task_id, None)
+            if not self._subscribers.get(task_id):
+                self._subscribers.pop(task_id, None)
+        if evicted:
+            logger.debug(f"[A2A] Evicted {len(evicted)} terminal tasks")
+        return len(evicted)
 
     async def subscribe(self, task_id: str) -> asyncio.Queue[StreamChunk]:
         """Subscribe to task updates.
@@ -199,6 +354,8 @@ class TaskStore:
                     self._subscribers[task_id].remove(queue)
                 except ValueError:
                     pass
+                if not self._subscribers[task_id]:
+                    del self._subscribers[task_id]
 
     async def _notify_status_update(
         self,
@@ -212,9 +369,6 @@ class TaskStore:
         self._sequence_counters[task_id] = self._sequence_counters.get(task_id, 0) + 1
         seq = self._sequence_counters[task_id]
 
-        now = timestamp_pb2.Timestamp()
-        now.GetCurrentTime()
-
         chunk = StreamChunk(
             event_type=StreamEventType.STREAM_EVENT_TYPE_STATUS_UPDATE,
             task_id=task_id,
@@ -222,7 +376,7 @@ class TaskStore:
             status_update=TaskStatusUpdate(
                 state=TaskState.Name(state),
             ),
-            timestamp=now,
+            timestamp=_now(),
         )
 
         for queue in self._subscribers[task_id]:
@@ -252,4 +406,126 @@ class TaskStore:
                 logger.warning(f"[A2A] Subscriber queue full for {task_id}")
 
 
-__all__ = ["TaskStore"]
+class TaskStore(BaseTaskStore):
+    """In-memory task storage with secondary indexes.
+
+    Each index (all tasks, by state, by context id, by agent id) is an
+    append-only list of (revision, task_id) in revision order. A write
+    appends to the task's current indexes; entries whose revision is no
+    longer the task's current one are skipped on read (lazy deletion) and
+    dropped when the lists are compacted. Terminal tasks are also kept in
+    an ordered dict, oldest first, so eviction never scans active tasks.
+    """
+
+    def __init__(self, config: Optional[TaskStoreConfig] = None) -> None:
+        """Initialize task store."""
+        super().__init__(config)
+        self._tasks: Dict[str, Task] = {}
+        self._revisions: Dict[str, int] = {}
+        self._revision = 0
+        self._log: List[Tuple[int, str]] = []
+        self._by_state: Dict[int, List[Tuple[int, str]]] = {}
+        self._by_context: Dict[str, List[Tuple[int, str]]] = {}
+        self._by_agent: Dict[str, List[Tuple[int, str]]] = {}
+        self._terminal: "OrderedDict[str, float]" = OrderedDict()  # id -> updated (epoch s)
+
+    async def _get(self, task_id: str) -> Optional[Task]:
+        return self._tasks.get(task_id)
+
+    async def count(self) -> int:
+        return len(self._tasks)
+
+    async def _put(self, task: Task) -> None:
+        self._revision += 1
+        entry = (self._revision, task.id)
+        self._tasks[task.id] = task
+        self._revisions[task.id] = self._revision
+        self._index(entry, task)
+
+        if task.state in TERMINAL_STATES:
+            self._terminal[task.id] = task.updated_at.ToNanoseconds() / 1e9
+            self._terminal.move_to_end(task.id)
+        else:
+            self._terminal.pop(task.id, None)
+
+        if len(self._log) > 2 * len(self._tasks) + 1024:
+            self._compact()
+
+    def _index(self, entry: Tuple[int, str], task: Task) -> None:
+        self._log.append(entry)
+        self._by_state.setdefault(task.state, []).append(entry)
+        if task.context_id:
+            self._by_context.setdefault(task.context_id, []).append(entry)
+        if task.agent_id:
+            self._by_agent.setdefault(task.agent_id, []).append(entry)
+
+    def _compact(self) -> None:
+        """Rebuild the indexes from live entries only."""
+        live = [entry for entry in self._log if self._revisions.get(entry[1]) == entry[0]]
+        self._log = []
+        self._by_state, self._by_context, self._by_agent = {}, {}, {}
+        for entry in live:
+            self._index(entry, self._tasks[entry[1]])
+
+    def _newest_first(
+        self, index: List[Tuple[int, str]], before: Optional[int]
+    ) -> Iterator[Tuple[int, str]]:
+        """Live entries of one index with revision < ``before``, newest first."""
+        end = len(index) if before is None else bisect.bisect_left(index, (before, ""))
+        revisions = self._revisions
+        for i in range(end - 1, -1, -1):
+            entry = index[i]
+            if revisions.get(entry[1]) == entry[0]:
+                yield entry
+
+    def _candidates(self, query: TaskQuery, before: Optional[int]) -> Iterator[Tuple[int, str]]:
+        """Walk the most selective index for the query."""
+        if query.context_id:
+            return self._newest_first(self._by_context.get(query.context_id, []), before)
+        if query.agent_id:
+            return self._newest_first(self._by_agent.get(query.agent_id, []), before)
+        if query.states:
+            streams = [
+                self._newest_first(self._by_state.get(state, []), before)
+                for state in set(query.states)
+            ]
+            return heapq.merge(*streams, reverse=True)
+        return self._newest_first(self._log, before)
+
+    async def _page(
+        self, query: TaskQuery, before: Optional[int], limit: int
+    ) -> List[Tuple[int, Task]]:
+        rows = []
+        for revision, task_id in self._candidates(query, before):
+            task = self._tasks[task_id]
+            if query.matches(task):
+                rows.append((revision, task))
+                if len(rows) >= limit:
+                    break
+        return rows
+
+    async def _evict(self, expired_before: Optional[float], max_tasks: Optional[int]) -> List[str]:
+        evicted = []
+        while self._terminal:
+            task_id, updated = next(iter(self._terminal.items()))
+            expired = expired_before is not None and updated < expired_before
+            oversize = max_tasks is not None and len(self._tasks) > max_tasks
+            if not (expired or oversize):
+                break
+            del self._terminal[task_id]
+            del self._tasks[task_id]
+            del self._revisions[task_id]
+            evicted.append(task_id)
+        return evicted
+
+
+__all__ = [
+    "BaseTaskStore",
+    "TaskStore",
+    "TaskStoreConfig",
+    "TaskQuery",
+    "TaskPage",
+    "TERMINAL_STATES",
+    "encode_cursor",
+    "decode_cursor",
+]
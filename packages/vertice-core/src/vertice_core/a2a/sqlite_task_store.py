@@ -0,0 +1,171 @@
+"""
+A2A Protocol SQLite Task Store
+==============================
+
+Persistent TaskStore backed by a single SQLite file.
+
+Tasks are stored as serialized protobufs next to the columns the listing
+queries filter on. Each write assigns the next revision, and the
+(state, rev), (context_id, rev) and (agent_id, rev) indexes serve the
+filtered, newest-first pages without sorting. Queries run in a worker
+thread (``asyncio.to_thread``) so disk I/O never blocks the event loop.
+
+Author: JuanCS Dev
+Date: 2025-12-30
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from .grpc_task_store import TERMINAL_STATES, BaseTaskStore, TaskQuery, TaskStoreConfig
+from .proto import Task
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    rev INTEGER NOT NULL UNIQUE,
+    state INTEGER NOT NULL,
+    context_id TEXT NOT NULL,
+    agent_id TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    terminal INTEGER NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_state ON tasks(state, rev);
+CREATE INDEX IF NOT EXISTS idx_tasks_context ON tasks(context_id, rev);
+CREATE INDEX IF NOT EXISTS idx_tasks_agent ON tasks(agent_id, rev);
+CREATE INDEX IF NOT EXISTS idx_tasks_terminal ON tasks(terminal, updated_at);
+"""
+
+
+class SqliteTaskStore(BaseTaskStore):
+    """TaskStore persisted in SQLite (WAL mode).
+
+    Example:
+        >>> store = SqliteTaskStore("~/.vertice/a2a_tasks.db")
+        >>> task = await store.create_task(message)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = ":memory:",
+        config: Optional[TaskStoreConfig] = None,
+    ) -> None:
+        """Open (or create) the task database at ``path``."""
+        super().__init__(config)
+        if str(path) != ":memory:":
+            path = Path(path).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self._db_lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._db_lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+        row = self._conn.execute("SELECT MAX(rev), COUNT(*) FROM tasks").fetchone()
+        self._revision, self._count = row[0] or 0, row[1]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._db_lock:
+            self._conn.close()
+
+    async def _get(self, task_id: str) -> Optional[Task]:
+        return await asyncio.to_thread(self._get_sync, task_id)
+
+    def _get_sync(self, task_id: str) -> Optional[Task]:
+        with self._db_lock:
+            row = self._conn.execute("SELECT data FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        return Task.FromString(row[0]) if row else None
+
+    async def count(self) -> int:
+        return self._count
+
+    async def _put(self, task: Task) -> None:
+        await asyncio.to_thread(self._put_sync, task)
+
+    def _put_sync(self, task: Task) -> None:
+        with self._db_lock, self._conn:
+            self._revision += 1
+            exists = self._conn.execute("SELECT 1 FROM tasks WHERE id = ?", (task.id,)).fetchone()
+            self._count += not exists
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tasks"
+                " (id, rev, state, context_id, agent_id, updated_at, terminal, data)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    task.id,
+                    self._revision,
+                    task.state,
+                    task.context_id,
+                    task.agent_id,
+                    task.updated_at.ToNanoseconds() / 1e9,
+                    int(task.state in TERMINAL_STATES),
+                    task.SerializeToString(),
+                ),
+            )
+
+    async def _page(
+        self, query: TaskQuery, before: Optional[int], limit: int
+    ) -> List[Tuple[int, Task]]:
+        return await asyncio.to_thread(self._page_sync, query, before, limit)
+
+    def _page_sync(
+        self, query: TaskQuery, before: Optional[int], limit: int
+    ) -> List[Tuple[int, Task]]:
+        clauses, params = [], []
+        if before is not None:
+            clauses.append("rev < ?")
+            params.append(before)
+        if query.states:
+            states = sorted(set(query.states))
+            clauses.append(f"state IN ({', '.join('?' * len(states))})")
+            params.extend(states)
+        if query.agent_id:
+            clauses.append("agent_id = ?")
+            params.append(query.agent_id)
+        if query.context_id:
+            clauses.append("context_id = ?")
+            params.append(query.context_id)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._db_lock:
+            rows = self._conn.execute(
+                f"SELECT rev, data FROM tasks {where} ORDER BY rev DESC LIMIT ?",
+                (*params, limit),
+            ).fetchall()
+        return [(rev, Task.FromString(data)) for rev, data in rows]
+
+    async def _evict(self, expired_before: Optional[float], max_tasks: Optional[int]) -> List[str]:
+        return await asyncio.to_thread(self._evict_sync, expired_before, max_tasks)
+
+    def _evict_sync(self, expired_before: Optional[float], max_tasks: Optional[int]) -> List[str]:
+        evicted: List[str] = []
+        with self._db_lock, self._conn:
+            if expired_before is not None:
+                rows = self._conn.execute(
+                    "SELECT id FROM tasks WHERE terminal = 1 AND updated_at < ?",
+                    (expired_before,),
+                ).fetchall()
+                evicted.extend(row[0] for row in rows)
+            if max_tasks is not None:
+                excess = self._count - len(evicted) - max_tasks
+                if excess > 0:
+                    rows = self._conn.execute(
+                        "SELECT id FROM tasks WHERE terminal = 1"
+                        " AND (? IS NULL OR updated_at >= ?)"
+                        " ORDER BY updated_at LIMIT ?",
+                        (expired_before, expired_before, excess),
+                    ).fetchall()
+                    evicted.extend(row[0] for row in rows)
+            self._conn.executemany("DELETE FROM tasks WHERE id = ?", [(i,) for i in evicted])
+            self._count -= len(evicted)
+        return evicted
+
+
+__all__ = ["SqliteTaskStore"]
@@ -219,6 +219,19 @@ class ActiveOrchestrator:
         logger.info(f"Handoff requested: {from_agent.value} → {to_agent.value}")
         return handoff
 
+    async def route_steps(self, steps: List[ExecutionStep]) -> None:
+        """Assign agents to decomposed plan steps with one batched routing call."""
+        if not steps:
+            return
+
+        decisions = await self.router.route_many(
+            [step.description for step in steps],
+            context=self.context.variables(),
+        )
+        for step, decision in zip(steps, decisions):
+            step.agent_type = decision.agent_type
+            step.parameters.setdefault("routing_confidence", decision.confidence)
+
     async def _generate_summary(self) -> AsyncIterator[str]:
         """Generate execution summary."""
         yield "\n" + "=" * 40 + "\n"
@@ -5,7 +5,7 @@ Router Module - Semantic routing for agent selection.
 
 from .cache import RouterCacheMixin
 from .router import SemanticRouter
-from .similarity import SimilarityEngine
+from .similarity import RouteMatrix, SimilarityEngine
 from .stats import RouterStatsMixin
 from .types import (
     AgentType,
@@ -30,6 +30,7 @@ __all__ = [
     "RouterStatsMixin",
     # Utilities
     "SimilarityEngine",
+    "RouteMatrix",
     # Types
     "AgentType",
     "TaskComplexity",
@@ -3,18 +3,36 @@ Router Cache Mixin - Caching for routing decisions.
 """
 
 import time
-from typing import Dict, Optional
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Tuple
 
+from .similarity import SimilarityEngine
 from .types import RoutingDecision
 
+# (unit embedding, decision, timestamp)
+_SemanticEntry = Tuple[Tuple[float, ...], RoutingDecision, float]
+
 
 class RouterCacheMixin:
-    """Mixin for caching routing decisions."""
+    """
+    Mixin for caching routing decisions.
+
+    Two layers: an exact cache keyed by query string, and a small semantic
+    cache keyed by query embedding that answers near-duplicate queries
+    (e.g. "fix the login bug" vs "fix the login bug please") without
+    another LLM classification.
+    """
+
+    SEMANTIC_CACHE_SIZE = 128
+    SEMANTIC_THRESHOLD = 0.97  # Minimum cosine similarity for a semantic hit
 
     def __init__(self) -> None:
         self._cache: Dict[str, RoutingDecision] = {}
         self._cache_timestamps: Dict[str, float] = {}
         self._cache_ttl = 300.0  # 5 minutes default
+        # Least recently used first
+        self._semantic_cache: "OrderedDict[str, _SemanticEntry]" = OrderedDict()
+        self._semantic_hits = 0
 
     def get_cached_decision(self, query: str) -> Optional[RoutingDecision]:
         """
@@ -49,6 +67,58 @@ class RouterCacheMixin:
         self._cache[query] = decision
         self._cache_timestamps[query] = time.time()
 
+    def get_similar_decision(self, embedding: Sequence[float]) -> Optional[RoutingDecision]:
+        """
+        Get a cached decision for a near-duplicate query.
+
+        Args:
+            embedding: Query embedding
+
+        Returns:
+            Decision of the most similar cached query above
+            SEMANTIC_THRESHOLD, None otherwise
+        """
+        unit = SimilarityEngine.unit_vector(embedding)
+        if unit is None or not self._semantic_cache:
+            return None
+
+        now = time.time()
+        best_query, best_score = None, self.SEMANTIC_THRESHOLD
+        for query, (cached_unit, _, cached_time) in list(self._semantic_cache.items()):
+            if now - cached_time > self._cache_ttl:
+                del self._semantic_cache[query]
+                continue
+            if len(cached_unit) != len(unit):
+                continue
+            score = SimilarityEngine.dot(cached_unit, unit)
+            if score >= best_score:
+                best_query, best_score = query, score
+
+        if best_query is None:
+            return None
+        self._semantic_cache.move_to_end(best_query)
+        self._semantic_hits += 1
+        return self._semantic_cache[best_query][1]
+
+    def cache_semantic_decision(
+        self, query: str, embedding: Sequence[float], decision: RoutingDecision
+    ) -> None:
+        """
+        Cache a decision for near-duplicate lookups.
+
+        Args:
+            query: Query string
+            embedding: Query embedding
+            decision: Routing decision to cache
+        """
+        unit = SimilarityEngine.unit_vector(embedding)
+        if unit is None:
+            return
+        self._semantic_cache[query] = (unit, decision, time.time())
+        self._semantic_cache.move_to_end(query)
+        while len(self._semantic_cache) > self.SEMANTIC_CACHE_SIZE:
+            self._semantic_cache.popitem(last=False)
+
     def _remove_from_cache(self, query: str) -> None:
         """Remove a query from cache."""
         self._cache.pop(query, None)
@@ -80,9 +150,10 @@ class RouterCacheMixin:
         Returns:
             Number of entries cleared
         """
-        cleared_count = len(self._cache)
+        cleared_count = len(self._cache) + len(self._semantic_cache)
         self._cache.clear()
         self._cache_timestamps.clear()
+        self._semantic_cache.clear()
         return cleared_count
 
     def get_cache_stats(self) -> Dict[str, int]:
@@ -90,4 +161,6 @@ class RouterCacheMixin:
         return {
             "total_entries": len(self._cache),
             "expired_entries": self.clear_expired_cache(),
+            "semantic_entries": len(self._semantic_cache),
+            "semantic_hits": self._semantic_hits,
         }
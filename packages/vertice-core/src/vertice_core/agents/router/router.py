@@ -3,18 +3,32 @@ Semantic Router - Core routing logic using embeddings + LLM fallback.
 """
 
 import asyncio
+import functools
 import hashlib
+import inspect
 import logging
 import time
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 from .cache import RouterCacheMixin
-from .similarity import SimilarityEngine
+from .similarity import RouteMatrix
 from .stats import RouterStatsMixin
 from .types import AgentType, RouteDefinition, RoutingDecision, TaskComplexity
 
 logger = logging.getLogger(__name__)
 
+EmbedBatchFunc = Callable[[List[str]], Union[List[List[float]], Awaitable[List[List[float]]]]]
+
+
+@functools.lru_cache(maxsize=1024)
+def _hash_embedding(text: str) -> Tuple[float, ...]:
+    """Deterministic md5-based pseudo-embedding."""
+    return tuple(b / 255.0 for b in hashlib.md5(text.encode()).digest())
+
+
+def _is_empty(embedding: Optional[Sequence[float]]) -> bool:
+    return embedding is None or len(embedding) == 0
+
 
 class SemanticRouter(RouterCacheMixin, RouterStatsMixin):
     """
@@ -22,14 +36,16 @@ class SemanticRouter(RouterCacheMixin, RouterStatsMixin):
 
     Strategy:
     1. Embed user request
-    2. Compare against pre-computed route embeddings
+    2. Score it against the pre-computed route exemplar matrix
     3. If confidence > threshold: return fast path result
-    4. If confidence < threshold: use LLM for classification
+    4. If confidence < threshold: reuse a near-duplicate decision or
+       use LLM for classification
 
     Usage:
         router = SemanticRouter()
         await router.initialize()  # Pre-compute embeddings
         decision = await router.route("implement user login")
+        decisions = await router.route_many(["write tests", "review the diff"])
     """
 
     # Confidence thresholds
@@ -42,6 +58,7 @@ class SemanticRouter(RouterCacheMixin, RouterStatsMixin):
         routes: Optional[List[RouteDefinition]] = None,
         embed_func: Optional[Callable[[str], List[float]]] = None,
         llm_classify_func: Optional[Callable[[str, List[str]], str]] = None,
+        embed_batch_func: Optional[EmbedBatchFunc] = None,
     ):
         """
         Initialize router.
@@ -50,6 +67,8 @@ class SemanticRouter(RouterCacheMixin, RouterStatsMixin):
             routes: Custom route definitions (defaults to DEFAULT_ROUTES)
             embed_func: Function to generate embeddings
             llm_classify_func: Function for LLM-based classification fallback
+            embed_batch_func: Optional function (sync or async) embedding a
+                list of texts in one call; used by initialize() and route_many()
         """
         RouterCacheMixin.__init__(self)
         RouterStatsMixin.__init__(self)
@@ -57,30 +76,47 @@ class SemanticRouter(RouterCacheMixin, RouterStatsMixin):
         # Load default routes if none provided
         self.routes = routes or self._get_default_routes()
         self._embed_func = embed_func
+        self._embed_batch_func = embed_batch_func
         self._llm_classify_func = llm_classify_func
         self._initialized = False
 
+        # Near-duplicate lookups are meaningless for hash-based embeddings
+        self._semantic_cache_enabled = embed_func is not None or embed_batch_func is not None
+
         # Route lookup
         self._route_map: Dict[str, RouteDefinition] = {r.name: r for r in self.routes}
 
         # Pre-computed embeddings
         self._route_embeddings: Dict[str, List[float]] = {}
+        self._exemplar_embeddings: Dict[str, List[float]] = {}
+        self._matrix = RouteMatrix([])
 
     async def initialize(self) -> None:
-        """Initialize router by pre-computing route embeddings."""
+        """Initialize router by pre-computing the route exemplar matrix."""
         if self._initialized:
             return
 
         logger.info(f"Initializing router with {len(self.routes)} routes")
 
-        # Pre-compute embeddings for all routes
+        # Embed exemplars not seen before (add_route() re-initializes)
+        texts = dict.fromkeys(t for route in self.routes for t in self._route_exemplars(route))
+        missing = [text for text in texts if text not in self._exemplar_embeddings]
+        for text, embedding in zip(missing, await self._get_embeddings(missing)):
+            if not _is_empty(embedding):
+                self._exemplar_embeddings[text] = embedding
+
+        exemplars = []
+        self._route_embeddings = {}
         for route in self.routes:
-            embedding = await self._get_embedding(route.description)
-            if embedding:
-                self._route_embeddings[route.name] = embedding
+            for text in self._route_exemplars(route):
+                if text in self._exemplar_embeddings:
+                    exemplars.append((route.name, self._exemplar_embeddings[text]))
+            if route.description in self._exemplar_embeddings:
+                self._route_embeddings[route.name] = self._exemplar_embeddings[route.description]
+        self._matrix = RouteMatrix(exemplars)
 
         self._initialized = True
-        logger.info("Router initialization complete")
+        logger.info(f"Router initialization complete ({len(self._matrix)} exemplars)")
 
     async def route(self, query: str, context: Optional[Dict[str, Any]] = None) -> RoutingDecision:
         """
@@ -102,56 +138,142 @@ class SemanticRouter(RouterCacheMixin, RouterStatsMixin):
             return cached
 
         try:
+            await self.initialize()
+
             # Get query embedding
             query_embedding = await self._get_embedding(query)
-            if not query_embedding:
+            if _is_empty(query_embedding):
                 return self._default_decision()
 
-            # Find best matches
-            similarities = {}
-            for route_name, route_embedding in self._route_embeddings.items():
-                similarity = SimilarityEngine.cosine_similarity(query_embedding, route_embedding)
-                similarities[route_name] = similarity
-
-            # Sort by similarity
-            sorted_routes = sorted(similarities.items(), key=lambda x: x[1], reverse=True)
-            best_route, best_score = sorted_routes[0]
-
-            # Check for ambiguous results
-            if len(sorted_routes) > 1:
-                second_best_score = sorted_routes[1][1]
-                if abs(best_score - second_best_score) < self.AMBIGUOUS_THRESHOLD:
-                    # Ambiguous, use LLM fallback
-                    return await self._llm_fallback(query, sorted_routes[:3], start_time)
-
-            # High confidence - return fast path result
-            if best_score >= self.HIGH_CONFIDENCE:
-                decision = self._create_decision(
-                    best_route, best_score, sorted_routes[1:], "fast_path"
-                )
-                self.record_route(best_route, best_score, (time.time() - start_time) * 1000)
-                self.cache_decision(query, decision)
-                return decision
-
-            # Low confidence - use LLM fallback
-            if best_score < self.LOW_CONFIDENCE:
-                return await self._llm_fallback(query, sorted_routes[:3], start_time)
-
-            # Medium confidence - return with caution
-            decision = self._create_decision(
-                best_route, best_score, sorted_routes[1:], "medium_confidence"
-            )
-            self.record_route(best_route, best_score, (time.time() - start_time) * 1000)
-            self.cache_decision(query, decision)
-            return decision
+            ranked = self._matrix.score(query_embedding)
+            return await self._decide(query, query_embedding, ranked, start_time)
 
         except Exception as e:
             logger.error(f"Routing error: {e}")
             self.record_error()
             return self._default_decision()
 
+    async def route_many(
+        self, queries: Sequence[str], context: Optional[Dict[str, Any]] = None
+    ) -> List[RoutingDecision]:
+        """
+        Route several queries at once, e.g. the subtasks of a decomposed request.
+
+        Queries are deduplicated, embedded in one batch and scored in a single
+        matrix pass; those needing the LLM fallback are classified concurrently.
+
+        Args:
+            queries: Query strings
+            context: Optional context information
+
+        Returns:
+            Routing decisions in query order
+        """
+        start_time = time.time()
+        decisions: Dict[str, RoutingDecision] = {}
+        pending: List[str] = []
+
+        for query in dict.fromkeys(queries):
+            cached = self.get_cached_decision(query)
+            if cached:
+                self.record_route(cached.route_name, cached.confidence, 0, cache_hit=True)
+                decisions[query] = cached
+            else:
+                pending.append(query)
+
+        if pending:
+            try:
+                await self.initialize()
+                embedded = [
+                    (query, embedding)
+                    for query, embedding in zip(pending, await self._get_embeddings(pending))
+                    if not _is_empty(embedding)
+                ]
+                rankings = self._matrix.score_many([embedding for _, embedding in embedded])
+                results = await asyncio.gather(
+                    *(
+                        self._decide(query, embedding, ranked, start_time)
+                        for (query, embedding), ranked in zip(embedded, rankings)
+                    ),
+                    return_exceptions=True,
+                )
+                for (query, _), result in zip(embedded, results):
+                    if isinstance(result, Exception):
+                        logger.error(f"Routing error: {result}")
+                        self.record_error()
+                        continue
+                    decisions[query] = result
+
+            except Exception as e:
+                logger.error(f"Batch routing error: {e}")
+                self.record_error()
+
+        return [decisions.get(query) or self._default_decision() for query in queries]
+
+    async def _decide(
+        self,
+        query: str,
+        query_embedding: Sequence[float],
+        ranked: List[Tuple[str, float]],
+        start_time: float,
+    ) -> RoutingDecision:
+        """Turn ranked route scores into a decision, falling back to the LLM."""
+        if not ranked:
+            return self._default_decision()
+
+        best_route, best_score = ranked[0]
+
+        # Ambiguous or low confidence - use fallback
+        ambiguous = len(ranked) > 1 and abs(best_score - ranked[1][1]) < self.AMBIGUOUS_THRESHOLD
+        if ambiguous or best_score < self.LOW_CONFIDENCE:
+            return await self._resolve_fallback(query, query_embedding, ranked[:3], start_time)
+
+        # High confidence - fast path; otherwise medium confidence, return with caution
+        reasoning = "fast_path" if best_score >= self.HIGH_CONFIDENCE else "medium_confidence"
+        decision = self._create_decision(best_route, best_score, ranked[1:], reasoning)
+        self.record_route(best_route, best_score, (time.time() - start_time) * 1000)
+        self.cache_decision(query, decision)
+        return decision
+
+    async def _resolve_fallback(
+        self,
+        query: str,
+        query_embedding: Sequence[float],
+        candidates: List[Tuple[str, float]],
+        start_time: float,
+    ) -> RoutingDecision:
+        """Answer from a near-duplicate decision before paying for the LLM."""
+        if self._semantic_cache_enabled:
+            similar = self.get_similar_decision(query_embedding)
+            if similar:
+                self.record_route(
+                    similar.route_name,
+                    similar.confidence,
+                    (time.time() - start_time) * 1000,
+                    cache_hit=True,
+                )
+                self.cache_decision(query, similar)
+                return similar
+
+        decision = await self._llm_fallback(query, candidates, start_time)
+
+        # "llm_failed" is transient and must not stick
+        if decision.reasoning == "llm_fallback":
+            self.cache_decision(query, decision)
+            if self._semantic_cache_enabled:
+                self.cache_semantic_decision(query, query_embedding, decision)
+        elif decision.reasoning == "llm_unavailable":
+            self.cache_decision(query, decision)
+        return decision
+
     async def _get_embedding(self, text: str) -> Optional[List[float]]:
         """Get embedding for text using configured function."""
+        if self._embed_batch_func and not self._embed_func:
+            return (await self._get_embeddings([text]))[0]
+        return self._embed_one(text)
+
+    def _embed_one(self, text: str) -> Optional[List[float]]:
+        """Embed a single text with embed_func, or the hash-based fallback."""
         if self._embed_func:
             try:
                 return self._embed_func(text)
@@ -161,14 +283,30 @@ class SemanticRouter(RouterCacheMixin, RouterStatsMixin):
         # Fallback to simple hash-based embedding (for testing)
         return self._hash_based_embedding(text)
 
+    async def _get_embeddings(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Get embeddings for several texts, in one call when a batch function is set."""
+        if texts and self._embed_batch_func:
+            try:
+                embeddings = self._embed_batch_func(texts)
+                if inspect.isawaitable(embeddings):
+                    embeddings = await embeddings
+                if len(embeddings) == len(texts):
+                    return list(embeddings)
+                logger.warning("Batch embedding function returned wrong number of embeddings")
+            except Exception as e:
+                logger.warning(f"Batch embedding function failed: {e}")
+
+        return [self._embed_one(text) for text in texts]
+
     def _hash_based_embedding(self, text: str) -> List[float]:
-        """Generate simple hash-based embedding for fallback."""
-        # Create deterministic "embedding" based on text hash
-        hash_obj = hashlib.md5(text.encode())
-        hash_bytes = hash_obj.digest()
+        """Generate simple hash-based embedding for fallback (memoized)."""
+        # Not a real embedding, just a deterministic vector for testing
+        return list(_hash_embedding(text))
 
-        # Convert to float list (not a real embedding, just for fallback)
-        return [float(b) / 255.0 for b in hash_bytes[:32]]  # 32 dimensions
+    @staticmethod
+    def _route_exemplars(route: RouteDefinition) -> List[str]:
+        """Texts embedded for a route: its description and examples."""
+        return [route.description, *route.examples]
 
     def _create_decision(
         self,
@@ -261,10 +399,8 @@ class SemanticRouter(RouterCacheMixin, RouterStatsMixin):
         self.routes.append(route)
         self._route_map[route.name] = route
 
-        # Pre-compute embedding if initialized
-        if self._initialized:
-            # Note: This would need async embedding in real implementation
-            logger.warning("Adding routes after initialization requires re-initialization")
+        # Rebuild the exemplar matrix on next use; known embeddings are reused
+        self._initialized = False
 
     def _get_default_routes(self) -> List[RouteDefinition]:
         """Get default routing definitions."""
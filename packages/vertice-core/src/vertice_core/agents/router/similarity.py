@@ -3,7 +3,16 @@ Similarity Engine - Cosine similarity and vector operations.
 """
 
 import math
-from typing import List
+import operator
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 
 class SimilarityEngine:
@@ -85,3 +94,100 @@ class SimilarityEngine:
         if magnitude == 0:
             return vector
         return [x / magnitude for x in vector]
+
+    @staticmethod
+    def unit_vector(vector: Sequence[float]) -> Optional[Tuple[float, ...]]:
+        """
+        Normalize a vector for dot-product scoring.
+
+        Args:
+            vector: Input vector
+
+        Returns:
+            Unit-length tuple, or None for empty and zero vectors
+        """
+        magnitude = math.sqrt(sum(x * x for x in vector)) if vector else 0.0
+        if magnitude == 0:
+            return None
+        return tuple(x / magnitude for x in vector)
+
+    @staticmethod
+    def dot(a: Sequence[float], b: Sequence[float]) -> float:
+        """Dot product of two equal-length vectors."""
+        return sum(map(operator.mul, a, b))
+
+
+class RouteMatrix:
+    """
+    Unit-normalized exemplar embeddings for every route.
+
+    Each route contributes one row per exemplar (its description and
+    examples); a route scores the best cosine similarity over its rows.
+    Rows are normalized once at build time, so scoring a query is a single
+    matrix-vector product (numpy when installed, plain Python otherwise).
+    """
+
+    def __init__(self, exemplars: Sequence[Tuple[str, Sequence[float]]]):
+        """
+        Build the matrix.
+
+        Args:
+            exemplars: (route name, embedding) pairs; rows of one route must
+                be contiguous. Empty, zero and mismatched-dimension vectors
+                are skipped.
+        """
+        self.dim = 0
+        self.route_names: List[str] = []
+        self._rows: List[Tuple[float, ...]] = []
+        self._offsets: List[int] = []
+
+        for route_name, embedding in exemplars:
+            row = SimilarityEngine.unit_vector(embedding)
+            if row is None or (self.dim and len(row) != self.dim):
+                continue
+            self.dim = len(row)
+            if not self.route_names or self.route_names[-1] != route_name:
+                self.route_names.append(route_name)
+                self._offsets.append(len(self._rows))
+            self._rows.append(row)
+
+        self._matrix = np.asarray(self._rows, dtype=np.float64) if NUMPY_AVAILABLE else None
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def score(self, query: Sequence[float]) -> List[Tuple[str, float]]:
+        """
+        Score a query against every route.
+
+        Args:
+            query: Query embedding
+
+        Returns:
+            (route name, similarity) pairs, best first; ties keep route order
+        """
+        return self.score_many([query])[0]
+
+    def score_many(self, queries: Sequence[Sequence[float]]) -> List[List[Tuple[str, float]]]:
+        """Score several queries in one pass; see score()."""
+        units = [SimilarityEngine.unit_vector(q) for q in queries]
+        valid = [i for i, u in enumerate(units) if u is not None and len(u) == self.dim]
+        zero: Dict[str, float] = dict.fromkeys(self.route_names, 0.0)
+        scores: List[Dict[str, float]] = [zero] * len(queries)
+
+        if valid and self._rows:
+            if self._matrix is not None:
+                products = np.asarray([units[i] for i in valid]) @ self._matrix.T
+                best = np.maximum.reduceat(products, self._offsets, axis=1).tolist()
+            else:
+                best = [self._best_per_route(units[i]) for i in valid]
+            for i, row in zip(valid, best):
+                scores[i] = dict(zip(self.route_names, row))
+
+        return [sorted(s.items(), key=lambda item: item[1], reverse=True) for s in scores]
+
+    def _best_per_route(self, unit: Tuple[float, ...]) -> List[float]:
+        dot = SimilarityEngine.dot
+        products = [dot(row, unit) for row in self._rows]
+        bounds = self._offsets[1:] + [len(products)]
+        return [max(products[start:end]) for start, end in zip(self._offsets, bounds)]
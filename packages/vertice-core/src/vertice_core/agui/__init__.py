@@ -13,6 +13,8 @@ from .protocol import (
     AGUIFinalData,
     AGUIToolData,
     AGUIDeltaData,
+    AGUIDeltaCoalescer,
+    coalesce_deltas,
     sse_encode_event,
 )
 from .ag_ui_adk import adk_event_to_agui, adk_events_to_agui
@@ -24,6 +26,8 @@ __all__ = [
     "AGUIFinalData",
     "AGUIToolData",
     "AGUIDeltaData",
+    "AGUIDeltaCoalescer",
+    "coalesce_deltas",
     "sse_encode_event",
     "adk_event_to_agui",
     "adk_events_to_agui",
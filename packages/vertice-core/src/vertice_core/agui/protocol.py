@@ -12,15 +12,21 @@ Wire format: Server-Sent Events (SSE)
   data: <json>
 
 The JSON payload always validates as AGUIEvent.
+
+Delta coalescing (opt-in): `coalesce_deltas` merges bursts of plain text deltas
+into fewer events. Clients see the same concatenated text, just fewer frames.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
+import time
 import uuid
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -117,12 +123,163 @@ class AGUIEvent(BaseModel):
         return cls(type=AGUIEventType.ERROR, session_id=session_id, data=payload)
 
 
+# Built once: json.dumps(...) with non-default options creates a new encoder per call.
+_json_encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+# Data keys a text delta may carry and still be merged with its neighbours.
+_MERGEABLE_DELTA_KEYS = frozenset({"text", "frame", "channel"})
+
+
 def sse_encode_event(event: AGUIEvent) -> str:
     """
     Encode an AGUIEvent to SSE payload.
 
     We keep it intentionally simple and predictable to maximize compatibility.
+    Deltas (the hot path) skip `model_dump()` and are written straight from the
+    envelope fields; the bytes are identical to the generic path.
     """
 
-    data = json.dumps(event.model_dump(), separators=(",", ":"), ensure_ascii=False)
+    if event.type is AGUIEventType.DELTA:
+        try:
+            data = _json_encode(event.data)
+        except TypeError:
+            # Non-JSON-native payload (e.g. nested models): let pydantic dump it.
+            pass
+        else:
+            return (
+                f'event: delta\ndata: {{"id":{_json_encode(event.id)},"type":"delta",'
+                f'"session_id":{_json_encode(event.session_id)},"ts":{_json_encode(event.ts)},'
+                f'"data":{data}}}\n\n'
+            )
+
+    data = _json_encode(event.model_dump())
     return f"event: {event.type.value}\ndata: {data}\n\n"
+
+
+def _merge_key(event: AGUIEvent) -> Optional[tuple]:
+    """Key under which consecutive deltas may merge; None if not mergeable."""
+    if event.type is not AGUIEventType.DELTA:
+        return None
+    data = event.data
+    if not isinstance(data.get("text"), str) or not data.keys() <= _MERGEABLE_DELTA_KEYS:
+        return None
+    return (event.session_id, data.get("frame"), data.get("channel"))
+
+
+class AGUIDeltaCoalescer:
+    """
+    Merge bursts of text deltas into fewer AGUIEvents.
+
+    A delta is sent at once if nothing was sent within the last `window_ms`, so
+    the first token is never delayed. Later deltas are buffered until the window
+    elapses, the buffer reaches `max_bytes` (UTF-8), or a non-delta event
+    arrives. The merged event keeps the first delta's id and ts.
+
+    Both limits at 0 disables coalescing (every event passes through).
+    """
+
+    def __init__(self, window_ms: float = 0.0, max_bytes: int = 0) -> None:
+        self.window_s = window_ms / 1000.0
+        self.max_bytes = max_bytes
+        self._pending: List[AGUIEvent] = []
+        self._pending_key: Optional[tuple] = None
+        self._pending_bytes = 0
+        self._last_sent = float("-inf")
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.window_s or self.max_bytes)
+
+    def deadline(self) -> Optional[float]:
+        """Monotonic time at which the pending buffer is due, if any."""
+        if not self._pending or not self.window_s:
+            return None
+        return self._last_sent + self.window_s
+
+    def push(self, event: AGUIEvent) -> List[AGUIEvent]:
+        """Feed one event; returns the events ready to send, in order."""
+        if not self.enabled:
+            return [event]
+
+        key = _merge_key(event)
+        if key is None:
+            return self.flush() + [event]
+
+        out: List[AGUIEvent] = []
+        if self._pending and key != self._pending_key:
+            out = self.flush()
+        self._pending.append(event)
+        self._pending_key = key
+        self._pending_bytes += len(event.data["text"].encode("utf-8"))
+
+        now = time.monotonic()
+        if (self.window_s and now - self._last_sent >= self.window_s) or (
+            self.max_bytes and self._pending_bytes >= self.max_bytes
+        ):
+            out.extend(self.flush())
+        return out
+
+    def flush(self) -> List[AGUIEvent]:
+        """Send whatever is buffered as a single delta."""
+        if not self._pending:
+            return []
+        pending = self._pending
+        self._pending = []
+        self._pending_key = None
+        self._pending_bytes = 0
+        self._last_sent = time.monotonic()
+
+        if len(pending) == 1:
+            return pending
+        first = pending[0]
+        data = dict(first.data)
+        data["text"] = "".join(ev.data["text"] for ev in pending)
+        return [first.model_copy(update={"data": data})]
+
+
+async def coalesce_deltas(
+    events: AsyncIterator[AGUIEvent],
+    *,
+    window_ms: float = 0.0,
+    max_bytes: int = 0,
+) -> AsyncIterator[AGUIEvent]:
+    """
+    Apply AGUIDeltaCoalescer to an event stream.
+
+    Buffered text is flushed when its window expires even if the upstream
+    stalls, so coalescing never holds output for longer than `window_ms`.
+    """
+    coalescer = AGUIDeltaCoalescer(window_ms=window_ms, max_bytes=max_bytes)
+    if not coalescer.enabled:
+        async for event in events:
+            yield event
+        return
+
+    iterator = events.__aiter__()
+    next_event: Optional[asyncio.Future] = None
+    try:
+        while True:
+            if next_event is None:
+                next_event = asyncio.ensure_future(iterator.__anext__())
+
+            deadline = coalescer.deadline()
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            done, _ = await asyncio.wait({next_event}, timeout=timeout)
+            if not done:
+                for ready in coalescer.flush():
+                    yield ready
+                continue
+
+            task, next_event = next_event, None
+            try:
+                event = task.result()
+            except StopAsyncIteration:
+                break
+            for ready in coalescer.push(event):
+                yield ready
+
+        for ready in coalescer.flush():
+            yield ready
+    finally:
+        if next_event is not None:
+            next_event.cancel()
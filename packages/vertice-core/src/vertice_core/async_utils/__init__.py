@@ -5,8 +5,9 @@ SCALE & SUSTAIN Phase 3.1 - Async Everywhere.
 
 Provides async wrappers and utilities for:
 - File I/O (aiofiles)
+- Shared line-offset index for range reads
 - Process execution (asyncio subprocess)
-- HTTP requests (httpx)
+- HTTP requests (httpx) on a shared, process-wide connection pool
 - Concurrency utilities (semaphores, retry, timeout)
 
 Author: JuanCS Dev
@@ -22,9 +23,21 @@ from .files import (
     list_dir,
     read_bytes,
     write_bytes,
+    read_lines,
+    count_lines,
+    read_head,
+    write_atomic,
+    LineSlice,
+    LARGE_FILE_THRESHOLD,
     AIOFILES_AVAILABLE,
 )
 
+from .line_index import (
+    FileLineIndex,
+    LineIndexCache,
+    get_line_index_cache,
+)
+
 from .process import (
     run_command,
     run_shell,
@@ -41,6 +54,13 @@ from .http import (
     HTTP_CLIENT,
 )
 
+from .http_clients import (
+    HttpClientManager,
+    HttpPoolConfig,
+    get_http_clients,
+    close_http_clients,
+)
+
 from .utils import (
     run_sync,
     gather_with_limit,
@@ -64,7 +84,17 @@ __all__ = [
     "list_dir",
     "read_bytes",
     "write_bytes",
+    "read_lines",
+    "count_lines",
+    "read_head",
+    "write_atomic",
+    "LineSlice",
+    "LARGE_FILE_THRESHOLD",
     "AIOFILES_AVAILABLE",
+    # Line index
+    "FileLineIndex",
+    "LineIndexCache",
+    "get_line_index_cache",
     # Process
     "run_command",
     "run_shell",
@@ -77,6 +107,10 @@ __all__ = [
     "get",
     "post",
     "HTTP_CLIENT",
+    "HttpClientManager",
+    "HttpPoolConfig",
+    "get_http_clients",
+    "close_http_clients",
     # Utils
     "run_sync",
     "gather_with_limit",
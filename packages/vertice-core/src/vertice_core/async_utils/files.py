@@ -13,7 +13,9 @@ Date: 2025-11-26
 import asyncio
 import json
 from pathlib import Path
-from typing import Any, List, Union
+from typing import Any, List, Optional, Tuple, Union
+
+from .line_index import LineSlice, get_line_index_cache
 
 # Try to import aiofiles, fallback to thread pool
 try:
@@ -177,6 +179,132 @@ async def write_bytes(path: Union[str, Path], data: bytes, create_dirs: bool = T
         await loop.run_in_executor(None, lambda: path.write_bytes(data))
 
 
+# =============================================================================
+# LINE-RANGE READS, PREVIEWS AND ATOMIC WRITES
+# =============================================================================
+
+# Files larger than this are never loaded whole by callers that can preview.
+LARGE_FILE_THRESHOLD = 8 * 1024 * 1024
+
+# Default byte budget for previews of large files.
+PREVIEW_BYTES = 256 * 1024
+
+_atomic_ops: Optional[Any] = None
+
+
+def _read_lines_sync(path: Path, start: int, end: int, encoding: str) -> LineSlice:
+    return get_line_index_cache().get(path).read_lines(start, end, encoding)
+
+
+def _count_lines_sync(path: Path) -> int:
+    return get_line_index_cache().get(path).line_count
+
+
+def _read_head_sync(path: Path, max_bytes: int, encoding: str) -> Tuple[str, bool]:
+    return get_line_index_cache().get(path).read_head(max_bytes, encoding)
+
+
+async def read_lines(
+    path: Union[str, Path], start: int, end: int, encoding: str = "utf-8"
+) -> LineSlice:
+    """
+    Read a 1-indexed, inclusive line range without loading the whole file.
+
+    Uses the shared line-offset index (see ``line_index``), so repeated
+    range reads on the same file slice directly into the requested bytes.
+
+    Args:
+        path: File path
+        start: First line (1-indexed)
+        end: Last line (inclusive)
+        encoding: File encoding (must be ASCII-compatible)
+
+    Returns:
+        LineSlice with the text, number of lines returned and total lines
+    """
+    path = Path(path)
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, _read_lines_sync, path, start, end, encoding)
+
+
+async def count_lines(path: Union[str, Path]) -> int:
+    """
+    Count lines in a file using the cached line-offset index.
+
+    Args:
+        path: File path
+
+    Returns:
+        Number of lines (``str.split("\\n")`` semantics)
+    """
+    path = Path(path)
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, _count_lines_sync, path)
+
+
+async def read_head(
+    path: Union[str, Path], max_bytes: int = PREVIEW_BYTES, encoding: str = "utf-8"
+) -> Tuple[str, bool]:
+    """
+    Read a bounded preview from the start of a file.
+
+    Args:
+        path: File path
+        max_bytes: Maximum number of bytes to read
+        encoding: File encoding
+
+    Returns:
+        Tuple of (preview text, whether the file was truncated)
+    """
+    path = Path(path)
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, _read_head_sync, path, max_bytes, encoding)
+
+
+async def write_atomic(
+    path: Union[str, Path],
+    content: Union[str, bytes],
+    encoding: str = "utf-8",
+    create_dirs: bool = True,
+) -> Any:
+    """
+    Write a file atomically (temp + fsync + rename) off the event loop.
+
+    Delegates to ``core.atomic_ops.AtomicFileOps``; backups are left to the
+    caller so tools keep their own backup policy.
+
+    Args:
+        path: File path
+        content: Content to write
+        encoding: Text encoding (for string content)
+        create_dirs: Create parent directories if needed
+
+    Returns:
+        AtomicResult describing the write
+    """
+    global _atomic_ops
+    if _atomic_ops is None:
+        from ..core.atomic_ops import AtomicFileOps
+
+        _atomic_ops = AtomicFileOps(enable_checkpoints=False, enable_locking=False)
+
+    ops = _atomic_ops
+    loop = asyncio.get_event_loop()
+    result = await loop.run_in_executor(
+        None,
+        lambda: ops.write_atomic(
+            path, content, encoding=encoding, create_dirs=create_dirs, create_backup=False
+        ),
+    )
+    if result.success:
+        # Release the old version's map now rather than on next lookup
+        get_line_index_cache().invalidate(path)
+        from ..core.workspace_snapshot import get_workspace_snapshot
+
+        get_workspace_snapshot().invalidate(path)
+    return result
+
+
 # Sync wrappers for compatibility
 def read_file_sync(path: Union[str, Path], encoding: str = "utf-8") -> str:
     """Sync wrapper for read_file."""
@@ -197,6 +325,13 @@ __all__ = [
     "list_dir",
     "read_bytes",
     "write_bytes",
+    "read_lines",
+    "count_lines",
+    "read_head",
+    "write_atomic",
+    "LineSlice",
+    "LARGE_FILE_THRESHOLD",
+    "PREVIEW_BYTES",
     "read_file_sync",
     "write_file_sync",
     "AIOFILES_AVAILABLE",
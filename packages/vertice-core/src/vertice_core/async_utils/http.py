@@ -3,8 +3,8 @@ Async HTTP Client.
 
 SCALE & SUSTAIN Phase 3.1 - Async Everywhere.
 
-Async HTTP client using httpx with connection pooling.
-Falls back to aiohttp or requests in thread pool if httpx not available.
+Async HTTP client on the shared connection pool (http_clients), using httpx
+or, if httpx is not available, aiohttp. Falls back to requests in a thread pool.
 
 Author: JuanCS Dev
 Date: 2025-11-26
@@ -108,21 +108,20 @@ class HttpClient:
 
     async def _init_client(self) -> None:
         """Initialize the underlying HTTP client."""
+        from .http_clients import get_http_clients
+
+        # Connections come from the shared pool, which sets the limits
         if HTTP_CLIENT == "httpx" and httpx:
-            self._client = httpx.AsyncClient(
+            self._client = get_http_clients().httpx_client(
                 base_url=self.base_url,
                 headers=self.headers,
                 timeout=self.timeout,
-                limits=httpx.Limits(max_connections=self.max_connections),
             )
         elif HTTP_CLIENT == "aiohttp" and aiohttp:
-            connector = aiohttp.TCPConnector(limit=self.max_connections)
-            timeout_obj = aiohttp.ClientTimeout(total=self.timeout)
-            self._client = aiohttp.ClientSession(
+            self._client = get_http_clients().aiohttp_session(
                 base_url=self.base_url if self.base_url else None,
                 headers=self.headers,
-                connector=connector,
-                timeout=timeout_obj,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
             )
 
     async def close(self) -> None:
@@ -0,0 +1,446 @@
+"""
+Shared HTTP Clients.
+
+One process-wide HTTP connection pool for every provider and tool.
+
+httpx clients handed out by the manager share a single transport, so
+connections, TLS sessions and keep-alive are reused across clients with
+different base URLs and headers. aiohttp sessions share one TCPConnector,
+which also caches DNS lookups. Limits are coordinated: a global connection
+cap plus a per-host cap, with requests over the per-host cap queued.
+
+Per host the manager tracks requests, in-flight and peak concurrency,
+saturation (in flight / per-host limit), time spent queued for a
+connection, and how many connections had to be opened.
+
+Usage:
+    clients = get_http_clients()
+    async with clients.httpx_client(base_url="https://api.example.com") as client:
+        response = await client.get("/v1/models")
+
+    async with clients.aiohttp_session(headers={"x-api-key": key}) as session:
+        async with session.get(url) as resp:
+            ...
+
+    await close_http_clients()  # On shutdown: drain in-flight requests, close pools
+
+Closing a client or session returned by the manager only releases that
+client; the pooled connections stay open for the next caller.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Optional
+
+try:
+    import httpx
+except ImportError:  # aiohttp sessions still work without it
+    httpx = None
+
+if TYPE_CHECKING:
+    import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass
+class HttpPoolConfig:
+    """Limits and timeouts for the shared pool."""
+
+    max_connections: int = 100
+    max_connections_per_host: int = 20
+    max_keepalive: int = 40
+    keepalive_expiry: float = 60.0
+    connect_timeout: float = 10.0
+    timeout: float = 30.0  # Default total timeout for new clients
+    dns_cache_ttl: int = 300
+    http2: bool = True  # Used when h2 is installed
+    shutdown_timeout: float = 10.0
+
+
+@dataclass
+class HostStats:
+    """Pool usage for one host."""
+
+    requests: int = 0
+    failures: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    queued: int = 0  # Waiting for a connection right now
+    queued_total: int = 0
+    queue_time: float = 0.0
+    max_queue_time: float = 0.0
+    new_connections: int = 0
+
+    def start(self) -> None:
+        self.requests += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def record_wait(self, seconds: float) -> None:
+        self.queued_total += 1
+        self.queue_time += seconds
+        self.max_queue_time = max(self.max_queue_time, seconds)
+
+    def to_dict(self, limit: int) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "saturation": round(self.in_flight / limit, 3) if limit else 0.0,
+            "queued": self.queued,
+            "queued_total": self.queued_total,
+            "avg_queue_ms": round(self.queue_time / max(1, self.queued_total) * 1000, 3),
+            "max_queue_ms": round(self.max_queue_time * 1000, 3),
+            "new_connections": self.new_connections,
+            "reused_connections": max(0, self.requests - self.failures - self.new_connections),
+        }
+
+
+if httpx is not None:
+
+    class _ReleasingStream(httpx.AsyncByteStream):
+        """Response body that frees its per-host slot once the body is closed."""
+
+        def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+            self._stream = stream
+            self._release = release
+
+        async def __aiter__(self) -> AsyncIterator[bytes]:
+            async for chunk in self._stream:
+                yield chunk
+
+        async def aclose(self) -> None:
+            try:
+                await self._stream.aclose()
+            finally:
+                self._release()
+
+    class _SharedTransport(httpx.AsyncBaseTransport):
+        """Per-client view of the manager's transport; closing it keeps the pool open."""
+
+        def __init__(self, manager: "HttpClientManager"):
+            self._manager = manager
+
+        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+            return await self._manager._send(request)
+
+        async def aclose(self) -> None:
+            pass  # The pool belongs to the manager
+
+
+class HttpClientManager:
+    """
+    Process-wide owner of pooled HTTP connections.
+
+    Pools are bound to the running event loop; if a client is requested
+    from a different loop (e.g. a new ``asyncio.run``), fresh pools are
+    created for it while the statistics carry over. Pools are closed on
+    their own loop: when ``asyncio.run`` shuts that loop down, or, if the
+    manager moves to another loop first, by a close scheduled on the old one.
+    """
+
+    def __init__(self, config: Optional[HttpPoolConfig] = None):
+        self.config = config or HttpPoolConfig()
+        self.http2 = self.config.http2 and HTTP2_AVAILABLE
+        self._stats: Dict[str, HostStats] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._transport: Optional["httpx.AsyncHTTPTransport"] = None
+        self._connector: Optional["aiohttp.TCPConnector"] = None
+        self._trace_config: Optional["aiohttp.TraceConfig"] = None
+        self._shutdown_guard: Optional[AsyncIterator[None]] = None
+        self._gates: Dict[str, asyncio.Semaphore] = {}
+        self._in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._closing = False
+
+    # -- httpx --------------------------------------------------------------
+
+    def httpx_client(self, **kwargs: Any) -> httpx.AsyncClient:
+        """Create an ``httpx.AsyncClient`` (any base_url/headers) on the shared pool."""
+        if httpx is None:
+            raise ImportError("httpx is not installed")
+        kwargs.setdefault(
+            "timeout", httpx.Timeout(self.config.timeout, connect=self.config.connect_timeout)
+        )
+        return httpx.AsyncClient(transport=_SharedTransport(self), **kwargs)
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        if self._closing:
+            raise httpx.ConnectError("HTTP client manager is shutting down", request=request)
+        self._bind_loop()
+        if self._transport is None:
+            self._transport = httpx.AsyncHTTPTransport(
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_keepalive,
+                    keepalive_expiry=self.config.keepalive_expiry,
+                ),
+            )
+        transport = self._transport
+
+        host = request.url.netloc.decode("ascii")
+        stats = self.host_stats(host)
+        gate = self._gates.get(host)
+        if gate is None:
+            gate = self._gates[host] = asyncio.Semaphore(self.config.max_connections_per_host)
+
+        if gate.locked():
+            # Same limit httpx applies to waiting for a pooled connection
+            pool_timeout = request.extensions.get("timeout", {}).get("pool")
+            stats.queued += 1
+            queued_at = time.monotonic()
+            try:
+                await asyncio.wait_for(gate.acquire(), pool_timeout)
+            except asyncio.TimeoutError:
+                stats.failures += 1
+                raise httpx.PoolTimeout(
+                    f"Timed out waiting for a connection to {host}", request=request
+                ) from None
+            finally:
+                stats.queued -= 1
+            stats.record_wait(time.monotonic() - queued_at)
+        else:
+            await gate.acquire()
+
+        self._request_started(stats)
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                gate.release()
+                self._request_finished(stats)
+
+        previous_trace = request.extensions.get("trace")
+
+        async def trace(event: str, info: Dict[str, Any]) -> None:
+            if event == "connection.connect_tcp.complete":
+                stats.new_connections += 1
+            if previous_trace is not None:
+                await previous_trace(event, info)
+
+        request.extensions["trace"] = trace
+        try:
+            response = await transport.handle_async_request(request)
+        except BaseException:
+            stats.failures += 1
+            release()
+            raise
+        response.stream = _ReleasingStream(response.stream, release)
+        return response
+
+    # -- aiohttp ------------------------------------------------------------
+
+    def aiohttp_session(self, **kwargs: Any) -> "aiohttp.ClientSession":
+        """Create an ``aiohttp.ClientSession`` on the shared connector.
+
+        Must be called from a running event loop.
+        """
+        import aiohttp
+
+        self._bind_loop()
+        if self._connector is None or self._connector.closed:
+            self._connector = aiohttp.TCPConnector(
+                limit=self.config.max_connections,
+                limit_per_host=self.config.max_connections_per_host,
+                keepalive_timeout=self.config.keepalive_expiry,
+                ttl_dns_cache=self.config.dns_cache_ttl,
+            )
+        kwargs.setdefault("timeout", aiohttp.ClientTimeout(total=self.config.timeout))
+        kwargs.setdefault("trust_env", True)
+        trace_configs = [self._aiohttp_trace(), *kwargs.pop("trace_configs", [])]
+        return aiohttp.ClientSession(
+            connector=self._connector,
+            connector_owner=False,
+            trace_configs=trace_configs,
+            **kwargs,
+        )
+
+    def _aiohttp_trace(self) -> "aiohttp.TraceConfig":
+        """Trace hooks feeding aiohttp requests into the per-host stats.
+
+        aiohttp reports a request as finished once response headers arrive.
+        """
+        if self._trace_config is not None:
+            return self._trace_config
+        import aiohttp
+
+        async def on_request_start(session, ctx: SimpleNamespace, params) -> None:
+            ctx.stats = self.host_stats(params.url.raw_authority)
+            self._request_started(ctx.stats)
+
+        async def on_request_end(session, ctx: SimpleNamespace, params) -> None:
+            self._request_finished(ctx.stats)
+
+        async def on_request_exception(session, ctx: SimpleNamespace, params) -> None:
+            ctx.stats.failures += 1
+            self._request_finished(ctx.stats)
+
+        async def on_queued_start(session, ctx: SimpleNamespace, params) -> None:
+            ctx.stats.queued += 1
+            ctx.queued_at = time.monotonic()
+
+        async def on_queued_end(session, ctx: SimpleNamespace, params) -> None:
+            ctx.stats.queued -= 1
+            ctx.stats.record_wait(time.monotonic() - ctx.queued_at)
+
+        async def on_connection_created(session, ctx: SimpleNamespace, params) -> None:
+            ctx.stats.new_connections += 1
+
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(on_request_start)
+        trace.on_request_end.append(on_request_end)
+        trace.on_request_exception.append(on_request_exception)
+        trace.on_connection_queued_start.append(on_queued_start)
+        trace.on_connection_queued_end.append(on_queued_end)
+        trace.on_connection_create_end.append(on_connection_created)
+        trace.freeze()
+        self._trace_config = trace
+        return trace
+
+    # -- bookkeeping ----------------------------------------------------------
+
+    def _bind_loop(self) -> None:
+        """Move to the running event loop, retiring pools created on another one."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        if self._loop is not None:
+            logger.debug("Event loop changed; creating new HTTP pools")
+            self._retire_pools(self._loop)
+        self._loop = loop
+        self._transport = None
+        self._connector = None
+        # Started async generators are closed by loop.shutdown_asyncgens()
+        self._shutdown_guard = self._close_on_loop_shutdown(loop)
+        asyncio.ensure_future(self._shutdown_guard.asend(None))
+        self._gates.clear()
+        self._in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._closing = False
+        for stats in self._stats.values():
+            stats.in_flight = stats.queued = 0
+
+    def _retire_pools(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Close the current pools on ``loop``, the loop their connections belong to."""
+        transport, connector = self._transport, self._connector
+        self._transport = self._connector = None
+        if transport is None and connector is None:
+            return
+        if loop.is_closed():
+            # Only reachable if the loop was closed without shutdown_asyncgens()
+            logger.warning("HTTP pools outlived their event loop; sockets close on collection")
+            return
+        asyncio.run_coroutine_threadsafe(self._close_pools(transport, connector), loop)
+
+    async def _close_on_loop_shutdown(self, loop: asyncio.AbstractEventLoop) -> AsyncIterator[None]:
+        """Close the pools while ``loop`` shuts down, if they still belong to it."""
+        try:
+            yield
+        finally:
+            if self._loop is loop:
+                transport, connector = self._transport, self._connector
+                self._transport = self._connector = None
+                self._loop = None
+                await self._close_pools(transport, connector)
+
+    @staticmethod
+    async def _close_pools(
+        transport: Optional["httpx.AsyncHTTPTransport"],
+        connector: Optional["aiohttp.TCPConnector"],
+    ) -> None:
+        if transport is not None:
+            await transport.aclose()
+        if connector is not None:
+            await connector.close()
+
+    def _request_started(self, stats: HostStats) -> None:
+        stats.start()
+        self._in_flight += 1
+        self._idle.clear()
+
+    def _request_finished(self, stats: HostStats) -> None:
+        stats.in_flight -= 1
+        self._in_flight -= 1
+        if self._in_flight <= 0:
+            self._in_flight = 0
+            self._idle.set()
+
+    def host_stats(self, host: str) -> HostStats:
+        """Statistics for ``host`` (``name:port`` when the port is explicit)."""
+        stats = self._stats.get(host)
+        if stats is None:
+            stats = self._stats[host] = HostStats()
+        return stats
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool-wide and per-host statistics."""
+        limit = self.config.max_connections_per_host
+        return {
+            "http2": self.http2,
+            "in_flight": self._in_flight,
+            "hosts": {host: stats.to_dict(limit) for host, stats in self._stats.items()},
+        }
+
+    async def aclose(self, timeout: Optional[float] = None) -> None:
+        """Stop accepting httpx requests, wait for in-flight ones, then close the pools.
+
+        Requests still running after ``timeout`` seconds are cut off.
+        The manager can be used again afterwards; pools are recreated on demand.
+        """
+        self._closing = True
+        timeout = self.config.shutdown_timeout if timeout is None else timeout
+        try:
+            if self._in_flight:
+                await asyncio.wait_for(self._idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Closing HTTP pools with %d requests in flight", self._in_flight)
+        finally:
+            transport, connector = self._transport, self._connector
+            self._transport = self._connector = None
+            self._gates.clear()
+            self._closing = False
+            await self._close_pools(transport, connector)
+
+
+# Global manager instance
+_manager: Optional[HttpClientManager] = None
+
+
+def get_http_clients() -> HttpClientManager:
+    """Get the process-wide HTTP client manager."""
+    global _manager
+    if _manager is None:
+        _manager = HttpClientManager()
+    return _manager
+
+
+async def close_http_clients(timeout: Optional[float] = None) -> None:
+    """Gracefully close the process-wide pools (call on application shutdown)."""
+    if _manager is not None:
+        await _manager.aclose(timeout)
+
+
+__all__ = [
+    "HttpClientManager",
+    "HttpPoolConfig",
+    "HostStats",
+    "HTTP2_AVAILABLE",
+    "get_http_clients",
+    "close_http_clients",
+]
@@ -0,0 +1,362 @@
+"""
+Line-Offset Index Cache.
+
+Process-wide cache of per-file line start offsets, shared by the file tools,
+the TUI file context window and the code chunker.
+
+Each entry is keyed by (path, mtime, size) and holds a compact ``array('Q')``
+of line start byte offsets plus an open descriptor of the file, so any line
+range can be served with one positioned read instead of re-reading and
+re-splitting the whole file. Entries are revalidated against ``os.stat`` on every lookup
+and dropped eagerly when a ``core.file_watcher.FileWatcher`` reports a change.
+
+Usage:
+    index = get_line_index_cache().get("src/app.py")
+    lines = index.read_lines(10, 20)
+
+Author: JuanCS Dev
+Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import weakref
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Union
+
+# Bounds: entries (each holds an open file descriptor) and total offset-array bytes
+DEFAULT_MAX_ENTRIES = 128
+DEFAULT_MAX_INDEX_BYTES = 64 * 1024 * 1024
+
+
+class LineSlice(NamedTuple):
+    """A range of lines read from a file."""
+
+    content: str
+    line_count: int
+    total_lines: int
+
+
+@dataclass
+class LineIndexStats:
+    """Line index cache statistics."""
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Calculate hit rate."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+
+_seek_lock = threading.Lock()
+
+
+def _pread_at(fd: int, length: int, offset: int) -> bytes:
+    if hasattr(os, "pread"):
+        return os.pread(fd, length, offset)
+    with _seek_lock:  # Windows has no pread
+        os.lseek(fd, offset, os.SEEK_SET)
+        return os.read(fd, length)
+
+
+def _pread(fd: int, length: int, offset: int) -> bytes:
+    """Read up to ``length`` bytes at ``offset``; short only at end of file."""
+    chunks = []
+    while length > 0:
+        chunk = _pread_at(fd, length, offset)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        length -= len(chunk)
+        offset += len(chunk)
+    return b"".join(chunks)
+
+
+class FileLineIndex:
+    """
+    Line start offsets and an open file descriptor for one version of a file.
+
+    Line numbering follows ``str.split("\\n")``: a trailing newline yields a
+    final empty line and an empty file has exactly one line.
+
+    Reads are positioned reads on the descriptor, not a memory map: atomic
+    writes replace the inode, so readers keep seeing the version that was
+    indexed, and a file truncated in place yields short reads instead of
+    SIGBUS.
+    """
+
+    __slots__ = ("path", "mtime_ns", "size", "offsets", "_fd", "_closer", "__weakref__")
+
+    def __init__(self, path: Path, mtime_ns: int, size: int) -> None:
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.size = size
+
+        with open(path, "rb") as f:
+            offsets = array("Q", accumulate(map(len, f), initial=0))
+            self._fd = os.dup(f.fileno())
+        self._closer = weakref.finalize(self, os.close, self._fd)
+
+        if len(offsets) > 1 and self._slice(size - 1, size) != b"\n":
+            offsets.pop()
+        self.offsets = offsets
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines (``str.split("\\n")`` semantics)."""
+        return len(self.offsets)
+
+    @property
+    def splitlines_count(self) -> int:
+        """Number of lines as ``str.splitlines()`` counts them.
+
+        Lines end at ``"\\n"`` (so ``"\\r\\n"`` too). Unlike ``str.splitlines()``,
+        a bare ``"\\r"`` or another Unicode line boundary does not end a line.
+        """
+        if self.size == 0 or self.offsets[-1] == self.size:
+            return len(self.offsets) - 1
+        return len(self.offsets)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Bytes held by the offset array."""
+        return self.offsets.itemsize * len(self.offsets)
+
+    def matches(self, st: os.stat_result) -> bool:
+        """Check whether this index still describes the file on disk."""
+        return st.st_mtime_ns == self.mtime_ns and st.st_size == self.size
+
+    def _slice(self, start: int, end: int) -> bytes:
+        if start >= end:
+            return b""
+        return _pread(self._fd, end - start, start)
+
+    def close(self) -> None:
+        """Close the file descriptor (also done when the index is collected)."""
+        self._closer()
+
+    def span(self, first: int, stop: int) -> Tuple[int, int]:
+        """
+        Byte span for 0-indexed lines ``[first, stop)``, newlines included.
+
+        Indices are clamped to the file, like list slicing.
+        """
+        count = len(self.offsets)
+        first = max(0, min(first, count))
+        stop = max(first, min(stop, count))
+        start_byte = self.offsets[first] if first < count else self.size
+        end_byte = self.offsets[stop] if stop < count else self.size
+        return start_byte, end_byte
+
+    def read_span(
+        self, first: int, stop: int, encoding: str = "utf-8", errors: str = "strict"
+    ) -> str:
+        """Text of 0-indexed lines ``[first, stop)`` with line endings kept."""
+        start_byte, end_byte = self.span(first, stop)
+        text = self._slice(start_byte, end_byte).decode(encoding, errors)
+        return text.replace("\r\n", "\n")
+
+    def read_lines(
+        self, start: int, end: int, encoding: str = "utf-8", errors: str = "strict"
+    ) -> LineSlice:
+        """
+        Read a 1-indexed, inclusive line range.
+
+        Selects exactly the lines ``text.split("\\n")[start - 1 : end]`` would.
+        """
+        total = len(self.offsets)
+        selected = range(total)[start - 1 : end]
+        if not selected:
+            return LineSlice("", 0, total)
+
+        first, last = selected[0], selected[-1]
+        start_byte = self.offsets[first]
+        end_byte = self.offsets[last + 1] - 1 if last + 1 < total else self.size
+        text = self._slice(start_byte, end_byte).decode(encoding, errors)
+        return LineSlice(text.replace("\r\n", "\n"), len(selected), total)
+
+    def read_head(self, max_bytes: int, encoding: str = "utf-8") -> Tuple[str, bool]:
+        """Read at most ``max_bytes``, cut back to the last complete line."""
+        if self.size <= max_bytes:
+            return self._slice(0, self.size).decode(encoding, errors="replace"), False
+
+        data = self._slice(0, max_bytes)
+        cut = data.rfind(b"\n")
+        if cut > 0:
+            data = data[:cut]
+        return data.decode(encoding, errors="replace"), True
+
+    def read_text(self, encoding: str = "utf-8", errors: str = "strict") -> str:
+        """Whole file as text (newlines normalized like ``Path.read_text``)."""
+        return self.read_span(0, len(self.offsets), encoding, errors)
+
+
+class LineIndexCache:
+    """
+    LRU cache of FileLineIndex entries keyed by resolved path.
+
+    Thread-safe. Every lookup revalidates (mtime, size), so a stale entry is
+    never served even without a file watcher attached.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_index_bytes: int = DEFAULT_MAX_INDEX_BYTES,
+    ) -> None:
+        self._entries: "OrderedDict[str, FileLineIndex]" = OrderedDict()
+        self._max_entries = max_entries
+        self._max_index_bytes = max_index_bytes
+        self._index_bytes = 0
+        self._mapped_bytes = 0
+        self._lock = threading.Lock()
+        self._stats = LineIndexStats()
+
+    def get(self, path: Union[str, Path]) -> FileLineIndex:
+        """
+        Get the line index for a file, building it on a miss.
+
+        Raises:
+            OSError: If the file cannot be stat'ed or read
+        """
+        path = Path(path)
+        key = str(path.resolve())
+        st = os.stat(key)
+
+        with self._lock:
+            index = self._entries.get(key)
+            if index is not None and index.matches(st):
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return index
+            self._stats.misses += 1
+
+        # Build outside the lock so a large file doesn't stall other readers
+        index = FileLineIndex(Path(key), st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = index
+            self._index_bytes += index.memory_bytes
+            self._mapped_bytes += index.size
+            self._evict()
+        return index
+
+    def peek(self, path: Union[str, Path]) -> Optional[FileLineIndex]:
+        """
+        Return a still-valid cached index without building one on a miss.
+
+        Lets bulk scanners (e.g. the chunker) reuse indexes other paths
+        already built, without flooding the cache with every file they read.
+        """
+        key = str(Path(path).resolve())
+        with self._lock:
+            index = self._entries.get(key)
+        if index is None:
+            return None
+        try:
+            if index.matches(os.stat(key)):
+                return index
+        except OSError:
+            pass
+        return None
+
+    def invalidate(self, path: Union[str, Path]) -> bool:
+        """Drop the entry for a path. Returns True if one was cached."""
+        key = str(Path(path).resolve())
+        with self._lock:
+            removed = self._pop(key)
+            if removed:
+                self._stats.invalidations += 1
+            return removed
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._index_bytes = 0
+            self._mapped_bytes = 0
+
+    def attach_watcher(self, watcher: Any) -> Any:
+        """Invalidate entries from a ``core.file_watcher.FileWatcher``'s batches.
+
+        Returns:
+            The watcher's unsubscribe function
+        """
+        return watcher.subscribe(self._on_file_events)
+
+    def _on_file_events(self, events: Any) -> None:
+        for event in events:
+            self.invalidate(event.path)
+
+    def _pop(self, key: str) -> bool:
+        index = self._entries.pop(key, None)
+        if index is None:
+            return False
+        # Descriptors are closed when the last reader drops its reference
+        self._index_bytes -= index.memory_bytes
+        self._mapped_bytes -= index.size
+        return True
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self._max_entries or self._index_bytes > self._max_index_bytes
+        ):
+            key = next(iter(self._entries))
+            self._pop(key)
+            self._stats.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self._stats.hits,
+                "misses": self._stats.misses,
+                "hit_rate": self._stats.hit_rate,
+                "invalidations": self._stats.invalidations,
+                "evictions": self._stats.evictions,
+                "index_bytes": self._index_bytes,
+                "mapped_bytes": self._mapped_bytes,
+            }
+
+
+# =============================================================================
+# SINGLETON INSTANCE
+# =============================================================================
+
+_line_index_cache: Optional[LineIndexCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_line_index_cache() -> LineIndexCache:
+    """Get or create the process-wide LineIndexCache."""
+    global _line_index_cache
+    if _line_index_cache is None:
+        with _cache_lock:
+            if _line_index_cache is None:
+                _line_index_cache = LineIndexCache()
+    return _line_index_cache
+
+
+__all__ = [
+    "LineSlice",
+    "LineIndexStats",
+    "FileLineIndex",
+    "LineIndexCache",
+    "get_line_index_cache",
+]
@@ -12,7 +12,10 @@ from __future__ import annotations
 import logging
 import os
 from dataclasses import dataclass, field
-from typing import Any, AsyncIterator, Dict, List, Optional, Protocol
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Protocol, Union
+
+if TYPE_CHECKING:
+    from vertice_core.openresponses_stream import StreamEvent
 
 logger = logging.getLogger(__name__)
 
@@ -192,8 +195,9 @@ class VerticeClient:
         self,
         messages: List[Dict[str, str]],
         system_prompt: Optional[str] = None,
+        as_events: bool = False,
         **kwargs: Any,
-    ) -> AsyncIterator[str]:
+    ) -> AsyncIterator[Union[str, "StreamEvent"]]:
         """Stream using Open Responses SSE protocol.
 
         Wraps stream_chat() output with semantic SSE events that can be
@@ -202,10 +206,13 @@ class VerticeClient:
         Args:
             messages: Chat messages
             system_prompt: Optional system prompt
+            as_events: Yield StreamEvent objects instead of SSE text (and no
+                [DONE] marker) for in-process consumers
             **kwargs: Additional kwargs passed to stream_chat
 
         Yields:
-            SSE formatted events following Open Responses spec
+            SSE formatted events following Open Responses spec, or the
+            typed events themselves when as_events is set
         """
         from vertice_core.openresponses_stream import OpenResponsesStreamBuilder
 
@@ -218,15 +225,13 @@ class VerticeClient:
 
         # Emit start events
         builder.start()
-        for event in builder.get_events():
-            yield event.to_sse()
-        builder.clear_events()
+        for event in builder.drain(as_events):
+            yield event
 
         # Add message item
         msg_item = builder.add_message()
-        for event in builder.get_events():
-            yield event.to_sse()
-        builder.clear_events()
+        for event in builder.drain(as_events):
+            yield event
 
         # Stream content and emit text deltas
         # CRITICAL FIX: Extract tools from kwargs and pass explicitly
@@ -236,14 +241,15 @@ class VerticeClient:
                 messages, system_prompt=system_prompt, tools=tools, **kwargs
             ):
                 builder.text_delta(msg_item, chunk)
-                yield builder.get_last_event_sse()
-                builder.clear_events()
+                for event in builder.drain(as_events):
+                    yield event
 
             # Complete successfully
             builder.complete()
-            for event in builder.get_events():
-                yield event.to_sse()
-            yield builder.done()
+            for event in builder.drain(as_events):
+                yield event
+            if not as_events:
+                yield builder.done()
 
         except Exception as e:
             # Emit error event
@@ -254,9 +260,10 @@ class VerticeClient:
                 message=str(e)[:200],
             )
             builder.fail(error)
-            for event in builder.get_events():
-                yield event.to_sse()
-            yield builder.done()
+            for event in builder.drain(as_events):
+                yield event
+            if not as_events:
+                yield builder.done()
 
     async def generate(
         self,
@@ -53,6 +53,7 @@ from .ast import (
     EditResult,
     LanguageConfig,
     ASTEditor,
+    EditSession,
     get_ast_editor,
     LANGUAGE_CONFIGS,
     TREE_SITTER_AVAILABLE,
@@ -98,6 +99,7 @@ __all__ = [
     "EditResult",
     "LanguageConfig",
     "ASTEditor",
+    "EditSession",
     "get_ast_editor",
     "LANGUAGE_CONFIGS",
     "TREE_SITTER_AVAILABLE",
@@ -13,6 +13,10 @@ Usage:
     editor = get_ast_editor()  # Singleton
     matches = editor.find_in_code(content, "my_function", "python")
     result = editor.replace_in_code(content, "old_name", "new_name", "python")
+
+    session = editor.open_session(content, "python", path="app.py")
+    session.replace_in_code("old_name", "new_name")
+    symbols = session.get_symbols()  # incremental reparse
 """
 
 from typing import Optional
@@ -31,6 +35,7 @@ from .languages import (
     TREE_SITTER_AVAILABLE,
 )
 from .editor import ASTEditor
+from .session import EditSession
 
 
 # Singleton instance
@@ -59,5 +64,6 @@ __all__ = [
     "TREE_SITTER_AVAILABLE",
     # Editor
     "ASTEditor",
+    "EditSession",
     "get_ast_editor",
 ]
@@ -21,8 +21,9 @@ from __future__ import annotations
 
 import logging
 import re
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
 from .types import (
     CodeLocation,
@@ -41,8 +42,33 @@ from .languages import (
     Tree,
 )
 
+if TYPE_CHECKING:
+    from .session import EditSession
+
 logger = logging.getLogger(__name__)
 
+# Tree.edit arguments: start/old_end/new_end bytes, then start/old_end/new_end points
+TreeEdit = Tuple[int, int, int, Tuple[int, int], Tuple[int, int], Tuple[int, int]]
+
+
+class _ParsedSource:
+    """Cached parse of one source text; stale trees need an incremental reparse."""
+
+    __slots__ = ("tree", "source", "stale")
+
+    def __init__(self, tree: Tree, source: bytes, stale: bool = False):
+        self.tree = tree
+        self.source = source
+        self.stale = stale
+
+
+def advance_point(point: Tuple[int, int], text: bytes) -> Tuple[int, int]:
+    """Point (row, byte column) reached after inserting text at point."""
+    newlines = text.count(b"\n")
+    if not newlines:
+        return (point[0], point[1] + len(text))
+    return (point[0] + newlines, len(text) - text.rfind(b"\n") - 1)
+
 
 class ASTEditor:
     """
@@ -54,16 +80,26 @@ class ASTEditor:
     - find_symbol: Find function/class/variable definitions
     - get_symbols: Extract all symbols from file
 
+    Parse trees are cached by language and content, so repeated queries on
+    the same text parse once. replace_in_code hands its edits to the cache,
+    and the edited text is then reparsed incrementally. For a series of edits
+    to one file, open_session() keeps a tree in sync via Tree.edit.
+
     Usage:
         editor = ASTEditor()
         matches = editor.find_in_code(content, "my_function", "python")
         result = editor.replace_in_code(content, "old_name", "new_name", "python")
     """
 
+    # Parse trees kept for recently seen (language, content) pairs
+    PARSE_CACHE_SIZE = 32
+
     def __init__(self):
         """Initialize AST editor."""
         self._parsers: Dict[str, Parser] = {}
-        self._trees: Dict[str, Tree] = {}
+        self._parse_cache: OrderedDict[Tuple[str, str], _ParsedSource] = OrderedDict()
+        self._sessions: Dict[str, "EditSession"] = {}
+        self._parse_stats = {"full_parses": 0, "incremental_parses": 0, "cache_hits": 0}
 
         if TREE_SITTER_AVAILABLE:
             for lang, grammar in LANGUAGE_GRAMMARS.items():
@@ -89,6 +125,16 @@ class ASTEditor:
 
     def _parse(self, content: str, language: str) -> Optional[Tree]:
         """Parse content into AST."""
+        parsed = self._parse_source(content, language)
+        return parsed[0] if parsed else None
+
+    def _parse_source(self, content: str, language: str) -> Optional[Tuple[Tree, bytes]]:
+        """
+        Parse content, returning the tree and its UTF-8 source.
+
+        Served from the parse cache when possible; the returned tree is
+        shared and must not be edited (copy() it first).
+        """
         if not TREE_SITTER_AVAILABLE:
             return None
 
@@ -96,7 +142,35 @@ class ASTEditor:
         if not parser:
             return None
 
-        return parser.parse(content.encode("utf-8"))
+        key = (language, content)
+        entry = self._parse_cache.get(key)
+        if entry is not None:
+            self._parse_cache.move_to_end(key)
+            if entry.stale:
+                entry.tree = parser.parse(entry.source, entry.tree)
+                entry.stale = False
+                self._parse_stats["incremental_parses"] += 1
+            else:
+                self._parse_stats["cache_hits"] += 1
+            return entry.tree, entry.source
+
+        source = content.encode("utf-8")
+        tree = parser.parse(source)
+        self._parse_stats["full_parses"] += 1
+        self._cache_tree(language, content, tree, source)
+        return tree, source
+
+    def _cache_tree(
+        self, language: str, content: str, tree: Tree, source: bytes, stale: bool = False
+    ) -> None:
+        """Remember a parse (or an edited tree awaiting reparse) for content."""
+        if self.PARSE_CACHE_SIZE <= 0:
+            return
+
+        self._parse_cache[(language, content)] = _ParsedSource(tree, source, stale)
+        self._parse_cache.move_to_end((language, content))
+        while len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
 
     def _walk_tree(self, node: Node) -> Iterator[Node]:
         """Walk all nodes in the tree."""
@@ -171,55 +245,83 @@ class ASTEditor:
         case_sensitive: bool = True,
     ) -> List[CodeMatch]:
         """Find text occurrences only in actual code."""
+        parsed = self._parse_source(content, language)
+
+        if parsed:
+            tree, content_bytes = parsed
+            return self._find_in_tree(
+                tree,
+                content_bytes,
+                content,
+                search,
+                language,
+                include_strings,
+                include_comments,
+                case_sensitive,
+            )
+
+        return self._fallback_find(
+            content,
+            search,
+            language,
+            include_strings,
+            include_comments,
+            case_sensitive,
+        )
+
+    def _find_in_tree(
+        self,
+        tree: Tree,
+        content_bytes: bytes,
+        content: str,
+        search: str,
+        language: str,
+        include_strings: bool,
+        include_comments: bool,
+        case_sensitive: bool,
+    ) -> List[CodeMatch]:
+        """Find text occurrences in a parsed tree (pre-order, like _walk_tree)."""
         matches: List[CodeMatch] = []
         lines = content.split("\n")
+        search_lower = search.lower()
 
-        tree = self._parse(content, language)
+        stack = [tree.root_node]
+        while stack:
+            node = stack.pop()
+            node_text = self._get_text(node, content_bytes)
 
-        if tree:
-            content_bytes = content.encode("utf-8")
+            # A node's descendants cover a slice of its text, so a subtree
+            # without the search text can be skipped whole
+            if case_sensitive:
+                if search not in node_text:
+                    continue
+            else:
+                if search_lower not in node_text.lower():
+                    continue
 
-            for node in self._walk_tree(tree.root_node):
-                node_text = self._get_text(node, content_bytes)
+            stack.extend(reversed(node.children))
 
-                if case_sensitive:
-                    if search not in node_text:
-                        continue
-                else:
-                    if search.lower() not in node_text.lower():
-                        continue
+            context = self._get_node_context(node, language)
 
-                context = self._get_node_context(node, language)
+            if context == NodeContext.STRING and not include_strings:
+                continue
+            if context == NodeContext.COMMENT and not include_comments:
+                continue
 
-                if context == NodeContext.STRING and not include_strings:
-                    continue
-                if context == NodeContext.COMMENT and not include_comments:
-                    continue
+            if node.child_count == 0 or node_text == search:
+                location = self._node_to_location(node)
+                line_text = lines[location.line - 1] if location.line <= len(lines) else ""
 
-                if node.child_count == 0 or node_text == search:
-                    location = self._node_to_location(node)
-                    line_text = lines[location.line - 1] if location.line <= len(lines) else ""
-
-                    matches.append(
-                        CodeMatch(
-                            text=node_text,
-                            location=location,
-                            context=context,
-                            node_type=node.type,
-                            parent_type=node.parent.type if node.parent else "",
-                            full_line=line_text,
-                        )
+                matches.append(
+                    CodeMatch(
+                        text=node_text,
+                        location=location,
+                        context=context,
+                        node_type=node.type,
+                        parent_type=node.parent.type if node.parent else "",
+                        full_line=line_text,
                     )
-
-        else:
-            matches = self._fallback_find(
-                content,
-                search,
-                language,
-                include_strings,
-                include_comments,
-                case_sensitive,
-            )
+                )
 
         return matches
 
@@ -298,12 +400,61 @@ class ASTEditor:
         if old_text == new_text:
             return EditResult(success=True, content=content, changes_made=0)
 
-        matches = self.find_in_code(content, old_text, language, include_strings, include_comments)
+        parsed = self._parse_source(content, language)
+        if parsed:
+            matches = self._find_in_tree(
+                parsed[0],
+                parsed[1],
+                content,
+                old_text,
+                language,
+                include_strings,
+                include_comments,
+                case_sensitive=True,
+            )
+        else:
+            matches = self.find_in_code(
+                content, old_text, language, include_strings, include_comments
+            )
 
         if not matches:
             return EditResult(success=True, content=content, changes_made=0)
 
-        matches.sort(
+        new_content, locations_changed, edits = self._apply_replacements(
+            content, matches, old_text, new_text, max_replacements
+        )
+
+        # Hand the edits to the cache: the next query on new_content
+        # reparses incrementally instead of from scratch
+        if parsed and edits:
+            tree = parsed[0].copy()
+            for edit in edits:
+                tree.edit(*edit)
+            self._cache_tree(language, new_content, tree, new_content.encode("utf-8"), stale=True)
+
+        return EditResult(
+            success=True,
+            content=new_content,
+            changes_made=len(locations_changed),
+            locations_changed=locations_changed,
+        )
+
+    def _apply_replacements(
+        self,
+        content: str,
+        matches: List[CodeMatch],
+        old_text: str,
+        new_text: str,
+        max_replacements: int = 0,
+    ) -> Tuple[str, List[CodeLocation], List[TreeEdit]]:
+        """
+        Replace old_text at each match, last match first.
+
+        Returns the new content, the changed locations and the matching
+        Tree.edit arguments, in the order they must be applied.
+        """
+        matches = sorted(
+            matches,
             key=lambda m: (m.location.line, m.location.column),
             reverse=True,
         )
@@ -313,6 +464,12 @@ class ASTEditor:
 
         lines = content.split("\n")
         locations_changed: List[CodeLocation] = []
+        edits: List[TreeEdit] = []
+        new_bytes = new_text.encode("utf-8")
+
+        line_starts = [0]
+        for line in lines[:-1]:
+            line_starts.append(line_starts[-1] + len(line.encode("utf-8")) + 1)
 
         for match in matches:
             line_idx = match.location.line - 1
@@ -324,14 +481,23 @@ class ASTEditor:
                 lines[line_idx] = line[:col_start] + new_text + line[col_end:]
                 locations_changed.append(match.location)
 
-        new_content = "\n".join(lines)
+                # Later matches were applied first, so this prefix is untouched
+                start_column = len(line[:col_start].encode("utf-8"))
+                removed = len(line[col_start:col_end].encode("utf-8"))
+                start_byte = line_starts[line_idx] + start_column
+                start_point = (line_idx, start_column)
+                edits.append(
+                    (
+                        start_byte,
+                        start_byte + removed,
+                        start_byte + len(new_bytes),
+                        start_point,
+                        (line_idx, start_column + removed),
+                        advance_point(start_point, new_bytes),
+                    )
+                )
 
-        return EditResult(
-            success=True,
-            content=new_content,
-            changes_made=len(locations_changed),
-            locations_changed=locations_changed,
-        )
+        return "\n".join(lines), locations_changed, edits
 
     # =========================================================================
     # Public API - Symbol Extraction
@@ -364,12 +530,24 @@ class ASTEditor:
         tree = self._parse(content, language)
 
         if tree is None:
-            if language == "python":
-                try:
-                    compile(content, "<string>", "exec")
-                    return True, None
-                except SyntaxError as e:
-                    return False, f"Line {e.lineno}: {e.msg}"
+            return self._fallback_syntax_check(content, language)
+
+        return self._check_tree_syntax(tree)
+
+    def _fallback_syntax_check(self, content: str, language: str) -> Tuple[bool, Optional[str]]:
+        """Syntax check without tree-sitter."""
+        if language == "python":
+            try:
+                compile(content, "<string>", "exec")
+                return True, None
+            except SyntaxError as e:
+                return False, f"Line {e.lineno}: {e.msg}"
+        return True, None
+
+    def _check_tree_syntax(self, tree: Tree) -> Tuple[bool, Optional[str]]:
+        """Report the first ERROR or missing node of a parsed tree."""
+        # has_error covers the whole subtree; error-free trees skip the walk
+        if not tree.root_node.has_error:
             return True, None
 
         def has_error(node: Node) -> Optional[str]:
@@ -378,6 +556,8 @@ class ASTEditor:
                 return f"Syntax error at line {line}"
 
             for child in node.children:
+                if not child.has_error:
+                    continue
                 error = has_error(child)
                 if error:
                     return error
@@ -391,12 +571,17 @@ class ASTEditor:
         self, content: str, line: int, column: int, language: str
     ) -> Optional[Dict[str, Any]]:
         """Get AST node information at position."""
-        tree = self._parse(content, language)
-        if not tree:
+        parsed = self._parse_source(content, language)
+        if not parsed:
             return None
 
-        content_bytes = content.encode("utf-8")
+        tree, content_bytes = parsed
+        return self._node_info_at(tree, content_bytes, line, column, language)
 
+    def _node_info_at(
+        self, tree: Tree, content_bytes: bytes, line: int, column: int, language: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get node information at a position of a parsed tree."""
         point = (line - 1, column - 1)
         node = tree.root_node.descendant_for_point_range(point, point)
 
@@ -413,6 +598,55 @@ class ASTEditor:
             "parent_type": node.parent.type if node.parent else None,
         }
 
+    # =========================================================================
+    # Public API - Edit Sessions
+    # =========================================================================
+
+    def open_session(
+        self, content: str, language: str, path: Optional[str] = None
+    ) -> "EditSession":
+        """
+        Start (or resume) an edit session that reparses incrementally.
+
+        Args:
+            content: Current file content
+            language: Language name or filepath
+            path: Optional key; an open session for the same path and
+                content is returned instead of a new one
+
+        Returns:
+            EditSession for the content
+        """
+        from .session import EditSession
+
+        language = self._get_language(language) or language
+        if path is not None:
+            session = self._sessions.get(path)
+            if session and session.language == language and session.content == content:
+                return session
+
+        session = EditSession(self, content, language, path)
+        if path is not None:
+            self._sessions[path] = session
+        return session
+
+    def close_session(self, path: str) -> None:
+        """Forget the edit session kept for path."""
+        self._sessions.pop(path, None)
+
+    def get_parse_stats(self) -> Dict[str, int]:
+        """Get parse counts (full, incremental, cache hits) and cache size."""
+        return {
+            **self._parse_stats,
+            "cached_trees": len(self._parse_cache),
+            "sessions": len(self._sessions),
+        }
+
+    def clear_cache(self) -> None:
+        """Drop cached parse trees and edit sessions."""
+        self._parse_cache.clear()
+        self._sessions.clear()
+
     # =========================================================================
     # Utility Methods
     # =========================================================================
@@ -0,0 +1,251 @@
+"""
+Edit Sessions - Incremental Re-parsing Across a Series of Edits.
+
+An EditSession owns one file's text and parse tree. Each edit is applied to
+the text and described to the tree with Tree.edit; the next query reparses
+incrementally, reusing every subtree the edit didn't touch.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .types import CodeMatch, CodeSymbol, EditResult
+from .languages import Tree
+from .editor import advance_point
+
+if TYPE_CHECKING:
+    from .editor import ASTEditor
+
+
+class EditSession:
+    """
+    One file's content and parse tree, kept in sync across edits.
+
+    Queries are answered from the session's tree. Without tree-sitter (or
+    for languages without a grammar) they fall back to the editor's
+    stateless methods on the current content.
+
+    Usage:
+        session = editor.open_session(content, "python", path="app.py")
+        session.replace_in_code("old_name", "new_name")
+        session.edit(start, end, "text")
+        ok, error = session.is_valid_syntax()
+        new_content = session.content
+    """
+
+    def __init__(
+        self,
+        editor: "ASTEditor",
+        content: str,
+        language: str,
+        path: Optional[str] = None,
+    ):
+        """
+        Initialize session.
+
+        Args:
+            editor: Editor providing parsers and query helpers
+            content: Initial content
+            language: Language name
+            path: Optional file path the session belongs to
+        """
+        self._editor = editor
+        self.language = language
+        self.path = path
+        self._content = content
+        self._source = b""
+        self._tree: Optional[Tree] = None
+        self._stale = False
+
+        self.edit_count = 0
+        self.incremental_parses = 0
+
+        parsed = editor._parse_source(content, language)
+        if parsed:
+            # Cached trees are shared; this one will be edited
+            self._tree = parsed[0].copy()
+            self._source = parsed[1]
+
+    @property
+    def content(self) -> str:
+        """Current content, with every edit applied."""
+        return self._content
+
+    @property
+    def tree(self) -> Optional[Tree]:
+        """Current parse tree (reparsed incrementally after edits)."""
+        if self._tree is not None and self._stale:
+            parser = self._editor._parsers[self.language]
+            self._tree = parser.parse(self._source, self._tree)
+            self._stale = False
+            self.incremental_parses += 1
+            self._editor._parse_stats["incremental_parses"] += 1
+            self._editor._cache_tree(self.language, self._content, self._tree.copy(), self._source)
+        return self._tree
+
+    # =========================================================================
+    # Editing
+    # =========================================================================
+
+    def edit(self, start: int, end: int, new_text: str) -> None:
+        """
+        Replace content[start:end] with new_text.
+
+        Args:
+            start: Start character offset
+            end: End character offset (exclusive)
+            new_text: Replacement text
+        """
+        content = self._content
+        if not 0 <= start <= end <= len(content):
+            raise ValueError(f"Invalid edit range {start}:{end} for {len(content)} characters")
+
+        self._content = content[:start] + new_text + content[end:]
+        self.edit_count += 1
+
+        if self._tree is None:
+            return
+
+        start_byte, start_point = self._byte_position(content, start)
+        old_end_byte, old_end_point = self._byte_position(content, end)
+        new_bytes = new_text.encode("utf-8")
+
+        self._apply_tree_edit(
+            (
+                start_byte,
+                old_end_byte,
+                start_byte + len(new_bytes),
+                start_point,
+                old_end_point,
+                advance_point(start_point, new_bytes),
+            ),
+            new_bytes,
+        )
+
+    def replace_in_code(
+        self,
+        old_text: str,
+        new_text: str,
+        include_strings: bool = False,
+        include_comments: bool = False,
+        max_replacements: int = 0,
+    ) -> EditResult:
+        """Replace text only in actual code, updating the session."""
+        if old_text == new_text:
+            return EditResult(success=True, content=self._content, changes_made=0)
+
+        matches = self.find_in_code(old_text, include_strings, include_comments)
+
+        if not matches:
+            return EditResult(success=True, content=self._content, changes_made=0)
+
+        new_content, locations_changed, edits = self._editor._apply_replacements(
+            self._content, matches, old_text, new_text, max_replacements
+        )
+
+        self._content = new_content
+        self.edit_count += len(edits)
+        if self._tree is not None:
+            for tree_edit in edits:
+                self._tree.edit(*tree_edit)
+            self._source = new_content.encode("utf-8")
+            self._stale = True
+
+        return EditResult(
+            success=True,
+            content=new_content,
+            changes_made=len(locations_changed),
+            locations_changed=locations_changed,
+        )
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def find_in_code(
+        self,
+        search: str,
+        include_strings: bool = False,
+        include_comments: bool = False,
+        case_sensitive: bool = True,
+    ) -> List[CodeMatch]:
+        """Find text occurrences only in actual code."""
+        tree = self.tree
+        if tree is None:
+            return self._editor.find_in_code(
+                self._content,
+                search,
+                self.language,
+                include_strings,
+                include_comments,
+                case_sensitive,
+            )
+
+        return self._editor._find_in_tree(
+            tree,
+            self._source,
+            self._content,
+            search,
+            self.language,
+            include_strings,
+            include_comments,
+            case_sensitive,
+        )
+
+    def get_symbols(self) -> List[CodeSymbol]:
+        """Extract all symbols from the current content."""
+        from . import symbols as sym
+
+        tree = self.tree
+        if tree is None:
+            return sym.get_symbols(self._editor, self._content, self.language)
+
+        return sym.symbols_from_tree(self._editor, tree, self._source, self.language)
+
+    def find_symbol(
+        self, symbol_name: str, symbol_type: Optional[str] = None
+    ) -> Optional[CodeSymbol]:
+        """Find a specific symbol by name."""
+        from . import symbols as sym
+
+        return sym.select_symbol(self.get_symbols(), symbol_name, symbol_type)
+
+    def is_valid_syntax(self) -> Tuple[bool, Optional[str]]:
+        """Check if the current content has valid syntax."""
+        tree = self.tree
+        if tree is None:
+            return self._editor._fallback_syntax_check(self._content, self.language)
+
+        return self._editor._check_tree_syntax(tree)
+
+    def get_node_at_position(self, line: int, column: int) -> Optional[Dict[str, Any]]:
+        """Get AST node information at position."""
+        tree = self.tree
+        if tree is None:
+            return None
+
+        return self._editor._node_info_at(tree, self._source, line, column, self.language)
+
+    # =========================================================================
+    # Internal
+    # =========================================================================
+
+    def _apply_tree_edit(
+        self,
+        tree_edit: Tuple[int, int, int, Tuple[int, int], Tuple[int, int], Tuple[int, int]],
+        new_bytes: bytes,
+    ) -> None:
+        """Splice new_bytes into the source and describe the edit to the tree."""
+        start_byte, old_end_byte = tree_edit[0], tree_edit[1]
+        self._source = self._source[:start_byte] + new_bytes + self._source[old_end_byte:]
+        self._tree.edit(*tree_edit)
+        self._stale = True
+
+    @staticmethod
+    def _byte_position(content: str, offset: int) -> Tuple[int, Tuple[int, int]]:
+        """Byte offset and (row, byte column) point of a character offset."""
+        prefix = content[:offset]
+        line_start = prefix.rfind("\n") + 1
+        column = len(prefix[line_start:].encode("utf-8"))
+        return len(prefix.encode("utf-8")), (prefix.count("\n"), column)
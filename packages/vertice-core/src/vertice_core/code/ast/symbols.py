@@ -10,7 +10,7 @@ import re
 from typing import TYPE_CHECKING, List, Optional
 
 from .types import CodeLocation, CodeSymbol
-from .languages import LANGUAGE_CONFIGS, Node
+from .languages import LANGUAGE_CONFIGS, Node, Tree
 
 if TYPE_CHECKING:
     from .editor import ASTEditor
@@ -18,19 +18,28 @@ if TYPE_CHECKING:
 
 def get_symbols(editor: "ASTEditor", content: str, language: str) -> List[CodeSymbol]:
     """Extract all symbols (functions, classes, etc.) from code."""
+    if language not in LANGUAGE_CONFIGS:
+        return []
+
+    parsed = editor._parse_source(content, language)
+
+    if not parsed:
+        return fallback_get_symbols(content, language)
+
+    tree, content_bytes = parsed
+    return symbols_from_tree(editor, tree, content_bytes, language)
+
+
+def symbols_from_tree(
+    editor: "ASTEditor", tree: "Tree", content_bytes: bytes, language: str
+) -> List[CodeSymbol]:
+    """Extract all symbols from an already parsed tree."""
     symbols: List[CodeSymbol] = []
     config = LANGUAGE_CONFIGS.get(language)
 
     if not config:
         return symbols
 
-    tree = editor._parse(content, language)
-
-    if not tree:
-        return fallback_get_symbols(content, language)
-
-    content_bytes = content.encode("utf-8")
-
     def extract_symbols(node: Node, parent_name: Optional[str] = None):
         node_type = node.type
 
@@ -156,8 +165,13 @@ def find_symbol(
     symbol_type: Optional[str] = None,
 ) -> Optional[CodeSymbol]:
     """Find a specific symbol by name."""
-    symbols = get_symbols(editor, content, language)
+    return select_symbol(get_symbols(editor, content, language), symbol_name, symbol_type)
+
 
+def select_symbol(
+    symbols: List[CodeSymbol], symbol_name: str, symbol_type: Optional[str] = None
+) -> Optional[CodeSymbol]:
+    """First symbol with the given name (and type, if given)."""
     for symbol in symbols:
         if symbol.name == symbol_name:
             if symbol_type is None or symbol.symbol_type == symbol_type:
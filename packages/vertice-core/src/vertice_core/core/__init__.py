@@ -10,8 +10,10 @@ CRITICAL FEATURES:
 """
 
 import datetime
+import importlib
+import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 # Temporal Consciousness - Always know the current spacetime coordinates
@@ -175,35 +177,303 @@ __all__ = [
     "insights_collector",
 ]
 
-from .types import *
-from .exceptions import *
-from .config import *
-from .logging_setup import *
-from .validation import *
-
-# PERFORMANCE OPTIMIZATION (Jan 2026):
-# Lazy load providers to avoid ~1.5s import of google.cloud.aiplatform
-# Use: from vertice_core.providers import VertexAIProvider
-# from .providers import *  # DISABLED - causes 1.5s startup delay
-
-from .governance_pipeline import *
-from .observability import *
-from .input_enhancer import *
-from .intent_classifier import *
-from .complexity_analyzer import *
-
-# from .single_shot import *  # FIXME: Circular import
-from .request_amplifier import *
-from .defense import *
-from .prompt_shield import *
-from .context_tracker import *
-from .help_system import *
-from .session_manager import *
-from .parser import *
-from .error_presenter import *
-from .guardrails import *
-from .integration_types import *
-from .integration_coordinator import *
-
-# from .maestro_governance import *  # FIXME: Module not found
-from .error_utils import *
+# Names re-exported from submodules with ``from module import *`` semantics,
+# imported on first access instead of eagerly: importing any
+# ``vertice_core.core.<module>`` used to load the governance, observability and
+# integration stacks through this package. Later modules shadow earlier ones,
+# as the star imports did; names that are also submodules resolve to those.
+# .providers stays out (~1.5s import of google.cloud.aiplatform); .single_shot
+# (FIXME: circular import) and .maestro_governance (missing) remain disabled.
+_STAR_EXPORTS: dict[str, tuple[str, ...]] = {
+    ".types": (
+        "T",
+        "T_co",
+        "T_contra",
+        "MessageRole",
+        "ErrorCategory",
+        "WorkflowState",
+        "FilePath",
+        "FileContent",
+        "FileEncoding",
+        "MessageList",
+        "ProgressCallback",
+        "ErrorCallback",
+        "TokenCallback",
+        "ModelInfo",
+        "Message",
+        "ToolParameter",
+        "ToolDefinition",
+        "ToolCall",
+        "ToolResult",
+        "FileEdit",
+        "FileOperation",
+        "ContextEntry",
+        "SessionState",
+        "ErrorInfo",
+        "RecoveryStrategy",
+        "GenerationConfig",
+        "TokenUsage",
+        "LLMResponse",
+        "ValidationRule",
+        "ValidationResult",
+        "WorkflowStep",
+        "WorkflowDefinition",
+        "WorkflowExecution",
+        "ProviderConfig",
+        "AppConfig",
+        "Serializable",
+        "Validatable",
+        "AsyncExecutable",
+        "Streamable",
+        "CodeSpan",
+        "DiffHunk",
+        "is_message",
+        "is_message_list",
+        "is_file_path",
+    ),
+    ".exceptions": (
+        "VerticeError",
+        "QwenError",
+        "ErrorContext",
+        "SyntaxError",
+        "ImportError",
+        "TypeError",
+        "RuntimeError",
+        "FileNotFoundError",
+        "PermissionError",
+        "FileAlreadyExistsError",
+        "NetworkError",
+        "TimeoutError",
+        "RateLimitError",
+        "ResourceError",
+        "TokenLimitError",
+        "MemoryLimitError",
+        "ValidationError",
+        "ConfigurationError",
+        "LLMError",
+        "LLMValidationError",
+        "ToolError",
+        "ToolNotFoundError",
+    ),
+    ".config": ("load_env", "Config"),
+    ".logging_setup": ("setup_logging",),
+    ".validation": (
+        "ValidationLayer",
+        "InjectionType",
+        "ValidationResult",
+        "Required",
+        "TypeCheck",
+        "InputValidator",
+        "validate_command",
+        "validate_file_path",
+        "validate_prompt",
+        "is_safe_command",
+        "is_safe_path",
+    ),
+    ".governance_pipeline": (
+        "AgentTask",
+        "AgentResponse",
+        "get_tracer",
+        "trace_operation",
+        "enforce_permission",
+        "AgentPermission",
+        "tracer",
+        "GovernancePipeline",
+    ),
+    ".observability": (
+        "OTEL_AVAILABLE",
+        "DummySpan",
+        "DummyTracer",
+        "setup_observability",
+        "get_tracer",
+        "trace_operation",
+        "trace_agent_execution",
+        "ObservabilityContext",
+        "get_status_code",
+    ),
+    ".input_enhancer": (
+        "InputType",
+        "CodeBlock",
+        "CodeExtraction",
+        "EnhancedInput",
+        "TypoCorrection",
+        "InputEnhancer",
+        "get_input_enhancer",
+        "enhance_input",
+        "extract_code_blocks",
+        "clean_repl_paste",
+        "suggest_correction",
+    ),
+    ".intent_classifier": (
+        "normalize_text",
+        "Intent",
+        "IntentResult",
+        "SemanticIntentClassifier",
+        "get_classifier",
+        "classify_intent",
+    ),
+    ".complexity_analyzer": (
+        "Intent",
+        "ComplexityAnalysis",
+        "ComplexityAnalyzer",
+        "analyze_complexity",
+    ),
+    ".request_amplifier": (
+        "SemanticIntentClassifier",
+        "AmplifiedRequest",
+        "RequestAmplifier",
+        "amplify_request",
+    ),
+    ".defense": (
+        "InjectionDetection",
+        "PromptInjectionDefender",
+        "AutoCritic",
+        "ContextCompactor",
+        "DefenseResult",
+        "PromptDefense",
+    ),
+    ".prompt_shield": (
+        "ThreatLevel",
+        "InjectionType",
+        "ShieldResult",
+        "PromptShield",
+        "analyze_prompt",
+        "is_prompt_safe",
+        "sanitize_prompt",
+        "wrap_file_content",
+    ),
+    ".context_tracker": (
+        "ContextType",
+        "ReferenceType",
+        "ContextItem",
+        "ResolvedReference",
+        "ContextTracker",
+        "get_context_tracker",
+        "record_file",
+        "resolve_reference",
+        "get_recent_files",
+    ),
+    ".help_system": ("HelpSystem",),
+    ".session_manager": (
+        "SessionState",
+        "ConversationMessage",
+        "SessionSnapshot",
+        "SessionInfo",
+        "SessionSearchHit",
+        "SessionManager",
+        "SessionCatalog",
+        "get_session_manager",
+        "start_session",
+        "resume_session",
+        "add_message",
+        "save_session",
+        "end_session",
+    ),
+    ".parser": (
+        "JSONDict",
+        "ToolDefinition",
+        "ParseStrategy",
+        "ToolCall",
+        "ParserStats",
+        "ParseResult",
+        "ResponseParser",
+    ),
+    ".error_presenter": (
+        "AudienceLevel",
+        "ErrorCategory",
+        "ErrorExplanation",
+        "PresentedError",
+        "ErrorPresenter",
+        "present_error",
+        "explain_error",
+        "get_error_suggestions",
+        "format_error_terminal",
+    ),
+    ".guardrails": (
+        "SafetyLevel",
+        "SafetyViolation",
+        "SafetyResult",
+        "InputGuardrail",
+        "OutputGuardrail",
+        "AISafetyGuardrails",
+        "get_ai_safety_guardrails",
+    ),
+    ".integration_types": (
+        "RichContext",
+        "IntentType",
+        "Intent",
+        "AgentResponse",
+        "AgentInvoker",
+        "ToolCategory",
+        "ToolDefinition",
+        "ToolExecutionResult",
+        "context_to_prompt_string",
+        "EventType",
+        "Event",
+        "EventHandler",
+        "EventBus",
+        "ToastConfig",
+        "ProgressConfig",
+        "IntegrationCoordinator",
+    ),
+    ".integration_coordinator": (
+        "RichContext",
+        "AgentInvoker",
+        "Event",
+        "EventBus",
+        "EventHandler",
+        "EventType",
+        "Intent",
+        "IntentType",
+        "ToolDefinition",
+        "ToolExecutionResult",
+        "SimpleEventBus",
+        "Coordinator",
+    ),
+    ".error_utils": (
+        "log_error",
+        "log_warning",
+        "log_retry",
+        "format_error_for_user",
+        "create_error_result",
+        "is_retryable_error",
+        "ErrorContext",
+    ),
+}
+
+_LAZY_IMPORTS: dict[str, str] = {
+    name: module_path for module_path, names in _STAR_EXPORTS.items() for name in names
+}
+_submodules: Optional[frozenset[str]] = None
+
+
+def _submodule_names() -> frozenset[str]:
+    """Modules and subpackages of this package, listed once."""
+    global _submodules
+    if _submodules is None:
+        names = set()
+        for directory in __path__:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".py"):
+                        names.add(entry.name[:-3])
+                    elif os.path.isfile(os.path.join(entry.path, "__init__.py")):
+                        names.add(entry.name)
+        names.discard("__init__")
+        _submodules = frozenset(names)
+    return _submodules
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is not None:
+        value = getattr(importlib.import_module(module_path, __name__), name)
+        globals()[name] = value
+        return value
+    if name in _submodule_names():
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -7,7 +7,7 @@ Addresses: ISSUE-002, ISSUE-004, ISSUE-057, ISSUE-058, ISSUE-066
 Implements atomic file operations:
 - Write-to-temp + rename pattern
 - fsync for durability
-- Rollback on failure
+- Rollback on failure (backups kept as deduplicated, delta-encoded blobs)
 - File locking for concurrent access
 - Checksum verification
 
@@ -27,16 +27,20 @@ from __future__ import annotations
 
 import os
 import hashlib
+import secrets
+import stat
 import tempfile
 import shutil
 import time
-from typing import Any, Callable, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 from pathlib import Path
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from contextlib import contextmanager
 import logging
 
+from .blob_store import BlobStore, get_blob_store
+
 # Try to import filelock, graceful degradation if not available
 try:
     from filelock import FileLock, Timeout as LockTimeout
@@ -68,6 +72,7 @@ class OperationCheckpoint:
     op_type: AtomicOpType
     target_path: str
     backup_path: Optional[str] = None
+    backup_blob: Optional[str] = None
     temp_path: Optional[str] = None
     original_checksum: Optional[str] = None
     timestamp: float = field(default_factory=time.time)
@@ -80,6 +85,7 @@ class OperationCheckpoint:
             "op_type": self.op_type.name,
             "target_path": self.target_path,
             "backup_path": self.backup_path,
+            "backup_blob": self.backup_blob,
             "temp_path": self.temp_path,
             "original_checksum": self.original_checksum,
             "timestamp": self.timestamp,
@@ -94,6 +100,7 @@ class OperationCheckpoint:
             op_type=AtomicOpType[data["op_type"]],
             target_path=data["target_path"],
             backup_path=data.get("backup_path"),
+            backup_blob=data.get("backup_blob"),
             temp_path=data.get("temp_path"),
             original_checksum=data.get("original_checksum"),
             timestamp=data.get("timestamp", time.time()),
@@ -109,6 +116,7 @@ class AtomicResult:
     path: str
     checksum: Optional[str] = None
     backup_path: Optional[str] = None
+    backup_blob: Optional[str] = None
     error: Optional[str] = None
     checkpoint: Optional[OperationCheckpoint] = None
     duration_ms: float = 0.0
@@ -137,9 +145,12 @@ class AtomicFileOps:
             print(f"Error: {result.error}")
     """
 
-    # Default backup directory
+    # Backup directory when backups are plain file copies
     BACKUP_DIR = ".vertice_atomic_backups"
 
+    # Ref namespace for blob-backed backups: "atomic/<path>@<time_ns>"
+    BACKUP_REF_PREFIX = "atomic/"
+
     # Lock timeout in seconds
     LOCK_TIMEOUT = 30
 
@@ -149,17 +160,22 @@ class AtomicFileOps:
         enable_checkpoints: bool = True,
         enable_locking: bool = True,
         sync_on_write: bool = True,
+        blob_store: Optional[BlobStore] = None,
     ):
         """
         Initialize AtomicFileOps.
 
         Args:
-            backup_dir: Directory for backups (default: .qwen_atomic_backups)
+            backup_dir: Keep backups as file copies in this directory instead
+                of the blob store
             enable_checkpoints: Enable checkpointing for rollback
             enable_locking: Enable file locking for concurrent access
             sync_on_write: Call fsync after writes (slower but safer)
+            blob_store: Backup storage (default: shared store in .vertice/blobs)
         """
         self.backup_dir = Path(backup_dir or self.BACKUP_DIR)
+        self.use_blob_backups = blob_store is not None or backup_dir is None
+        self._blob_store = blob_store
         self.enable_checkpoints = enable_checkpoints
         self.enable_locking = enable_locking and HAS_FILELOCK
         self.sync_on_write = sync_on_write
@@ -207,6 +223,35 @@ class AtomicFileOps:
         self.backup_dir.mkdir(parents=True, exist_ok=True)
         return self.backup_dir
 
+    @property
+    def blob_store(self) -> BlobStore:
+        """Backup storage, opened on first use."""
+        if self._blob_store is None:
+            self._blob_store = get_blob_store()
+        return self._blob_store
+
+    def _backup(
+        self, path: Path, checkpoint: OperationCheckpoint, content: Optional[bytes] = None
+    ) -> None:
+        """Back up an existing file into the checkpoint (blob ref or file copy)."""
+        if not self.use_blob_backups:
+            backup_path = self._create_backup(path)
+            checkpoint.backup_path = str(backup_path) if backup_path else None
+            return
+        if content is None:
+            if not path.is_file():
+                return
+            content = path.read_bytes()
+
+        # Delta-encode against this file's previous backup
+        prefix = f"{self.BACKUP_REF_PREFIX}{path.resolve()}@"
+        previous = self.blob_store.refs(prefix)
+        checkpoint.backup_blob = self.blob_store.put(
+            content,
+            ref=f"{prefix}{time.time_ns()}",
+            base=previous[-1][1] if previous else None,
+        )
+
     def _create_backup(self, path: Path) -> Optional[Path]:
         """Create backup of existing file."""
         if not path.exists():
@@ -220,6 +265,17 @@ class AtomicFileOps:
         shutil.copy2(str(path), str(backup_path))
         return backup_path
 
+    @staticmethod
+    def _open_temp(path: Path) -> Tuple[int, str]:
+        """Create a unique temp file next to path, with the mode a plain open() would give."""
+        for _ in range(tempfile.TMP_MAX):
+            temp_path = str(path.parent / f".{path.name}.{secrets.token_hex(4)}.tmp")
+            try:
+                return os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), temp_path
+            except FileExistsError:
+                continue
+        raise FileExistsError(f"No usable temporary file name next to {path}")
+
     def _sync_file(self, fd: int) -> None:
         """Sync file descriptor to disk."""
         if not self.sync_on_write:
@@ -292,23 +348,21 @@ class AtomicFileOps:
         checksum = self._compute_checksum(content_bytes)
 
         temp_path = None
-        backup_path = None
 
         try:
             with self._file_lock(path):
                 # Store original checksum if file exists
+                file_mode = None
                 if path.exists():
+                    file_mode = stat.S_IMODE(path.stat().st_mode)
                     original_content = path.read_bytes()
                     checkpoint.original_checksum = self._compute_checksum(original_content)
 
                     if create_backup:
-                        backup_path = self._create_backup(path)
-                        checkpoint.backup_path = str(backup_path) if backup_path else None
+                        self._backup(path, checkpoint, original_content)
 
                 # Create temp file in same directory (important for atomic rename)
-                fd, temp_path = tempfile.mkstemp(
-                    dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp"
-                )
+                fd, temp_path = self._open_temp(path)
 
                 checkpoint.temp_path = temp_path
 
@@ -322,6 +376,10 @@ class AtomicFileOps:
                 finally:
                     os.close(fd)
 
+                # New files get 0666 minus the umask; replacements keep the target's mode
+                if file_mode is not None:
+                    os.chmod(temp_path, file_mode)
+
                 # Atomic rename (POSIX guarantees this is atomic)
                 os.replace(temp_path, str(path))
                 temp_path = None  # Don't cleanup on success
@@ -339,7 +397,8 @@ class AtomicFileOps:
                 success=True,
                 path=str(path),
                 checksum=checksum,
-                backup_path=str(backup_path) if backup_path else None,
+                backup_path=checkpoint.backup_path,
+                backup_blob=checkpoint.backup_blob,
                 checkpoint=checkpoint,
                 duration_ms=duration,
             )
@@ -426,8 +485,6 @@ class AtomicFileOps:
             target_path=str(path),
         )
 
-        backup_path = None
-
         try:
             with self._file_lock(path):
                 # Store original checksum
@@ -436,8 +493,7 @@ class AtomicFileOps:
 
                 # Create backup
                 if create_backup:
-                    backup_path = self._create_backup(path)
-                    checkpoint.backup_path = str(backup_path) if backup_path else None
+                    self._backup(path, checkpoint, original_content)
 
                 # Delete file
                 if path.is_dir():
@@ -454,7 +510,8 @@ class AtomicFileOps:
             return AtomicResult(
                 success=True,
                 path=str(path),
-                backup_path=str(backup_path) if backup_path else None,
+                backup_path=checkpoint.backup_path,
+                backup_blob=checkpoint.backup_blob,
                 checkpoint=checkpoint,
                 duration_ms=duration,
             )
@@ -494,16 +551,13 @@ class AtomicFileOps:
             metadata={"source": str(source)},
         )
 
-        backup_path = None
-
         try:
             # Lock both source and dest
             with self._file_lock(source):
                 with self._file_lock(dest):
                     # Backup dest if it exists
                     if dest.exists() and create_backup:
-                        backup_path = self._create_backup(dest)
-                        checkpoint.backup_path = str(backup_path) if backup_path else None
+                        self._backup(dest, checkpoint)
 
                     # Ensure dest parent exists
                     dest.parent.mkdir(parents=True, exist_ok=True)
@@ -525,7 +579,8 @@ class AtomicFileOps:
             return AtomicResult(
                 success=True,
                 path=str(dest),
-                backup_path=str(backup_path) if backup_path else None,
+                backup_path=checkpoint.backup_path,
+                backup_blob=checkpoint.backup_blob,
                 checkpoint=checkpoint,
                 duration_ms=duration,
             )
@@ -548,10 +603,8 @@ class AtomicFileOps:
 
             if checkpoint.op_type == AtomicOpType.WRITE:
                 # Restore from backup or delete new file
-                if checkpoint.backup_path:
-                    backup = Path(checkpoint.backup_path)
-                    if backup.exists():
-                        shutil.copy2(str(backup), str(target))
+                if checkpoint.backup_path or checkpoint.backup_blob:
+                    if self._restore_backup(checkpoint, target):
                         return AtomicResult(success=True, path=str(target))
                 elif checkpoint.original_checksum is None:
                     # File didn't exist before, delete it
@@ -561,11 +614,8 @@ class AtomicFileOps:
 
             elif checkpoint.op_type == AtomicOpType.DELETE:
                 # Restore from backup
-                if checkpoint.backup_path:
-                    backup = Path(checkpoint.backup_path)
-                    if backup.exists():
-                        shutil.copy2(str(backup), str(target))
-                        return AtomicResult(success=True, path=str(target))
+                if self._restore_backup(checkpoint, target):
+                    return AtomicResult(success=True, path=str(target))
 
             elif checkpoint.op_type == AtomicOpType.MOVE:
                 # Move back
@@ -580,6 +630,22 @@ class AtomicFileOps:
         except Exception as e:
             return AtomicResult.failure(checkpoint.target_path, f"Rollback failed: {e}")
 
+    def _restore_backup(self, checkpoint: OperationCheckpoint, target: Path) -> bool:
+        """Put the checkpoint's backup back at target; False if it is gone."""
+        if checkpoint.backup_blob:
+            try:
+                content = self.blob_store.get(checkpoint.backup_blob)
+            except KeyError:
+                return False
+            return self.write_atomic(target, content, create_backup=False).success
+
+        if checkpoint.backup_path:
+            backup = Path(checkpoint.backup_path)
+            if backup.exists():
+                shutil.copy2(str(backup), str(target))
+                return True
+        return False
+
     def verify_checksum(self, path: Union[str, Path], expected: str) -> bool:
         """Verify file checksum matches expected."""
         path = Path(path)
@@ -591,21 +657,26 @@ class AtomicFileOps:
 
     def cleanup_backups(self, max_age_hours: float = 24) -> int:
         """
-        Clean up old backup files.
+        Clean up old backups (blob refs and backup files).
 
         Args:
             max_age_hours: Maximum age of backups to keep
 
         Returns:
-            Number of files deleted
+            Number of backups deleted
         """
-        if not self.backup_dir.exists():
-            return 0
-
         max_age_seconds = max_age_hours * 3600
         now = time.time()
         deleted = 0
 
+        if self.use_blob_backups:
+            for name, _, created in self.blob_store.refs(self.BACKUP_REF_PREFIX):
+                if now - created > max_age_seconds and self.blob_store.drop_ref(name):
+                    deleted += 1
+
+        if not self.backup_dir.exists():
+            return deleted
+
         for backup_file in self.backup_dir.iterdir():
             if backup_file.is_file():
                 age = now - backup_file.stat().st_mtime
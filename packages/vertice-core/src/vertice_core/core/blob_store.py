@@ -0,0 +1,509 @@
+"""
+BlobStore - Content-Addressed Snapshot Storage
+Pipeline de Diamante - Camada 3: EXECUTION SANDBOX
+
+Shared storage for file snapshots taken by UndoManager, AtomicFileOps
+backups and the edit tool's backups:
+- Blobs are keyed by SHA-256 of their content, so identical snapshots are
+  stored once, and zlib-compressed on disk
+- Owners hold named refs ("undo/<op>/original", "backup/<path>@<ts>")
+  instead of copies; a blob's refcount is its refs plus the delta blobs
+  built on it, and it is deleted when that reaches zero
+- A snapshot can be stored as a delta against a base blob (usually the
+  previous version of the same file): the common prefix and suffix are
+  kept by reference and only the changed middle is stored. Chains are
+  capped at ``max_delta_depth`` so reads stay bounded
+
+Layout under the project state dir (``.vertice/blobs``):
+    objects/ab/cdef...   compressed blob payloads
+    index.db             SQLite refcounts, delta bases and refs
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BLOB_DIR = ".vertice/blobs"
+BACKUP_REF_PREFIX = "backup/"
+MAX_BACKUPS_PER_FILE = 50
+
+_FULL = b"F"
+_DELTA = b"D"
+_DELTA_HEADER = struct.Struct(">QQ")  # common prefix length, common suffix length
+_SCAN_CHUNK = 1 << 16
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    digest TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL,
+    base TEXT,
+    depth INTEGER NOT NULL,
+    refcount INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS refs (
+    name TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    created REAL NOT NULL
+);
+"""
+
+
+def _common_prefix(a: bytes, b: bytes, limit: int) -> int:
+    """Length of the common prefix of a and b, at most ``limit``."""
+    n = 0
+    while n < limit:
+        step = min(_SCAN_CHUNK, limit - n)
+        if a[n : n + step] == b[n : n + step]:
+            n += step
+            continue
+        lo, hi = 0, step  # a[n:n+lo] matches, a[n:n+hi] does not
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if a[n : n + mid] == b[n : n + mid]:
+                lo = mid
+            else:
+                hi = mid
+        return n + lo
+    return n
+
+
+def _common_suffix(a: bytes, b: bytes, limit: int) -> int:
+    """Length of the common suffix of a and b, at most ``limit``."""
+    la, lb = len(a), len(b)
+    n = 0
+    while n < limit:
+        step = min(_SCAN_CHUNK, limit - n)
+        if a[la - n - step : la - n] == b[lb - n - step : lb - n]:
+            n += step
+            continue
+        lo, hi = 0, step
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if a[la - n - mid : la - n] == b[lb - n - mid : lb - n]:
+                lo = mid
+            else:
+                hi = mid
+        return n + lo
+    return n
+
+
+def make_delta(base: bytes, data: bytes) -> bytes:
+    """Encode ``data`` as (prefix, suffix) shared with ``base`` plus the changed middle."""
+    limit = min(len(base), len(data))
+    prefix = _common_prefix(base, data, limit)
+    suffix = _common_suffix(base, data, limit - prefix)
+    return _DELTA_HEADER.pack(prefix, suffix) + data[prefix : len(data) - suffix]
+
+
+def _apply_delta_into(buf: bytearray, delta: bytes, offset: int = 0) -> None:
+    """Apply a make_delta result (starting at ``offset``) to buf in place."""
+    prefix, suffix = _DELTA_HEADER.unpack_from(delta, offset)
+    buf[prefix : len(buf) - suffix] = memoryview(delta)[offset + _DELTA_HEADER.size :]
+
+
+def apply_delta(base: bytes, delta: bytes) -> bytes:
+    """Rebuild the data encoded by make_delta."""
+    buf = bytearray(base)
+    _apply_delta_into(buf, delta)
+    return bytes(buf)
+
+
+class BlobStore:
+    """
+    Deduplicated, compressed, reference-counted blob storage.
+
+    Usage:
+        store = BlobStore()
+        v1 = store.put(old_text, ref="undo/op_1/original")
+        v2 = store.put(new_text, ref="undo/op_1/new", base=v1)  # Stored as a delta
+        assert store.get(v2) == new_text.encode()
+        store.drop_refs("undo/op_1/")  # Both blobs freed
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path] = DEFAULT_BLOB_DIR,
+        compress_level: int = 6,
+        max_delta_depth: int = 50,
+        cache_bytes: int = 64 * 1024 * 1024,
+    ):
+        """
+        Initialize BlobStore.
+
+        Args:
+            root: Store directory (default: .vertice/blobs)
+            compress_level: zlib level for stored payloads
+            max_delta_depth: Longest delta chain before a full copy is stored
+            cache_bytes: Memory budget for recently read or written blobs
+        """
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.compress_level = compress_level
+        self.max_delta_depth = max_delta_depth
+        self.cache_bytes = cache_bytes
+
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        # Last put (the next put's usual base) and chain roots, so reads
+        # only replay the deltas on top of a cached full copy
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._cached_bytes = 0
+        self._conn = sqlite3.connect(str(self.root / "index.db"), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the index database."""
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def digest_of(data: Union[str, bytes]) -> str:
+        """Content address of data."""
+        return hashlib.sha256(_to_bytes(data)).hexdigest()
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def _write_object(self, digest: str, payload: bytes) -> int:
+        """Write a compressed payload via temp + rename; returns its size on disk."""
+        path = self._object_path(digest)
+        path.parent.mkdir(exist_ok=True)
+        blob = zlib.compress(payload, self.compress_level)
+        fd, temp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(blob)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+        return len(blob)
+
+    def put(
+        self,
+        data: Union[str, bytes],
+        ref: Optional[str] = None,
+        base: Optional[str] = None,
+    ) -> str:
+        """
+        Store data (deduplicated) and optionally point ``ref`` at it.
+
+        Args:
+            data: Content (str is stored UTF-8 encoded)
+            ref: Ref name to create or move to this blob
+            base: Digest of a similar blob to delta-encode against
+
+        Returns:
+            Digest of the stored content
+        """
+        data = _to_bytes(data)
+        digest = hashlib.sha256(data).hexdigest()
+
+        with self._lock, self._conn:
+            if not self._conn.execute("SELECT 1 FROM blobs WHERE digest = ?", (digest,)).fetchone():
+                self._insert_blob(digest, data, base)
+            if ref is not None:
+                self._set_ref_locked(ref, digest)
+            self._cache_put(digest, data)
+        return digest
+
+    def _cache_put(self, digest: str, data: bytes) -> None:
+        if len(data) > self.cache_bytes:
+            return
+        old = self._cache.pop(digest, None)
+        if old is not None:
+            self._cached_bytes -= len(old)
+        self._cache[digest] = data
+        self._cached_bytes += len(data)
+        while self._cached_bytes > self.cache_bytes:
+            self._cached_bytes -= len(self._cache.popitem(last=False)[1])
+
+    def _cache_get(self, digest: str) -> Optional[bytes]:
+        data = self._cache.get(digest)
+        if data is not None:
+            self._cache.move_to_end(digest)
+        return data
+
+    def _insert_blob(self, digest: str, data: bytes, base: Optional[str]) -> None:
+        row = None
+        if base is not None and base != digest:
+            row = self._conn.execute("SELECT depth FROM blobs WHERE digest = ?", (base,)).fetchone()
+
+        payload = _FULL + data
+        depth = 0
+        if row is not None and row[0] < self.max_delta_depth:
+            delta = make_delta(self._get_locked(base), data)
+            if len(delta) < len(data) // 2:
+                payload, depth = _DELTA + delta, row[0] + 1
+        if not depth:
+            base = None
+
+        stored = self._write_object(digest, payload)
+        self._conn.execute(
+            "INSERT INTO blobs (digest, size, stored_size, base, depth, refcount)"
+            " VALUES (?, ?, ?, ?, ?, 0)",
+            (digest, len(data), stored, base, depth),
+        )
+        if base is not None:
+            self._incref(base)
+
+    def get(self, digest: str) -> bytes:
+        """
+        Load a blob's content.
+
+        Raises:
+            KeyError: If the blob is not in the store
+        """
+        with self._lock:
+            return self._get_locked(digest)
+
+    def _get_locked(self, digest: str) -> bytes:
+        cached = self._cache_get(digest)
+        if cached is not None:
+            return cached
+
+        # Walk back to a cached or full copy, then replay the deltas in place
+        deltas: List[bytes] = []
+        current = digest
+        while True:
+            root = self._cache_get(current)
+            if root is not None:
+                break
+            row = self._conn.execute(
+                "SELECT base FROM blobs WHERE digest = ?", (current,)
+            ).fetchone()
+            if row is None:
+                raise KeyError(f"Blob not found: {current}")
+            payload = zlib.decompress(self._object_path(current).read_bytes())
+            if payload[:1] != _DELTA:
+                root = payload[1:]
+                self._cache_put(current, root)
+                break
+            deltas.append(payload)
+            current = row[0]
+
+        if not deltas:
+            return root
+        buf = bytearray(root)
+        for payload in reversed(deltas):
+            _apply_delta_into(buf, payload, 1)
+        data = bytes(buf)
+        self._cache_put(digest, data)
+        return data
+
+    # Refs ------------------------------------------------------------------
+
+    def set_ref(self, name: str, digest: str) -> None:
+        """Point ``name`` at an existing blob."""
+        with self._lock, self._conn:
+            self._set_ref_locked(name, digest)
+
+    def _set_ref_locked(self, name: str, digest: str) -> None:
+        old = self._conn.execute("SELECT digest FROM refs WHERE name = ?", (name,)).fetchone()
+        if old is not None and old[0] == digest:
+            return
+        self._incref(digest)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO refs (name, digest, created) VALUES (?, ?, ?)",
+            (name, digest, time.time()),
+        )
+        if old is not None:
+            self._decref(old[0])
+
+    def resolve(self, name: str) -> Optional[str]:
+        """Digest a ref points at, or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT digest FROM refs WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def read_ref(self, name: str) -> Optional[bytes]:
+        """Content a ref points at, or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT digest FROM refs WHERE name = ?", (name,)).fetchone()
+            return self._get_locked(row[0]) if row else None
+
+    def refs(self, prefix: str = "") -> List[Tuple[str, str, float]]:
+        """(name, digest, created) of refs starting with ``prefix``, oldest first."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT name, digest, created FROM refs WHERE name >= ? AND name < ?"
+                " ORDER BY created, name",
+                (prefix, prefix + "\U0010ffff"),
+            ).fetchall()
+
+    def drop_ref(self, name: str) -> bool:
+        """Remove a ref; blobs left unreferenced are deleted."""
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT digest FROM refs WHERE name = ?", (name,)).fetchone()
+            if row is None:
+                return False
+            self._conn.execute("DELETE FROM refs WHERE name = ?", (name,))
+            self._decref(row[0])
+        return True
+
+    def drop_refs(self, prefix: str) -> int:
+        """Remove every ref starting with ``prefix``; returns how many were removed."""
+        names = [name for name, _, _ in self.refs(prefix)]
+        return sum(self.drop_ref(name) for name in names)
+
+    # Refcounting -----------------------------------------------------------
+
+    def _incref(self, digest: str) -> None:
+        self._conn.execute("UPDATE blobs SET refcount = refcount + 1 WHERE digest = ?", (digest,))
+
+    def _decref(self, digest: Optional[str]) -> None:
+        """Drop one reference, deleting the blob (and releasing its base) at zero."""
+        while digest is not None:
+            self._conn.execute(
+                "UPDATE blobs SET refcount = refcount - 1 WHERE digest = ?", (digest,)
+            )
+            row = self._conn.execute(
+                "SELECT refcount, base FROM blobs WHERE digest = ?", (digest,)
+            ).fetchone()
+            if row is None or row[0] > 0:
+                return
+            self._conn.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+            self._unlink_object(digest)
+            digest = row[1]
+
+    def _unlink_object(self, digest: str) -> None:
+        data = self._cache.pop(digest, None)
+        if data is not None:
+            self._cached_bytes -= len(data)
+        try:
+            self._object_path(digest).unlink()
+        except FileNotFoundError:
+            pass
+
+    def gc(self) -> int:
+        """
+        Sweep blobs nobody references (e.g. put() without a ref, or left
+        by a crash) and object files missing from the index.
+
+        Returns:
+            Number of blobs removed
+        """
+        removed = 0
+        with self._lock, self._conn:
+            while True:
+                rows = self._conn.execute(
+                    "SELECT digest, base FROM blobs WHERE refcount <= 0"
+                ).fetchall()
+                if not rows:
+                    break
+                for digest, base in rows:
+                    self._conn.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+                    self._unlink_object(digest)
+                    if base is not None:
+                        self._conn.execute(
+                            "UPDATE blobs SET refcount = refcount - 1 WHERE digest = ?", (base,)
+                        )
+                    removed += 1
+
+            known = {row[0] for row in self._conn.execute("SELECT digest FROM blobs")}
+            for path in self.objects_dir.glob("*/*"):
+                if path.parent.name + path.name not in known:
+                    path.unlink()
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        """Blob and ref counts, logical size and bytes on disk."""
+        with self._lock:
+            blobs, deltas, size, stored = self._conn.execute(
+                "SELECT COUNT(*), COUNT(base), COALESCE(SUM(size), 0),"
+                " COALESCE(SUM(stored_size), 0) FROM blobs"
+            ).fetchone()
+            refs = self._conn.execute("SELECT COUNT(*) FROM refs").fetchone()[0]
+        return {
+            "blobs": blobs,
+            "delta_blobs": deltas,
+            "refs": refs,
+            "logical_bytes": size,
+            "stored_bytes": stored,
+        }
+
+
+def _to_bytes(data: Union[str, bytes]) -> bytes:
+    return data.encode("utf-8", "surrogateescape") if isinstance(data, str) else data
+
+
+# Shared instances, one per store directory
+_stores: Dict[Path, BlobStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_blob_store(root: Union[str, Path, None] = None) -> BlobStore:
+    """Get the shared BlobStore for ``root`` (default: .vertice/blobs under the cwd)."""
+    path = Path(root or DEFAULT_BLOB_DIR).resolve()
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = BlobStore(path)
+        return store
+
+
+def _backup_prefix(path: Union[str, Path]) -> str:
+    return f"{BACKUP_REF_PREFIX}{Path(path).resolve()}@"
+
+
+def list_backups(
+    path: Union[str, Path], store: Optional[BlobStore] = None
+) -> List[Tuple[str, str, float]]:
+    """(ref, digest, created) of the edit backups of ``path``, oldest first."""
+    return (store or get_blob_store()).refs(_backup_prefix(path))
+
+
+def save_backup(
+    path: Union[str, Path],
+    content: Union[str, bytes],
+    store: Optional[BlobStore] = None,
+    keep: int = MAX_BACKUPS_PER_FILE,
+) -> Tuple[str, str]:
+    """
+    Back up ``content`` as the newest version of ``path``.
+
+    The backup is delta-encoded against the previous one and only the newest
+    ``keep`` backups of the file are retained.
+
+    Returns:
+        (ref, digest) of the backup
+    """
+    store = store or get_blob_store()
+    previous = list_backups(path, store)
+    ref = f"{_backup_prefix(path)}{time.time_ns()}"
+    digest = store.put(content, ref=ref, base=previous[-1][1] if previous else None)
+    for name, _, _ in previous[: max(0, len(previous) + 1 - keep)]:
+        store.drop_ref(name)
+    return ref, digest
+
+
+# Export all public symbols
+__all__ = [
+    "DEFAULT_BLOB_DIR",
+    "BACKUP_REF_PREFIX",
+    "MAX_BACKUPS_PER_FILE",
+    "BlobStore",
+    "get_blob_store",
+    "list_backups",
+    "save_backup",
+    "make_delta",
+    "apply_delta",
+]
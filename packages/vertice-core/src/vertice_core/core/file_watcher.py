@@ -1,19 +1,42 @@
 """Real-time file system monitoring (Claude pattern).
 
 Boris Cherny: Event-driven, incremental updates only.
+
+Backends:
+- inotify (Linux, via ctypes - no extra dependency): kernel pushes events,
+  ``check_updates`` only drains a non-blocking fd.
+- polling (fallback): walks the tree comparing (mtime, size) and hashes
+  only files whose stat changed.
+
+Events are coalesced per path and delivered in batches to subscribers, so
+the indexer, the TUI file tree and cache invalidation share one watcher.
 """
 
+import asyncio
+import ctypes
+import errno
+import hashlib
 import os
+import struct
+import sys
+import threading
 import time
-import hashlib
-from pathlib import Path
-from typing import Dict, Set, Optional, Callable
 from collections import deque
 from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+EXCLUDED_DIRS = frozenset({"node_modules", "__pycache__", "venv"})
+
+# Pass in watch_extensions to watch every file regardless of extension
+ALL_FILES = "*"
+
+# Signature of a file version: (mtime_ns, size)
+StatSignature = Tuple[int, int]
+
 
 @dataclass
 class FileEvent:
@@ -25,105 +48,531 @@ class FileEvent:
     file_hash: Optional[str] = None
 
 
+def _coalesce(previous: Optional[str], current: str) -> Optional[str]:
+    """Merge two pending event types for one path (None = no net change)."""
+    if previous is None:
+        return current
+    if previous == "created":
+        return None if current == "deleted" else "created"
+    if previous == "deleted":
+        return "deleted" if current == "deleted" else "modified"
+    return current  # modified + (modified|deleted|created)
+
+
+class _PollingBackend:
+    """Stat-first polling: hash only files whose (mtime, size) changed."""
+
+    name = "polling"
+    poll_interval = 1.0
+
+    def __init__(self, watcher: "FileWatcher"):
+        self._watcher = watcher
+        self._hashes: Dict[str, str] = {}
+
+    def start(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def fileno(self) -> Optional[int]:
+        return None
+
+    def poll(self) -> List[Tuple[str, str, Optional[str]]]:
+        w = self._watcher
+        changes: List[Tuple[str, str, Optional[str]]] = []
+        current: Dict[str, StatSignature] = {}
+
+        for path_str, sig in w._walk_signatures():
+            current[path_str] = sig
+            old = w._file_stats.get(path_str)
+            if old is None:
+                changes.append((path_str, "created", self._rehash(path_str)))
+            elif old != sig:
+                # Stat changed: confirm with a content hash when we have a
+                # previous one (a touch-only change is not a modification)
+                previous_hash = self._hashes.get(path_str)
+                new_hash = self._rehash(path_str)
+                if new_hash != previous_hash:
+                    changes.append((path_str, "modified", new_hash))
+
+        for path_str in w._file_stats.keys() - current.keys():
+            self._hashes.pop(path_str, None)
+            changes.append((path_str, "deleted", None))
+
+        w._file_stats = current
+        return changes
+
+    def _rehash(self, path_str: str) -> str:
+        file_hash = self._watcher._hash_file(path_str)
+        self._hashes[path_str] = file_hash
+        return file_hash
+
+
+class _InotifyBackend:
+    """Linux inotify via ctypes; one watch descriptor per directory."""
+
+    name = "inotify"
+    poll_interval = 0.25
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+    IN_ISDIR = 0x40000000
+
+    WATCH_MASK = (
+        IN_MODIFY
+        | IN_CLOSE_WRITE
+        | IN_MOVED_FROM
+        | IN_MOVED_TO
+        | IN_CREATE
+        | IN_DELETE
+        | IN_DELETE_SELF
+        | IN_ONLYDIR
+    )
+
+    _EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, watcher: "FileWatcher"):
+        self._watcher = watcher
+        self._libc = self._load_libc()
+        self._fd = -1
+        self._wd_to_dir: Dict[int, str] = {}
+        self._dir_to_wd: Dict[str, int] = {}
+
+    @staticmethod
+    def _load_libc() -> ctypes.CDLL:
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        libc = ctypes.CDLL(None, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("libc has no inotify support")
+        return libc
+
+    def fileno(self) -> Optional[int]:
+        return self._fd if self._fd >= 0 else None
+
+    def start(self) -> None:
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._fd = fd
+        try:
+            for directory in self._watcher._walk_dirs(self._watcher.root_path):
+                self._add_watch(directory)
+        except OSError:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+        self._fd = -1
+        self._wd_to_dir.clear()
+        self._dir_to_wd.clear()
+
+    def _add_watch(self, directory: str) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), self.WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err in (errno.ENOENT, errno.ENOTDIR, errno.EACCES):
+                return  # vanished or unreadable; nothing to watch
+            raise OSError(err, f"inotify_add_watch failed for {directory}")
+        self._wd_to_dir[wd] = directory
+        self._dir_to_wd[directory] = wd
+
+    def _forget_dir(self, directory: str) -> None:
+        prefix = directory + os.sep
+        for path in [d for d in self._dir_to_wd if d == directory or d.startswith(prefix)]:
+            wd = self._dir_to_wd.pop(path)
+            self._wd_to_dir.pop(wd, None)
+            self._libc.inotify_rm_watch(self._fd, wd)
+
+    def _read_events(self) -> Iterator[Tuple[int, int, str]]:
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return
+            if not data:
+                return
+            pos = 0
+            header = self._EVENT_HEADER
+            while pos < len(data):
+                wd, mask, _cookie, length = header.unpack_from(data, pos)
+                pos += header.size
+                name = os.fsdecode(data[pos : pos + length].rstrip(b"\0"))
+                pos += length
+                yield wd, mask, name
+
+    def poll(self) -> List[Tuple[str, str, Optional[str]]]:
+        w = self._watcher
+        changes: List[Tuple[str, str, Optional[str]]] = []
+
+        for wd, mask, name in self._read_events():
+            if mask & self.IN_Q_OVERFLOW:
+                logger.warning("inotify queue overflow; rescanning watched tree")
+                return self._resync()
+
+            if mask & self.IN_IGNORED:
+                directory = self._wd_to_dir.pop(wd, None)
+                if directory is not None:
+                    self._dir_to_wd.pop(directory, None)
+                continue
+
+            directory = self._wd_to_dir.get(wd)
+            if directory is None or not name:
+                continue
+            path_str = os.path.join(directory, name)
+
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    if not w._skip_dir(name):
+                        changes.extend(self._scan_new_dir(path_str))
+                elif mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                    self._forget_dir(path_str)
+                    changes.extend(self._drop_subtree(path_str))
+                continue
+
+            if not w._is_watched(path_str):
+                continue
+
+            if mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                if w._file_stats.pop(path_str, None) is not None:
+                    changes.append((path_str, "deleted", None))
+                continue
+
+            sig = w._stat_signature(path_str)
+            if sig is None:
+                continue
+            old = w._file_stats.get(path_str)
+            w._file_stats[path_str] = sig
+            if old is None:
+                changes.append((path_str, "created", None))
+            elif old != sig or mask & (self.IN_MODIFY | self.IN_MOVED_TO):
+                # mtime can be coarser than back-to-back writes, so trust the event
+                changes.append((path_str, "modified", None))
+
+        return changes
+
+    def _watch_new_dir(self, directory: str) -> None:
+        """Add a watch while running; a directory that can't be watched is skipped."""
+        try:
+            self._add_watch(directory)
+        except OSError as e:  # e.g. ENOSPC: max_user_watches reached
+            logger.warning(f"Not watching {directory}: {e}")
+
+    def _scan_new_dir(self, directory: str) -> List[Tuple[str, str, Optional[str]]]:
+        w = self._watcher
+        changes: List[Tuple[str, str, Optional[str]]] = []
+        for sub in w._walk_dirs(Path(directory)):
+            self._watch_new_dir(sub)
+        for path_str, sig in w._walk_signatures(Path(directory)):
+            if path_str not in w._file_stats:
+                w._file_stats[path_str] = sig
+                changes.append((path_str, "created", None))
+        return changes
+
+    def _drop_subtree(self, directory: str) -> List[Tuple[str, str, Optional[str]]]:
+        prefix = directory + os.sep
+        gone = [p for p in self._watcher._file_stats if p.startswith(prefix)]
+        for path_str in gone:
+            del self._watcher._file_stats[path_str]
+        return [(p, "deleted", None) for p in gone]
+
+    def _resync(self) -> List[Tuple[str, str, Optional[str]]]:
+        """Recover from a dropped event queue by diffing a fresh scan."""
+        w = self._watcher
+        for directory in w._walk_dirs(w.root_path):
+            if directory not in self._dir_to_wd:
+                self._watch_new_dir(directory)
+        changes: List[Tuple[str, str, Optional[str]]] = []
+        current = dict(w._walk_signatures())
+        for path_str, sig in current.items():
+            old = w._file_stats.get(path_str)
+            if old is None:
+                changes.append((path_str, "created", None))
+            elif old != sig:
+                changes.append((path_str, "modified", None))
+        for path_str in w._file_stats.keys() - current.keys():
+            changes.append((path_str, "deleted", None))
+        w._file_stats = current
+        return changes
+
+
 class FileWatcher:
     """File system watcher with incremental updates (Claude pattern).
 
-    Uses polling for simplicity (watchdog adds dependency).
-    Updates every 1s, only processes changed files.
+    Uses inotify where available and falls back to stat-first polling.
+    Call ``check_updates`` periodically (every ``poll_interval`` seconds);
+    changes are coalesced per path and flushed once no new change has
+    arrived for ``debounce_seconds``.
+
+    Subscribers registered with ``subscribe`` receive each flushed batch;
+    ``add_callback`` callbacks receive the batch's events one by one. Each
+    gets only files with its own extensions (default: the watcher's); the
+    watcher scans the union of them all.
+    ``start_polling`` drives ``check_updates`` from the running event loop.
     """
 
-    def __init__(self, root_path: str = ".", watch_extensions: Set[str] = None):
+    def __init__(
+        self,
+        root_path: str = ".",
+        watch_extensions: Set[str] = None,
+        backend: str = "auto",
+        debounce_seconds: float = 0.0,
+    ):
         self.root_path = Path(root_path)
-        self._watch_extensions = watch_extensions or {".py", ".js", ".ts", ".go", ".rs"}
-        self._file_hashes: Dict[str, str] = {}
+        self._watch_extensions = set(watch_extensions or {".py", ".js", ".ts", ".go", ".rs"})
+        self._scan_extensions = set(self._watch_extensions)  # Plus subscribers' extensions
+        self._watch_all = ALL_FILES in self._scan_extensions
+        self._backend_preference = backend
+        self.debounce_seconds = debounce_seconds
+        self._backend = None
+        self._file_stats: Dict[str, StatSignature] = {}
+        self._pending: Dict[str, FileEvent] = {}
+        self._last_change = 0.0
         self._recent_events: deque = deque(maxlen=100)
-        self._callbacks: list[Callable] = []
+        self._callbacks: list[Tuple[Callable[[FileEvent], None], Optional[FrozenSet[str]]]] = []
+        self._subscribers: list[
+            Tuple[Callable[[List[FileEvent]], None], Optional[FrozenSet[str]]]
+        ] = []
+        self._lock = threading.Lock()
         self._running = False
+        self._poll_task: Optional[asyncio.Task] = None
 
-    def add_callback(self, callback: Callable[[FileEvent], None]) -> None:
-        """Register callback for file events."""
-        self._callbacks.append(callback)
+    @property
+    def watches_all_files(self) -> bool:
+        """Whether every file is scanned (for this watcher or one of its subscribers)."""
+        return self._watch_all
+
+    def add_extensions(self, extensions: Set[str]) -> None:
+        """Widen the watcher's own extensions (the default subscription filter)."""
+        self._watch_extensions |= set(extensions)
+        self._widen_scan(extensions)
+
+    def _widen_scan(self, extensions: Set[str]) -> None:
+        """Scan more extensions; newly matched files join the baseline."""
+        added = set(extensions) - self._scan_extensions
+        if not added:
+            return
+        with self._lock:
+            self._scan_extensions |= added
+            self._watch_all = ALL_FILES in self._scan_extensions
+            if self._running:
+                for path_str, sig in self._walk_signatures():
+                    self._file_stats.setdefault(path_str, sig)
+
+    def start_polling(self) -> Optional[asyncio.Task]:
+        """Call ``check_updates`` every ``poll_interval`` on the running event loop.
+
+        One task per watcher, so several subsystems can ask for it.
+
+        Returns:
+            The polling task, or None when no event loop is running
+        """
+        if self._poll_task is not None and not self._poll_task.done():
+            return self._poll_task
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        self._poll_task = loop.create_task(self._poll_forever())
+        return self._poll_task
+
+    async def _poll_forever(self) -> None:
+        while self._running:
+            try:
+                self.check_updates()
+            except Exception as e:  # Keep watching; the next poll may succeed
+                logger.error(f"File watcher poll failed: {e}")
+            await asyncio.sleep(self.poll_interval)
+
+    def _filter(self, extensions: Optional[Set[str]]) -> Optional[FrozenSet[str]]:
+        """Subscription filter (None = the watcher's own extensions)."""
+        if extensions is None:
+            return None
+        self._widen_scan(extensions)
+        return frozenset(extensions)
+
+    def _wants(self, path_str: str, extensions: Optional[FrozenSet[str]]) -> bool:
+        wanted = self._watch_extensions if extensions is None else extensions
+        return ALL_FILES in wanted or os.path.splitext(path_str)[1] in wanted
+
+    def add_callback(
+        self, callback: Callable[[FileEvent], None], extensions: Optional[Set[str]] = None
+    ) -> None:
+        """Register callback for individual file events (``extensions``: see subscribe)."""
+        self._callbacks.append((callback, self._filter(extensions)))
+
+    def subscribe(
+        self,
+        callback: Callable[[List[FileEvent]], None],
+        extensions: Optional[Set[str]] = None,
+    ) -> Callable[[], None]:
+        """Register callback for coalesced event batches.
+
+        Args:
+            callback: Receives each batch's events for files it asked for
+            extensions: Extensions to receive ({ALL_FILES} for every file;
+                default: the watcher's own). Other subscribers are unaffected.
+
+        Returns:
+            Function that removes the subscription
+        """
+        entry = (callback, self._filter(extensions))
+        self._subscribers.append(entry)
+
+        def unsubscribe() -> None:
+            if entry in self._subscribers:
+                self._subscribers.remove(entry)
+
+        return unsubscribe
+
+    @property
+    def backend(self) -> str:
+        """Name of the active backend ('inotify' or 'polling')."""
+        return self._backend.name if self._backend else "none"
+
+    @property
+    def poll_interval(self) -> float:
+        """Suggested interval between ``check_updates`` calls."""
+        return self._backend.poll_interval if self._backend else 1.0
+
+    def fileno(self) -> Optional[int]:
+        """Readable fd signalling new events (inotify only), for loop.add_reader."""
+        return self._backend.fileno() if self._backend else None
 
     def start(self):
         """Start watching (sync, for simplicity)."""
         self._running = True
         self._initial_scan()
+        self._backend = self._create_backend()
 
     def stop(self):
         """Stop watching."""
         self._running = False
+        if self._backend:
+            self._backend.close()
+
+    def _create_backend(self):
+        if self._backend_preference in ("auto", "inotify"):
+            try:
+                backend = _InotifyBackend(self)
+                backend.start()
+                return backend
+            except OSError as e:
+                if self._backend_preference == "inotify":
+                    raise
+                logger.debug(f"inotify unavailable, falling back to polling: {e}")
+        return _PollingBackend(self)
 
     def _initial_scan(self):
-        """Initial scan to establish baseline."""
-        for file_path in self._get_watched_files():
-            file_hash = self._hash_file(file_path)
-            self._file_hashes[str(file_path)] = file_hash
+        """Initial scan to establish baseline (stat only, no hashing)."""
+        self._file_stats = dict(self._walk_signatures())
 
     def check_updates(self):
         """Check for file updates (call periodically)."""
-        if not self._running:
+        if not self._running or self._backend is None:
             return
 
-        current_files = set(str(p) for p in self._get_watched_files())
-        tracked_files = set(self._file_hashes.keys())
-
-        # Detect new files
-        for file_path in current_files - tracked_files:
-            event = FileEvent(
-                path=file_path,
-                event_type="created",
-                timestamp=time.time(),
-                file_hash=self._hash_file(file_path),
-            )
-            self._handle_event(event)
-            self._file_hashes[file_path] = event.file_hash
+        with self._lock:
+            changes = self._backend.poll()
+            now = time.time()
+            for path_str, event_type, file_hash in changes:
+                pending = self._pending.get(path_str)
+                merged = _coalesce(pending.event_type if pending else None, event_type)
+                if merged is None:
+                    self._pending.pop(path_str, None)
+                else:
+                    self._pending[path_str] = FileEvent(
+                        path=path_str, event_type=merged, timestamp=now, file_hash=file_hash
+                    )
+            if changes:
+                self._last_change = now
+
+            if not self._pending or now - self._last_change < self.debounce_seconds:
+                return
+            batch = list(self._pending.values())
+            self._pending.clear()
+
+        self._dispatch(batch)
+
+    def _dispatch(self, batch: List[FileEvent]) -> None:
+        """Deliver a flushed batch to subscribers and per-event callbacks."""
+        self._recent_events.extend(e for e in batch if self._wants(e.path, None))
+
+        for subscriber, extensions in list(self._subscribers):
+            events = [e for e in batch if self._wants(e.path, extensions)]
+            if not events:
+                continue
+            try:
+                subscriber(events)
+            except Exception as e:
+                logger.error(f"Subscriber failed: {e}")
 
-        # Detect deleted files
-        for file_path in tracked_files - current_files:
-            event = FileEvent(path=file_path, event_type="deleted", timestamp=time.time())
+        for event in batch:
             self._handle_event(event)
-            del self._file_hashes[file_path]
-
-        # Detect modified files
-        for file_path in current_files & tracked_files:
-            new_hash = self._hash_file(file_path)
-            if new_hash != self._file_hashes[file_path]:
-                event = FileEvent(
-                    path=file_path, event_type="modified", timestamp=time.time(), file_hash=new_hash
-                )
-                self._handle_event(event)
-                self._file_hashes[file_path] = new_hash
+
+    def _skip_dir(self, name: str) -> bool:
+        return name.startswith(".") or name in EXCLUDED_DIRS
+
+    def _is_watched(self, path_str: str) -> bool:
+        return self._watch_all or os.path.splitext(path_str)[1] in self._scan_extensions
+
+    def _walk_dirs(self, root: Path) -> Iterator[str]:
+        """Yield watched directories (hidden and common excludes skipped)."""
+        for dirpath, dirs, _files in os.walk(root):
+            dirs[:] = [d for d in dirs if not self._skip_dir(d)]
+            yield dirpath
+
+    def _walk_signatures(self, root: Optional[Path] = None) -> Iterator[Tuple[str, StatSignature]]:
+        """Yield (path, (mtime_ns, size)) for every watched file."""
+        for dirpath, dirs, files in os.walk(root or self.root_path):
+            dirs[:] = [d for d in dirs if not self._skip_dir(d)]
+            for name in files:
+                path_str = os.path.join(dirpath, name)
+                if self._is_watched(path_str):
+                    sig = self._stat_signature(path_str)
+                    if sig is not None:
+                        yield path_str, sig
 
     def _get_watched_files(self):
         """Get all files to watch."""
-        for root, dirs, files in os.walk(self.root_path):
-            # Skip hidden dirs and common excludes
-            dirs[:] = [
-                d
-                for d in dirs
-                if not d.startswith(".") and d not in ["node_modules", "__pycache__", "venv"]
-            ]
-
-            for file in files:
-                file_path = Path(root) / file
-                if file_path.suffix in self._watch_extensions:
-                    yield file_path
+        for path_str, _sig in self._walk_signatures():
+            yield Path(path_str)
+
+    @staticmethod
+    def _stat_signature(path_str: str) -> Optional[StatSignature]:
+        try:
+            st = os.stat(path_str)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
 
     def _hash_file(self, file_path: str) -> str:
-        """Fast file hash (first 8KB only for speed)."""
+        """Content hash (only called for files whose stat changed)."""
         try:
+            digest = hashlib.md5()
             with open(file_path, "rb") as f:
-                # Only hash first 8KB for speed
-                content = f.read(8192)
-                return hashlib.md5(content).hexdigest()
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(block)
+            return digest.hexdigest()
         except (IOError, OSError):
             return ""
 
     def _handle_event(self, event: FileEvent):
         """Handle file event."""
-        self._recent_events.append(event)
-
-        for callback in self._callbacks:
+        for callback, extensions in self._callbacks:
+            if not self._wants(event.path, extensions):
+                continue
             try:
                 callback(event)
             except Exception as e:
@@ -137,7 +586,29 @@ class FileWatcher:
     @property
     def tracked_files(self) -> int:
         """Get number of tracked files."""
-        return len(self._file_hashes)
+        return len(self._file_stats)
+
+
+_shared_watchers: Dict[str, FileWatcher] = {}
+_shared_lock = threading.Lock()
+
+
+def get_file_watcher(root_path: str = ".", watch_extensions: Set[str] = None) -> FileWatcher:
+    """Get the shared, started watcher for a root (one per resolved path).
+
+    Subsystems subscribe to this instance instead of each walking the tree.
+    ``watch_extensions`` only sets up a new watcher; to receive other
+    extensions from a shared one, pass them to ``subscribe``.
+    """
+    key = str(Path(root_path).resolve())
+    with _shared_lock:
+        watcher = _shared_watchers.get(key)
+        if watcher is None:
+            watcher = FileWatcher(root_path, watch_extensions)
+            _shared_watchers[key] = watcher
+        if not watcher._running:
+            watcher.start()
+    return watcher
 
 
 class RecentFilesTracker:
@@ -17,16 +17,20 @@ Based on:
 - OWASP LLM Top 10 (2024)
 
 PERFORMANCE NOTE: Uses compiled regex and LRU cache for speed.
+Content is scanned once for literal anchors; each pattern only runs where one
+of its anchors occurs, and results are cached by content hash.
 """
 
 from __future__ import annotations
 
+import codecs
 import re
 import hashlib
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, field
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from functools import lru_cache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -140,10 +144,13 @@ class ShieldResult:
         sanitized = content
         # Remove system-like tags
         sanitized = re.sub(r"<\|[^|]*\|>", "[REMOVED]", sanitized)
-        # Remove obvious override attempts
-        sanitized = re.sub(
-            r"(?i)(ignore|disregard|forget)\s+(previous|all|above)", "[FILTERED]", sanitized
-        )
+        # Remove obvious override attempts (skip the slow regex when the
+        # verbs cannot occur at all)
+        folded = _fold_case(content)
+        if folded is None or any(verb in folded for verb in ("ignore", "disregard", "forget")):
+            sanitized = re.sub(
+                r"(?i)(ignore|disregard|forget)\s+(previous|all|above)", "[FILTERED]", sanitized
+            )
         return sanitized
 
     @staticmethod
@@ -334,6 +341,268 @@ INDIRECT_INJECTION_MARKERS = [
     "# AI INSTRUCTION:",
 ]
 
+# Lowercase literals that every match of a pattern starts with, keyed by the
+# pattern source. The scanner only tries a pattern where one of its anchors
+# occurs; patterns missing here fall back to a full pattern.search().
+_PATTERN_ANCHORS: Dict[str, Tuple[str, ...]] = {
+    r"(?i)ignore\s+(all\s+)?(previous\s+)?instructions?": ("ignore",),
+    r"(?i)ignore\s+(all|previous|above|system)\s+(instructions?|prompts?|rules?|constraints?)": (
+        "ignore",
+    ),
+    r"(?i)disregard\s+(previous|all|system|your|the)": ("disregard",),
+    r"(?i)forget\s+(everything|all|your|previous)": ("forget",),
+    r"(?i)(new|your\s+new)\s+(instruction|directive|rule|mode)s?\s*(are|is)?:?": ("new", "your"),
+    r"(?i)override\s+(mode|setting|instruction|behavior|safety)": ("override",),
+    r"(?i)SYSTEM:": ("system:",),
+    r"(?i)\[\[ADMIN\]\]": ("[[admin]]",),
+    r"(?i)you\s+are\s+now\s+(a\s+)?(different|new|another|DAN)": ("you",),
+    r"(?i)act\s+as\s+(a\s+)?(different|new|evil|malicious|if|GPT)": ("act",),
+    r"(?i)pretend\s+(you\s+)?(have\s+no|are|to\s+be)": ("pretend",),
+    r"(?i)from\s+now\s+on,?\s+(you|act|behave)": ("from",),
+    r"(?i)as\s+an?\s+AI\s+(without|with\s+no)": ("as",),
+    r"(?i)roleplay\s+as": ("roleplay",),
+    r"<\|im_start\|>": ("<|im_start|>",),
+    r"<\|im_end\|>": ("<|im_end|>",),
+    r"<\|system\|>": ("<|system|>",),
+    r"<\|user\|>": ("<|user|>",),
+    r"<\|assistant\|>": ("<|assistant|>",),
+    r"```\s*system": ("```",),
+    r"\[INST\]|\[/INST\]": ("[inst]", "[/inst]"),
+    r"<<SYS>>|<</SYS>>": ("<<sys>>", "<</sys>>"),
+    r"(?i)show\s+(me\s+)?(your|the)\s+(system\s+)?(prompt|instructions?)": ("show",),
+    r"(?i)what\s+(are|is)\s+your\s+(instructions?|system\s+prompt|rules?)": ("what",),
+    r"(?i)repeat\s+(your|the)\s+(instructions?|system\s+prompt)": ("repeat",),
+    r"(?i)print\s+(your|the)\s+(initial|original|full)?\s*(prompt|instructions?|initialization)": (
+        "print",
+    ),
+    r"(?i)\bDAN\b": ("dan",),
+    r"(?i)\bDo\s+Anything\s+Now\b": ("do",),
+    r"(?i)(enter|enable|activate)\s+developer\s+mode": ("enter", "enable", "activate"),
+    r"(?i)developer\s+mode": ("developer",),
+    r"(?i)evil\s+(mode|assistant|ai)": ("evil",),
+    r"(?i)bypass\s+(safety|filter|restriction|guard)": ("bypass",),
+    r"(?i)disable\s+(safety|filter|restriction|censorship)": ("disable",),
+    r"(?i)jailbreak": ("jailbreak",),
+    r"(?i)BEGIN\s+JAILBREAK": ("begin",),
+    r"(?i)send\s+(this|the|all)\s+(to|via)\s+(email|http|url|webhook)": ("send",),
+    r"(?i)post\s+to\s+(url|endpoint|api|webhook)": ("post",),
+    r"(?i)upload\s+(this|the|all|data)\s+to": ("upload",),
+}
+
+# Keywords looked for in decoded (hex, ROT13, base64) content
+_DANGEROUS_KEYWORDS = (
+    "ignore",
+    "previous",
+    "instruction",
+    "system",
+    "prompt",
+    "jailbreak",
+    "dan",
+    "override",
+    "bypass",
+    "disable",
+)
+
+# Hidden instructions in comments: (opener, closer, description)
+_HIDDEN_COMMENT_CHECKS: List[Tuple[str, Optional[str], str]] = [
+    ("<!--", "-->", "HTML comment injection"),
+    ("/*", "*/", "Multi-line comment injection"),
+    ("//", None, "Single-line comment injection"),
+    ("#", None, "Hash comment injection"),
+]
+_HIDDEN_KEYWORDS = ("ignore", "system", "prompt", "instruction")
+_HIDDEN_KEYWORD = re.compile("|".join(_HIDDEN_KEYWORDS), re.IGNORECASE)
+
+# Non-ASCII characters that re.IGNORECASE matches against ASCII letters but
+# str.lower() leaves alone (or expands to two characters).
+_FOLD_FIXES = (("İ", "i"), ("ı", "i"), ("ſ", "s"))
+
+
+def _fold_case(text: str) -> Optional[str]:
+    """
+    Lowercase text position-for-position, folding like re.IGNORECASE.
+
+    Returns None if the result would not line up with the input.
+    """
+    if text.isascii():
+        return text.lower()
+    for char, ascii_char in _FOLD_FIXES:
+        if char in text:
+            text = text.replace(char, ascii_char)
+    folded = text.lower()
+    return folded if len(folded) == len(text) else None
+
+
+@dataclass
+class _ScanHits:
+    """Everything analyze() needs from a single pass over the content."""
+
+    markers: Set[str] = field(default_factory=set)
+    patterns: Set[int] = field(default_factory=set)
+    # None when not computed (non-ASCII content); resolved lazily
+    rot13_keywords: Optional[Set[str]] = None
+
+
+class _ShieldScanner:
+    """
+    Multi-pattern engine behind PromptShield.analyze.
+
+    Content is case-folded window by window and searched for literal anchors
+    (pattern prefixes, markers, ROT13-encoded keywords) with str.find. A
+    pattern is only verified with pattern.match() where one of its anchors
+    occurs, always against the full content so matches may cross windows.
+    Windows overlap by the longest literal minus one, so no literal is lost
+    at a boundary.
+    """
+
+    # A full pattern.search() costs about as much as verifying one anchor
+    # hit per this many chars; past that budget a pattern is searched instead
+    CHARS_PER_PROBE = 256
+    MIN_PROBES = 64
+
+    def __init__(
+        self,
+        patterns: List[Tuple[re.Pattern, str, InjectionType, float]],
+        markers: List[str],
+    ):
+        self.patterns = patterns
+        self.markers = markers
+        self.anchors = [_PATTERN_ANCHORS.get(pattern.pattern) for pattern, *_ in patterns]
+        self._marker_needles = [(marker, marker.lower()) for marker in markers]
+        self._rot13_needles = [
+            (keyword, codecs.encode(keyword, "rot_13")) for keyword in _DANGEROUS_KEYWORDS
+        ]
+        literals = [anchor for anchors in self.anchors if anchors for anchor in anchors]
+        literals += markers + list(_DANGEROUS_KEYWORDS)
+        self.overlap = max(len(literal) for literal in literals) - 1
+
+    def windows(self, length: int, size: int) -> Iterator[Tuple[int, int]]:
+        """Yield (start, end) windows covering length chars with overlap."""
+        size = max(size, self.overlap + 1)
+        start = 0
+        while True:
+            end = min(start + size, length)
+            yield start, end
+            if end == length:
+                return
+            start = end - self.overlap
+
+    def scan(self, content: str, window: int) -> _ScanHits:
+        """Find markers, matching patterns and ROT13 keywords in one pass."""
+        hits = _ScanHits()
+        is_ascii = content.isascii()
+        if is_ascii:
+            hits.rot13_keywords = set()
+        # Patterns already decided (matched, or searched in full)
+        resolved: Set[int] = set()
+        probes = [0] * len(self.patterns)
+        max_probes = max(self.MIN_PROBES, len(content) // self.CHARS_PER_PROBE)
+        foldable = True
+
+        for start, end in self.windows(len(content), window):
+            chunk = content if start == 0 and end == len(content) else content[start:end]
+            folded = _fold_case(chunk)
+            if folded is None:
+                foldable = False
+
+            if is_ascii:
+                for marker, needle in self._marker_needles:
+                    if needle in folded:
+                        hits.markers.add(marker)
+                for keyword, needle in self._rot13_needles:
+                    if needle in folded:
+                        hits.rot13_keywords.add(keyword)
+            else:
+                # Markers are defined against str.upper(), which can expand
+                # characters; keep those exact semantics for non-ASCII text
+                upper = chunk.upper()
+                for marker in self.markers:
+                    if marker in upper:
+                        hits.markers.add(marker)
+
+            if not foldable:
+                continue
+            for index, (pattern, *_) in enumerate(self.patterns):
+                anchors = self.anchors[index]
+                if anchors is None or index in resolved:
+                    continue
+                for anchor in anchors:
+                    pos = folded.find(anchor)
+                    while pos != -1 and index not in resolved:
+                        if probes[index] >= max_probes:
+                            # Anchor too common here: one regex pass is cheaper.
+                            # Every earlier candidate was already rejected.
+                            resolved.add(index)
+                            if pattern.search(content, start + pos):
+                                hits.patterns.add(index)
+                            break
+                        probes[index] += 1
+                        if pattern.match(content, start + pos):
+                            resolved.add(index)
+                            hits.patterns.add(index)
+                        pos = folded.find(anchor, pos + 1)
+
+        # No anchors known (or content could not be folded): plain search
+        for index, (pattern, *_) in enumerate(self.patterns):
+            if index in resolved or (foldable and self.anchors[index] is not None):
+                continue
+            if pattern.search(content):
+                hits.patterns.add(index)
+        return hits
+
+    def rot13_keywords(self, content: str, window: int) -> Set[str]:
+        """Keywords present in the ROT13 decoding of content."""
+        found: Set[str] = set()
+        for start, end in self.windows(len(content), window):
+            decoded = codecs.decode(content[start:end], "rot_13").lower()
+            for keyword in _DANGEROUS_KEYWORDS:
+                if keyword in decoded:
+                    found.add(keyword)
+        return found
+
+
+_SCANNER = _ShieldScanner(INJECTION_PATTERNS, INDIRECT_INJECTION_MARKERS)
+
+
+class _ResultCache:
+    """Thread-safe LRU of ShieldResults, bounded by entries and total chars."""
+
+    def __init__(self, max_entries: int, max_chars: int):
+        self.max_entries = max_entries
+        self.max_chars = max_chars
+        self._entries: OrderedDict[tuple, Tuple[ShieldResult, int]] = OrderedDict()
+        self._chars = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[ShieldResult]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: tuple, result: ShieldResult, size: int) -> None:
+        if size > self.max_chars:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._chars -= old[1]
+            self._entries[key] = (result, size)
+            self._chars += size
+            while len(self._entries) > self.max_entries or self._chars > self.max_chars:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._chars -= evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._chars = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
 
 class PromptShield:
     """
@@ -341,7 +610,9 @@ class PromptShield:
 
     PERFORMANCE OPTIMIZATIONS:
     - Compiled regex patterns (module-level)
-    - LRU cache for repeated checks
+    - Single anchor scan; patterns only verified at candidate positions
+    - Windowed scanning of very large inputs (SCAN_WINDOW chars per pass)
+    - LRU cache of results keyed by content hash
     - Early exit on high-confidence detections
     - Lazy evaluation where possible
 
@@ -355,6 +626,10 @@ class PromptShield:
 
     # Cache size for repeated content checks
     CACHE_SIZE = 1024
+    # Total content chars kept alive by the result cache
+    CACHE_MAX_CHARS = 16 * 1024 * 1024
+    # Chars case-folded and scanned per window
+    SCAN_WINDOW = 1024 * 1024
 
     def __init__(
         self, threshold: float = 0.7, check_indirect: bool = True, strict_mode: bool = False
@@ -371,10 +646,10 @@ class PromptShield:
         self.check_indirect = check_indirect
         self.strict_mode = strict_mode
 
-    @lru_cache(maxsize=CACHE_SIZE)
     def _get_content_hash(self, content: str) -> str:
         """Get hash of content for caching."""
-        return hashlib.md5(content.encode(), usedforsecurity=False).hexdigest()
+        # Collision resistant: a forged collision must not reuse a safe verdict
+        return hashlib.sha256(content.encode("utf-8", "surrogatepass")).hexdigest()
 
     def analyze(self, content: str, source: str = "user") -> ShieldResult:
         """
@@ -390,14 +665,34 @@ class PromptShield:
         if not content or not content.strip():
             return ShieldResult.safe(content)
 
+        key = (
+            self._get_content_hash(content),
+            self.threshold,
+            self.check_indirect,
+            self.strict_mode,
+        )
+        result = _RESULT_CACHE.get(key)
+        if result is None:
+            result = self._analyze_uncached(content)
+            _RESULT_CACHE.put(key, result, len(content))
+        # Callers may mutate the lists; never hand out the cached instance
+        return replace(
+            result,
+            detected_threats=list(result.detected_threats),
+            matched_patterns=list(result.matched_patterns),
+            recommendations=list(result.recommendations),
+        )
+
+    def _analyze_uncached(self, content: str) -> ShieldResult:
+        """Run the full analysis (see analyze)."""
         detected_threats: List[InjectionType] = []
         matched_patterns: List[str] = []
         max_severity = 0.0
+        hits = _SCANNER.scan(content, self.SCAN_WINDOW)
 
         # Fast path: Check for obvious markers first
-        content_upper = content.upper()
-        for marker in INDIRECT_INJECTION_MARKERS:
-            if marker in content_upper:
+        for marker in _SCANNER.markers:
+            if marker in hits.markers:
                 detected_threats.append(InjectionType.INDIRECT_INJECTION)
                 matched_patterns.append(f"Indirect marker: {marker[:30]}")
                 max_severity = max(max_severity, 0.9)
@@ -407,8 +702,8 @@ class PromptShield:
                     )
 
         # Pattern matching
-        for pattern, description, threat_type, severity in INJECTION_PATTERNS:
-            if pattern.search(content):
+        for index, (_, description, threat_type, severity) in enumerate(_SCANNER.patterns):
+            if index in hits.patterns:
                 detected_threats.append(threat_type)
                 matched_patterns.append(description)
                 max_severity = max(max_severity, severity)
@@ -441,7 +736,7 @@ class PromptShield:
                 return indirect_result
 
         # Check for base64 encoded attacks
-        base64_result = self._check_base64_injection(content)
+        base64_result = self._check_base64_injection(content, hits.rot13_keywords)
         if not base64_result.is_safe:
             return base64_result
 
@@ -452,16 +747,21 @@ class PromptShield:
         threats: List[InjectionType] = []
         patterns: List[str] = []
 
-        # Check for hidden instructions in various formats
-        hidden_patterns = [
-            (r"<!--.*?(ignore|system|prompt|instruction).*?-->", "HTML comment injection"),
-            (r"/\*.*?(ignore|system|prompt|instruction).*?\*/", "Multi-line comment injection"),
-            (r"//.*?(ignore|system|prompt|instruction)", "Single-line comment injection"),
-            (r"#.*?(ignore|system|prompt|instruction)", "Hash comment injection"),
-        ]
-
-        for pattern, description in hidden_patterns:
-            if re.search(pattern, content, re.IGNORECASE | re.DOTALL):
+        # Check for hidden instructions in various formats: a keyword after
+        # the first opener (and before the last closer, if any). Same result
+        # as "<!--.*?(keyword).*?-->" with DOTALL, in linear time.
+        folded = _fold_case(content)
+        for opener, closer, description in _HIDDEN_COMMENT_CHECKS:
+            start = content.find(opener)
+            end = len(content) if closer is None else content.rfind(closer)
+            if start == -1 or end == -1:
+                continue
+            start += len(opener)
+            if folded is None:
+                found = _HIDDEN_KEYWORD.search(content, start, end) is not None
+            else:
+                found = any(folded.find(keyword, start, end) != -1 for keyword in _HIDDEN_KEYWORDS)
+            if found:
                 threats.append(InjectionType.INDIRECT_INJECTION)
                 patterns.append(description)
 
@@ -470,23 +770,20 @@ class PromptShield:
 
         return ShieldResult.safe(content)
 
-    def _check_base64_injection(self, content: str) -> ShieldResult:
-        """Check for base64 and other encoded attacks."""
+    def _check_base64_injection(
+        self, content: str, rot13_keywords: Optional[Set[str]] = None
+    ) -> ShieldResult:
+        """
+        Check for base64 and other encoded attacks.
+
+        Args:
+            content: Content to check
+            rot13_keywords: Keywords already found in the ROT13 decoding
+                (from the anchor scan); computed here when None
+        """
         import base64
-        import codecs
-
-        dangerous_keywords = [
-            "ignore",
-            "previous",
-            "instruction",
-            "system",
-            "prompt",
-            "jailbreak",
-            "dan",
-            "override",
-            "bypass",
-            "disable",
-        ]
+
+        dangerous_keywords = _DANGEROUS_KEYWORDS
 
         # Check for hex escape sequences (e.g., \x69\x67\x6e\x6f\x72\x65 = "ignore")
         hex_pattern = re.compile(r"(?:\\x[0-9a-fA-F]{2})+")
@@ -511,9 +808,10 @@ class PromptShield:
 
         # Check for ROT13 encoding (used to obfuscate text)
         try:
-            rot13_decoded = codecs.decode(content, "rot_13")
+            if rot13_keywords is None:
+                rot13_keywords = _SCANNER.rot13_keywords(content, self.SCAN_WINDOW)
             for keyword in dangerous_keywords:
-                if keyword.lower() in rot13_decoded.lower():
+                if keyword in rot13_keywords:
                     return ShieldResult.threat(
                         content,
                         ThreatLevel.MEDIUM,
@@ -646,6 +944,9 @@ class PromptShield:
 # Convenience functions
 
 
+_RESULT_CACHE = _ResultCache(PromptShield.CACHE_SIZE, PromptShield.CACHE_MAX_CHARS)
+
+
 def analyze_prompt(content: str) -> ShieldResult:
     """Quick analysis of prompt content."""
     return PromptShield().analyze(content)
@@ -6,6 +6,8 @@ This package provides session management for qwen-dev-cli.
 Submodules:
     - types: Domain models (SessionState, SessionSnapshot, etc.)
     - storage: I/O operations for session files
+    - journal: Append-only, checksummed log of session deltas
+    - catalog: SQLite FTS5 index for session listing and search
     - manager: SessionManager class
 
 Usage:
@@ -22,7 +24,9 @@ from .types import (
     ConversationMessage,
     SessionSnapshot,
     SessionInfo,
+    SessionSearchHit,
 )
+from .catalog import SessionCatalog
 from .manager import SessionManager
 
 
@@ -73,8 +77,10 @@ __all__ = [
     "ConversationMessage",
     "SessionSnapshot",
     "SessionInfo",
+    "SessionSearchHit",
     # Manager
     "SessionManager",
+    "SessionCatalog",
     # Singleton
     "get_session_manager",
     # Convenience functions
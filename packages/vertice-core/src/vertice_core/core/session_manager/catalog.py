@@ -0,0 +1,400 @@
+"""
+Session Catalog - SQLite index of session metadata and message text.
+
+SessionManager keeps the catalog current as sessions are saved, so listing,
+searching and ranking sessions never loads a session file. Titles and
+messages are indexed with FTS5 (bm25 ranking, prefix matching); SQLite
+builds without FTS5 fall back to LIKE scans of the same tables.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from .types import (
+    ConversationMessage,
+    SessionInfo,
+    SessionSearchHit,
+    SessionSnapshot,
+    SessionState,
+)
+
+logger = logging.getLogger(__name__)
+
+TITLE_WEIGHT = 5.0  # bm25 weight of a title match relative to message text
+SNIPPET_TOKENS = 12
+
+_TOKEN_RE = re.compile(r"\w+")
+
+_SESSION_COLUMNS = (
+    "session_id, state, created_at, updated_at, message_count, working_directory,"
+    " title, model, input_tokens, output_tokens"
+)
+
+
+class SessionCatalog:
+    """
+    Searchable catalog of stored sessions.
+
+    Usage:
+        catalog = SessionCatalog(session_dir / "sessions_catalog.db")
+        catalog.index_session(snapshot, title="Fix the login bug")
+        catalog.search_sessions("login")
+        catalog.search_messages("login", limit=20)
+        catalog.recent(10)
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Open (or create) a catalog.
+
+        Args:
+            db_path: SQLite database file.
+        """
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self.fts_enabled = _init_catalog(self._conn)
+
+    def index_session(self, snapshot: SessionSnapshot, title: str, start: int = 0) -> None:
+        """
+        Add a session's new messages and refresh its metadata row.
+
+        Args:
+            snapshot: Session to index.
+            title: Display title (the session summary).
+            start: Index of the first message not yet catalogued; 0 re-indexes
+                the whole session.
+        """
+        session_id = snapshot.session_id
+        messages = snapshot.messages[start:]
+        input_tokens, output_tokens = _token_totals(messages)
+        model = _latest_model(messages) or snapshot.context.get("model")
+
+        with self._lock, self._conn:
+            conn = self._conn
+            if start == 0:
+                conn.execute("DELETE FROM documents WHERE session_id = ?", (session_id,))
+
+            row = conn.execute(
+                "SELECT id, title FROM documents WHERE session_id = ? AND message_index = -1",
+                (session_id,),
+            ).fetchone()
+            if row is None or row[1] != title:
+                if row is not None:
+                    conn.execute("DELETE FROM documents WHERE id = ?", (row[0],))
+                conn.execute(
+                    "INSERT INTO documents (session_id, message_index, role, title, content)"
+                    " VALUES (?, -1, '', ?, '')",
+                    (session_id, title),
+                )
+
+            conn.executemany(
+                "INSERT INTO documents (session_id, message_index, role, title, content)"
+                " VALUES (?, ?, ?, '', ?)",
+                [
+                    (session_id, start + i, message.role, message.content)
+                    for i, message in enumerate(messages)
+                ],
+            )
+
+            token_update = (
+                "input_tokens = excluded.input_tokens, output_tokens = excluded.output_tokens"
+                if start == 0
+                else "input_tokens = sessions.input_tokens + excluded.input_tokens,"
+                " output_tokens = sessions.output_tokens + excluded.output_tokens"
+            )
+            conn.execute(
+                f"INSERT INTO sessions ({_SESSION_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(session_id) DO UPDATE SET"
+                " state = excluded.state, updated_at = excluded.updated_at,"
+                " message_count = excluded.message_count,"
+                " working_directory = excluded.working_directory, title = excluded.title,"
+                f" model = COALESCE(excluded.model, sessions.model), {token_update}",
+                (
+                    session_id,
+                    snapshot.state.value,
+                    snapshot.created_at,
+                    snapshot.updated_at,
+                    len(snapshot.messages),
+                    snapshot.working_directory,
+                    title,
+                    model,
+                    input_tokens,
+                    output_tokens,
+                ),
+            )
+
+    def indexed_count(self, session_id: str) -> Optional[int]:
+        """Number of messages catalogued for a session, None if unknown."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT message_count FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def remove_sessions(self, session_ids: Iterable[str]) -> None:
+        """Drop sessions from the catalog."""
+        ids = [(session_id,) for session_id in session_ids]
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM documents WHERE session_id = ?", ids)
+            self._conn.executemany("DELETE FROM sessions WHERE session_id = ?", ids)
+
+    def count(self) -> int:
+        """Number of catalogued sessions."""
+        with self._lock:
+            return self._conn.execute("SELECT count(*) FROM sessions").fetchone()[0]
+
+    def recent(self, limit: int = 20) -> List[SessionInfo]:
+        """Most recently updated sessions."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_SESSION_COLUMNS} FROM sessions ORDER BY updated_at DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [_session_info(row) for row in rows]
+
+    def search_sessions(self, query: str, limit: int = 10) -> List[SessionInfo]:
+        """
+        Sessions whose title or messages match, best match first.
+
+        Every query term must match (as a word prefix) within one title or
+        message.
+        """
+        if self.fts_enabled:
+            match = _match_expression(query)
+            if match is None:
+                return []
+            sql = (
+                # LIMIT keeps SQLite from flattening bm25() into the aggregate
+                f"SELECT {_SESSION_COLUMNS} FROM sessions JOIN ("
+                "  SELECT d.session_id AS sid, min(h.rank) AS best FROM ("
+                f"    SELECT rowid, bm25(documents_fts, {TITLE_WEIGHT}, 1.0) AS rank"
+                "     FROM documents_fts WHERE documents_fts MATCH ? LIMIT -1"
+                "  ) h JOIN documents d ON d.id = h.rowid GROUP BY d.session_id"
+                ") ON sid = session_id ORDER BY best, updated_at DESC LIMIT ?"
+            )
+            params: Tuple = (match, limit)
+        else:
+            where, terms = _like_filter(query)
+            if where is None:
+                return []
+            sql = (
+                f"SELECT {_SESSION_COLUMNS} FROM sessions WHERE session_id IN ("
+                f"  SELECT session_id FROM documents WHERE {where}"
+                ") ORDER BY updated_at DESC LIMIT ?"
+            )
+            params = (*terms, limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [_session_info(row) for row in rows]
+
+    def search_messages(
+        self, query: str, limit: int = 20, session_id: Optional[str] = None
+    ) -> List[SessionSearchHit]:
+        """
+        Individual titles and messages matching a query, best match first.
+
+        Args:
+            query: Search text; every term must match as a word prefix.
+            limit: Maximum number of hits.
+            session_id: Restrict to one session.
+        """
+        session_filter = " AND d.session_id = ?" if session_id else ""
+        if self.fts_enabled:
+            match = _match_expression(query)
+            if match is None:
+                return []
+            sql = (
+                "SELECT d.session_id, d.message_index, d.role, d.title, d.content,"
+                f" snippet(documents_fts, -1, '[', ']', '…', {SNIPPET_TOKENS}),"
+                f" bm25(documents_fts, {TITLE_WEIGHT}, 1.0) AS rank"
+                " FROM documents_fts JOIN documents d ON d.id = documents_fts.rowid"
+                f" WHERE documents_fts MATCH ?{session_filter} ORDER BY rank LIMIT ?"
+            )
+            params: Tuple = (match,)
+        else:
+            where, terms = _like_filter(query, prefix="d.")
+            if where is None:
+                return []
+            sql = (
+                "SELECT d.session_id, d.message_index, d.role, d.title, d.content, '', 0.0"
+                f" FROM documents d WHERE {where}{session_filter} ORDER BY d.id DESC LIMIT ?"
+            )
+            params = tuple(terms)
+        params += (session_id, limit) if session_id else (limit,)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        hits = []
+        for sid, index, role, title, content, snippet, rank in rows:
+            text = content or title
+            hits.append(
+                SessionSearchHit(
+                    session_id=sid,
+                    message_index=index,
+                    role=role,
+                    content=text,
+                    snippet=snippet or _fallback_snippet(text, query),
+                    rank=rank,
+                )
+            )
+        return hits
+
+    def clear(self) -> None:
+        """Remove everything from the catalog."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM documents")
+            self._conn.execute("DELETE FROM sessions")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def _init_catalog(conn: sqlite3.Connection) -> bool:
+    """Create the catalog tables; returns whether the FTS5 index is available."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS sessions (
+            session_id TEXT PRIMARY KEY,
+            state TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL,
+            message_count INTEGER NOT NULL,
+            working_directory TEXT NOT NULL,
+            title TEXT NOT NULL,
+            model TEXT,
+            input_tokens INTEGER NOT NULL DEFAULT 0,
+            output_tokens INTEGER NOT NULL DEFAULT 0
+        )
+        """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_updated ON sessions (updated_at)")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS documents (
+            id INTEGER PRIMARY KEY,
+            session_id TEXT NOT NULL,
+            message_index INTEGER NOT NULL,
+            role TEXT NOT NULL,
+            title TEXT NOT NULL,
+            content TEXT NOT NULL
+        )
+        """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_documents_session ON documents (session_id)")
+
+    try:
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+                title, content,
+                content='documents', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            )
+            """)
+    except sqlite3.OperationalError as e:
+        logger.warning(f"SQLite FTS5 unavailable, session search falls back to LIKE: {e}")
+        return False
+
+    # Keep the external-content FTS index in step with the documents table
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS documents_ai AFTER INSERT ON documents BEGIN
+            INSERT INTO documents_fts (rowid, title, content)
+            VALUES (new.id, new.title, new.content);
+        END
+        """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS documents_ad AFTER DELETE ON documents BEGIN
+            INSERT INTO documents_fts (documents_fts, rowid, title, content)
+            VALUES ('delete', old.id, old.title, old.content);
+        END
+        """)
+    return True
+
+
+def _match_expression(query: str) -> Optional[str]:
+    """FTS5 query requiring every term as a word prefix; None if no terms."""
+    terms = _TOKEN_RE.findall(query)
+    if not terms:
+        return None
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def _like_filter(query: str, prefix: str = "") -> Tuple[Optional[str], List[str]]:
+    """LIKE-based equivalent of _match_expression for builds without FTS5."""
+    terms = _TOKEN_RE.findall(query)
+    if not terms:
+        return None, []
+    clause = f"({prefix}title LIKE ? ESCAPE '\\' OR {prefix}content LIKE ? ESCAPE '\\')"
+    params = []
+    for term in terms:
+        pattern = "%" + re.sub(r"([\\%_])", r"\\\1", term) + "%"
+        params.extend([pattern, pattern])
+    return " AND ".join([clause] * len(terms)), params
+
+
+def _fallback_snippet(text: str, query: str, width: int = 40) -> str:
+    """Text around the first query term, for hits without an FTS snippet."""
+    terms = _TOKEN_RE.findall(query)
+    pos = text.lower().find(terms[0].lower()) if terms else -1
+    if pos == -1:
+        return text[: width * 2]
+    start = max(0, pos - width)
+    snippet = text[start : pos + width]
+    return ("…" if start else "") + snippet + ("…" if pos + width < len(text) else "")
+
+
+def _token_totals(messages: Sequence[ConversationMessage]) -> Tuple[int, int]:
+    """Sum input/output token counts recorded in message metadata."""
+    input_tokens = output_tokens = 0
+    for message in messages:
+        metadata = message.metadata
+        try:
+            input_tokens += int(metadata.get("input_tokens", metadata.get("prompt_tokens", 0)))
+            output_tokens += int(
+                metadata.get("output_tokens", metadata.get("completion_tokens", 0))
+            )
+            if "tokens" in metadata:
+                if message.role == "assistant":
+                    output_tokens += int(metadata["tokens"])
+                else:
+                    input_tokens += int(metadata["tokens"])
+        except (TypeError, ValueError):
+            continue
+    return input_tokens, output_tokens
+
+
+def _latest_model(messages: Sequence[ConversationMessage]) -> Optional[str]:
+    for message in reversed(messages):
+        model = message.metadata.get("model")
+        if model:
+            return str(model)
+    return None
+
+
+def _session_info(row: Tuple) -> SessionInfo:
+    session_id, state, created_at, updated_at, message_count, working_directory = row[:6]
+    title, model, input_tokens, output_tokens = row[6:]
+    return SessionInfo(
+        session_id=session_id,
+        state=SessionState(state),
+        created_at=created_at,
+        updated_at=updated_at,
+        message_count=message_count,
+        working_directory=working_directory,
+        summary=title,
+        model=model,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+    )
+
+
+__all__ = ["SessionCatalog"]
@@ -0,0 +1,253 @@
+"""
+Session Journal - Append-only log of session deltas.
+
+Every message or state change becomes one framed record:
+
+    [payload length: u32 LE][CRC32 of payload: u32 LE][compact JSON payload]
+
+Records carry a monotonically increasing ``seq``. A snapshot stores the
+``journal_seq`` it already contains, so replay applies only newer records
+and a crash between writing a snapshot and truncating the journal is
+harmless. Replay stops at the first torn or corrupt frame; opening the
+journal for append truncates that tail so new records stay reachable.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .storage import _json_serialize_handler
+from .types import ConversationMessage, SessionSnapshot, SessionState
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct("<II")
+
+# Guard against reading a garbage length as a huge allocation
+MAX_RECORD_BYTES = 64 * 1024 * 1024
+
+
+def encode_record(record: Dict[str, Any]) -> bytes:
+    """Frame a record for the journal."""
+    payload = json.dumps(
+        record, separators=(",", ":"), ensure_ascii=False, default=_json_serialize_handler
+    ).encode("utf-8")
+    return _HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def read_journal(path: Path) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Read all intact records from a journal file.
+
+    Args:
+        path: Journal file path.
+
+    Returns:
+        (records, valid_length) where valid_length is the byte offset just
+        past the last intact record.
+    """
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return [], 0
+
+    records: List[Dict[str, Any]] = []
+    offset = 0
+    while offset + _HEADER.size <= len(data):
+        length, crc = _HEADER.unpack_from(data, offset)
+        start = offset + _HEADER.size
+        end = start + length
+        if length > MAX_RECORD_BYTES or end > len(data):
+            break
+        payload = data[start:end]
+        if zlib.crc32(payload) != crc:
+            break
+        try:
+            records.append(json.loads(payload))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            break
+        offset = end
+
+    if offset < len(data):
+        logger.warning(f"Ignoring {len(data) - offset} torn/corrupt bytes at end of {path}")
+    return records, offset
+
+
+def apply_record(snapshot: SessionSnapshot, record: Dict[str, Any]) -> None:
+    """Apply one journal record to a snapshot in place."""
+    op = record.get("op")
+
+    if op == "message":
+        snapshot.messages.append(ConversationMessage.from_dict(record["message"]))
+    elif op == "context":
+        snapshot.context[record["key"]] = record["value"]
+    elif op == "pending":
+        snapshot.pending_operations.append(record["operation"])
+    elif op == "pending_clear":
+        snapshot.pending_operations = []
+    elif op == "file":
+        tracked = {
+            "read": snapshot.read_files,
+            "modify": snapshot.modified_files,
+            "delete": snapshot.deleted_files,
+        }.get(record["operation"])
+        if tracked is not None:
+            tracked.add(record["path"])
+    elif op == "environment":
+        snapshot.environment_snapshot = record["environment"]
+    elif op == "state":
+        snapshot.state = SessionState(record["state"])
+    else:
+        logger.warning(f"Skipping unknown session journal op: {op!r}")
+
+    snapshot.updated_at = record.get("updated_at", snapshot.updated_at)
+    snapshot.journal_seq = record.get("seq", snapshot.journal_seq)
+
+
+def replay_journal(snapshot: SessionSnapshot, path: Path) -> int:
+    """
+    Replay journal records newer than the snapshot onto it.
+
+    Args:
+        snapshot: Snapshot loaded from disk (modified in place).
+        path: Journal file path.
+
+    Returns:
+        Number of records applied.
+    """
+    records, _ = read_journal(path)
+    applied = 0
+    for record in records:
+        if record.get("seq", 0) <= snapshot.journal_seq:
+            continue
+        try:
+            apply_record(snapshot, record)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Stopping replay of {path} at malformed record: {e}")
+            break
+        applied += 1
+    return applied
+
+
+class SessionJournal:
+    """
+    Append-only journal file for one session.
+
+    Usage:
+        journal = SessionJournal(path, start_seq=snapshot.journal_seq)
+        journal.append([{"op": "message", "message": {...}}])
+        journal.truncate()  # after a compacting snapshot
+    """
+
+    def __init__(self, path: Path, start_seq: int = 0, sync_on_write: bool = True):
+        """
+        Open (or create) a journal for appending.
+
+        Args:
+            path: Journal file path.
+            start_seq: Last sequence number already stored in the snapshot.
+            sync_on_write: fsync the journal after every append.
+        """
+        self.path = path
+        self.sync_on_write = sync_on_write
+
+        records, valid_length = read_journal(path)
+        last_seq = records[-1].get("seq", 0) if records else 0
+        self.seq = max(start_seq, last_seq)
+
+        created = not path.exists()
+        self._fd: Optional[int] = os.open(
+            str(path), os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0), 0o644
+        )
+        if os.fstat(self._fd).st_size != valid_length:
+            os.ftruncate(self._fd, valid_length)
+            self._sync_file()
+        self.size = valid_length
+
+        if created:
+            self._sync_directory()
+
+    def append(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Append records with a single write and fsync.
+
+        Sequence numbers are assigned here.
+
+        Returns:
+            Number of bytes written.
+        """
+        if self._fd is None:
+            raise ValueError(f"Journal is closed: {self.path}")
+
+        frames = []
+        seq = self.seq
+        for record in records:
+            seq += 1
+            frames.append(encode_record({**record, "seq": seq}))
+        if not frames:
+            return 0
+
+        data = b"".join(frames)
+        view = memoryview(data)
+        try:
+            while view:
+                written = os.write(self._fd, view)
+                view = view[written:]
+            self._sync_file()
+        except BaseException:
+            # Cut off a torn frame so a retried append is not stranded behind it
+            try:
+                os.ftruncate(self._fd, self.size)
+            except OSError as e:
+                logger.warning(f"Could not roll back journal {self.path}: {e}")
+            raise
+
+        self.seq = seq
+        self.size += len(data)
+        return len(data)
+
+    def truncate(self) -> None:
+        """Drop all records (they are folded into a newer snapshot)."""
+        if self._fd is None:
+            raise ValueError(f"Journal is closed: {self.path}")
+        os.ftruncate(self._fd, 0)
+        self._sync_file()
+        self.size = 0
+
+    def close(self) -> None:
+        """Close the journal file."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _sync_file(self) -> None:
+        if self.sync_on_write:
+            os.fsync(self._fd)
+
+    def _sync_directory(self) -> None:
+        """Make the new journal's directory entry durable."""
+        if not self.sync_on_write:
+            return
+        try:
+            dir_fd = os.open(str(self.path.parent), os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except (OSError, AttributeError):
+            pass  # Best effort, not available on all platforms
+
+
+__all__ = [
+    "SessionJournal",
+    "encode_record",
+    "read_journal",
+    "apply_record",
+    "replay_journal",
+]
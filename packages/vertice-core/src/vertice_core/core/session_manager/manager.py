@@ -10,6 +10,7 @@ import hashlib
 import json
 import logging
 import os
+import sqlite3
 import threading
 import time
 from datetime import datetime
@@ -19,10 +20,14 @@ from typing import Any, Dict, List, Optional
 from .types import (
     ConversationMessage,
     SessionInfo,
+    SessionSearchHit,
     SessionSnapshot,
     SessionState,
 )
+from .catalog import SessionCatalog
+from .journal import SessionJournal, replay_journal
 from .storage import (
+    get_journal_path,
     get_session_path,
     load_index,
     load_session,
@@ -39,11 +44,17 @@ class SessionManager:
 
     Features:
     - Auto-save at configurable intervals
+    - Append-only journal: a save appends only what changed since the
+      last one (one fsync), so save cost does not grow with the session
+    - Periodic compaction into a full snapshot
     - Checksum verification for corruption detection
     - Automatic crash recovery
-    - Session history with search
+    - Session history with indexed full-text search (SQLite FTS5 catalog)
     - Compression for storage efficiency
 
+    Session state must be changed through the manager's methods
+    (add_message, update_context, ...) so the change is journaled.
+
     Usage:
         manager = SessionManager()
         session = manager.start_session()
@@ -54,9 +65,12 @@ class SessionManager:
     SESSION_DIR = ".vertice/sessions"
     CURRENT_SESSION_FILE = "current_session.json"
     INDEX_FILE = "sessions_index.json"
+    CATALOG_FILE = "sessions_catalog.db"
     AUTO_SAVE_INTERVAL = 30  # seconds
     MAX_SESSIONS = 50  # Keep last N sessions
     COMPRESSION_THRESHOLD = 10 * 1024  # Compress if > 10KB
+    JOURNAL_COMPACT_BYTES = 1024 * 1024  # Compact once the journal outgrows this...
+    # ...and everything already folded into the snapshot (keeps compaction amortized O(1))
 
     def __init__(
         self,
@@ -73,6 +87,14 @@ class SessionManager:
 
         self._current_session: Optional[SessionSnapshot] = None
         self._dirty = False
+        self._journal: Optional[SessionJournal] = None
+        self._pending: List[Dict[str, Any]] = []  # Deltas not yet journaled
+        self._folded_bytes = 0  # Journal bytes compacted into the snapshot so far
+        self._save_lock = threading.RLock()  # Serializes saves and their file I/O
+        self._state_lock = threading.RLock()  # Guards session changes and _pending
+        self._catalog: Optional[SessionCatalog] = None
+        self._catalog_failed = False
+        self._catalog_indexed: Optional[int] = 0  # Messages catalogued; None = ask catalog
         self._last_save = time.time()
         self._auto_save_thread: Optional[threading.Thread] = None
         self._stop_auto_save = threading.Event()
@@ -90,6 +112,128 @@ class SessionManager:
         """Get path for session file."""
         return get_session_path(self.session_dir, session_id, self.enable_compression)
 
+    def _load_session(self, session_id: str) -> Optional[SessionSnapshot]:
+        """Load a session snapshot and replay its journal."""
+        session = load_session(self._get_session_path(session_id))
+        if session:
+            replay_journal(session, get_journal_path(self.session_dir, session_id))
+        return session
+
+    def _open_journal(self) -> None:
+        """Open the current session's journal for appending."""
+        self._close_journal()
+        session = self._current_session
+        self._journal = SessionJournal(
+            get_journal_path(self.session_dir, session.session_id),
+            start_seq=session.journal_seq,
+        )
+        self._pending = []
+        self._folded_bytes = 0
+
+    def _close_journal(self) -> None:
+        if self._journal:
+            self._journal.close()
+            self._journal = None
+
+    def _record(self, op: str, **fields: Any) -> None:
+        """Queue a delta for the next save and mark the session dirty.
+
+        Callers change the session under _state_lock too, so a save never
+        snapshots a change whose delta is then journaled again.
+        """
+        with self._state_lock:
+            session = self._current_session
+            session.updated_at = time.time()
+            self._pending.append({"op": op, "updated_at": session.updated_at, **fields})
+            self._dirty = True
+
+    def _compact(self) -> bool:
+        """Write a full snapshot and empty the journal it supersedes."""
+        session = self._current_session
+        with self._state_lock:
+            session.journal_seq = self._journal.seq if self._journal else session.journal_seq
+            data = session.to_dict()
+            # Queued deltas are part of the snapshot
+            records, self._pending = self._pending, []
+
+        if not save_session(
+            session,
+            self._get_session_path(session.session_id),
+            self.enable_compression,
+            self.COMPRESSION_THRESHOLD,
+            data=data,
+        ):
+            with self._state_lock:
+                self._pending = records + self._pending
+            return False
+
+        if self._journal:
+            self._folded_bytes += self._journal.size
+            self._journal.truncate()
+        return True
+
+    def _should_compact(self) -> bool:
+        size = self._journal.size
+        return size >= self.JOURNAL_COMPACT_BYTES and size >= self._folded_bytes
+
+    def _get_catalog(self) -> Optional[SessionCatalog]:
+        """Open the search catalog, rebuilding it if it is out of step with the index."""
+        with self._save_lock:
+            if self._catalog is None and not self._catalog_failed:
+                try:
+                    self._catalog = SessionCatalog(self.session_dir / self.CATALOG_FILE)
+                    index = load_index(self.session_dir, self.INDEX_FILE)
+                    if self._catalog.count() != len(index):
+                        self.rebuild_catalog()
+                except sqlite3.Error as e:
+                    logger.error(f"Session catalog unavailable: {e}")
+                    self._catalog = None
+                    self._catalog_failed = True
+            return self._catalog
+
+    def rebuild_catalog(self) -> int:
+        """
+        Re-index every session in the index from its files.
+
+        Returns:
+            Number of sessions indexed.
+        """
+        catalog = self._get_catalog()
+        if catalog is None:
+            return 0
+
+        catalog.clear()
+        indexed = 0
+        for session_id, data in load_index(self.session_dir, self.INDEX_FILE).items():
+            session = self._load_session(session_id)
+            if session:
+                catalog.index_session(session, data.get("summary", ""))
+                indexed += 1
+
+        self._catalog_indexed = None
+        return indexed
+
+    def _update_catalog(self, summary: str, pruned: List[str]) -> None:
+        """Catalog the current session's new messages; failures never fail a save."""
+        catalog = self._get_catalog()
+        if catalog is None:
+            return
+
+        session = self._current_session
+        try:
+            if pruned:
+                catalog.remove_sessions(pruned)
+            start = self._catalog_indexed
+            if start is None:
+                start = catalog.indexed_count(session.session_id) or 0
+            if start > len(session.messages):
+                start = 0
+            catalog.index_session(session, summary, start)
+            self._catalog_indexed = len(session.messages)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to update session catalog: {e}")
+            self._catalog_indexed = 0  # Re-index from scratch next time
+
     def _auto_save_loop(self) -> None:
         """Background thread for auto-saving."""
         while not self._stop_auto_save.wait(self.auto_save_interval):
@@ -109,12 +253,13 @@ class SessionManager:
         if self._auto_save_thread:
             self._auto_save_thread.join(timeout=1)
 
-    def _generate_summary(self) -> str:
+    def _generate_summary(self, session: Optional[SessionSnapshot] = None) -> str:
         """Generate brief summary of session."""
-        if not self._current_session:
+        session = session or self._current_session
+        if not session:
             return ""
 
-        messages = self._current_session.messages
+        messages = session.messages
         if not messages:
             return "Empty session"
 
@@ -150,8 +295,10 @@ class SessionManager:
             pending_operations=[],
         )
 
+        self._open_journal()
+        self._catalog_indexed = 0
         self._dirty = True
-        self.save()
+        self.save(compact=True)
         self._start_auto_save()
 
         logger.info(f"Started new session: {session_id}")
@@ -170,14 +317,14 @@ class SessionManager:
 
     def resume_session(self, session_id: str) -> Optional[SessionSnapshot]:
         """Resume an existing session."""
-        path = self._get_session_path(session_id)
-        session = load_session(path)
+        session = self._load_session(session_id)
 
         if session:
-            session.state = SessionState.RECOVERED
-            session.updated_at = time.time()
             self._current_session = session
-            self._dirty = True
+            self._open_journal()
+            self._catalog_indexed = None
+            session.state = SessionState.RECOVERED
+            self._record("state", state=session.state.value)
             self._start_auto_save()
 
             logger.info(f"Resumed session: {session_id}")
@@ -203,8 +350,7 @@ class SessionManager:
                 session_id = data.get("session_id")
 
                 if session_id:
-                    path = self._get_session_path(session_id)
-                    session = load_session(path)
+                    session = self._load_session(session_id)
 
                     if session and session.state == SessionState.ACTIVE:
                         session.state = SessionState.CRASHED
@@ -232,43 +378,40 @@ class SessionManager:
             metadata=metadata or {},
         )
 
-        self._current_session.messages.append(message)
-        self._current_session.updated_at = time.time()
-        self._dirty = True
+        with self._state_lock:
+            self._current_session.messages.append(message)
+            self._record("message", message=message.to_dict())
 
     def update_context(self, key: str, value: Any) -> None:
         """Update session context."""
         if not self._current_session:
             raise RuntimeError("No active session")
 
-        self._current_session.context[key] = value
-        self._current_session.updated_at = time.time()
-        self._dirty = True
+        with self._state_lock:
+            self._current_session.context[key] = value
+            self._record("context", key=key, value=value)
 
     def add_pending_operation(self, operation: Dict[str, Any]) -> None:
         """Add a pending operation (for crash recovery)."""
         if not self._current_session:
             return
 
-        self._current_session.pending_operations.append(operation)
-        self._dirty = True
+        with self._state_lock:
+            self._current_session.pending_operations.append(operation)
+            self._record("pending", operation=operation)
 
     def clear_pending_operations(self) -> List[Dict[str, Any]]:
         """Clear and return pending operations."""
         if not self._current_session:
             return []
 
-        operations = self._current_session.pending_operations
-        self._current_session.pending_operations = []
-        self._dirty = True
+        with self._state_lock:
+            operations = self._current_session.pending_operations
+            self._current_session.pending_operations = []
+            self._record("pending_clear")
 
         return operations
 
-    def _mark_dirty(self) -> None:
-        """Mark session as dirty (needs save)."""
-        self._current_session.updated_at = time.time()
-        self._dirty = True
-
     def track_file_operation(self, operation: str, path: str) -> None:
         """Track file operations for session history.
 
@@ -279,19 +422,22 @@ class SessionManager:
         if not self._current_session:
             return
 
-        if operation == "read":
-            self._current_session.read_files.add(path)
-        elif operation == "modify":
-            self._current_session.modified_files.add(path)
-        elif operation == "delete":
-            self._current_session.deleted_files.add(path)
+        with self._state_lock:
+            if operation == "read":
+                self._current_session.read_files.add(path)
+            elif operation == "modify":
+                self._current_session.modified_files.add(path)
+            elif operation == "delete":
+                self._current_session.deleted_files.add(path)
 
-        self._mark_dirty()
+            self._record("file", operation=operation, path=path)
 
     def capture_environment(self) -> None:
         """Capture current environment variables."""
         if self._current_session:
-            self._current_session.environment_snapshot = dict(os.environ)
+            with self._state_lock:
+                self._current_session.environment_snapshot = dict(os.environ)
+                self._record("environment", environment=self._current_session.environment_snapshot)
 
     def get_file_stats(self) -> Dict[str, int]:
         """Get file operation statistics."""
@@ -303,22 +449,56 @@ class SessionManager:
             "deleted": len(self._current_session.deleted_files),
         }
 
-    def save(self) -> bool:
-        """Save current session to disk."""
-        if not self._current_session:
-            return False
+    def save(self, compact: bool = False) -> bool:
+        """
+        Save current session to disk.
 
-        self._current_session.updated_at = time.time()
+        Appends the changes since the last save to the journal; writes a
+        full snapshot instead when compact=True or the journal has grown
+        past JOURNAL_COMPACT_BYTES and the data already folded into the
+        snapshot.
+        """
+        with self._save_lock:
+            if not self._current_session:
+                return False
+            if not self._save_locked(compact):
+                return False
 
-        # Save session file
-        path = self._get_session_path(self._current_session.session_id)
-        if not save_session(
-            self._current_session,
-            path,
-            self.enable_compression,
-            self.COMPRESSION_THRESHOLD,
-        ):
-            return False
+            with self._state_lock:
+                self._dirty = bool(self._pending)
+            self._last_save = time.time()
+
+        return True
+
+    def _save_locked(self, compact: bool) -> bool:
+        """Persist session data and bookkeeping; caller holds _save_lock.
+
+        Changes only wait for _state_lock while the queued deltas are handed
+        over, never for the fsync or snapshot write that follows.
+        """
+        with self._state_lock:
+            self._current_session.updated_at = time.time()
+
+        if self._journal is None:
+            # Session was set up without a journal: start one from a full snapshot
+            self._open_journal()
+            compact = True
+
+        if compact:
+            if not self._compact():
+                return False
+        else:
+            with self._state_lock:
+                records, self._pending = self._pending, []
+            try:
+                self._journal.append(records)
+            except (OSError, TypeError, ValueError):
+                logger.error("Failed to append to session journal", exc_info=True)
+                with self._state_lock:
+                    self._pending = records + self._pending
+                return False
+            if self._should_compact() and not self._compact():
+                return False
 
         # Update current session marker
         current_path = self.session_dir / self.CURRENT_SESSION_FILE
@@ -339,40 +519,69 @@ class SessionManager:
             working_directory=self._current_session.working_directory,
             summary=summary,
         )
-        update_index(self.session_dir, self.INDEX_FILE, info, self.max_sessions)
-
-        self._dirty = False
-        self._last_save = time.time()
-
+        pruned = update_index(self.session_dir, self.INDEX_FILE, info, self.max_sessions)
+        self._update_catalog(summary, pruned)
         return True
 
     def save_session(self, snapshot: SessionSnapshot) -> bool:
         """Alias for saving a specific snapshot (compatibility)."""
+        if snapshot is self._current_session:
+            return self.save(compact=True)
+
         path = self._get_session_path(snapshot.session_id)
-        return save_session(
+        if not save_session(
             snapshot,
             path,
             self.enable_compression,
             self.COMPRESSION_THRESHOLD,
-        )
+        ):
+            return False
+
+        # The snapshot is the whole truth now; replaying an old journal would duplicate
+        get_journal_path(self.session_dir, snapshot.session_id).unlink(missing_ok=True)
+
+        catalog = self._get_catalog()
+        if catalog is not None:
+            try:
+                catalog.index_session(snapshot, self._generate_summary(snapshot))
+            except sqlite3.Error as e:
+                logger.error(f"Failed to update session catalog: {e}")
+        return True
 
     def end_session(self) -> None:
         """End the current session gracefully."""
         if self._current_session:
-            self._current_session.state = SessionState.COMPLETED
-            self._current_session.updated_at = time.time()
-            self.save()
+            self._stop_auto_save_thread()
 
-            # Remove current session marker
-            current_path = self.session_dir / self.CURRENT_SESSION_FILE
-            if current_path.exists():
-                current_path.unlink()
+            with self._save_lock:
+                with self._state_lock:
+                    self._current_session.state = SessionState.COMPLETED
+                    self._current_session.updated_at = time.time()
+                saved = self.save(compact=True)
 
-            self._stop_auto_save_thread()
-            self._current_session = None
+                # A finished session is a single snapshot file
+                self._close_journal()
+                if saved:
+                    get_journal_path(self.session_dir, self._current_session.session_id).unlink(
+                        missing_ok=True
+                    )
+
+                # Remove current session marker
+                current_path = self.session_dir / self.CURRENT_SESSION_FILE
+                if current_path.exists():
+                    current_path.unlink()
+
+                self._current_session = None
 
     def list_sessions(self, limit: int = 20) -> List[SessionInfo]:
         """List recent sessions."""
+        catalog = self._get_catalog()
+        if catalog is not None:
+            try:
+                return catalog.recent(limit)
+            except sqlite3.Error as e:
+                logger.error(f"Session catalog query failed: {e}")
+
         index = load_index(self.session_dir, self.INDEX_FILE)
 
         if not index:
@@ -395,7 +604,44 @@ class SessionManager:
         return sessions[:limit]
 
     def search_sessions(self, query: str, limit: int = 10) -> List[SessionInfo]:
-        """Search sessions by content."""
+        """
+        Search sessions by title and message content, best match first.
+
+        Every query word must match as a word prefix. Uses the catalog, so
+        no session file is loaded; falls back to scanning session files
+        when the catalog is unavailable.
+        """
+        catalog = self._get_catalog()
+        if catalog is not None:
+            try:
+                return catalog.search_sessions(query, limit)
+            except sqlite3.Error as e:
+                logger.error(f"Session catalog query failed: {e}")
+
+        return self._scan_sessions(query, limit)
+
+    def search_messages(
+        self, query: str, limit: int = 20, session_id: Optional[str] = None
+    ) -> List[SessionSearchHit]:
+        """
+        Search individual messages (and session titles), best match first.
+
+        Args:
+            query: Search text; every word must match as a word prefix.
+            limit: Maximum number of hits.
+            session_id: Restrict the search to one session.
+        """
+        catalog = self._get_catalog()
+        if catalog is None:
+            return []
+        try:
+            return catalog.search_messages(query, limit, session_id)
+        except sqlite3.Error as e:
+            logger.error(f"Session catalog query failed: {e}")
+            return []
+
+    def _scan_sessions(self, query: str, limit: int) -> List[SessionInfo]:
+        """Substring search that loads each session file."""
         query_lower = query.lower()
         results = []
 
@@ -406,8 +652,7 @@ class SessionManager:
                 continue
 
             # Load full session and search messages
-            path = self._get_session_path(session_info.session_id)
-            session = load_session(path)
+            session = self._load_session(session_info.session_id)
 
             if session:
                 for msg in session.messages:
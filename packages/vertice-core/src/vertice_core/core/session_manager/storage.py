@@ -13,7 +13,7 @@ import logging
 import os
 import tempfile
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from .types import SessionSnapshot, SessionInfo
 
@@ -43,27 +43,40 @@ def get_session_path(session_dir: Path, session_id: str, enable_compression: boo
     return session_dir / f"{session_id}{ext}"
 
 
+def get_journal_path(session_dir: Path, session_id: str) -> Path:
+    """Get path for the session's append-only journal."""
+    return session_dir / f"{session_id}.journal"
+
+
 def save_session(
     snapshot: SessionSnapshot,
     path: Path,
     enable_compression: bool = True,
     compression_threshold: int = 10 * 1024,
+    data: Optional[Dict[str, Any]] = None,
 ) -> bool:
     """
     Save session snapshot to file with ATOMIC WRITE.
+
+    Full snapshots are only written when a session starts, ends or its
+    journal is compacted; everyday saves append to the journal instead.
+    Pass data to write a to_dict() copy taken earlier.
     """
     try:
-        data = snapshot.to_dict()
+        if data is None:
+            data = snapshot.to_dict()
         data["checksum"] = compute_checksum(data)
 
-        content = json.dumps(data, indent=2, default=_json_serialize_handler)
+        content = json.dumps(data, separators=(",", ":"), default=_json_serialize_handler)
 
         # Determine final path with correct extension
         if enable_compression and len(content) > compression_threshold:
             final_path = path.with_suffix(".json.gz")
+            stale_path = path.with_suffix(".json")
             use_compression = True
         else:
             final_path = path.with_suffix(".json")
+            stale_path = path.with_suffix(".json.gz")
             use_compression = False
 
         # P0 FIX: Atomic write using temp file + rename
@@ -73,27 +86,20 @@ def save_session(
         )
 
         try:
-            if use_compression:
-                # Close fd first, gzip.open will open fresh
-                os.close(fd)
-                with gzip.open(temp_path, "wt", encoding="utf-8") as f:
-                    f.write(content)
-            else:
-                # Write directly to fd
-                with os.fdopen(fd, "w", encoding="utf-8") as f:
-                    f.write(content)
-                # fd is now closed by context manager
-
-            # Ensure data is flushed to disk before rename
-            # (rename is atomic on POSIX, this ensures the temp file is complete)
-            if hasattr(os, "sync"):
-                os.sync()
+            with os.fdopen(fd, "wb") as f:
+                if use_compression:
+                    with gzip.GzipFile(fileobj=f, mode="wb") as gz:
+                        gz.write(content.encode("utf-8"))
+                else:
+                    f.write(content.encode("utf-8"))
+
+                # Ensure this file is on disk before the rename publishes it
+                f.flush()
+                os.fsync(f.fileno())
 
             # Atomic rename (overwrites existing file atomically on POSIX)
             os.replace(temp_path, str(final_path))
 
-            return True
-
         except (IOError, OSError, ValueError) as e:
             # Clean up temp file on failure
             logger.debug(f"Cleaning up temp file {temp_path} after I/O error: {e}")
@@ -103,6 +109,14 @@ def save_session(
                 logger.error(f"Failed to clean up temp file {temp_path}: {unlink_e}")
             raise
 
+        # load_session() prefers .json.gz; never leave an older copy behind
+        try:
+            stale_path.unlink()
+        except FileNotFoundError:
+            pass
+
+        return True
+
     except (OSError, IOError, ValueError, TypeError):
         logger.error(f"Failed to save session snapshot to {path}", exc_info=True)
         return False
@@ -163,7 +177,7 @@ def update_index(
     index_file: str,
     session_info: SessionInfo,
     max_sessions: int = 50,
-) -> None:
+) -> List[str]:
     """
     Update session index file.
 
@@ -172,6 +186,9 @@ def update_index(
         index_file: Name of the index file.
         session_info: Session info to add/update.
         max_sessions: Maximum number of sessions to keep.
+
+    Returns:
+        IDs of sessions pruned from the index.
     """
     index_path = session_dir / index_file
     index: Dict[str, Dict[str, Any]] = {}
@@ -192,13 +209,15 @@ def update_index(
     }
 
     # Prune old sessions
+    pruned: List[str] = []
     if len(index) > max_sessions:
         sorted_sessions = sorted(index.items(), key=lambda x: x[1]["updated_at"], reverse=True)
         index = dict(sorted_sessions[:max_sessions])
+        pruned = [session_id for session_id, _ in sorted_sessions[max_sessions:]]
 
         # Delete old session files
         for session_id, _ in sorted_sessions[max_sessions:]:
-            for ext in [".json", ".json.gz"]:
+            for ext in [".json", ".json.gz", ".journal"]:
                 path = session_dir / f"{session_id}{ext}"
                 if path.exists():
                     try:
@@ -207,6 +226,7 @@ def update_index(
                         pass
 
     index_path.write_text(json.dumps(index, indent=2, default=_json_serialize_handler))
+    return pruned
 
 
 def load_index(session_dir: Path, index_file: str) -> Dict[str, Dict[str, Any]]:
@@ -235,6 +255,7 @@ def load_index(session_dir: Path, index_file: str) -> Dict[str, Dict[str, Any]]:
 __all__ = [
     "compute_checksum",
     "get_session_path",
+    "get_journal_path",
     "save_session",
     "load_session",
     "update_index",
@@ -10,7 +10,7 @@ import os
 import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 
 class SessionState(Enum):
@@ -81,6 +81,9 @@ class SessionSnapshot:
     # Metadata
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # Last journal record folded into this snapshot
+    journal_seq: int = 0
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary."""
         return {
@@ -90,15 +93,16 @@ class SessionSnapshot:
             "updated_at": self.updated_at,
             "checksum": self.checksum,
             "messages": [m.to_dict() for m in self.messages],
-            "context": self.context,
+            "context": dict(self.context),
             "working_directory": self.working_directory,
-            "open_files": self.open_files,
-            "pending_operations": self.pending_operations,
+            "open_files": list(self.open_files),
+            "pending_operations": list(self.pending_operations),
             "read_files": list(self.read_files),
             "modified_files": list(self.modified_files),
             "deleted_files": list(self.deleted_files),
-            "environment_snapshot": self.environment_snapshot,
-            "metadata": self.metadata,
+            "environment_snapshot": dict(self.environment_snapshot),
+            "metadata": dict(self.metadata),
+            "journal_seq": self.journal_seq,
         }
 
     @classmethod
@@ -120,6 +124,7 @@ class SessionSnapshot:
             deleted_files=set(data.get("deleted_files", [])),
             environment_snapshot=data.get("environment_snapshot", {}),
             metadata=data.get("metadata", {}),
+            journal_seq=data.get("journal_seq", 0),
         )
 
 
@@ -135,10 +140,28 @@ class SessionInfo:
     working_directory: str
     summary: str  # Brief description
 
+    # Catalog metadata (see SessionCatalog)
+    model: Optional[str] = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+
+@dataclass
+class SessionSearchHit:
+    """A message (or session title) matching a catalog search."""
+
+    session_id: str
+    message_index: int  # -1 for a title match
+    role: str
+    content: str
+    snippet: str  # Match in context, terms wrapped in [ ]
+    rank: float  # bm25 rank, lower is better
+
 
 __all__ = [
     "SessionState",
     "ConversationMessage",
     "SessionSnapshot",
     "SessionInfo",
+    "SessionSearchHit",
 ]
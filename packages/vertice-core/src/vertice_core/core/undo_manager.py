@@ -7,7 +7,8 @@ Addresses: ISSUE-030 (Undo support)
 Implements comprehensive undo/redo:
 - Stack-based operation history
 - Branching support (redo cleared on new action)
-- Memory-efficient snapshots
+- Memory-efficient snapshots (refs into the shared content-addressed BlobStore,
+  delta-encoded against the file's previous version)
 - Operation descriptions for timeline view
 - Automatic compaction of old operations
 
@@ -24,8 +25,10 @@ import os
 import json
 import time
 import shutil
-import hashlib
-from typing import Any, Callable, Dict, List, Optional, TypeVar
+import uuid
+import sqlite3
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Set, TypeVar
 from pathlib import Path
 from dataclasses import dataclass, field
 from enum import Enum
@@ -33,12 +36,23 @@ from contextlib import contextmanager
 import logging
 
 from .atomic_ops import AtomicFileOps
+from .blob_store import DEFAULT_BLOB_DIR, BlobStore, get_blob_store
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
 
+def _drop_snapshot_refs(store: BlobStore, prefixes: Set[str]) -> None:
+    """Release the snapshots of a non-persistent manager's remaining operations."""
+    try:
+        for prefix in list(prefixes):
+            store.drop_refs(prefix)
+    except sqlite3.Error as e:  # Store already closed
+        logger.debug(f"Could not release undo snapshots: {e}")
+    prefixes.clear()
+
+
 class OperationType(Enum):
     """Types of undoable operations."""
 
@@ -64,11 +78,14 @@ class UndoableOperation:
     description: str
     timestamp: float
 
-    # For file operations
+    # For file operations (contents live in the BlobStore; *_content is only
+    # set for operations built by hand or loaded from a legacy state file)
     target_path: Optional[str] = None
     original_content: Optional[str] = None
     new_content: Optional[str] = None
     backup_path: Optional[str] = None
+    original_blob: Optional[str] = None
+    new_blob: Optional[str] = None
 
     # For move/rename
     source_path: Optional[str] = None
@@ -93,6 +110,8 @@ class UndoableOperation:
             "timestamp": self.timestamp,
             "target_path": self.target_path,
             "backup_path": self.backup_path,
+            "original_blob": self.original_blob,
+            "new_blob": self.new_blob,
             "source_path": self.source_path,
             "dest_path": self.dest_path,
             "sub_operations": [op.to_dict() for op in self.sub_operations],
@@ -109,6 +128,8 @@ class UndoableOperation:
             timestamp=data["timestamp"],
             target_path=data.get("target_path"),
             backup_path=data.get("backup_path"),
+            original_blob=data.get("original_blob"),
+            new_blob=data.get("new_blob"),
             source_path=data.get("source_path"),
             dest_path=data.get("dest_path"),
             sub_operations=[cls.from_dict(op) for op in data.get("sub_operations", [])],
@@ -145,7 +166,8 @@ class UndoManager:
     - Redo stack cleared on new operation
     - Branching support for complex workflows
     - Persistent state for crash recovery
-    - Memory-efficient snapshot storage
+    - Memory-efficient snapshot storage (deduplicated, delta-encoded blobs
+      released when an operation leaves both stacks)
 
     Usage:
         manager = UndoManager()
@@ -174,24 +196,32 @@ class UndoManager:
         snapshot_dir: Optional[str] = None,
         persist_state: bool = True,
         working_dir: Optional[str] = None,
+        blob_store: Optional[BlobStore] = None,
     ):
         """
         Initialize UndoManager.
 
         Args:
             max_size: Maximum number of operations in history
-            snapshot_dir: Directory for file snapshots
-            persist_state: Save state to disk for crash recovery
+            snapshot_dir: Directory of legacy per-operation snapshot files
+            persist_state: Save state to disk for crash recovery (otherwise
+                snapshots are released on close() or garbage collection)
             working_dir: Working directory (default: cwd)
+            blob_store: Snapshot storage (default: shared store in .vertice/blobs)
         """
         self.max_size = max_size
         self.working_dir = Path(working_dir or os.getcwd())
         self.snapshot_dir = self.working_dir / (snapshot_dir or self.SNAPSHOT_DIR)
         self.persist_state = persist_state
+        self._blob_store = blob_store
+        self._latest_blob: Dict[str, str] = {}  # path -> newest snapshot, used as delta base
+        self._live_refs: Set[str] = set()  # Ref prefixes of operations still on a stack
+        self._finalizer: Optional[weakref.finalize] = None
 
         self._undo_stack: List[UndoableOperation] = []
         self._redo_stack: List[UndoableOperation] = []
         self._operation_counter = 0
+        self._instance_id = uuid.uuid4().hex[:8]  # Keeps refs apart in a shared blob store
 
         self._atomic_ops = AtomicFileOps()
 
@@ -202,31 +232,69 @@ class UndoManager:
     def _generate_op_id(self) -> str:
         """Generate unique operation ID."""
         self._operation_counter += 1
-        return f"undo_{int(time.time() * 1000)}_{self._operation_counter}"
-
-    def _ensure_snapshot_dir(self) -> Path:
-        """Ensure snapshot directory exists."""
-        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
-        return self.snapshot_dir
-
-    def _save_snapshot(self, content: str, op_id: str) -> str:
-        """Save content snapshot to disk."""
-        snapshot_dir = self._ensure_snapshot_dir()
-
-        # Use hash for deduplication
-        content_hash = hashlib.sha256(content.encode()).hexdigest()[:16]
-        snapshot_path = snapshot_dir / f"{op_id}_{content_hash}.snapshot"
-
-        snapshot_path.write_text(content)
-        return str(snapshot_path)
+        return f"undo_{int(time.time() * 1000)}_{self._instance_id}_{self._operation_counter}"
+
+    @property
+    def blob_store(self) -> BlobStore:
+        """Snapshot storage, opened on first use."""
+        if self._blob_store is None:
+            self._blob_store = get_blob_store(self.working_dir / DEFAULT_BLOB_DIR)
+        return self._blob_store
+
+    def _save_snapshot(self, content: str, op_id: str, kind: str, path: str) -> str:
+        """Store content under an operation ref; returns its digest."""
+        if not self.persist_state and self._finalizer is None:
+            # Nothing reloads these refs later, so they go with the manager
+            self._finalizer = weakref.finalize(
+                self, _drop_snapshot_refs, self.blob_store, self._live_refs
+            )
+        digest = self.blob_store.put(
+            content, ref=f"undo/{op_id}/{kind}", base=self._latest_blob.get(path)
+        )
+        self._live_refs.add(f"undo/{op_id}/")
+        self._latest_blob[path] = digest
+        return digest
 
     def _load_snapshot(self, path: str) -> Optional[str]:
-        """Load content from snapshot."""
+        """Load content from a legacy snapshot file."""
         try:
             return Path(path).read_text()
         except (FileNotFoundError, PermissionError, IOError):
             return None
 
+    def _load_blob(self, digest: str) -> Optional[str]:
+        """Load snapshot content from the blob store."""
+        try:
+            return self.blob_store.get(digest).decode("utf-8", "surrogateescape")
+        except (KeyError, OSError):
+            return None
+
+    def _original_of(self, op: UndoableOperation) -> Optional[str]:
+        """Content before the operation."""
+        if op.original_blob:
+            return self._load_blob(op.original_blob)
+        legacy = self._load_snapshot(op.backup_path) if op.backup_path else None
+        return legacy or op.original_content
+
+    def _new_of(self, op: UndoableOperation) -> Optional[str]:
+        """Content after the operation."""
+        if op.new_blob:
+            return self._load_blob(op.new_blob)
+        return op.new_content
+
+    def _release(self, op: UndoableOperation) -> None:
+        """Drop an operation's snapshots once it can no longer be undone or redone."""
+        for sub_op in op.sub_operations:
+            self._release(sub_op)
+        if op.original_blob or op.new_blob:
+            self.blob_store.drop_refs(f"undo/{op.id}/")
+            self._live_refs.discard(f"undo/{op.id}/")
+        if op.backup_path and os.path.exists(op.backup_path):
+            try:
+                os.unlink(op.backup_path)
+            except (OSError, PermissionError):
+                pass
+
     def _save_state(self) -> None:
         """Save manager state to disk."""
         if not self.persist_state:
@@ -267,6 +335,8 @@ class UndoManager:
     def _push_operation(self, operation: UndoableOperation) -> None:
         """Push operation to undo stack."""
         # Clear redo stack (branching: new action clears redo)
+        for dropped in self._redo_stack:
+            self._release(dropped)
         self._redo_stack.clear()
 
         # Add to undo stack
@@ -274,13 +344,7 @@ class UndoManager:
 
         # Enforce max size
         while len(self._undo_stack) > self.max_size:
-            removed = self._undo_stack.pop(0)
-            # Clean up snapshot if exists
-            if removed.backup_path and os.path.exists(removed.backup_path):
-                try:
-                    os.unlink(removed.backup_path)
-                except (OSError, PermissionError):
-                    pass
+            self._release(self._undo_stack.pop(0))
 
         # Persist state
         self._save_state()
@@ -292,13 +356,14 @@ class UndoManager:
         description: Optional[str] = None,
     ) -> UndoableOperation:
         """Record file creation operation."""
+        op_id = self._generate_op_id()
         op = UndoableOperation(
-            id=self._generate_op_id(),
+            id=op_id,
             op_type=OperationType.FILE_CREATE,
             description=description or f"Create {Path(path).name}",
             timestamp=time.time(),
             target_path=path,
-            new_content=content,
+            new_blob=self._save_snapshot(content, op_id, "new", path),
         )
 
         self._push_operation(op)
@@ -312,9 +377,8 @@ class UndoManager:
         description: Optional[str] = None,
     ) -> UndoableOperation:
         """Record file edit operation."""
-        # Save original content as snapshot
+        # Snapshot both versions; the new one is a delta against the original
         op_id = self._generate_op_id()
-        backup_path = self._save_snapshot(original_content, op_id)
 
         op = UndoableOperation(
             id=op_id,
@@ -322,9 +386,8 @@ class UndoManager:
             description=description or f"Edit {Path(path).name}",
             timestamp=time.time(),
             target_path=path,
-            original_content=original_content,
-            new_content=new_content,
-            backup_path=backup_path,
+            original_blob=self._save_snapshot(original_content, op_id, "original", path),
+            new_blob=self._save_snapshot(new_content, op_id, "new", path),
         )
 
         self._push_operation(op)
@@ -338,7 +401,6 @@ class UndoManager:
     ) -> UndoableOperation:
         """Record file deletion operation."""
         op_id = self._generate_op_id()
-        backup_path = self._save_snapshot(original_content, op_id)
 
         op = UndoableOperation(
             id=op_id,
@@ -346,8 +408,7 @@ class UndoManager:
             description=description or f"Delete {Path(path).name}",
             timestamp=time.time(),
             target_path=path,
-            original_content=original_content,
-            backup_path=backup_path,
+            original_blob=self._save_snapshot(original_content, op_id, "original", path),
         )
 
         self._push_operation(op)
@@ -430,7 +491,7 @@ class UndoManager:
 
             elif op.op_type == OperationType.FILE_EDIT:
                 # Undo edit = restore original
-                original = self._load_snapshot(op.backup_path) or op.original_content
+                original = self._original_of(op)
                 if original is not None:
                     result = self._atomic_ops.write_atomic(
                         op.target_path, original, create_backup=False
@@ -443,7 +504,7 @@ class UndoManager:
 
             elif op.op_type == OperationType.FILE_DELETE:
                 # Undo delete = restore file
-                original = self._load_snapshot(op.backup_path) or op.original_content
+                original = self._original_of(op)
                 if original is not None:
                     result = self._atomic_ops.write_atomic(
                         op.target_path, original, create_backup=False
@@ -495,7 +556,7 @@ class UndoManager:
             if op.op_type == OperationType.FILE_CREATE:
                 # Redo create = create again
                 result = self._atomic_ops.write_atomic(
-                    op.target_path, op.new_content, create_backup=False
+                    op.target_path, self._new_of(op), create_backup=False
                 )
                 if result.success:
                     return UndoResult.success_result(op, f"Redid: {op.description}")
@@ -505,7 +566,7 @@ class UndoManager:
             elif op.op_type == OperationType.FILE_EDIT:
                 # Redo edit = apply new content
                 result = self._atomic_ops.write_atomic(
-                    op.target_path, op.new_content, create_backup=False
+                    op.target_path, self._new_of(op), create_backup=False
                 )
                 if result.success:
                     return UndoResult.success_result(op, f"Redid: {op.description}")
@@ -610,14 +671,25 @@ class UndoManager:
 
     def clear_history(self) -> None:
         """Clear all undo/redo history."""
+        for op in self._undo_stack + self._redo_stack:
+            self._release(op)
         self._undo_stack.clear()
         self._redo_stack.clear()
+        self._latest_blob.clear()
         self._save_state()
 
-        # Clean up snapshots
+        # Clean up legacy snapshot files
         if self.snapshot_dir.exists():
             shutil.rmtree(str(self.snapshot_dir))
 
+    def close(self) -> None:
+        """Release the snapshots of a non-persistent manager; its history is lost."""
+        if self._finalizer is not None:
+            self._finalizer()
+            self._undo_stack.clear()
+            self._redo_stack.clear()
+            self._latest_blob.clear()
+
     @contextmanager
     def batch_operations(self, description: str):
         """
@@ -0,0 +1,489 @@
+"""
+Workspace Snapshot - Shared Directory Listings and Git Status.
+
+Process-wide cache of what the exploration tools keep asking the filesystem:
+directory listings with stat info, and git status output. The directory
+tree, list and git status tools and the TUI file tree all read from it, so
+repeated exploration within one agent turn costs a stat per directory
+instead of a fresh walk.
+
+Nothing expires on a timer. A directory listing is reused while the
+directory's mtime is unchanged (creates, deletes and renames all bump it)
+and dropped when a ``core.file_watcher.FileWatcher`` reports an event in it.
+In-place edits don't touch the directory's mtime, so without a watcher that
+sees every file type, the sizes and mtimes of a reused listing are re-stat'ed.
+Git output is reused while the repository state is unchanged: the index
+and HEAD/ref mtimes, plus a generation counter that every observed working
+tree change bumps. Git output is only cached while a watcher is attached
+(the snapshot subscribes to every file type), since in-place edits leave
+no other trace.
+
+Usage:
+    snapshot = get_workspace_snapshot()
+    entries = snapshot.list_dir("src")
+    status = snapshot.git_status(".")
+
+Author: JuanCS Dev
+Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+# Bounds on cached directory listings and git outputs (LRU)
+DEFAULT_MAX_DIRS = 4096
+DEFAULT_MAX_GIT = 256
+
+# A listing taken this soon after the directory changed may have raced a
+# change within the same mtime tick; such listings are rescanned once more.
+RACY_WINDOW_NS = 100_000_000
+
+
+class DirEntry(NamedTuple):
+    """One directory entry with the stat info the tools need."""
+
+    name: str
+    is_dir: bool
+    is_symlink: bool
+    size: int
+    mtime_ns: int
+
+
+class GitOutput(NamedTuple):
+    """Result of a git command."""
+
+    returncode: int
+    stdout: str
+    stderr: str
+
+
+@dataclass(frozen=True)
+class GitStatusSnapshot:
+    """Parsed ``git status --porcelain`` for one repository."""
+
+    root: Path
+    branch: str
+    entries: Tuple[Tuple[str, str], ...]  # (XY status code, repo-relative path)
+
+    @property
+    def staged(self) -> List[str]:
+        return [path for code, path in self.entries if code[0] in "MADR"]
+
+    @property
+    def modified(self) -> List[str]:
+        return [path for code, path in self.entries if code[1] == "M"]
+
+    @property
+    def untracked(self) -> List[str]:
+        return [path for code, path in self.entries if code == "??"]
+
+
+@dataclass
+class SnapshotStats:
+    """Workspace snapshot statistics."""
+
+    dir_hits: int = 0
+    dir_misses: int = 0
+    git_hits: int = 0
+    git_misses: int = 0
+    invalidations: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Calculate hit rate over listings and git commands."""
+        hits = self.dir_hits + self.git_hits
+        total = hits + self.dir_misses + self.git_misses
+        return hits / total if total > 0 else 0.0
+
+
+class WorkspaceSnapshot:
+    """
+    Cached directory listings and git output, invalidated by change events.
+
+    Thread-safe. Listings are always revalidated against the directory's
+    mtime, so they are never stale in name or type. Sizes of files edited
+    in place are refreshed by watcher events or ``invalidate`` when a
+    watcher sees every file type, and by a re-stat on every reuse otherwise.
+    """
+
+    def __init__(self, max_dirs: int = DEFAULT_MAX_DIRS, max_git: int = DEFAULT_MAX_GIT) -> None:
+        # path -> (dir mtime_ns, trusted, entries)
+        self._dirs: "OrderedDict[str, Tuple[int, bool, Tuple[DirEntry, ...]]]" = OrderedDict()
+        # (path, args) -> (repo signature, output)
+        self._git: "OrderedDict[Tuple[str, Tuple[str, ...]], Tuple[Tuple[Any, ...], GitOutput]]" = (
+            OrderedDict()
+        )
+        self._max_dirs = max_dirs
+        self._max_git = max_git
+        self._generation = 0
+        self._watchers: List[Any] = []
+        self._lock = threading.Lock()
+        self._stats = SnapshotStats()
+
+    # =========================================================================
+    # Directory listings
+    # =========================================================================
+
+    def list_dir(self, path: Union[str, Path]) -> Tuple[DirEntry, ...]:
+        """
+        List a directory, sorted by name.
+
+        Raises:
+            OSError: If the directory cannot be stat'ed or read
+        """
+        key = os.path.abspath(path)
+        mtime_ns = os.stat(key).st_mtime_ns
+
+        with self._lock:
+            cached = self._dirs.get(key)
+            if cached is not None and cached[0] == mtime_ns and cached[1]:
+                self._dirs.move_to_end(key)
+                self._stats.dir_hits += 1
+                if self._watches_all_files():
+                    return cached[2]
+                reused = cached
+            else:
+                reused = None
+                self._stats.dir_misses += 1
+                if cached is not None and cached[0] != mtime_ns:
+                    # Entries came or went since the last listing
+                    self._generation += 1
+
+        if reused is not None:
+            # Nothing reports in-place edits: refresh the file stats
+            entries = _restat(key, reused[2])
+            if entries is not reused[2]:
+                with self._lock:
+                    if self._dirs.get(key) is reused:
+                        self._dirs[key] = (mtime_ns, True, entries)
+            return entries
+
+        trusted = time.time_ns() - mtime_ns >= RACY_WINDOW_NS
+        entries = tuple(sorted(_scan(key), key=lambda entry: entry.name))
+
+        with self._lock:
+            self._dirs[key] = (mtime_ns, trusted, entries)
+            self._dirs.move_to_end(key)
+            while len(self._dirs) > self._max_dirs:
+                self._dirs.popitem(last=False)
+                self._stats.evictions += 1
+        return entries
+
+    def walk(self, path: Union[str, Path]) -> Iterator[Tuple[Path, DirEntry]]:
+        """
+        Yield ``(path, entry)`` for everything below a directory, pre-order.
+
+        Like ``Path.rglob("*")``, symlinked directories are listed but not
+        descended into. Unreadable subdirectories are skipped.
+        """
+        base = Path(path)
+        stack = [base]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = self.list_dir(directory)
+            except OSError:
+                if directory is base:
+                    raise
+                continue
+            subdirs = []
+            for entry in entries:
+                child = directory / entry.name
+                yield child, entry
+                if entry.is_dir and not entry.is_symlink:
+                    subdirs.append(child)
+            stack.extend(reversed(subdirs))
+
+    def glob(
+        self, path: Union[str, Path], pattern: str, recursive: bool = False
+    ) -> List[Tuple[Path, DirEntry]]:
+        """
+        Match entry names against a glob pattern, like ``Path.glob``/``rglob``.
+
+        Only single-component patterns (e.g. ``*.py``) are supported.
+        """
+        if "/" in pattern or os.sep in pattern:
+            raise ValueError(f"Pattern must match a single path component: {pattern}")
+
+        if recursive:
+            candidates = self.walk(path)
+        else:
+            base = Path(path)
+            candidates = ((base / entry.name, entry) for entry in self.list_dir(base))
+        return [item for item in candidates if fnmatch.fnmatchcase(item[1].name, pattern)]
+
+    # =========================================================================
+    # Git
+    # =========================================================================
+
+    def git(self, path: Union[str, Path], *args: str, timeout: float = 5) -> GitOutput:
+        """
+        Run ``git -C path <args>``, reusing output while the repository is unchanged.
+
+        Only use this for read-only commands whose output depends on the
+        working tree, index and HEAD (e.g. ``status``, ``rev-parse``).
+        """
+        key = (os.path.abspath(path), args)
+        signature = self._repo_signature(key[0])
+
+        if signature is not None:
+            with self._lock:
+                cached = self._git.get(key)
+                if cached is not None and cached[0] == signature:
+                    self._git.move_to_end(key)
+                    self._stats.git_hits += 1
+                    return cached[1]
+        with self._lock:
+            self._stats.git_misses += 1
+
+        result = subprocess.run(
+            ["git", "-C", key[0], *args], capture_output=True, text=True, timeout=timeout
+        )
+        output = GitOutput(result.returncode, result.stdout, result.stderr)
+
+        if signature is not None:
+            # `git status` may refresh the index itself, so key the entry on
+            # the state after the run - unless the working tree changed meanwhile
+            after = self._repo_signature(key[0])
+            if after is not None and after[0] == signature[0]:
+                with self._lock:
+                    self._git[key] = (after, output)
+                    self._git.move_to_end(key)
+                    while len(self._git) > self._max_git:
+                        self._git.popitem(last=False)
+                        self._stats.evictions += 1
+        return output
+
+    def git_status(self, path: Union[str, Path] = ".") -> Optional[GitStatusSnapshot]:
+        """
+        Branch and porcelain status of the repository containing ``path``.
+
+        Returns:
+            None if ``path`` is not inside a git repository
+        """
+        root = _find_repo(os.path.abspath(path))
+        if root is None:
+            return None
+
+        status = self.git(path, "status", "--porcelain")
+        if status.returncode != 0:
+            return None
+        head = self.git(path, "rev-parse", "--abbrev-ref", "HEAD")
+        branch = head.stdout.strip() if head.returncode == 0 else "unknown"
+
+        entries = []
+        for line in status.stdout.split("\n"):
+            if len(line) < 3 or not line.strip():
+                continue
+            entries.append((line[:2], line[3:].strip()))
+        return GitStatusSnapshot(root=Path(root[0]), branch=branch, entries=tuple(entries))
+
+    def _repo_signature(self, path: str) -> Optional[Tuple[Any, ...]]:
+        """State git output depends on, or None if it can't be tracked."""
+        if not self._watches_all_files():
+            return None
+        repo = _find_repo(path)
+        if repo is None:
+            return None
+
+        _, git_dir = repo
+        try:
+            with open(os.path.join(git_dir, "HEAD"), "rb") as f:
+                head = f.read()
+        except OSError:
+            return None
+
+        ref_state = None
+        if head.startswith(b"ref: "):
+            ref = head[5:].strip().decode("utf-8", "replace")
+            ref_state = _stat_key(os.path.join(git_dir, ref))
+
+        with self._lock:
+            generation = self._generation
+        return (
+            generation,
+            head,
+            ref_state,
+            _stat_key(os.path.join(git_dir, "index")),
+            _stat_key(os.path.join(git_dir, "packed-refs")),
+        )
+
+    def _watches_all_files(self) -> bool:
+        """Whether an attached watcher reports changes to every file."""
+        return any(watcher.watches_all_files for watcher in self._watchers)
+
+    # =========================================================================
+    # Invalidation
+    # =========================================================================
+
+    def invalidate(self, path: Union[str, Path]) -> None:
+        """Record a change to a path: drops its listing and its parent's."""
+        key = os.path.abspath(path)
+        with self._lock:
+            self._generation += 1
+            self._stats.invalidations += 1
+            self._dirs.pop(key, None)
+            self._dirs.pop(os.path.dirname(key), None)
+
+    def clear(self) -> None:
+        """Drop everything."""
+        with self._lock:
+            self._generation += 1
+            self._dirs.clear()
+            self._git.clear()
+
+    def attach_watcher(self, watcher: Any) -> Any:
+        """Invalidate from a ``core.file_watcher.FileWatcher``'s batches.
+
+        The subscription covers every file type, so attaching a watcher
+        also enables caching of git output.
+
+        Returns:
+            The watcher's unsubscribe function
+        """
+        from .file_watcher import ALL_FILES
+
+        unsubscribe = watcher.subscribe(self._on_file_events, extensions={ALL_FILES})
+        with self._lock:
+            self._watchers.append(watcher)
+
+        def detach() -> None:
+            unsubscribe()
+            with self._lock:
+                self._watchers.remove(watcher)
+
+        return detach
+
+    def _on_file_events(self, events: Any) -> None:
+        for event in events:
+            self.invalidate(event.path)
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped on every observed working tree change."""
+        return self._generation
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get snapshot statistics."""
+        with self._lock:
+            return {
+                "directories": len(self._dirs),
+                "git_entries": len(self._git),
+                "dir_hits": self._stats.dir_hits,
+                "dir_misses": self._stats.dir_misses,
+                "git_hits": self._stats.git_hits,
+                "git_misses": self._stats.git_misses,
+                "hit_rate": self._stats.hit_rate,
+                "invalidations": self._stats.invalidations,
+                "evictions": self._stats.evictions,
+                "generation": self._generation,
+                "watchers": len(self._watchers),
+            }
+
+
+def _scan(directory: str) -> Iterator[DirEntry]:
+    """Stat every entry of a directory (follows symlinks like ``Path.stat``)."""
+    with os.scandir(directory) as it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir()
+                is_symlink = entry.is_symlink()
+            except OSError:
+                is_dir = is_symlink = False
+            if is_dir:
+                yield DirEntry(entry.name, True, is_symlink, 0, 0)
+                continue
+            try:
+                st = entry.stat()
+                yield DirEntry(entry.name, False, is_symlink, st.st_size, st.st_mtime_ns)
+            except OSError:
+                # Dangling symlink
+                yield DirEntry(entry.name, False, is_symlink, 0, 0)
+
+
+def _restat(directory: str, entries: Tuple[DirEntry, ...]) -> Tuple[DirEntry, ...]:
+    """Refresh file sizes and mtimes; returns ``entries`` itself if none changed."""
+    fresh = list(entries)
+    changed = False
+    for i, entry in enumerate(entries):
+        if entry.is_dir:
+            continue
+        try:
+            st = os.stat(os.path.join(directory, entry.name))
+            size, mtime_ns = st.st_size, st.st_mtime_ns
+        except OSError:
+            size = mtime_ns = 0
+        if (size, mtime_ns) != (entry.size, entry.mtime_ns):
+            fresh[i] = entry._replace(size=size, mtime_ns=mtime_ns)
+            changed = True
+    return tuple(fresh) if changed else entries
+
+
+def _find_repo(path: str) -> Optional[Tuple[str, str]]:
+    """Find ``(work tree root, git dir)`` for a path by walking up to ``.git``."""
+    current = path
+    while True:
+        dot_git = os.path.join(current, ".git")
+        if os.path.isdir(dot_git):
+            return current, dot_git
+        if os.path.isfile(dot_git):
+            # Worktrees and submodules: "gitdir: <path>"
+            try:
+                with open(dot_git, encoding="utf-8") as f:
+                    line = f.readline().strip()
+            except OSError:
+                return None
+            if line.startswith("gitdir:"):
+                git_dir = os.path.join(current, line[7:].strip())
+                return current, os.path.normpath(git_dir)
+            return None
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def _stat_key(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+# =============================================================================
+# SINGLETON INSTANCE
+# =============================================================================
+
+_workspace_snapshot: Optional[WorkspaceSnapshot] = None
+_snapshot_lock = threading.Lock()
+
+
+def get_workspace_snapshot() -> WorkspaceSnapshot:
+    """Get or create the process-wide WorkspaceSnapshot."""
+    global _workspace_snapshot
+    if _workspace_snapshot is None:
+        with _snapshot_lock:
+            if _workspace_snapshot is None:
+                _workspace_snapshot = WorkspaceSnapshot()
+    return _workspace_snapshot
+
+
+__all__ = [
+    "DirEntry",
+    "GitOutput",
+    "GitStatusSnapshot",
+    "SnapshotStats",
+    "WorkspaceSnapshot",
+    "get_workspace_snapshot",
+]
@@ -23,6 +23,8 @@ from enum import Enum
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
+from ..async_utils.line_index import get_line_index_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -160,9 +162,13 @@ class CodeChunker:
         if not path.is_file():
             return []
 
-        # Read content
+        # Read content (reuse the shared mmap if another tool already indexed it)
         try:
-            content = path.read_text(encoding="utf-8", errors="replace")
+            index = get_line_index_cache().peek(path)
+            if index is not None:
+                content = index.read_text(errors="replace")
+            else:
+                content = path.read_text(encoding="utf-8", errors="replace")
         except (OSError, IOError) as e:
             logger.warning(f"Could not read file {path}: {e}")
             return []
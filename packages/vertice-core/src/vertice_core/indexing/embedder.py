@@ -261,9 +261,10 @@ class SemanticEmbedder:
     async def _ensure_client(self) -> httpx.AsyncClient:
         """Ensure HTTP client is initialized."""
         if self._client is None:
-            self._client = httpx.AsyncClient(
+            from vertice_core.async_utils.http_clients import get_http_clients
+
+            self._client = get_http_clients().httpx_client(
                 timeout=httpx.Timeout(60.0, connect=10.0),
-                limits=httpx.Limits(max_connections=10),
             )
         return self._client
 
@@ -17,6 +17,7 @@ Soli Deo Gloria
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import logging
@@ -24,7 +25,7 @@ import time
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from .chunker import CodeChunk, CodeChunker
 from .embedder import EmbeddingConfig, SemanticEmbedder, get_embedder
@@ -302,6 +303,10 @@ class CodebaseIndexer:
         self._is_indexing = False
         self._cancel_requested = False
 
+        # Files reported changed by a FileWatcher, awaiting re-index
+        self._dirty_files: Set[str] = set()
+        self._reindex_task: Optional[asyncio.Task] = None
+
     @property
     def progress(self) -> IndexingProgress:
         """Get current indexing progress."""
@@ -395,6 +400,7 @@ class CodebaseIndexer:
 
         finally:
             self._is_indexing = False
+            self._schedule_pending()  # Changes that arrived during this pass
 
         return self._progress
 
@@ -583,6 +589,63 @@ class CodebaseIndexer:
 
         return stored
 
+    def attach_watcher(self, watcher: Any) -> Callable[[], None]:
+        """
+        Keep the index current from a shared ``core.file_watcher.FileWatcher``.
+
+        Deleted files are dropped immediately; created/modified files are
+        queued and re-indexed on the running event loop.
+
+        Returns:
+            The watcher's unsubscribe function
+        """
+        return watcher.subscribe(self._on_file_events, extensions=set(self.config.extensions))
+
+    def _on_file_events(self, events: List[Any]) -> None:
+        """Handle a coalesced batch of watcher events."""
+        for event in events:
+            if Path(event.path).suffix not in self.config.extensions:
+                continue
+            if any(excl in event.path for excl in self.config.exclude_patterns):
+                continue
+            if event.event_type == "deleted":
+                self._dirty_files.discard(event.path)
+                self.delete_file(event.path)
+            else:
+                self._dirty_files.add(event.path)
+
+        self._schedule_pending()
+
+    def _schedule_pending(self) -> None:
+        """Start a background re-index of the queued files, unless one is running."""
+        if not self._dirty_files:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No loop: picked up by the next index_pending_changes()
+        if self._reindex_task is None or self._reindex_task.done():
+            self._reindex_task = loop.create_task(self.index_pending_changes())
+
+    async def index_pending_changes(self) -> int:
+        """
+        Re-index files queued by watcher events.
+
+        Stops early while a full index_codebase() pass runs; that pass
+        reschedules the rest when it finishes.
+
+        Returns:
+            Number of chunks indexed
+        """
+        indexed = 0
+        while self._dirty_files and not self._is_indexing:
+            filepath = self._dirty_files.pop()
+            try:
+                indexed += await self.index_file(filepath)
+            except Exception as e:
+                logger.warning(f"Re-index of {filepath} failed: {e}")
+        return indexed
+
     def delete_file(self, filepath: str) -> int:
         """Remove a file from the index."""
         deleted = self._store.delete_file(filepath)
@@ -610,13 +673,21 @@ class CodebaseIndexer:
 
 # Singleton instance
 _indexer: Optional[CodebaseIndexer] = None
+_indexer_unsubscribe: Optional[Callable[[], None]] = None
 
 
 def get_indexer(config: Optional[IndexerConfig] = None) -> CodebaseIndexer:
-    """Get or create singleton indexer instance."""
-    global _indexer
+    """Get or create singleton indexer instance, kept current by the shared FileWatcher."""
+    global _indexer, _indexer_unsubscribe
     if _indexer is None or config is not None:
+        from ..core.file_watcher import get_file_watcher
+
+        if _indexer_unsubscribe is not None:
+            _indexer_unsubscribe()
         _indexer = CodebaseIndexer(config)
+        watcher = get_file_watcher(_indexer.config.root_dir)
+        _indexer_unsubscribe = _indexer.attach_watcher(watcher)
+        watcher.start_polling()
     return _indexer
 
 
@@ -7,12 +7,19 @@ Provides blazing-fast semantic search and context awareness.
 import ast
 import json
 import logging
+import os
+import sqlite3
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
 from pathlib import Path
+from pickle import PicklingError
 
 logger = logging.getLogger(__name__)
 from typing import Dict, List, Set, Optional, Tuple
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import defaultdict, deque
 import hashlib
 import re
 
@@ -54,16 +61,37 @@ class SemanticIndexer:
     - Smart context collection
     """
 
-    def __init__(self, root_path: str, cache_dir: Optional[str] = None):
+    # On-disk store (SQLite, rewritten per changed file)
+    CACHE_DB = "index.db"
+
+    # Files per worker before parsing goes to a process pool
+    PARALLEL_MIN_FILES = 32
+
+    def __init__(
+        self,
+        root_path: str,
+        cache_dir: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ):
         self.root_path = Path(root_path).resolve()
         self.cache_dir = Path(cache_dir or self.root_path / ".qwen" / "index")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max_workers or os.cpu_count() or 1
 
         # In-memory indexes
         self.file_index: Dict[str, FileIndex] = {}
         self.symbol_index: Dict[str, List[Symbol]] = defaultdict(list)
         self.import_graph: Dict[str, Set[str]] = defaultdict(set)
 
+        # Search indexes over symbol names (trigram -> names, sorted names)
+        self._trigram_index: Dict[str, Set[str]] = defaultdict(set)
+        self._sorted_names: Optional[List[Tuple[str, str]]] = None
+        self._sorted_lower: List[str] = []
+
+        # Files changed since the store was last written or read
+        self._dirty_files: Set[str] = set()
+        self._store_synced = False
+
         # Exclude patterns
         self.exclude_patterns = {
             "__pycache__",
@@ -108,87 +136,19 @@ class SemanticIndexer:
 
     def parse_file(self, path: Path) -> Optional[FileIndex]:
         """Parse Python file and extract symbols."""
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            tree = ast.parse(content, filename=str(path))
-
-            symbols = []
-            imports = []
-
-            for node in ast.walk(tree):
-                # Classes
-                if isinstance(node, ast.ClassDef):
-                    symbols.append(
-                        Symbol(
-                            name=node.name,
-                            type="class",
-                            file_path=str(path.relative_to(self.root_path)),
-                            line_number=node.lineno,
-                            docstring=ast.get_docstring(node),
-                        )
-                    )
-
-                # Functions
-                elif isinstance(node, ast.FunctionDef):
-                    parent = None
-                    # Check if it's a method
-                    for parent_node in ast.walk(tree):
-                        if isinstance(parent_node, ast.ClassDef):
-                            if node in ast.walk(parent_node):
-                                parent = parent_node.name
-                                break
-
-                    # Build signature
-                    args = [arg.arg for arg in node.args.args]
-                    signature = f"{node.name}({', '.join(args)})"
-
-                    symbols.append(
-                        Symbol(
-                            name=node.name,
-                            type="method" if parent else "function",
-                            file_path=str(path.relative_to(self.root_path)),
-                            line_number=node.lineno,
-                            docstring=ast.get_docstring(node),
-                            signature=signature,
-                            parent=parent,
-                        )
-                    )
-
-                # Imports
-                elif isinstance(node, ast.Import):
-                    for alias in node.names:
-                        imports.append(alias.name)
-
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module:
-                        imports.append(node.module)
-
-            file_hash = self.compute_file_hash(path)
-
-            return FileIndex(
-                path=str(path.relative_to(self.root_path)),
-                hash=file_hash,
-                symbols=symbols,
-                imports=imports,
-                last_modified=path.stat().st_mtime,
-            )
-
-        except (SyntaxError, UnicodeDecodeError) as e:
-            logger.debug(f"Parse failed for {path}: {e}")
-            return None
-        except OSError as e:
-            logger.warning(f"Could not read file {path}: {e}")
-            return None
+        return _parse_python_file(self.root_path, path)
 
     def index_codebase(self, force: bool = False) -> int:
         """
         Index entire codebase.
 
+        Changed files replace their previous symbols; deleted files are
+        dropped. Parsing fans out to a process pool for large batches.
+
         Returns number of files indexed.
         """
-        indexed_count = 0
+        to_parse: List[Path] = []
+        seen: Set[str] = set()
 
         for path in self.root_path.rglob("*.py"):
             if not self.should_index(path):
@@ -196,6 +156,7 @@ class SemanticIndexer:
 
             # Check if file needs reindexing
             rel_path = str(path.relative_to(self.root_path))
+            seen.add(rel_path)
 
             if not force and rel_path in self.file_index:
                 existing = self.file_index[rel_path]
@@ -204,19 +165,15 @@ class SemanticIndexer:
                 if existing.hash == current_hash:
                     continue  # Skip unchanged files
 
-            # Parse and index
-            file_idx = self.parse_file(path)
-            if file_idx:
-                self.file_index[rel_path] = file_idx
+            to_parse.append(path)
 
-                # Update symbol index
-                for symbol in file_idx.symbols:
-                    self.symbol_index[symbol.name].append(symbol)
-
-                # Update import graph
-                for imp in file_idx.imports:
-                    self.import_graph[rel_path].add(imp)
+        for rel_path in [p for p in self.file_index if p not in seen]:
+            self._remove_file(rel_path)
 
+        indexed_count = 0
+        for file_idx in self._parse_files(to_parse):
+            if file_idx:
+                self._add_file(file_idx)
                 indexed_count += 1
 
         # Save to cache
@@ -224,6 +181,78 @@ class SemanticIndexer:
 
         return indexed_count
 
+    def _parse_files(self, paths: List[Path]) -> List[Optional[FileIndex]]:
+        """Parse files, in worker processes when the batch is large enough."""
+        workers = min(self.max_workers, len(paths) // self.PARALLEL_MIN_FILES)
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    return list(
+                        executor.map(
+                            _parse_python_file,
+                            repeat(self.root_path),
+                            paths,
+                            chunksize=self.PARALLEL_MIN_FILES // 2,
+                        )
+                    )
+            except (OSError, BrokenProcessPool, PicklingError) as e:
+                logger.debug(f"Parallel parse unavailable, parsing serially: {e}")
+
+        return [self.parse_file(path) for path in paths]
+
+    def _add_file(self, file_idx: FileIndex) -> None:
+        """Index a parsed file, replacing anything previously indexed for it."""
+        rel_path = file_idx.path
+        if rel_path in self.file_index:
+            self._remove_file(rel_path)
+
+        self.file_index[rel_path] = file_idx
+
+        # Update symbol index
+        for symbol in file_idx.symbols:
+            if symbol.name not in self.symbol_index:
+                self._index_name(symbol.name)
+            self.symbol_index[symbol.name].append(symbol)
+
+        # Update import graph
+        for imp in file_idx.imports:
+            self.import_graph[rel_path].add(imp)
+
+        self._dirty_files.add(rel_path)
+
+    def _remove_file(self, rel_path: str) -> None:
+        """Drop a file and its symbols from the in-memory indexes."""
+        file_idx = self.file_index.pop(rel_path, None)
+        if file_idx is None:
+            return
+
+        for name in {symbol.name for symbol in file_idx.symbols}:
+            remaining = [s for s in self.symbol_index.get(name, []) if s.file_path != rel_path]
+            if remaining:
+                self.symbol_index[name] = remaining
+            else:
+                self.symbol_index.pop(name, None)
+                self._unindex_name(name)
+
+        self.import_graph.pop(rel_path, None)
+        self._dirty_files.add(rel_path)
+
+    def _index_name(self, name: str) -> None:
+        """Add a new symbol name to the trigram index."""
+        for gram in _trigrams(name.lower()):
+            self._trigram_index[gram].add(name)
+        self._sorted_names = None
+
+    def _unindex_name(self, name: str) -> None:
+        """Remove a symbol name that no longer has any symbols."""
+        for gram in _trigrams(name.lower()):
+            names = self._trigram_index.get(gram)
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del self._trigram_index[gram]
+        self._sorted_names = None
+
     def find_symbol(self, name: str, type: Optional[str] = None) -> List[Symbol]:
         """Find symbols by name and optional type."""
         symbols = self.symbol_index.get(name, [])
@@ -329,28 +358,73 @@ class SemanticIndexer:
         return None
 
     def search_symbols(self, query: str, limit: int = 10) -> List[Symbol]:
-        """Fuzzy search symbols."""
+        """
+        Fuzzy search symbols.
+
+        Names containing the query come from the trigram index; queries
+        shorter than a trigram use the sorted-name prefix index and only
+        scan every name when prefix matches can't fill the limit.
+        """
         query_lower = query.lower()
-        results = []
 
-        for name, symbols in self.symbol_index.items():
-            if query_lower in name.lower():
-                results.extend(symbols)
+        if len(query_lower) >= 3:
+            names = self._trigram_candidates(query_lower)
+        else:
+            names = self._prefix_matches(query_lower)
+            if sum(len(self.symbol_index[name]) for name in names) < limit:
+                names = [name for name in self.symbol_index if query_lower in name.lower()]
 
         # Sort by relevance (exact match first, then prefix, then contains)
-        def sort_key(symbol: Symbol) -> Tuple[int, str]:
-            name_lower = symbol.name.lower()
+        def sort_key(name: str) -> Tuple[int, str]:
+            name_lower = name.lower()
             if name_lower == query_lower:
-                return (0, symbol.name)
+                return (0, name)
             elif name_lower.startswith(query_lower):
-                return (1, symbol.name)
+                return (1, name)
             else:
-                return (2, symbol.name)
+                return (2, name)
 
-        results.sort(key=sort_key)
+        results: List[Symbol] = []
+        for name in sorted(names, key=sort_key):
+            results.extend(self.symbol_index[name])
+            if len(results) >= limit:
+                break
 
         return results[:limit]
 
+    def _trigram_candidates(self, query_lower: str) -> List[str]:
+        """Names containing query_lower, via posting-list intersection."""
+        postings = []
+        for gram in _trigrams(query_lower):
+            names = self._trigram_index.get(gram)
+            if not names:
+                return []
+            postings.append(names)
+
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for names in postings[1:]:
+            candidates &= names
+            if not candidates:
+                return []
+
+        # Trigrams can match out of order; confirm the substring
+        return [name for name in candidates if query_lower in name.lower()]
+
+    def _prefix_matches(self, prefix_lower: str) -> List[str]:
+        """Names whose lowercase form starts with prefix_lower."""
+        if self._sorted_names is None:
+            self._sorted_names = sorted((name.lower(), name) for name in self.symbol_index)
+            self._sorted_lower = [lower for lower, _ in self._sorted_names]
+
+        start = bisect_left(self._sorted_lower, prefix_lower)
+        matches = []
+        for lower, name in self._sorted_names[start:]:
+            if not lower.startswith(prefix_lower):
+                break
+            matches.append(name)
+        return matches
+
     def get_stats(self) -> Dict:
         """Get indexer statistics."""
         total_symbols = sum(len(syms) for syms in self.symbol_index.values())
@@ -368,44 +442,116 @@ class SemanticIndexer:
         }
 
     def _save_cache(self):
-        """Save index to cache."""
-        cache_file = self.cache_dir / "index.json"
+        """
+        Save index to cache.
+
+        Only files changed since the last save or load are rewritten; the
+        first save of an index that wasn't loaded from the store rewrites it.
+        """
+        cache_file = self.cache_dir / self.CACHE_DB
+
+        if self._store_synced and not self._dirty_files:
+            return
 
         try:
-            data = {
-                "file_index": {
-                    path: {
-                        "path": idx.path,
-                        "hash": idx.hash,
-                        "symbols": [
-                            {
-                                "name": s.name,
-                                "type": s.type,
-                                "file_path": s.file_path,
-                                "line_number": s.line_number,
-                                "docstring": s.docstring,
-                                "signature": s.signature,
-                                "parent": s.parent,
-                            }
+            conn = sqlite3.connect(str(cache_file))
+            try:
+                with conn:
+                    _init_store(conn)
+                    if self._store_synced:
+                        paths = list(self._dirty_files)
+                        conn.executemany(
+                            "DELETE FROM symbols WHERE path = ?", [(p,) for p in paths]
+                        )
+                        conn.executemany("DELETE FROM files WHERE path = ?", [(p,) for p in paths])
+                    else:
+                        paths = list(self.file_index)
+                        conn.execute("DELETE FROM symbols")
+                        conn.execute("DELETE FROM files")
+
+                    files = [self.file_index[p] for p in paths if p in self.file_index]
+                    conn.executemany(
+                        "INSERT INTO files (path, hash, imports, last_modified) VALUES (?, ?, ?, ?)",
+                        [
+                            (idx.path, idx.hash, json.dumps(idx.imports), idx.last_modified)
+                            for idx in files
+                        ],
+                    )
+                    conn.executemany(
+                        "INSERT INTO symbols (path, name, type, file_path, line_number,"
+                        " docstring, signature, parent) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        [
+                            (
+                                idx.path,
+                                s.name,
+                                s.type,
+                                s.file_path,
+                                s.line_number,
+                                s.docstring,
+                                s.signature,
+                                s.parent,
+                            )
+                            for idx in files
                             for s in idx.symbols
                         ],
-                        "imports": idx.imports,
-                        "last_modified": idx.last_modified,
-                    }
-                    for path, idx in self.file_index.items()
-                }
-            }
+                    )
+            finally:
+                conn.close()
 
-            with open(cache_file, "w") as f:
-                json.dump(data, f, indent=2)
+            self._dirty_files.clear()
+            self._store_synced = True
 
-        except (OSError, IOError) as e:
+        except sqlite3.Error as e:
             logger.error(f"Failed to save index cache to {cache_file}: {e}")
-        except (TypeError, ValueError) as e:
-            logger.error(f"Failed to serialize index cache: {e}")
 
     def load_cache(self) -> bool:
         """Load index from cache."""
+        cache_file = self.cache_dir / self.CACHE_DB
+
+        if not cache_file.exists():
+            return self._load_legacy_cache()
+
+        try:
+            conn = sqlite3.connect(str(cache_file))
+            try:
+                _init_store(conn)
+                files = conn.execute(
+                    "SELECT path, hash, imports, last_modified FROM files"
+                ).fetchall()
+                symbols: Dict[str, List[Symbol]] = defaultdict(list)
+                for row in conn.execute(
+                    "SELECT path, name, type, file_path, line_number, docstring, signature,"
+                    " parent FROM symbols ORDER BY rowid"
+                ):
+                    symbols[row[0]].append(Symbol(*row[1:]))
+            finally:
+                conn.close()
+
+            # Reconstruct indexes
+            for path, file_hash, imports, last_modified in files:
+                self._add_file(
+                    FileIndex(
+                        path=path,
+                        hash=file_hash,
+                        symbols=symbols.get(path, []),
+                        imports=json.loads(imports),
+                        last_modified=last_modified,
+                    )
+                )
+
+            self._dirty_files.clear()
+            self._store_synced = True
+            return True
+
+        except sqlite3.Error as e:
+            logger.warning(f"Could not load index cache from {cache_file}: {e}")
+            return False
+        except (json.JSONDecodeError, TypeError) as e:
+            logger.warning(f"Index cache is corrupted, will rebuild: {e}")
+            return False
+
+    def _load_legacy_cache(self) -> bool:
+        """Load a JSON index written by older versions (migrated on next save)."""
         cache_file = self.cache_dir / "index.json"
 
         if not cache_file.exists():
@@ -419,24 +565,16 @@ class SemanticIndexer:
             for path, idx_data in data["file_index"].items():
                 symbols = [Symbol(**s) for s in idx_data["symbols"]]
 
-                file_idx = FileIndex(
-                    path=idx_data["path"],
-                    hash=idx_data["hash"],
-                    symbols=symbols,
-                    imports=idx_data["imports"],
-                    last_modified=idx_data["last_modified"],
+                self._add_file(
+                    FileIndex(
+                        path=idx_data["path"],
+                        hash=idx_data["hash"],
+                        symbols=symbols,
+                        imports=idx_data["imports"],
+                        last_modified=idx_data["last_modified"],
+                    )
                 )
 
-                self.file_index[path] = file_idx
-
-                # Rebuild symbol index
-                for symbol in symbols:
-                    self.symbol_index[symbol.name].append(symbol)
-
-                # Rebuild import graph
-                for imp in file_idx.imports:
-                    self.import_graph[path].add(imp)
-
             return True
 
         except (OSError, IOError) as e:
@@ -445,3 +583,117 @@ class SemanticIndexer:
         except (json.JSONDecodeError, KeyError, TypeError) as e:
             logger.warning(f"Index cache is corrupted, will rebuild: {e}")
             return False
+
+
+def _trigrams(text: str) -> Set[str]:
+    """All 3-character substrings of text."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _init_store(conn: sqlite3.Connection) -> None:
+    """Create the on-disk index tables."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS files (
+            path TEXT PRIMARY KEY,
+            hash TEXT NOT NULL,
+            imports TEXT NOT NULL,
+            last_modified REAL NOT NULL
+        )
+        """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS symbols (
+            path TEXT NOT NULL,
+            name TEXT NOT NULL,
+            type TEXT NOT NULL,
+            file_path TEXT NOT NULL,
+            line_number INTEGER NOT NULL,
+            docstring TEXT,
+            signature TEXT,
+            parent TEXT
+        )
+        """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_symbols_path ON symbols (path)")
+
+
+def _parse_python_file(root_path: Path, path: Path) -> Optional[FileIndex]:
+    """
+    Parse Python file and extract symbols.
+
+    Module-level so ProcessPoolExecutor workers can run it.
+    """
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        content = raw.decode("utf-8")
+
+        tree = ast.parse(content, filename=str(path))
+        rel_path = str(path.relative_to(root_path))
+
+        symbols = []
+        imports = []
+
+        # Breadth-first like ast.walk, carrying the outermost enclosing class
+        todo = deque([(tree, None)])
+        while todo:
+            node, owner = todo.popleft()
+            child_owner = owner
+            if owner is None and isinstance(node, ast.ClassDef):
+                child_owner = node.name
+            todo.extend((child, child_owner) for child in ast.iter_child_nodes(node))
+
+            # Classes
+            if isinstance(node, ast.ClassDef):
+                symbols.append(
+                    Symbol(
+                        name=node.name,
+                        type="class",
+                        file_path=rel_path,
+                        line_number=node.lineno,
+                        docstring=ast.get_docstring(node),
+                    )
+                )
+
+            # Functions
+            elif isinstance(node, ast.FunctionDef):
+                # Enclosing class, if it's a method
+                parent = owner
+
+                # Build signature
+                args = [arg.arg for arg in node.args.args]
+                signature = f"{node.name}({', '.join(args)})"
+
+                symbols.append(
+                    Symbol(
+                        name=node.name,
+                        type="method" if parent else "function",
+                        file_path=rel_path,
+                        line_number=node.lineno,
+                        docstring=ast.get_docstring(node),
+                        signature=signature,
+                        parent=parent,
+                    )
+                )
+
+            # Imports
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    imports.append(alias.name)
+
+            elif isinstance(node, ast.ImportFrom):
+                if node.module:
+                    imports.append(node.module)
+
+        return FileIndex(
+            path=rel_path,
+            hash=hashlib.sha256(raw).hexdigest()[:16],
+            symbols=symbols,
+            imports=imports,
+            last_modified=path.stat().st_mtime,
+        )
+
+    except (SyntaxError, UnicodeDecodeError, ValueError) as e:
+        logger.debug(f"Parse failed for {path}: {e}")
+        return None
+    except OSError as e:
+        logger.warning(f"Could not read file {path}: {e}")
+        return None
@@ -316,9 +316,9 @@ class ProviderManager:
 
         try:
             # Simple connectivity check based on provider type
-            import aiohttp
+            from vertice_core.async_utils.http_clients import get_http_clients
 
-            async with aiohttp.ClientSession() as session:
+            async with get_http_clients().aiohttp_session() as session:
                 if config.type == ProviderType.OLLAMA:
                     url = f"{config.base_url}/api/tags"
                 elif config.type in (ProviderType.OPENAI, ProviderType.NEBIUS):
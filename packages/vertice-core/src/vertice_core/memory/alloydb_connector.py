@@ -2,9 +2,25 @@ from __future__ import annotations
 
 import dataclasses
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Optional
 
-from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+    from sqlalchemy.sql.elements import TextClause
+
+
+# SQLAlchemy costs ~0.5s to import and only the AlloyDB backend needs it, so it
+# is loaded on first use rather than whenever the memory package is imported.
+def create_async_engine(url: str, **kwargs: Any) -> AsyncEngine:
+    from sqlalchemy.ext.asyncio import create_async_engine as _create_async_engine
+
+    return _create_async_engine(url, **kwargs)
+
+
+def text(sql: str) -> TextClause:
+    from sqlalchemy import text as _text
+
+    return _text(sql)
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
@@ -19,9 +19,7 @@ from typing import Any, Dict, List, Optional, Literal
 
 from .timing import timing_decorator
 from .connection_pool import ConnectionPool
-from ..alloydb_connector import AlloyDBConfig, AlloyDBConnector
-
-from sqlalchemy import text
+from ..alloydb_connector import AlloyDBConfig, AlloyDBConnector, text
 
 
 _ASYNC_BRIDGE_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=1)
@@ -20,9 +20,8 @@ from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional
 
 from async_lru import alru_cache
-from sqlalchemy import text
 
-from ..alloydb_connector import AlloyDBConfig, AlloyDBConnector
+from ..alloydb_connector import AlloyDBConfig, AlloyDBConnector, text
 from .timing import timing_decorator
 
 logger = logging.getLogger(__name__)
@@ -23,8 +23,9 @@ from .types import (
     ObservabilityConfig,
 )
 from .tracer import AgentTracer
-from .metrics import MetricsCollector, Histogram
+from .metrics import MetricsCollector, Histogram, BoundHistogram, BoundCounter
 from .exporter import SpanExporter, MetricsExporter, ConsoleExporter
+from .batch import BatchSpanProcessor
 from .mixin import ObservabilityMixin
 
 __all__ = [
@@ -42,8 +43,11 @@ __all__ = [
     "AgentTracer",
     "MetricsCollector",
     "Histogram",
+    "BoundHistogram",
+    "BoundCounter",
     "SpanExporter",
     "MetricsExporter",
     "ConsoleExporter",
+    "BatchSpanProcessor",
     "ObservabilityMixin",
 ]
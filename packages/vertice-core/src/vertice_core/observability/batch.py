@@ -0,0 +1,218 @@
+"""
+Batch Span Processor
+
+Moves span export off the caller's thread: finished spans go into a bounded
+ring buffer and a background worker ships them in batches.
+
+References:
+- OpenTelemetry SDK BatchSpanProcessor specification
+- OTLP/HTTP exporter retry and compression guidance
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from .exporter import BaseExporter
+from .metrics import Histogram
+from .types import ObservabilityConfig
+
+logger = logging.getLogger(__name__)
+
+
+class BatchSpanProcessor:
+    """
+    Background batching pipeline in front of an exporter.
+
+    - on_end() appends to a deque(maxlen=export_queue_size): no lock is taken
+      on the hot path, and when the buffer is full the oldest span is dropped.
+    - A daemon worker wakes every export_interval_seconds, or as soon as
+      batch_size spans are queued, and ships batches via
+      exporter.export_batch().
+    - Failed batches are retried with exponential backoff, then dropped.
+    - Spans are serialized (to_dict) on the worker, not by the caller.
+
+    Self-metrics (queue depth, drops, export latency) are in get_stats().
+
+    Usage:
+        processor = BatchSpanProcessor(SpanExporter(config, path), config)
+        tracer = AgentTracer(config, span_processor=processor)
+        ...
+        processor.shutdown()
+    """
+
+    def __init__(
+        self,
+        exporter: BaseExporter,
+        config: Optional[ObservabilityConfig] = None,
+    ):
+        """
+        Initialize processor.
+
+        Args:
+            exporter: Exporter that ships batches (export_batch)
+            config: Observability configuration (queue, batch, retry settings)
+        """
+        self._exporter = exporter
+        self._config = config or ObservabilityConfig()
+        self._queue: Deque[Any] = deque(maxlen=max(1, self._config.export_queue_size))
+        self._batch_size = max(1, self._config.batch_size)
+
+        self._wakeup = threading.Event()
+        self._export_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._shutdown = False
+
+        # Self-metrics
+        self._enqueued = 0
+        self._dropped = 0
+        self._exported = 0
+        self._failed_batches = 0
+        self._retries = 0
+        self._export_latency = Histogram(name="observability.export.latency")
+
+    def on_end(self, span: Any) -> None:
+        """
+        Queue a finished span (dict or object with to_dict()).
+
+        Never blocks: the oldest queued span is dropped when the buffer is full.
+        """
+        if self._shutdown:
+            self._dropped += 1
+            return
+
+        queue = self._queue
+        if len(queue) == queue.maxlen:
+            self._dropped += 1
+        queue.append(span)
+        self._enqueued += 1
+
+        if self._worker is None:
+            self._start_worker()
+        if len(queue) >= self._batch_size:
+            self._wakeup.set()
+
+    def enqueue(self, spans: List[Any]) -> None:
+        """Queue several finished spans."""
+        for span in spans:
+            self.on_end(span)
+
+    def force_flush(self) -> bool:
+        """
+        Export everything queued so far on the calling thread.
+
+        Returns:
+            True if every batch was exported
+        """
+        success = True
+        while self._queue:
+            success = self._export_next_batch() and success
+        return success
+
+    def shutdown(self, timeout: Optional[float] = None) -> bool:
+        """
+        Stop the worker, flush what is left and shut the exporter down.
+
+        Args:
+            timeout: Seconds to wait for the worker to finish its batch
+
+        Returns:
+            True if the final flush succeeded
+        """
+        self._shutdown = True
+        self._wakeup.set()
+        if self._worker is not None:
+            self._worker.join(timeout)
+
+        success = self.force_flush()
+        self._exporter.shutdown()
+        return success
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pipeline self-metrics."""
+        latency = self._export_latency
+        return {
+            "queue_depth": len(self._queue),
+            "queue_capacity": self._queue.maxlen,
+            "spans_enqueued": self._enqueued,
+            "spans_exported": self._exported,
+            "spans_dropped": self._dropped,
+            "failed_batches": self._failed_batches,
+            "export_retries": self._retries,
+            "export_count": latency.count,
+            "export_latency_avg_ms": (
+                latency.sum_value / latency.count * 1000 if latency.count else 0.0
+            ),
+            "export_latency_p95_ms": latency.percentile(95) * 1000,
+            "worker_alive": self._worker is not None and self._worker.is_alive(),
+        }
+
+    def _start_worker(self) -> None:
+        """Start the export thread on first use."""
+        with self._start_lock:
+            if self._worker is not None:
+                return
+            self._worker = threading.Thread(
+                target=self._run, name="vertice-span-export", daemon=True
+            )
+            self._worker.start()
+
+    def _run(self) -> None:
+        """Worker loop: wait for a full batch or the export interval, then drain."""
+        while not self._shutdown:
+            self._wakeup.wait(self._config.export_interval_seconds)
+            self._wakeup.clear()
+            while self._queue and not self._shutdown:
+                self._export_next_batch()
+
+    def _export_next_batch(self) -> bool:
+        """Pop up to batch_size spans and export them with retries."""
+        with self._export_lock:
+            batch: List[Dict[str, Any]] = []
+            queue = self._queue
+            while queue and len(batch) < self._batch_size:
+                try:
+                    span = queue.popleft()
+                except IndexError:
+                    break
+                batch.append(span.to_dict() if hasattr(span, "to_dict") else span)
+
+            if not batch:
+                return True
+            return self._export_with_retry(batch)
+
+    def _export_with_retry(self, batch: List[Dict[str, Any]]) -> bool:
+        """Export one batch; back off and retry, then drop it."""
+        backoff = self._config.export_retry_backoff_seconds
+        attempts = 1 + max(0, self._config.export_max_retries)
+
+        for attempt in range(attempts):
+            start = time.perf_counter()
+            try:
+                success = self._exporter.export_batch(batch)
+            except Exception as e:
+                logger.warning(f"[BatchSpanProcessor] Export raised: {e}")
+                success = False
+            self._export_latency.observe(time.perf_counter() - start)
+
+            if success:
+                self._exported += len(batch)
+                return True
+
+            if attempt + 1 < attempts:
+                self._retries += 1
+                # Don't hold up shutdown with long sleeps
+                if not self._shutdown:
+                    time.sleep(backoff * (2**attempt))
+
+        self._failed_batches += 1
+        self._dropped += len(batch)
+        logger.warning(
+            f"[BatchSpanProcessor] Dropped batch of {len(batch)} spans after {attempts} attempts"
+        )
+        return False
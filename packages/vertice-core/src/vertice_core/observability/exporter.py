@@ -11,11 +11,13 @@ References:
 
 from __future__ import annotations
 
+import gzip
 import json
 import logging
+import os
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, List, Optional
 from pathlib import Path
 
 from .types import ObservabilityConfig
@@ -36,6 +38,55 @@ class BaseExporter(ABC):
         """Shutdown exporter and flush any pending data."""
         raise NotImplementedError
 
+    def export_batch(self, data: List[Dict[str, Any]]) -> bool:
+        """Ship one batch right away, bypassing any internal batching."""
+        return self.export(data)
+
+
+def _last_token_offset(f: BinaryIO, end: int) -> int:
+    """Offset of the last non-whitespace byte before end (-1 if none)."""
+    while end > 0:
+        f.seek(end - 1)
+        if not f.read(1).isspace():
+            return end - 1
+        end -= 1
+    return -1
+
+
+def _append_json_array(path: Path, items: List[Dict[str, Any]]) -> None:
+    """
+    Append items to the JSON array stored in path.
+
+    Only the new items are serialized: the closing bracket is overwritten in
+    place instead of loading and rewriting the whole file on every flush.
+    """
+    body = ",\n".join(json.dumps(item, indent=2, default=str) for item in items)
+    try:
+        f = open(path, "r+b")
+    except FileNotFoundError:
+        with open(path, "w") as new_file:
+            new_file.write(f"[\n{body}\n]")
+        return
+
+    with f:
+        closing = _last_token_offset(f, f.seek(0, os.SEEK_END))
+        if closing == -1:
+            f.seek(0)
+            f.truncate()
+            f.write(f"[\n{body}\n]".encode())
+            return
+
+        f.seek(closing)
+        if f.read(1) != b"]":
+            raise ValueError(f"{path} does not contain a JSON array")
+        previous = _last_token_offset(f, closing)
+        f.seek(previous)
+        separator = "\n" if f.read(1) == b"[" else ",\n"
+
+        f.seek(closing)
+        f.truncate()
+        f.write(f"{separator}{body}\n]".encode())
+
 
 class SpanExporter(BaseExporter):
     """
@@ -95,49 +146,63 @@ class SpanExporter(BaseExporter):
         if not self._batch:
             return True
 
+        success = self.export_batch(self._batch)
+
+        if success:
+            self._batch.clear()
+            self._last_export = time.time()
+
+        return success
+
+    def export_batch(self, spans: List[Dict[str, Any]]) -> bool:
+        """
+        Ship spans to every configured backend now.
+
+        Used by BatchSpanProcessor from its worker thread; export() keeps
+        batching on the caller's thread.
+
+        Args:
+            spans: List of span dictionaries
+
+        Returns:
+            True if every backend accepted the spans
+        """
+        if not spans:
+            return True
+
         success = True
 
         # Export to file if configured
         if self._export_path:
-            success = self._export_to_file()
+            success = self._export_to_file(spans)
 
         # Export to OTLP if configured
         if self._config.otlp_endpoint:
-            success = success and self._export_to_otlp()
-
-        if success:
-            self._batch.clear()
-            self._last_export = time.time()
+            success = success and self._export_to_otlp(spans)
 
         return success
 
-    def _export_to_file(self) -> bool:
-        """Export spans to JSON file."""
+    def _export_to_file(self, spans: Optional[List[Dict[str, Any]]] = None) -> bool:
+        """Export spans (default: the pending batch) to JSON file."""
+        spans = self._batch if spans is None else spans
         try:
             self._export_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Append to existing file or create new
-            existing_data = []
-            if self._export_path.exists():
-                with open(self._export_path) as f:
-                    existing_data = json.load(f)
+            _append_json_array(self._export_path, spans)
 
-            existing_data.extend(self._batch)
-
-            with open(self._export_path, "w") as f:
-                json.dump(existing_data, f, indent=2, default=str)
-
-            logger.debug(f"[Exporter] Exported {len(self._batch)} spans to {self._export_path}")
+            logger.debug(f"[Exporter] Exported {len(spans)} spans to {self._export_path}")
             return True
 
         except Exception as e:
             logger.error(f"[Exporter] Failed to export to file: {e}")
             return False
 
-    def _export_to_otlp(self) -> bool:
-        """Export spans to OTLP endpoint."""
+    def _export_to_otlp(self, spans: Optional[List[Dict[str, Any]]] = None) -> bool:
+        """Export spans (default: the pending batch) to OTLP endpoint."""
         # Note: In production, use opentelemetry-exporter-otlp
         # This is a simplified implementation for demonstration
+        spans = self._batch if spans is None else spans
         try:
             import urllib.request
             import urllib.error
@@ -157,21 +222,27 @@ class SpanExporter(BaseExporter):
                                 },
                             ]
                         },
-                        "scopeSpans": [{"spans": self._batch}],
+                        "scopeSpans": [{"spans": spans}],
                     }
                 ]
             }
 
-            data = json.dumps(payload).encode("utf-8")
+            data = json.dumps(payload, default=str).encode("utf-8")
+            headers = {"Content-Type": "application/json"}
+            if self._config.export_compression:
+                data = gzip.compress(data, compresslevel=6)
+                headers["Content-Encoding"] = "gzip"
+
             req = urllib.request.Request(
                 f"{self._config.otlp_endpoint}/v1/traces",
                 data=data,
-                headers={"Content-Type": "application/json"},
+                headers=headers,
             )
 
-            with urllib.request.urlopen(req, timeout=10) as response:
-                if response.status == 200:
-                    logger.debug(f"[Exporter] Exported {len(self._batch)} spans to OTLP")
+            timeout = self._config.export_timeout_seconds
+            with urllib.request.urlopen(req, timeout=timeout) as response:
+                if 200 <= response.status < 300:
+                    logger.debug(f"[Exporter] Exported {len(spans)} spans to OTLP")
                     return True
 
             return False
@@ -289,7 +360,7 @@ class MetricsExporter(BaseExporter):
                     label_str = ""
                 lines.append(f"{metric_name}{label_str} {value}")
 
-        # Histograms (simplified)
+        # Histograms: cumulative buckets when present, quantiles as a summary
         for name, label_hists in metrics.get("histograms", {}).items():
             metric_name = name.replace(".", "_").replace("-", "_")
             lines.append(f"# TYPE {metric_name} histogram")
@@ -299,9 +370,29 @@ class MetricsExporter(BaseExporter):
                     label_str = "{" + labels + "}"
                 else:
                     label_str = ""
+                for bound, count in hist_data.get("buckets", {}).items():
+                    le = "+Inf" if bound == float("inf") else bound
+                    bucket_labels = f"{labels},le={le}" if labels else f"le={le}"
+                    lines.append(f"{metric_name}_bucket{{{bucket_labels}}} {count}")
                 lines.append(f"{metric_name}_count{label_str} {hist_data['count']}")
                 lines.append(f"{metric_name}_sum{label_str} {hist_data['sum']}")
 
+            # A family can't be both histogram and summary, so quantiles
+            # get their own name
+            quantile_hists = {
+                labels: hist_data["quantiles"]
+                for labels, hist_data in label_hists.items()
+                if hist_data.get("quantiles")
+            }
+            if quantile_hists:
+                lines.append(f"# TYPE {metric_name}_quantiles summary")
+                for labels, quantiles in quantile_hists.items():
+                    for quantile, value in quantiles.items():
+                        quantile_labels = (
+                            f"{labels},quantile={quantile}" if labels else f"quantile={quantile}"
+                        )
+                        lines.append(f"{metric_name}_quantiles{{{quantile_labels}}} {value}")
+
         return "\n".join(lines)
 
     def shutdown(self) -> None:
@@ -13,10 +13,12 @@ References:
 from __future__ import annotations
 
 import logging
+import math
 import time
+from bisect import bisect_left
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .types import MetricType, MetricDefinition, ObservabilityConfig
 
@@ -34,7 +36,20 @@ class MetricPoint:
 
 @dataclass
 class Histogram:
-    """Histogram metric with bucket aggregation."""
+    """
+    Histogram metric backed by a DDSketch-style quantile sketch.
+
+    - observe() is O(1) for the sketch (one log and a dict increment) plus a
+      bisect over the fixed Prometheus buckets.
+    - percentile() is within relative_accuracy of the true value instead of
+      snapping to a bucket boundary.
+    - merge() combines histograms from other processes or replicas;
+      to_dict()/from_dict() carry them over the wire.
+
+    References:
+    - Masson et al., "DDSketch: A Fast and Fully-Mergeable Quantile Sketch
+      with Relative-Error Guarantees" (VLDB 2019)
+    """
 
     name: str
     buckets: List[float] = field(
@@ -55,38 +70,214 @@ class Histogram:
             10.0,
         ]
     )
-    counts: Dict[float, int] = field(default_factory=dict)
     sum_value: float = 0.0
     count: int = 0
+    relative_accuracy: float = 0.01
+    max_bins: int = 2048
+
+    # Smallest magnitude tracked by the sketch; anything below counts as zero
+    MIN_INDEXABLE = 1e-9
 
     def __post_init__(self):
-        self.counts = {b: 0 for b in self.buckets}
-        self.counts[float("inf")] = 0
+        if not 0.0 < self.relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+        self._gamma = (1 + self.relative_accuracy) / (1 - self.relative_accuracy)
+        self._inv_log_gamma = 1.0 / math.log(self._gamma)
+        self._sorted_buckets = sorted(self.buckets)
+        # Non-cumulative hits per bucket; the last slot is +Inf
+        self._bucket_hits = [0] * (len(self._sorted_buckets) + 1)
+        self._bins: Dict[int, int] = {}
+        self._negative_bins: Dict[int, int] = {}
+        self._zero_count = 0
+        self.min_value = math.inf
+        self.max_value = -math.inf
 
     def observe(self, value: float) -> None:
         """Record a value in the histogram."""
         self.sum_value += value
         self.count += 1
-
-        for bucket in self.buckets:
-            if value <= bucket:
-                self.counts[bucket] += 1
-        self.counts[float("inf")] += 1
+        if value < self.min_value:
+            self.min_value = value
+        if value > self.max_value:
+            self.max_value = value
+
+        self._bucket_hits[bisect_left(self._sorted_buckets, value)] += 1
+
+        if value > self.MIN_INDEXABLE:
+            bins = self._bins
+            magnitude = value
+        elif value < -self.MIN_INDEXABLE:
+            bins = self._negative_bins
+            magnitude = -value
+        else:
+            self._zero_count += 1
+            return
+
+        key = math.ceil(math.log(magnitude) * self._inv_log_gamma)
+        if key in bins:
+            bins[key] += 1
+        else:
+            bins[key] = 1
+            if len(bins) > self.max_bins:
+                self._collapse(bins)
+
+    @property
+    def counts(self) -> Dict[float, int]:
+        """Cumulative count per bucket upper bound (Prometheus "le")."""
+        counts: Dict[float, int] = {}
+        cumulative = 0
+        for bound, hits in zip(self._sorted_buckets, self._bucket_hits):
+            cumulative += hits
+            counts[bound] = cumulative
+        counts[float("inf")] = self.count
+        return counts
 
     def percentile(self, p: float) -> float:
-        """Calculate approximate percentile from histogram."""
+        """Calculate percentile (0-100) within relative_accuracy."""
         if self.count == 0:
             return 0.0
 
-        target_count = int(self.count * p / 100)
+        rank = p / 100 * (self.count - 1)
         cumulative = 0
 
-        for bucket in sorted(self.buckets):
-            cumulative += self.counts[bucket]
-            if cumulative >= target_count:
-                return bucket
+        # Most negative first: larger keys are larger magnitudes
+        for key in sorted(self._negative_bins, reverse=True):
+            cumulative += self._negative_bins[key]
+            if cumulative > rank:
+                return self._clamp(-self._bin_value(key))
+
+        cumulative += self._zero_count
+        if cumulative > rank:
+            return self._clamp(0.0)
+
+        for key in sorted(self._bins):
+            cumulative += self._bins[key]
+            if cumulative > rank:
+                return self._clamp(self._bin_value(key))
+
+        return self.max_value
+
+    def merge(self, other: "Histogram") -> None:
+        """
+        Add another histogram's observations into this one.
+
+        Raises:
+            ValueError: If accuracy or bucket layout differ
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge histograms with different relative_accuracy")
+        if other._sorted_buckets != self._sorted_buckets:
+            raise ValueError("Cannot merge histograms with different buckets")
+
+        self.sum_value += other.sum_value
+        self.count += other.count
+        self.min_value = min(self.min_value, other.min_value)
+        self.max_value = max(self.max_value, other.max_value)
+        self._zero_count += other._zero_count
+        for index, hits in enumerate(other._bucket_hits):
+            self._bucket_hits[index] += hits
+        for own, theirs in ((self._bins, other._bins), (self._negative_bins, other._negative_bins)):
+            for key, hits in theirs.items():
+                own[key] = own.get(key, 0) + hits
+            if len(own) > self.max_bins:
+                self._collapse(own)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for shipping to another process (see from_dict)."""
+        return {
+            "name": self.name,
+            "buckets": list(self._sorted_buckets),
+            "relative_accuracy": self.relative_accuracy,
+            "max_bins": self.max_bins,
+            "count": self.count,
+            "sum": self.sum_value,
+            "min": self.min_value if self.count else None,
+            "max": self.max_value if self.count else None,
+            "zero_count": self._zero_count,
+            "bucket_hits": list(self._bucket_hits),
+            "bins": {str(key): hits for key, hits in self._bins.items()},
+            "negative_bins": {str(key): hits for key, hits in self._negative_bins.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Histogram":
+        """Rebuild a histogram serialized with to_dict()."""
+        hist = cls(
+            name=data["name"],
+            buckets=list(data["buckets"]),
+            relative_accuracy=data["relative_accuracy"],
+            max_bins=data.get("max_bins", 2048),
+        )
+        hist.count = data["count"]
+        hist.sum_value = data["sum"]
+        if hist.count:
+            hist.min_value = data["min"]
+            hist.max_value = data["max"]
+        hist._zero_count = data["zero_count"]
+        hist._bucket_hits = list(data["bucket_hits"])
+        hist._bins = {int(key): hits for key, hits in data["bins"].items()}
+        hist._negative_bins = {int(key): hits for key, hits in data["negative_bins"].items()}
+        return hist
+
+    def _bin_value(self, key: int) -> float:
+        """Representative value of a bin: within relative_accuracy of any member."""
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def _clamp(self, value: float) -> float:
+        """Never report outside the observed range."""
+        return min(max(value, self.min_value), self.max_value)
+
+    def _collapse(self, bins: Dict[int, int]) -> None:
+        """Fold the smallest-magnitude bins together to respect max_bins."""
+        keys = sorted(bins)
+        excess = len(keys) - self.max_bins
+        target = keys[excess]
+        for key in keys[:excess]:
+            bins[target] += bins.pop(key)
+
+
+class BoundHistogram:
+    """
+    Histogram handle with its label set resolved up front.
+
+    Returned by MetricsCollector.histogram(); observe() skips label-key
+    building, so hot paths record without allocating.
+    """
+
+    __slots__ = ("_histograms", "_name", "_key")
+
+    def __init__(self, histograms: Dict[str, Dict[str, Histogram]], name: str, key: str):
+        self._histograms = histograms
+        self._name = name
+        self._key = key
+
+    def observe(self, value: float) -> None:
+        """Record a value for this label set."""
+        series = self._histograms[self._name]
+        hist = series.get(self._key)
+        if hist is None:
+            hist = series[self._key] = Histogram(name=self._name)
+        hist.observe(value)
+
+
+class BoundCounter:
+    """
+    Counter handle with its label set resolved up front.
+
+    Returned by MetricsCollector.counter(). Unlike increment_counter(), it
+    does not append a time-series point per call.
+    """
+
+    __slots__ = ("_counters", "_name", "_key")
 
-        return self.buckets[-1]
+    def __init__(self, counters: Dict[str, Dict[str, float]], name: str, key: str):
+        self._counters = counters
+        self._name = name
+        self._key = key
+
+    def add(self, value: float = 1.0) -> None:
+        """Increment the counter for this label set."""
+        self._counters[self._name][self._key] += value
 
 
 class MetricsCollector:
@@ -173,6 +364,9 @@ class MetricsCollector:
         # Time series for trending
         self._time_series: Dict[str, List[MetricPoint]] = defaultdict(list)
 
+        # Pre-bound handles for the record_* hot paths
+        self._bound_histograms: Dict[Tuple[str, ...], BoundHistogram] = {}
+
         # Initialize standard metrics
         self._init_standard_metrics()
 
@@ -249,6 +443,52 @@ class MetricsCollector:
 
         self._histograms[name][label_key].observe(value)
 
+    def histogram(
+        self,
+        name: str,
+        labels: Optional[Dict[str, str]] = None,
+    ) -> BoundHistogram:
+        """
+        Get a histogram handle bound to one label set.
+
+        Resolve it once and call observe() on hot paths instead of
+        observe_histogram(), which rebuilds the label key on every call.
+
+        Args:
+            name: Metric name
+            labels: Metric labels
+
+        Returns:
+            BoundHistogram for the label set
+        """
+        return BoundHistogram(self._histograms, name, self._labels_to_key(labels))
+
+    def counter(
+        self,
+        name: str,
+        labels: Optional[Dict[str, str]] = None,
+    ) -> BoundCounter:
+        """
+        Get a counter handle bound to one label set.
+
+        Args:
+            name: Metric name
+            labels: Metric labels
+
+        Returns:
+            BoundCounter for the label set
+        """
+        return BoundCounter(self._counters, name, self._labels_to_key(labels))
+
+    def _bound_histogram(
+        self, cache_key: Tuple[str, ...], name: str, labels: Dict[str, str]
+    ) -> BoundHistogram:
+        """Get (or create and cache) an internal histogram handle."""
+        handle = self._bound_histograms.get(cache_key)
+        if handle is None:
+            handle = self._bound_histograms[cache_key] = self.histogram(name, labels)
+        return handle
+
     def record_token_usage(
         self,
         model: str,
@@ -301,15 +541,15 @@ class MetricsCollector:
             duration_ms: Duration in milliseconds
             model: Optional model name
         """
-        labels = {"gen_ai.operation.name": operation}
-        if model:
-            labels["gen_ai.request.model"] = model
-
-        self.observe_histogram(
-            "gen_ai.client.operation.duration",
-            value=duration_ms,
-            labels=labels,
-        )
+        handle = self._bound_histograms.get(("latency", operation, model or ""))
+        if handle is None:
+            labels = {"gen_ai.operation.name": operation}
+            if model:
+                labels["gen_ai.request.model"] = model
+            handle = self._bound_histogram(
+                ("latency", operation, model or ""), "gen_ai.client.operation.duration", labels
+            )
+        handle.observe(duration_ms)
 
     def record_ttft(self, model: str, ttft_ms: float) -> None:
         """
@@ -319,11 +559,14 @@ class MetricsCollector:
             model: Model name
             ttft_ms: Time to first token in milliseconds
         """
-        self.observe_histogram(
-            "gen_ai.server.time_to_first_token",
-            value=ttft_ms,
-            labels={"gen_ai.request.model": model},
-        )
+        handle = self._bound_histograms.get(("ttft", model))
+        if handle is None:
+            handle = self._bound_histogram(
+                ("ttft", model),
+                "gen_ai.server.time_to_first_token",
+                {"gen_ai.request.model": model},
+            )
+        handle.observe(ttft_ms)
 
     def record_tool_invocation(
         self,
@@ -348,11 +591,12 @@ class MetricsCollector:
         )
 
         if duration_ms is not None:
-            self.observe_histogram(
-                "agent.tool.duration",
-                value=duration_ms,
-                labels={"tool_name": tool_name},
-            )
+            handle = self._bound_histograms.get(("tool", tool_name))
+            if handle is None:
+                handle = self._bound_histogram(
+                    ("tool", tool_name), "agent.tool.duration", {"tool_name": tool_name}
+                )
+            handle.observe(duration_ms)
 
     def record_error(
         self,
@@ -401,7 +645,7 @@ class MetricsCollector:
         label_key = self._labels_to_key(labels)
 
         if name not in self._histograms or label_key not in self._histograms[name]:
-            return {"count": 0, "sum": 0.0, "p50": 0.0, "p90": 0.0, "p99": 0.0}
+            return {"count": 0, "sum": 0.0, "p50": 0.0, "p90": 0.0, "p95": 0.0, "p99": 0.0}
 
         hist = self._histograms[name][label_key]
         return {
@@ -410,6 +654,7 @@ class MetricsCollector:
             "mean": hist.sum_value / hist.count if hist.count > 0 else 0.0,
             "p50": hist.percentile(50),
             "p90": hist.percentile(90),
+            "p95": hist.percentile(95),
             "p99": hist.percentile(99),
         }
 
@@ -424,6 +669,12 @@ class MetricsCollector:
                         "count": h.count,
                         "sum": h.sum_value,
                         "mean": h.sum_value / h.count if h.count > 0 else 0.0,
+                        "buckets": h.counts,
+                        "quantiles": {
+                            "0.5": h.percentile(50),
+                            "0.95": h.percentile(95),
+                            "0.99": h.percentile(99),
+                        },
                     }
                     for label, h in label_hists.items()
                 }
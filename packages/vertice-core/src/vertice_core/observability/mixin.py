@@ -20,6 +20,7 @@ from .types import ObservabilityConfig
 from .tracer import AgentTracer
 from .metrics import MetricsCollector
 from .exporter import SpanExporter, MetricsExporter
+from .batch import BatchSpanProcessor
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +32,7 @@ class ObservabilityMixin:
     Adds:
     - Distributed tracing with OpenTelemetry conventions
     - Metrics collection and aggregation
-    - Export to various backends
+    - Export to various backends (spans shipped by a background worker)
     """
 
     def _init_observability(
@@ -49,9 +50,16 @@ class ObservabilityMixin:
             metrics_path: Path for metrics export
         """
         self._observability_config = config or ObservabilityConfig()
-        self._tracer = AgentTracer(self._observability_config)
         self._metrics = MetricsCollector(self._observability_config)
         self._span_exporter = SpanExporter(self._observability_config, traces_path)
+
+        # Finished spans stream to the exporter off the agent's thread
+        self._span_processor: Optional[BatchSpanProcessor] = None
+        if traces_path or self._observability_config.otlp_endpoint:
+            self._span_processor = BatchSpanProcessor(
+                self._span_exporter, self._observability_config
+            )
+        self._tracer = AgentTracer(self._observability_config, self._span_processor)
         self._metrics_exporter = MetricsExporter(self._observability_config, metrics_path)
         self._observability_initialized = True
 
@@ -252,17 +260,24 @@ class ObservabilityMixin:
         if not hasattr(self, "_observability_initialized"):
             return {"initialized": False}
 
-        return {
+        stats = {
             "initialized": True,
             "traces": self._tracer.get_trace_stats(),
             "metrics": self._metrics.get_all_metrics(),
         }
+        if self._span_processor is not None:
+            stats["export"] = self._span_processor.get_stats()
+        return stats
 
     def export_traces(self) -> bool:
         """Export collected traces."""
         if not hasattr(self, "_span_exporter"):
             return False
 
+        # Spans were already queued as they finished
+        if getattr(self, "_span_processor", None) is not None:
+            return self._span_processor.force_flush()
+
         spans = self._tracer.export_spans()
         return self._span_exporter.export(spans)
 
@@ -284,7 +299,9 @@ class ObservabilityMixin:
 
     def shutdown_observability(self) -> None:
         """Shutdown observability system and flush data."""
-        if hasattr(self, "_span_exporter"):
+        if getattr(self, "_span_processor", None) is not None:
+            self._span_processor.shutdown()
+        elif hasattr(self, "_span_exporter"):
             self.export_traces()
             self._span_exporter.shutdown()
 
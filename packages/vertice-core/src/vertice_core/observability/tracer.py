@@ -14,17 +14,19 @@ from __future__ import annotations
 import logging
 import random
 from contextlib import contextmanager
-from typing import Any, Dict, Generator, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional
 
 from .types import (
     AgentSpan,
     LLMSpan,
     ToolSpan,
     TraceContext,
-    SpanKind,
     ObservabilityConfig,
 )
 
+if TYPE_CHECKING:
+    from .batch import BatchSpanProcessor
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,14 +44,20 @@ class AgentTracer:
     - https://opentelemetry.io/docs/specs/semconv/gen-ai/
     """
 
-    def __init__(self, config: Optional[ObservabilityConfig] = None):
+    def __init__(
+        self,
+        config: Optional[ObservabilityConfig] = None,
+        span_processor: Optional["BatchSpanProcessor"] = None,
+    ):
         """
         Initialize tracer.
 
         Args:
             config: Observability configuration
+            span_processor: Receives every finished span for background export
         """
         self._config = config or ObservabilityConfig()
+        self._span_processor = span_processor
         self._active_spans: Dict[str, AgentSpan] = {}
         self._completed_spans: List[AgentSpan] = []
         self._llm_spans: List[LLMSpan] = []
@@ -157,7 +165,7 @@ class AgentTracer:
             # Sampling decision (P1-5)
             is_error = span.status_code == "ERROR"
             if self._should_sample(is_error=is_error):
-                self._completed_spans.append(span)
+                self._record(self._completed_spans, span)
             # If not sampled, span is dropped (not stored)
 
             self._current_context = old_context
@@ -203,7 +211,7 @@ class AgentTracer:
             span.error_type = type(e).__name__
             raise
         finally:
-            self._llm_spans.append(span)
+            self._record(self._llm_spans, span)
 
             logger.debug(
                 f"[Tracer] LLM span completed: {model} "
@@ -239,13 +247,28 @@ class AgentTracer:
             span.end(status_code="ERROR", error=str(e))
             raise
         finally:
-            self._tool_spans.append(span)
+            self._record(self._tool_spans, span)
 
             logger.debug(
                 f"[Tracer] Tool span completed: {tool_name} "
                 f"({span.duration_ms:.1f}ms, status={span.status_code})"
             )
 
+    def _record(self, spans: List[Any], span: Any) -> None:
+        """
+        Keep a finished span for stats and hand it to the span processor.
+
+        Each list keeps at most max_retained_spans; the oldest quarter is
+        trimmed in one go so appends stay amortized O(1).
+        """
+        spans.append(span)
+        limit = self._config.max_retained_spans
+        if len(spans) > limit + max(1, limit // 4):
+            del spans[: len(spans) - limit]
+
+        if self._span_processor is not None:
+            self._span_processor.on_end(span)
+
     def get_current_trace_id(self) -> Optional[str]:
         """Get current trace ID."""
         return self._current_context.trace_id if self._current_context else None
@@ -330,18 +353,7 @@ class AgentTracer:
             spans.append(span.to_dict())
 
         for span in self._tool_spans:
-            spans.append(
-                {
-                    "spanId": span.span_id,
-                    "parentSpanId": span.parent_span_id,
-                    "name": f"tool.{span.tool_name}",
-                    "kind": SpanKind.TOOL.value,
-                    "attributes": {
-                        "tool.name": span.tool_name,
-                    },
-                    "status": {"code": span.status_code},
-                }
-            )
+            spans.append(span.to_dict())
 
         return spans
 
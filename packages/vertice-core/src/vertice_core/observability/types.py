@@ -250,6 +250,19 @@ class ToolSpan:
         end = datetime.fromisoformat(self.end_time)
         self.duration_ms = (end - start).total_seconds() * 1000
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to OTLP-compatible dictionary."""
+        return {
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id,
+            "name": f"tool.{self.tool_name}",
+            "kind": SpanKind.TOOL.value,
+            "attributes": {
+                "tool.name": self.tool_name,
+            },
+            "status": {"code": self.status_code},
+        }
+
 
 @dataclass
 class MetricDefinition:
@@ -275,6 +288,14 @@ class ObservabilityConfig:
     export_interval_seconds: int = 60
     batch_size: int = 100
 
+    # Background export (BatchSpanProcessor)
+    export_queue_size: int = 2048  # Ring buffer; oldest spans dropped when full
+    export_max_retries: int = 3
+    export_retry_backoff_seconds: float = 0.5  # Doubled on each retry
+    export_timeout_seconds: float = 10.0
+    export_compression: bool = True  # gzip OTLP request bodies
+    max_retained_spans: int = 10_000  # Per span list kept by AgentTracer for stats
+
     # Sampling (P1-5 - Optimized for production scale)
     sampling_enabled: bool = True
     head_sample_rate: float = 0.1  # 10% head-based sampling (production)
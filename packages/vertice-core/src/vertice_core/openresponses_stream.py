@@ -9,8 +9,10 @@ Referência: Open Responses Specification - Streaming
 
 from __future__ import annotations
 import json
-from typing import Optional, Generator
-from dataclasses import dataclass, field
+import time
+from itertools import groupby
+from typing import Any, Optional, Generator
+from dataclasses import dataclass, field, replace
 
 from .openresponses_types import (
     ItemStatus,
@@ -22,6 +24,19 @@ from .openresponses_types import (
 )
 
 
+# Limite de eventos pendentes antes de compactar deltas consecutivos
+DEFAULT_MAX_PENDING_EVENTS = 4096
+
+# Encoder pré-compilado: json.dumps(..., ensure_ascii=False) cria um
+# JSONEncoder novo a cada chamada, o que pesa no caminho por token.
+_json_encode = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def _sse_head(event_type: str) -> str:
+    """Prefixo SSE fixo de um tipo de delta, até o sequence_number."""
+    return f'event: {event_type}\ndata: {{"type": "{event_type}", "sequence_number": '
+
+
 # =============================================================================
 # BASE EVENT
 # =============================================================================
@@ -53,7 +68,7 @@ class StreamEvent:
         data: <json>
 
         """
-        data = json.dumps(self.to_dict(), ensure_ascii=False)
+        data = _json_encode(self.to_dict())
         return f"event: {self.type}\ndata: {data}\n\n"
 
 
@@ -203,6 +218,9 @@ class ContentPartAddedEvent(StreamEvent):
         }
 
 
+_TEXT_DELTA_HEAD = _sse_head("response.output_text.delta")
+
+
 @dataclass
 class OutputTextDeltaEvent(StreamEvent):
     """
@@ -230,6 +248,14 @@ class OutputTextDeltaEvent(StreamEvent):
             "delta": self.delta,
         }
 
+    def to_sse(self) -> str:
+        # Caminho rápido: mesmo SSE de StreamEvent.to_sse, sem montar dict
+        return (
+            f"{_TEXT_DELTA_HEAD}{self.sequence_number}, "
+            f'"item_id": {_json_encode(self.item_id)}, "output_index": {self.output_index}, '
+            f'"content_index": {self.content_index}, "delta": {_json_encode(self.delta)}}}\n\n'
+        )
+
 
 @dataclass
 class OutputTextDoneEvent(StreamEvent):
@@ -308,6 +334,9 @@ class OutputItemDoneEvent(StreamEvent):
         }
 
 
+_FUNCTION_ARGS_DELTA_HEAD = _sse_head("response.function_call_arguments.delta")
+
+
 @dataclass
 class FunctionCallArgumentsDeltaEvent(StreamEvent):
     """
@@ -332,6 +361,16 @@ class FunctionCallArgumentsDeltaEvent(StreamEvent):
             "delta": self.delta,
         }
 
+    def to_sse(self) -> str:
+        return (
+            f"{_FUNCTION_ARGS_DELTA_HEAD}{self.sequence_number}, "
+            f'"item_id": {_json_encode(self.item_id)}, "output_index": {self.output_index}, '
+            f'"delta": {_json_encode(self.delta)}}}\n\n'
+        )
+
+
+_REASONING_DELTA_HEAD = _sse_head("response.reasoning_content.delta")
+
 
 @dataclass
 class ReasoningContentDeltaEvent(StreamEvent):
@@ -359,6 +398,16 @@ class ReasoningContentDeltaEvent(StreamEvent):
             "delta": self.delta,
         }
 
+    def to_sse(self) -> str:
+        return (
+            f"{_REASONING_DELTA_HEAD}{self.sequence_number}, "
+            f'"item_id": {_json_encode(self.item_id)}, "output_index": {self.output_index}, '
+            f'"content_index": {self.content_index}, "delta": {_json_encode(self.delta)}}}\n\n'
+        )
+
+
+_SUMMARY_DELTA_HEAD = _sse_head("response.reasoning_summary.delta")
+
 
 @dataclass
 class ReasoningSummaryDeltaEvent(StreamEvent):
@@ -384,6 +433,13 @@ class ReasoningSummaryDeltaEvent(StreamEvent):
             "delta": self.delta,
         }
 
+    def to_sse(self) -> str:
+        return (
+            f"{_SUMMARY_DELTA_HEAD}{self.sequence_number}, "
+            f'"item_id": {_json_encode(self.item_id)}, "output_index": {self.output_index}, '
+            f'"delta": {_json_encode(self.delta)}}}\n\n'
+        )
+
 
 @dataclass
 class ReasoningContentDoneEvent(StreamEvent):
@@ -416,6 +472,32 @@ class ReasoningContentDoneEvent(StreamEvent):
 # STREAM BUILDER - API Fluente para gerar streams
 # =============================================================================
 
+# Deltas que podem ser fundidos (coalescing/compactação) sem mudar o texto final
+_DELTA_EVENTS = (
+    OutputTextDeltaEvent,
+    ReasoningContentDeltaEvent,
+    ReasoningSummaryDeltaEvent,
+    FunctionCallArgumentsDeltaEvent,
+)
+
+
+def _merge_key(event: StreamEvent) -> Any:
+    """Chave de fusão: deltas consecutivos do mesmo tipo e item se fundem."""
+    if isinstance(event, _DELTA_EVENTS):
+        return (type(event), event.item_id, event.output_index)
+    return None
+
+
+@dataclass
+class _PendingDelta:
+    """Delta acumulado aguardando a janela de coalescing."""
+
+    event_cls: type
+    item_id: str
+    output_index: int
+    parts: list[str] = field(default_factory=list)
+    size: int = 0
+
 
 class OpenResponsesStreamBuilder:
     """
@@ -428,33 +510,140 @@ class OpenResponsesStreamBuilder:
 
         for chunk in text_chunks:
             builder.text_delta(msg, chunk)
-            yield builder.get_last_event_sse()
+            yield from builder.drain()
 
         builder.complete()
-        yield from builder.get_pending_events_sse()
+        yield from builder.drain()
         yield builder.done()
+
+    Coalescing (opcional): com coalesce_ms e/ou coalesce_bytes, deltas de
+    texto/raciocínio do mesmo item são agrupados num único evento. O primeiro
+    delta após uma pausa maior que a janela sai na hora; os seguintes são
+    acumulados até a janela vencer, o buffer atingir coalesce_bytes (UTF-8)
+    ou outro evento ser emitido. A concatenação dos deltas não muda.
+
+    Como o builder é síncrono, a janela só é avaliada quando chega um novo
+    delta; quem precisa de flush por relógio chama flush().
+
+    Se mais de max_pending_events ficarem sem drain(), deltas consecutivos
+    do mesmo item são compactados (sequence numbers continuam crescentes).
     """
 
-    def __init__(self, model: str):
+    def __init__(
+        self,
+        model: str,
+        coalesce_ms: float = 0.0,
+        coalesce_bytes: int = 0,
+        max_pending_events: int = DEFAULT_MAX_PENDING_EVENTS,
+    ):
         self.response = OpenResponse(model=model, status=ItemStatus.IN_PROGRESS)
         self._sequence = 0
         self._events: list[StreamEvent] = []
+        # item.id -> posição em response.output (evita list.index por delta)
+        self._output_index: dict[str, int] = {}
+
+        self._coalesce_s = coalesce_ms / 1000.0
+        self._coalesce_bytes = coalesce_bytes
+        self._pending: Optional[_PendingDelta] = None
+        self._last_delta_at = float("-inf")
+
+        self._max_pending_events = max_pending_events
+        self._compact_at = max_pending_events
 
     def _next_seq(self) -> int:
         """Incrementa e retorna próximo sequence number."""
         self._sequence += 1
         return self._sequence
 
+    def _index_of(self, item: Any) -> int:
+        """Posição do item em response.output, em O(1) após o primeiro uso."""
+        output_index = self._output_index.get(item.id)
+        if output_index is None:
+            output_index = self.response.output.index(item)
+            self._output_index[item.id] = output_index
+        return output_index
+
+    def _append(self, event: StreamEvent) -> None:
+        """Enfileira evento, compactando deltas se o buffer passar do limite."""
+        self._events.append(event)
+        if len(self._events) > self._compact_at:
+            self._compact_events()
+
+    def _compact_events(self) -> None:
+        """Funde deltas consecutivos do mesmo item já enfileirados."""
+        compacted: list[StreamEvent] = []
+        for key, run in groupby(self._events, key=_merge_key):
+            run = list(run)
+            if key is None or len(run) == 1:
+                compacted.extend(run)
+                continue
+            compacted.append(replace(run[0], delta="".join(event.delta for event in run)))
+        self._events = compacted
+        # Sem deltas para fundir: espera o buffer dobrar antes de tentar de novo
+        self._compact_at = max(self._max_pending_events, 2 * len(compacted))
+
+    def _emit_delta(self, event_cls: type, item: Any, delta: str) -> None:
+        """Emite (ou acumula, com coalescing) um delta para o item."""
+        output_index = self._index_of(item)
+
+        if not (self._coalesce_s or self._coalesce_bytes):
+            self._append(
+                event_cls(
+                    sequence_number=self._next_seq(),
+                    item_id=item.id,
+                    output_index=output_index,
+                    content_index=0,
+                    delta=delta,
+                )
+            )
+            return
+
+        pending = self._pending
+        if pending is not None and (
+            pending.event_cls is not event_cls or pending.item_id != item.id
+        ):
+            self.flush()
+            pending = None
+        if pending is None:
+            pending = self._pending = _PendingDelta(event_cls, item.id, output_index)
+
+        pending.parts.append(delta)
+        pending.size += len(delta.encode("utf-8"))
+
+        now = time.monotonic()
+        if (self._coalesce_s and now - self._last_delta_at >= self._coalesce_s) or (
+            self._coalesce_bytes and pending.size >= self._coalesce_bytes
+        ):
+            self.flush()
+
+    def flush(self) -> "OpenResponsesStreamBuilder":
+        """Emite o delta acumulado pelo coalescing, se houver."""
+        pending = self._pending
+        if pending is None:
+            return self
+        self._pending = None
+        self._last_delta_at = time.monotonic()
+        self._append(
+            pending.event_cls(
+                sequence_number=self._next_seq(),
+                item_id=pending.item_id,
+                output_index=pending.output_index,
+                content_index=0,
+                delta="".join(pending.parts),
+            )
+        )
+        return self
+
     def start(self) -> "OpenResponsesStreamBuilder":
         """
         Emite eventos iniciais (created + in_progress).
 
         DEVE ser chamado primeiro.
         """
-        self._events.append(
+        self._append(
             ResponseCreatedEvent(sequence_number=self._next_seq(), response=self.response.to_dict())
         )
-        self._events.append(
+        self._append(
             ResponseInProgressEvent(
                 sequence_number=self._next_seq(),
                 response={"id": self.response.id, "status": "in_progress"},
@@ -468,17 +657,19 @@ class OpenResponsesStreamBuilder:
 
         Retorna o item para uso posterior.
         """
+        self.flush()
         item = self.response.add_message()
         output_index = len(self.response.output) - 1
+        self._output_index[item.id] = output_index
 
-        self._events.append(
+        self._append(
             OutputItemAddedEvent(
                 sequence_number=self._next_seq(), output_index=output_index, item=item.to_dict()
             )
         )
 
         # Adiciona content_part.added para o texto
-        self._events.append(
+        self._append(
             ContentPartAddedEvent(
                 sequence_number=self._next_seq(),
                 item_id=item.id,
@@ -499,17 +690,7 @@ class OpenResponsesStreamBuilder:
             delta: Chunk de texto a adicionar
         """
         item.append_text(delta)
-        output_index = self.response.output.index(item)
-
-        self._events.append(
-            OutputTextDeltaEvent(
-                sequence_number=self._next_seq(),
-                item_id=item.id,
-                output_index=output_index,
-                content_index=0,
-                delta=delta,
-            )
-        )
+        self._emit_delta(OutputTextDeltaEvent, item, delta)
         return self
 
     def add_reasoning(self) -> ReasoningItem:
@@ -518,11 +699,13 @@ class OpenResponsesStreamBuilder:
 
         Retorna o item para uso posterior.
         """
+        self.flush()
         item = ReasoningItem(status=ItemStatus.IN_PROGRESS)
         self.response.output.append(item)
         output_index = len(self.response.output) - 1
+        self._output_index[item.id] = output_index
 
-        self._events.append(
+        self._append(
             OutputItemAddedEvent(
                 sequence_number=self._next_seq(), output_index=output_index, item=item.to_dict()
             )
@@ -535,17 +718,7 @@ class OpenResponsesStreamBuilder:
         Emite delta de raciocínio para um item.
         """
         item.append_content(delta)
-        output_index = self.response.output.index(item)
-
-        self._events.append(
-            ReasoningContentDeltaEvent(
-                sequence_number=self._next_seq(),
-                item_id=item.id,
-                output_index=output_index,
-                content_index=0,
-                delta=delta,
-            )
-        )
+        self._emit_delta(ReasoningContentDeltaEvent, item, delta)
         return self
 
     def complete(self, usage: Optional[TokenUsage] = None) -> "OpenResponsesStreamBuilder":
@@ -554,11 +727,12 @@ class OpenResponsesStreamBuilder:
 
         Emite eventos de finalização para todos os items.
         """
+        self.flush()
         # Finaliza cada item
         for idx, item in enumerate(self.response.output):
             if isinstance(item, MessageItem):
                 # output_text.done
-                self._events.append(
+                self._append(
                     OutputTextDoneEvent(
                         sequence_number=self._next_seq(),
                         item_id=item.id,
@@ -569,7 +743,7 @@ class OpenResponsesStreamBuilder:
                 )
                 # content_part.done
                 if item.content:
-                    self._events.append(
+                    self._append(
                         ContentPartDoneEvent(
                             sequence_number=self._next_seq(),
                             item_id=item.id,
@@ -581,7 +755,7 @@ class OpenResponsesStreamBuilder:
 
             # output_item.done
             item.status = ItemStatus.COMPLETED
-            self._events.append(
+            self._append(
                 OutputItemDoneEvent(
                     sequence_number=self._next_seq(), output_index=idx, item=item.to_dict()
                 )
@@ -589,7 +763,7 @@ class OpenResponsesStreamBuilder:
 
         # Finaliza response
         self.response.complete(usage)
-        self._events.append(
+        self._append(
             ResponseCompletedEvent(
                 sequence_number=self._next_seq(), response=self.response.to_dict()
             )
@@ -601,8 +775,9 @@ class OpenResponsesStreamBuilder:
         """
         Finaliza response com erro.
         """
+        self.flush()
         self.response.fail(error)
-        self._events.append(
+        self._append(
             ResponseFailedEvent(
                 sequence_number=self._next_seq(),
                 response=self.response.to_dict(),
@@ -632,6 +807,21 @@ class OpenResponsesStreamBuilder:
     def clear_events(self) -> None:
         """Limpa lista de eventos."""
         self._events.clear()
+        self._compact_at = self._max_pending_events
+
+    def drain(self, as_events: bool = False) -> list[StreamEvent] | list[str]:
+        """
+        Retorna e limpa os eventos pendentes.
+
+        Com as_events=True devolve os próprios StreamEvent, para consumidores
+        no mesmo processo (ex: TUI) que não precisam de SSE. Caso contrário,
+        devolve os eventos já codificados em SSE para a rede.
+        """
+        events, self._events = self._events, []
+        self._compact_at = self._max_pending_events
+        if as_events:
+            return events
+        return [event.to_sse() for event in events]
 
     @staticmethod
     def done() -> str:
@@ -650,6 +840,7 @@ class OpenResponsesStreamBuilder:
 __all__ = [
     # Base
     "StreamEvent",
+    "DEFAULT_MAX_PENDING_EVENTS",
     # State Machine Events
     "ResponseCreatedEvent",
     "ResponseInProgressEvent",
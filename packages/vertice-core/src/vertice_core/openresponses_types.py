@@ -290,10 +290,23 @@ class OutputTextContent:
     text: str = ""
     annotations: List[Annotation] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        # Streaming acrescenta milhares de deltas por item, e "text += delta"
+        # recopiaria o texto inteiro a cada um: append_text() guarda os deltas
+        # aqui e get_text() os junta em text.
+        self._pending: List[str] = []
+
+    def get_text(self) -> str:
+        """Texto completo, incluindo os deltas ainda não juntados."""
+        if self._pending:
+            self.text += "".join(self._pending)
+            self._pending.clear()
+        return self.text
+
     def to_dict(self) -> dict:
         return {
             "type": self.type,
-            "text": self.text,
+            "text": self.get_text(),
             "annotations": [a.to_dict() for a in self.annotations] if self.annotations else [],
         }
 
@@ -306,10 +319,15 @@ class OutputTextContent:
                 url=url,
                 title=title,
                 start_index=start,
-                end_index=end or len(self.text),
+                end_index=end or len(self.get_text()),
             )
         )
 
+    def append_text(self, delta: str) -> None:
+        """Acrescenta texto em O(1); a junção fica para o próximo get_text()."""
+        if delta:
+            self._pending.append(delta)
+
 
 @dataclass
 class InputTextContent:
@@ -370,13 +388,17 @@ class MessageItem:
 
     def get_text(self) -> str:
         """Retorna todo o texto concatenado."""
-        return "".join(c.text for c in self.content if hasattr(c, "text"))
+        return "".join(
+            c.get_text() if isinstance(c, OutputTextContent) else c.text
+            for c in self.content
+            if hasattr(c, "text")
+        )
 
     def append_text(self, delta: str) -> None:
         """Adiciona texto ao content."""
         if not self.content:
             self.content.append(OutputTextContent())
-        self.content[-1].text += delta
+        self.content[-1].append_text(delta)
 
     def add_citation(
         self,
@@ -595,7 +617,7 @@ class ReasoningItem:
 
     def get_reasoning_text(self) -> str:
         """Retorna todo o texto de raciocínio concatenado."""
-        return "".join(c.text for c in self.content if isinstance(c, OutputTextContent))
+        return "".join(c.get_text() for c in self.content if isinstance(c, OutputTextContent))
 
     def get_summary_text(self) -> str:
         """Retorna todo o texto do resumo concatenado."""
@@ -604,7 +626,7 @@ class ReasoningItem:
     def append_content(self, text: str) -> None:
         """Adiciona texto ao content."""
         if self.content:
-            self.content[0].text += text
+            self.content[0].append_text(text)
         else:
             self.content.append(OutputTextContent(text=text))
 
@@ -196,8 +196,9 @@ class LLMClientWithOpenResponsesProtocol(LLMClientWithChatProtocol, Protocol):
         self,
         messages: List[Dict[str, str]],
         system_prompt: Optional[str] = None,
+        as_events: bool = False,
         **kwargs: Any,
-    ) -> AsyncIterator[str]:
+    ) -> AsyncIterator[Any]:
         """
         Stream using Open Responses protocol.
 
@@ -206,6 +207,9 @@ class LLMClientWithOpenResponsesProtocol(LLMClientWithChatProtocol, Protocol):
         - event: response.output_text.delta
         - event: response.completed
         - data: [DONE]
+
+        With as_events=True, yields the StreamEvent objects themselves and
+        omits [DONE] (in-process consumers; SSE stays at network boundaries).
         """
         ...
 
@@ -15,6 +15,8 @@ from typing import Dict, List, Optional, AsyncGenerator
 import logging
 import httpx
 
+from vertice_core.async_utils.http_clients import get_http_clients
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,9 +68,8 @@ class AzureOpenAIProvider:
     async def _ensure_client(self) -> httpx.AsyncClient:
         """Ensure HTTP client is initialized."""
         if self._client is None:
-            self._client = httpx.AsyncClient(
+            self._client = get_http_clients().httpx_client(
                 timeout=httpx.Timeout(120.0, connect=10.0),
-                limits=httpx.Limits(max_connections=10),
             )
         return self._client
 
@@ -17,6 +17,7 @@ from typing import Any, AsyncIterator, Dict, List, Optional
 
 import aiohttp
 
+from vertice_core.async_utils.http_clients import get_http_clients
 from vertice_core.core.types import ModelInfo
 from vertice_core.types.jules_types import (
     JulesActivity,
@@ -168,9 +169,9 @@ class JulesClient:
         return bool(self.config.api_key) and not self._circuit_open
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session."""
+        """Get or create HTTP session on the shared connection pool."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
+            self._session = get_http_clients().aiohttp_session(
                 headers={
                     "x-goog-api-key": self.config.api_key,
                     "Content-Type": "application/json",
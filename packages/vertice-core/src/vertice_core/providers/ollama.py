@@ -5,6 +5,8 @@ import logging
 from typing import Dict, List, Optional, AsyncGenerator
 import aiohttp
 
+from vertice_core.async_utils.http_clients import get_http_clients
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,9 +26,9 @@ class OllamaProvider:
         logger.info(f"Ollama provider initialized: {self.base_url} / {self.model_name}")
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
+        """Get or create aiohttp session on the shared connection pool."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            self._session = get_http_clients().aiohttp_session()
         return self._session
 
     async def is_available(self) -> bool:
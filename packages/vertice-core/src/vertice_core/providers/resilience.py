@@ -2,7 +2,7 @@
 MAXIMUS Provider Resilience Patterns.
 
 This module provides Maximus-specific resilience helpers built on top of core.resilience:
-- HTTPX async client with HTTP/2 and connection pooling
+- HTTPX async client on the shared connection pool (HTTP/2 when h2 is installed)
 - Tenacity retry decorators
 - Combined circuit breaker + retry utilities
 
@@ -19,6 +19,7 @@ Follows CODE_CONSTITUTION: <500 lines, 100% type hints
 
 from __future__ import annotations
 
+import warnings
 from dataclasses import dataclass
 from functools import wraps
 from typing import Any, Awaitable, Callable, Optional, TypeVar
@@ -31,6 +32,8 @@ from tenacity import (
     wait_exponential_jitter,
 )
 
+from vertice_core.async_utils.http_clients import get_http_clients
+
 # Re-export base classes from vertice_core.resilience for convenience
 from vertice_core.resilience import (
     CircuitBreaker,
@@ -122,31 +125,29 @@ def create_http_client(
     """Create HTTPX client with production settings.
 
     Features:
-    - HTTP/2 enabled
-    - Connection pooling
+    - Shared process-wide connection pool (see async_utils.http_clients)
+    - HTTP/2 when the h2 package is installed
     - Configurable timeout
 
     Args:
         base_url: Base URL for requests.
         timeout: Request timeout in seconds.
-        pool_config: Connection pool configuration.
+        pool_config: Deprecated and ignored; connection limits are set on
+            the shared pool (HttpPoolConfig).
 
     Returns:
         Configured HTTPX async client.
     """
-    cfg = pool_config or ConnectionPoolConfig()
-
-    limits = httpx.Limits(
-        max_connections=cfg.max_connections,
-        max_keepalive_connections=cfg.max_keepalive,
-        keepalive_expiry=cfg.keepalive_expiry,
-    )
-
-    return httpx.AsyncClient(
+    if pool_config is not None:
+        warnings.warn(
+            "create_http_client(pool_config=...) is ignored; configure limits on the "
+            "shared pool with HttpPoolConfig instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+    return get_http_clients().httpx_client(
         base_url=base_url,
         timeout=httpx.Timeout(timeout, connect=10.0),
-        limits=limits,
-        http2=True,
     )
 
 
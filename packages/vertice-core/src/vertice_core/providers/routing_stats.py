@@ -0,0 +1,151 @@
+"""
+Live Provider Statistics - Inputs for adaptive routing in VerticeRouter.
+
+Per provider, tracks exponentially weighted moving averages (EWMA) of
+time-to-first-token, streaming throughput, error rate and rate-limit rate,
+a bounded window of recent TTFT samples for percentile-derived hedge delays,
+and a consecutive-failure circuit breaker that lets a single probe through
+once its cooldown is over.
+
+The expected cost of a request is its expected latency divided by its
+probability of success, so a fast provider that fails half the time ranks
+like one twice as slow.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Optional
+
+
+@dataclass
+class AdaptiveRoutingConfig:
+    """Tuning knobs for adaptive routing and hedged requests."""
+
+    enabled: bool = True
+    ewma_alpha: float = 0.3  # Weight of the newest sample
+    min_samples: int = 3  # Samples before a provider's latency is trusted
+    expected_tokens: int = 256  # Response size used to weigh TTFT against throughput
+    failure_threshold: int = 3  # Consecutive failures that open the circuit
+    recovery_timeout: float = 30.0  # Seconds an open circuit rejects requests
+    latency_window: int = 100  # Recent TTFT samples kept for percentiles
+    hedge: bool = False  # Start a second provider when the first is slow
+    hedge_quantile: float = 0.95
+    hedge_min_delay: float = 0.05
+    hedge_default_delay: float = 2.0  # Used until the primary has enough samples
+
+
+@dataclass
+class ProviderStats:
+    """Rolling performance and health statistics for one provider."""
+
+    config: AdaptiveRoutingConfig = field(default_factory=AdaptiveRoutingConfig)
+    ttft: Optional[float] = None  # EWMA seconds to first token
+    tokens_per_sec: Optional[float] = None  # EWMA streaming throughput
+    error_rate: float = 0.0  # EWMA over outcomes (1 = failed, other than rate limits)
+    rate_limit_rate: float = 0.0  # EWMA over outcomes (1 = rate limited)
+    samples: int = 0
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    open_until: float = 0.0
+    probing: bool = False  # Half-open probe in flight
+    recent_ttft: Deque[float] = field(default_factory=deque)
+
+    def __post_init__(self) -> None:
+        self.recent_ttft = deque(self.recent_ttft, maxlen=self.config.latency_window)
+
+    def _ewma(self, current: Optional[float], sample: float) -> float:
+        if current is None:
+            return sample
+        return current + self.config.ewma_alpha * (sample - current)
+
+    def record_success(
+        self, ttft: float, tokens: int = 0, duration: Optional[float] = None
+    ) -> None:
+        """Record a completed request.
+
+        Args:
+            ttft: Seconds until the first token (whole response for non-streaming)
+            tokens: Approximate tokens produced
+            duration: Seconds from first token to completion
+        """
+        self.samples += 1
+        self.successes += 1
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.probing = False
+        self.ttft = self._ewma(self.ttft, ttft)
+        self.recent_ttft.append(ttft)
+        if tokens and duration and duration > 0:
+            self.tokens_per_sec = self._ewma(self.tokens_per_sec, tokens / duration)
+        self.error_rate = self._ewma(self.error_rate, 0.0)
+        self.rate_limit_rate = self._ewma(self.rate_limit_rate, 0.0)
+
+    def record_failure(self, rate_limited: bool = False) -> None:
+        """Record a failed request; enough in a row (or a failed probe) open the circuit."""
+        self.probing = False
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.error_rate = self._ewma(self.error_rate, 0.0 if rate_limited else 1.0)
+        self.rate_limit_rate = self._ewma(self.rate_limit_rate, 1.0 if rate_limited else 0.0)
+        if self.consecutive_failures >= self.config.failure_threshold:
+            self.open_until = time.monotonic() + self.config.recovery_timeout
+
+    @property
+    def circuit_state(self) -> str:
+        """``closed``, ``open`` or ``half_open`` (cooldown over, next call is a probe)."""
+        if not self.open_until:
+            return "closed"
+        return "open" if time.monotonic() < self.open_until else "half_open"
+
+    def allows_request(self) -> bool:
+        """Whether admit() would let a request through now."""
+        state = self.circuit_state
+        return state == "closed" or (state == "half_open" and not self.probing)
+
+    def admit(self) -> bool:
+        """Admit a request; when half-open, only one probe at a time.
+
+        The probe's recorded outcome closes or re-opens the circuit; a probe
+        abandoned without one must be handed back with release_probe().
+        """
+        if not self.allows_request():
+            return False
+        if self.circuit_state == "half_open":
+            self.probing = True
+        return True
+
+    def release_probe(self) -> None:
+        """Hand back a probe that ended without a success or failure."""
+        self.probing = False
+
+    def latency_percentile(self, quantile: float) -> Optional[float]:
+        """TTFT percentile over the recent window (None without samples)."""
+        if not self.recent_ttft:
+            return None
+        ordered = sorted(self.recent_ttft)
+        return ordered[min(len(ordered) - 1, int(quantile * len(ordered)))]
+
+    def expected_cost(self) -> Optional[float]:
+        """Expected seconds per successful request (None until enough samples)."""
+        if self.ttft is None or self.samples < self.config.min_samples:
+            return None
+        latency = self.ttft
+        if self.tokens_per_sec:
+            latency += self.config.expected_tokens / self.tokens_per_sec
+        success = max(1.0 - self.error_rate - self.rate_limit_rate, 0.05)
+        return latency / success
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "ttft": self.ttft,
+            "tokens_per_sec": self.tokens_per_sec,
+            "error_rate": round(self.error_rate, 4),
+            "rate_limit_rate": round(self.rate_limit_rate, 4),
+            "samples": self.samples,
+            "failures": self.failures,
+            "circuit": self.circuit_state,
+        }
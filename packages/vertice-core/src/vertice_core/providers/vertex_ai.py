@@ -13,7 +13,8 @@ from __future__ import annotations
 
 import os
 import asyncio
-from typing import Any, Dict, List, Optional, AsyncGenerator
+import importlib.util
+from typing import Any, Dict, List, Optional, AsyncGenerator, Union
 import logging
 
 from vertice_core.openresponses_types import (
@@ -22,20 +23,23 @@ from vertice_core.openresponses_types import (
     ErrorType,
     JsonSchemaResponseFormat,
 )
-from vertice_core.openresponses_stream import OpenResponsesStreamBuilder
+from vertice_core.openresponses_stream import OpenResponsesStreamBuilder, StreamEvent
 
 # Configure Logging
 logger = logging.getLogger(__name__)
 
-# --- Google Gen AI SDK (Vertex AI) ---
-HAS_GENAI_SDK = False
-try:
-    from google import genai
-    from google.genai import types
 
-    HAS_GENAI_SDK = True
-except ImportError:
-    pass
+def _find_genai_sdk() -> bool:
+    try:
+        return importlib.util.find_spec("google.genai") is not None
+    except ImportError:
+        return False
+
+
+# --- Google Gen AI SDK (Vertex AI) ---
+# The SDK is imported when the first client is created rather than at module
+# import: it costs hundreds of milliseconds and most sessions never reach it.
+HAS_GENAI_SDK = _find_genai_sdk()
 
 
 class VertexAIProvider:
@@ -93,6 +97,8 @@ class VertexAIProvider:
         if not HAS_GENAI_SDK:
             raise RuntimeError("google-genai SDK not installed (required for Vertex AI Gemini 3).")
         try:
+            from google import genai
+
             self._genai_client = genai.Client(
                 vertexai=True,
                 project=self.project,
@@ -143,6 +149,8 @@ class VertexAIProvider:
     async def _stream_v3(self, messages, system_prompt, max_tokens, temperature, tools, **kwargs):
         """Native SDK v3 Implementation."""
         try:
+            from google.genai import types
+
             include_thoughts = bool(kwargs.pop("include_thoughts", False)) or (
                 os.getenv("VERTICE_VERTEX_INCLUDE_THOUGHTS", "0").strip().lower()
                 in {"1", "true", "yes", "on"}
@@ -245,15 +253,20 @@ class VertexAIProvider:
         system_prompt: Optional[str] = None,
         max_tokens: int = 8192,
         temperature: float = 0.7,
+        as_events: bool = False,
         **kwargs,
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[Union[str, StreamEvent], None]:
         """
         Stream usando protocolo Open Responses.
 
         Emite eventos SSE seguindo a especificação Open Responses.
 
+        Args:
+            as_events: Emite objetos StreamEvent em vez de SSE (sem [DONE]),
+                para consumidores no mesmo processo
+
         Yields:
-            str: Eventos SSE formatados
+            str: Eventos SSE formatados (ou StreamEvent com as_events=True)
 
         Exemplo de uso:
             async for event in provider.stream_open_responses(messages):
@@ -265,15 +278,13 @@ class VertexAIProvider:
         try:
             # Emite eventos iniciais
             builder.start()
-            for event in builder.get_events():
-                yield event.to_sse()
-            builder.clear_events()
+            for event in builder.drain(as_events):
+                yield event
 
             # Cria MessageItem
             message_item = builder.add_message()
-            for event in builder.get_events():
-                yield event.to_sse()
-            builder.clear_events()
+            for event in builder.drain(as_events):
+                yield event
 
             # Stream do conteúdo
             token_count = 0
@@ -286,8 +297,8 @@ class VertexAIProvider:
             ):
                 token_count += len(chunk.split())  # Estimativa simples
                 builder.text_delta(message_item, chunk)
-                yield builder.get_last_event_sse()
-                builder.clear_events()
+                for event in builder.drain(as_events):
+                    yield event
 
             # Finaliza com sucesso
             usage = TokenUsage(
@@ -298,11 +309,12 @@ class VertexAIProvider:
             usage.total_tokens = usage.input_tokens + usage.output_tokens
 
             builder.complete(usage)
-            for event in builder.get_events():
-                yield event.to_sse()
+            for event in builder.drain(as_events):
+                yield event
 
             # Evento terminal
-            yield builder.done()
+            if not as_events:
+                yield builder.done()
 
         except Exception as e:
             # Emite erro
@@ -310,9 +322,10 @@ class VertexAIProvider:
                 type=ErrorType.MODEL_ERROR, code="generation_failed", message=str(e)
             )
             builder.fail(error)
-            for event in builder.get_events():
-                yield event.to_sse()
-            yield builder.done()
+            for event in builder.drain(as_events):
+                yield event
+            if not as_events:
+                yield builder.done()
 
     async def stream_chat_structured(
         self,
@@ -7,23 +7,44 @@ Routes requests to the optimal LLM provider based on:
 - Speed requirements
 - Provider availability
 - Rate limit status
+- Live latency, throughput and error statistics (adaptive routing)
 """
 
 from __future__ import annotations
 
 import asyncio
-from typing import Dict, List, Optional, AsyncGenerator, Protocol, Any
+import time
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    TypeVar,
+    Union,
+)
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timedelta
 import logging
 
 from vertice_core.core.types import ModelInfo
-from vertice_core.openresponses_stream import OpenResponsesStreamBuilder
+from vertice_core.openresponses_stream import OpenResponsesStreamBuilder, StreamEvent
 from vertice_core.openresponses_types import OpenResponsesError, ErrorType
 
+from .routing_stats import AdaptiveRoutingConfig, ProviderStats
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Errors that move generate() on to the next provider in the chain
+_FALLBACK_ERRORS = (RuntimeError, ValueError, ConnectionError, asyncio.TimeoutError)
+
 
 class TaskComplexity(str, Enum):
     """Task complexity levels for routing decisions."""
@@ -56,10 +77,11 @@ class ProviderStatus:
     daily_limit: int = 10000
     is_rate_limited: bool = False
     rate_limit_until: Optional[datetime] = None
+    stats: ProviderStats = field(default_factory=ProviderStats)
 
     def can_use(self) -> bool:
         """Check if provider can be used."""
-        if not self.available:
+        if not self.available or not self.stats.allows_request():
             return False
         if self.is_rate_limited:
             if self.rate_limit_until and datetime.now() > self.rate_limit_until:
@@ -76,12 +98,19 @@ class ProviderStatus:
         self.tokens_today += tokens
         self.last_request = datetime.now()
 
+    def record_success(self, ttft: float, tokens: int = 0, duration: Optional[float] = None):
+        """Record a completed request and its latency."""
+        self.record_request(tokens)
+        self.stats.record_success(ttft, tokens, duration)
+
     def record_error(self, error: str):
         """Record an error."""
         self.last_error = error
-        if "429" in error or "rate limit" in error.lower():
+        rate_limited = "429" in error or "rate limit" in error.lower()
+        if rate_limited:
             self.is_rate_limited = True
             self.rate_limit_until = datetime.now() + timedelta(minutes=5)
+        self.stats.record_failure(rate_limited)
 
 
 @dataclass
@@ -124,6 +153,8 @@ class VerticeRouter:
     2. SPEED AWARE: Route to fastest available for urgent tasks
     3. COMPLEXITY AWARE: Use premium providers for complex tasks
     4. FALLBACK CHAIN: Automatic failover on errors
+    5. ADAPTIVE: Within the cost tier, prefer the provider that is currently
+       fastest and healthiest; optionally hedge slow requests on a second one
     """
 
     # Provider priorities (lower = higher priority)
@@ -161,6 +192,18 @@ class VerticeRouter:
         TaskComplexity.CRITICAL: ["vertex-ai", "azure-openai"],  # High-assurance fallback
     }
 
+    # Cost tiers: adaptive routing only reorders providers within one tier
+    PROVIDER_COST_TIER = {
+        "vertex-ai": "enterprise",
+        "anthropic-vertex": "enterprise",
+        "azure-openai": "enterprise",
+        "groq": "free",
+        "cerebras": "free",
+        "mistral": "free",
+        "openrouter": "free",
+        "gemini": "free",
+    }
+
     # Speed requirement to provider mapping (Vertex AI is the speed standard)
     SPEED_ROUTING = {
         SpeedRequirement.INSTANT: ["vertex-ai", "groq"],
@@ -169,17 +212,34 @@ class VerticeRouter:
         SpeedRequirement.RELAXED: ["vertex-ai", "azure-openai"],
     }
 
-    def __init__(self, enterprise_mode: bool = True):
+    def __init__(
+        self,
+        enterprise_mode: bool = True,
+        routing: Optional[AdaptiveRoutingConfig] = None,
+        cost_tier: Optional[str] = None,
+        providers: Optional[Dict[str, LLMProvider]] = None,
+    ):
         """Initialize the router.
 
         Args:
             enterprise_mode: If True, prioritize Vertex AI (for users with GCloud credits).
                            If False, prioritize free tier providers.
+            routing: Adaptive routing and hedging settings
+            cost_tier: Tier adaptive routing stays within (default: tier of the
+                       highest-priority candidate)
+            providers: Use these providers instead of discovering the configured ones
         """
         self._providers: Dict[str, LLMProvider] = {}
         self._status: Dict[str, ProviderStatus] = {}
         self._initialized = False
         self._enterprise_mode = enterprise_mode
+        self.routing = routing or AdaptiveRoutingConfig()
+        self.cost_tier = cost_tier
+
+        if providers is not None:
+            for name, provider in providers.items():
+                self.add_provider(name, provider)
+            self._initialized = True
 
         # Set priority based on mode
         if enterprise_mode:
@@ -187,6 +247,17 @@ class VerticeRouter:
         else:
             self.PROVIDER_PRIORITY = self.PROVIDER_PRIORITY_FREE
 
+    def add_provider(self, name: str, provider: LLMProvider) -> None:
+        """Register a provider instance and start tracking its status."""
+        info = provider.get_model_info()
+        self._providers[name] = provider
+        self._status[name] = ProviderStatus(
+            name=name,
+            available=True,
+            daily_limit=info.get("requests_per_day", 10000),
+            stats=ProviderStats(self.routing),
+        )
+
     def _lazy_init(self):
         """Lazy initialize providers."""
         if self._initialized:
@@ -226,14 +297,7 @@ class VerticeRouter:
                 provider = cls(**kwargs)
                 # Only initialize providers that are actually available
                 if provider.is_available():
-                    self._providers[name] = provider
-                    info = provider.get_model_info()
-                    daily_limit = info.get("requests_per_day", 10000)
-                    self._status[name] = ProviderStatus(
-                        name=name,
-                        available=True,
-                        daily_limit=daily_limit,
-                    )
+                    self.add_provider(name, provider)
                     logger.debug("Provider '%s' initialized successfully.", name)
                 else:
                     logger.warning("Provider '%s' not available (missing API key or config).", name)
@@ -327,10 +391,10 @@ Respond with ONLY the JSON object."""
                 analysis = json.loads(json_match.group())
                 return analysis
             else:
-                print(f"Failed to parse Claude analysis: {response}")
+                logger.warning("Failed to parse Claude analysis: %s", response)
 
         except Exception as e:
-            print(f"Claude analysis failed: {e}")
+            logger.warning("Claude analysis failed: %s", e)
 
         # Fallback
         return {
@@ -413,6 +477,18 @@ Respond with ONLY the JSON object."""
         if prefer_free:
             available_candidates.sort(key=lambda p: self.PROVIDER_PRIORITY.get(p, 99))
 
+        reasoning = f"for {complexity.value} task with {speed.value} speed requirement"
+        if self.routing.enabled:
+            static_choice = available_candidates[0]
+            available_candidates = self._rank_adaptive(available_candidates)
+            if available_candidates[0] != static_choice:
+                cost = self._status[available_candidates[0]].stats.expected_cost()
+                reasoning += (
+                    f" (adaptive: over '{static_choice}', expected {cost:.2f}s per request)"
+                    if cost is not None
+                    else f" (adaptive: '{static_choice}' unhealthy)"
+                )
+
         # Select best provider
         selected = available_candidates[0]
         fallbacks = available_candidates[1:3] if len(available_candidates) > 1 else []
@@ -428,7 +504,7 @@ Respond with ONLY the JSON object."""
         decision = RoutingDecision(
             provider_name=selected,
             model_name=model_name,
-            reasoning=f"Selected '{selected}' for {complexity.value} task with {speed.value} speed requirement",
+            reasoning=f"Selected '{selected}' {reasoning}",
             fallback_providers=fallbacks,
             estimated_cost=0.0 if selected in ["groq", "cerebras", "mistral"] else 0.01,
             estimated_speed="ultra_fast" if selected in ["groq", "cerebras"] else "fast",
@@ -441,6 +517,38 @@ Respond with ONLY the JSON object."""
         )
         return decision
 
+    def _cost_tier(self, name: str) -> str:
+        return self.PROVIDER_COST_TIER.get(name, "default")
+
+    def _rank_adaptive(self, candidates: List[str]) -> List[str]:
+        """Order candidates by live statistics within the configured cost tier.
+
+        Providers in the tier come first, healthy (closed circuit) before
+        half-open ones, then measured providers by expected cost per request.
+        Providers without enough samples keep their priority order after the
+        measured ones, so a cold router routes exactly like the static table.
+        """
+        tier = self.cost_tier or self._cost_tier(candidates[0])
+
+        def key(item):
+            index, name = item
+            stats = self._status[name].stats
+            cost = stats.expected_cost()
+            return (
+                self._cost_tier(name) != tier,
+                stats.circuit_state != "closed",
+                cost is None,
+                cost or 0.0,
+                index,
+            )
+
+        return [name for _, name in sorted(enumerate(candidates), key=key)]
+
+    def get_routing_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Live per-provider statistics used by adaptive routing."""
+        self._lazy_init()
+        return {name: status.stats.to_dict() for name, status in self._status.items()}
+
     def get_provider(self, name: str) -> Optional[LLMProvider]:
         """Get a specific provider instance."""
         self._lazy_init()
@@ -456,6 +564,10 @@ Respond with ONLY the JSON object."""
         """
         Generate completion with automatic routing and fallback.
 
+        With hedging enabled, each provider in the chain is paired with the
+        next one, which starts if the first has not answered within its p95
+        latency; the first answer wins and the other request is cancelled.
+
         Args:
             messages: Conversation messages
             complexity: Task complexity
@@ -466,42 +578,98 @@ Respond with ONLY the JSON object."""
             Generated text
         """
         decision = self.route(complexity=complexity, speed=speed)
+        chain = [decision.provider_name, *decision.fallback_providers]
 
-        # Try primary provider
-        provider = self._providers[decision.provider_name]
-        status = self._status[decision.provider_name]
+        def attempt(name: str) -> Awaitable[str]:
+            return self._generate_with(name, messages, **kwargs)
 
+        last_error: Optional[BaseException] = None
+        index = 0
+        while index < len(chain):
+            name = chain[index]
+            hedged = self.routing.hedge and index + 1 < len(chain)
+            try:
+                logger.info("Attempting to generate with provider: %s", name)
+                if hedged:
+                    return await self._hedge(name, chain[index + 1], attempt)
+                return await attempt(name)
+            except _FALLBACK_ERRORS as e:
+                last_error = e
+                logger.warning(
+                    "Provider '%s' failed with error: %s. Attempting fallbacks.",
+                    name,
+                    e,
+                    exc_info=True,
+                )
+            index += 2 if hedged else 1
+
+        logger.error("All available providers failed for the generation task.")
+        raise RuntimeError(f"All providers failed. Last error: {last_error}")
+
+    def _admit(self, name: str) -> bool:
+        """Admit a request to a provider; returns whether it is the half-open probe."""
+        stats = self._status[name].stats
+        probe = stats.circuit_state == "half_open"
+        if not stats.admit():
+            raise RuntimeError(f"Provider '{name}' circuit is open")
+        return probe
+
+    async def _generate_with(self, name: str, messages: List[Dict[str, str]], **kwargs) -> str:
+        """Call one provider, feeding its latency or failure into the stats."""
+        status = self._status[name]
+        probe = self._admit(name)
+        start = time.monotonic()
         try:
-            logger.info("Attempting to generate with primary provider: %s", decision.provider_name)
-            result = await provider.generate(messages, **kwargs)
-            status.record_request()
-            return result
-        except (RuntimeError, ValueError, ConnectionError, asyncio.TimeoutError) as e:
+            result = await self._providers[name].generate(messages, **kwargs)
+        except Exception as e:
             status.record_error(str(e))
-            logger.warning(
-                "Primary provider '%s' failed with error: %s. Attempting fallbacks.",
-                decision.provider_name,
-                e,
-                exc_info=True,
-            )
-
-            # Try fallbacks
-            for fallback_name in decision.fallback_providers:
-                try:
-                    logger.info("Attempting fallback generation with: %s", fallback_name)
-                    fallback = self._providers[fallback_name]
-                    result = await fallback.generate(messages, **kwargs)
-                    self._status[fallback_name].record_request()
-                    return result
-                except (RuntimeError, ValueError, ConnectionError, asyncio.TimeoutError) as fe:
-                    self._status[fallback_name].record_error(str(fe))
-                    logger.warning(
-                        "Fallback provider '%s' also failed.", fallback_name, exc_info=True
-                    )
-                    continue
-
-            logger.error("All available providers failed for the generation task.")
-            raise RuntimeError(f"All providers failed. Last error: {e}")
+            raise
+        except BaseException:
+            if probe:  # Cancelled (e.g. lost a hedge): no verdict on the provider
+                status.stats.release_probe()
+            raise
+        status.record_success(time.monotonic() - start, tokens=len(result) // 4)
+        return result
+
+    def _hedge_delay(self, name: str) -> float:
+        """Delay before hedging: the provider's recent p95 time to first token."""
+        stats = self._status[name].stats
+        delay = None
+        if stats.samples >= self.routing.min_samples:
+            delay = stats.latency_percentile(self.routing.hedge_quantile)
+        if delay is None:
+            delay = self.routing.hedge_default_delay
+        return max(delay, self.routing.hedge_min_delay)
+
+    async def _hedge(self, primary: str, backup: str, attempt: Callable[[str], Awaitable[T]]) -> T:
+        """Run ``attempt`` on primary, adding backup if primary is slow or fails.
+
+        Returns the first successful result and cancels the other request;
+        raises the last error if both fail.
+        """
+        first = asyncio.ensure_future(attempt(primary))
+        done, _ = await asyncio.wait({first}, timeout=self._hedge_delay(primary))
+        if done and first.exception() is None:
+            return first.result()
+
+        logger.debug("Hedging '%s' with '%s'", primary, backup)
+        pending = {asyncio.ensure_future(attempt(backup))}
+        if not done:
+            pending.add(first)
+        error = first.exception() if done else None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
 
     async def stream_chat(
         self,
@@ -511,10 +679,13 @@ Respond with ONLY the JSON object."""
         speed: SpeedRequirement = SpeedRequirement.NORMAL,
         **kwargs,
     ) -> AsyncGenerator[str, None]:
-        print(f"[DEBUG ROUTER] stream_chat called with complexity={complexity}, speed={speed}")
         """
         Stream chat with automatic routing and fallback.
 
+        With hedging enabled, the first fallback starts streaming if the
+        primary has not produced a first chunk within its p95 latency; the
+        stream that produces a chunk first is kept and the other is closed.
+
         Args:
             messages: Conversation messages
             system_prompt: Optional system prompt
@@ -526,25 +697,24 @@ Respond with ONLY the JSON object."""
             Text chunks
         """
         decision = self.route(complexity=complexity, speed=speed)
-
-        provider = self._providers[decision.provider_name]
-        status = self._status[decision.provider_name]
-
-        print(
-            f"[DEBUG ROUTER] Routing decision: provider={decision.provider_name}, fallbacks={decision.fallback_providers}"
+        logger.debug(
+            "Streaming with %s (fallbacks: %s)",
+            decision.provider_name,
+            decision.fallback_providers,
         )
+        fallbacks = list(decision.fallback_providers)
+
+        def open_stream(name: str) -> AsyncIterator[str]:
+            return self._stream_with(name, messages, system_prompt, **kwargs)
 
         try:
-            print(
-                f"[DEBUG ROUTER] Attempting to stream with primary provider: {decision.provider_name}"
-            )
-            async for chunk in provider.stream_chat(
-                messages, system_prompt=system_prompt, **kwargs
-            ):
+            if self.routing.hedge and fallbacks:
+                stream = self._hedged_stream(decision.provider_name, fallbacks.pop(0), open_stream)
+            else:
+                stream = open_stream(decision.provider_name)
+            async for chunk in stream:
                 yield chunk
-            status.record_request()
         except Exception as e:
-            status.record_error(str(e))
             logger.warning(
                 "Primary streaming provider '%s' failed: %s. Attempting fallbacks.",
                 decision.provider_name,
@@ -553,15 +723,11 @@ Respond with ONLY the JSON object."""
             )
 
             # Try fallbacks
-            for fallback_name in decision.fallback_providers:
+            for fallback_name in fallbacks:
                 try:
                     logger.info("Attempting fallback streaming with: %s", fallback_name)
-                    fallback = self._providers[fallback_name]
-                    async for chunk in fallback.stream_chat(
-                        messages, system_prompt=system_prompt, **kwargs
-                    ):
+                    async for chunk in open_stream(fallback_name):
                         yield chunk
-                    self._status[fallback_name].record_request()
                     return
                 except Exception as _:
                     logger.warning(
@@ -573,19 +739,92 @@ Respond with ONLY the JSON object."""
             logger.error("All available providers failed for the streaming task.")
             raise RuntimeError(f"All streaming providers failed: {e}")
 
+    async def _stream_with(
+        self, name: str, messages: List[Dict[str, str]], system_prompt: Optional[str], **kwargs
+    ) -> AsyncGenerator[str, None]:
+        """Stream from one provider, measuring time to first token and throughput."""
+        status = self._status[name]
+        probe = self._admit(name)
+        start = time.monotonic()
+        first_token: Optional[float] = None
+        chars = 0
+        try:
+            async for chunk in self._providers[name].stream_chat(
+                messages, system_prompt=system_prompt, **kwargs
+            ):
+                if first_token is None:
+                    first_token = time.monotonic()
+                chars += len(chunk)
+                yield chunk
+        except Exception as e:
+            status.record_error(str(e))
+            raise
+        except BaseException:
+            if probe:  # Cancelled or closed early: no verdict on the provider
+                status.stats.release_probe()
+            raise
+        end = time.monotonic()
+        first_token = first_token or end
+        status.record_success(first_token - start, tokens=chars // 4, duration=end - first_token)
+
+    async def _hedged_stream(
+        self, primary: str, backup: str, open_stream: Callable[[str], AsyncIterator[str]]
+    ) -> AsyncGenerator[str, None]:
+        """Race two streams to their first chunk and continue with the winner."""
+        streams = {primary: open_stream(primary)}
+        tasks = {asyncio.ensure_future(anext(streams[primary], None)): primary}
+        delay: Optional[float] = self._hedge_delay(primary)
+        winner: Optional[str] = None
+        first_chunk: Optional[str] = None
+        error: Optional[BaseException] = None
+        try:
+            while tasks and winner is None:
+                done, _ = await asyncio.wait(
+                    tasks, timeout=delay, return_when=asyncio.FIRST_COMPLETED
+                )
+                if backup not in streams and (not done or any(t.exception() for t in done)):
+                    logger.debug("Hedging stream '%s' with '%s'", primary, backup)
+                    streams[backup] = open_stream(backup)
+                    tasks[asyncio.ensure_future(anext(streams[backup], None))] = backup
+                    delay = None
+                for task in done:
+                    name = tasks.pop(task)
+                    if task.exception() is not None:
+                        error = task.exception()
+                    elif winner is None:
+                        winner, first_chunk = name, task.result()
+        finally:
+            for task, name in tasks.items():
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            for name, stream in streams.items():
+                if name != winner:
+                    await stream.aclose()
+
+        if winner is None:
+            raise error or RuntimeError("Hedged streams produced no output")
+        if first_chunk is None:
+            return  # Winner finished without output
+        yield first_chunk
+        async for chunk in streams[winner]:
+            yield chunk
+
     async def stream_open_responses(
         self,
         messages: List[Dict[str, str]],
         system_prompt: Optional[str] = None,
         complexity: TaskComplexity = TaskComplexity.MODERATE,
         speed: SpeedRequirement = SpeedRequirement.NORMAL,
+        as_events: bool = False,
         **kwargs,
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[Union[str, StreamEvent], None]:
         """
         Stream usando Open Responses com routing automático.
 
         Rota para o provider apropriado e converte output para
-        formato Open Responses se necessário.
+        formato Open Responses se necessário. Com as_events=True emite
+        objetos StreamEvent em vez de SSE (uso no mesmo processo).
         """
         decision = self.route(complexity=complexity, speed=speed)
         provider = self._providers[decision.provider_name]
@@ -595,7 +834,7 @@ Respond with ONLY the JSON object."""
         if hasattr(provider, "stream_open_responses"):
             try:
                 async for event in provider.stream_open_responses(
-                    messages, system_prompt=system_prompt, **kwargs
+                    messages, system_prompt=system_prompt, as_events=as_events, **kwargs
                 ):
                     yield event
                 status.record_request()
@@ -610,29 +849,28 @@ Respond with ONLY the JSON object."""
         try:
             # Eventos iniciais
             builder.start()
-            for event in builder.get_events():
-                yield event.to_sse()
-            builder.clear_events()
+            for event in builder.drain(as_events):
+                yield event
 
             # Message item
             message_item = builder.add_message()
-            for event in builder.get_events():
-                yield event.to_sse()
-            builder.clear_events()
+            for event in builder.drain(as_events):
+                yield event
 
             # Stream legacy
             async for chunk in provider.stream_chat(
                 messages, system_prompt=system_prompt, **kwargs
             ):
                 builder.text_delta(message_item, chunk)
-                yield builder.get_last_event_sse()
-                builder.clear_events()
+                for event in builder.drain(as_events):
+                    yield event
 
             # Finaliza
             builder.complete()
-            for event in builder.get_events():
-                yield event.to_sse()
-            yield builder.done()
+            for event in builder.drain(as_events):
+                yield event
+            if not as_events:
+                yield builder.done()
 
             status.record_request()
 
@@ -644,9 +882,10 @@ Respond with ONLY the JSON object."""
                 message=f"{decision.provider_name}: {str(e)}",
             )
             builder.fail(error)
-            for event in builder.get_events():
-                yield event.to_sse()
-            yield builder.done()
+            for event in builder.drain(as_events):
+                yield event
+            if not as_events:
+                yield builder.done()
 
     def get_status_report(self) -> str:
         """Get a status report of all providers."""
@@ -663,6 +902,13 @@ Respond with ONLY the JSON object."""
                     f"{available} {name}: {info['model']} "
                     f"({status.requests_today}/{status.daily_limit} requests)"
                 )
+                stats = status.stats
+                if stats.ttft is not None:
+                    tps = f"{stats.tokens_per_sec:.0f} tok/s" if stats.tokens_per_sec else "- tok/s"
+                    lines.append(
+                        f"   ttft {stats.ttft * 1000:.0f} ms, {tps}, "
+                        f"errors {stats.error_rate:.0%}, circuit {stats.circuit_state}"
+                    )
             else:
                 lines.append(f"❌ {name}: Not configured")
 
@@ -84,7 +84,9 @@ from .core.help_system import help_system  # noqa: E402
 
 # Import LLM client (using existing implementation)
 from .core.async_executor import AsyncExecutor  # noqa: E402
-from .core.file_watcher import FileWatcher, RecentFilesTracker  # noqa: E402
+from .core.file_watcher import RecentFilesTracker, get_file_watcher  # noqa: E402
+from .async_utils.line_index import get_line_index_cache  # noqa: E402
+from .core.workspace_snapshot import get_workspace_snapshot  # noqa: E402
 
 # Lazy: SemanticIndexer (heavy, used lazily anyway)
 _SemanticIndexer = None
@@ -335,14 +337,16 @@ class InteractiveShell:
         self.async_executor = AsyncExecutor(max_parallel=5)
 
         # Phase 4.4: File watcher for context tracking
-        self.file_watcher = FileWatcher(
-            root_path=".", watch_extensions={".py", ".js", ".ts", ".go", ".rs"}
-        )
+        # Shared watcher (inotify when available), also used by cache layers
+        self.file_watcher = get_file_watcher(root_path=".")
         self.recent_files = RecentFilesTracker(maxsize=50)
 
         # Setup file watcher callback
-        self.file_watcher.add_callback(self._on_file_changed)
-        self.file_watcher.start()
+        self.file_watcher.add_callback(
+            self._on_file_changed, extensions={".py", ".js", ".ts", ".go", ".rs"}
+        )
+        get_line_index_cache().attach_watcher(self.file_watcher)
+        get_workspace_snapshot().attach_watcher(self.file_watcher)
 
         # SCALE & SUSTAIN Phase 1.2: Command Dispatcher (CC Reduction)
         # Replaces massive if/elif chain (CC=112) with O(1) dictionary dispatch
@@ -623,12 +627,7 @@ class InteractiveShell:
 
         register_builtin_patterns(suggestion_engine)
 
-        async def file_watcher_loop():
-            while True:
-                self.file_watcher.check_updates()
-                await asyncio.sleep(1.0)
-
-        watcher_task = asyncio.create_task(file_watcher_loop())
+        watcher_task = self.file_watcher.start_polling()
         self._auto_index_task = asyncio.create_task(self._auto_index_background())
 
         try:
@@ -27,177 +27,278 @@ Claude Code Parity (Sprints 1-3):
 - Context auto-compact (Sprint 3)
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 # Base classes
 from .base import Tool, ToolCategory, ToolResult, ToolRegistry
 
-# File operations
-from .file_ops import (
-    ReadFileTool,
-    WriteFileTool,
-    EditFileTool,
-    ListDirectoryTool,
-    DeleteFileTool,
-)
+if TYPE_CHECKING:
+    # File operations
+    from .file_ops import (
+        ReadFileTool,
+        WriteFileTool,
+        EditFileTool,
+        ListDirectoryTool,
+        DeleteFileTool,
+    )
 
-# File management
-from .file_mgmt import (
-    MoveFileTool,
-    CopyFileTool,
-    CreateDirectoryTool,
-    ReadMultipleFilesTool,
-    InsertLinesTool,
-)
+    # File management
+    from .file_mgmt import (
+        MoveFileTool,
+        CopyFileTool,
+        CreateDirectoryTool,
+        ReadMultipleFilesTool,
+        InsertLinesTool,
+    )
 
-# Search tools
-from .search import SearchFilesTool, GetDirectoryTreeTool
+    # Search tools
+    from .search import SearchFilesTool, GetDirectoryTreeTool
 
-# Claude Code parity tools
-from .claude_parity_tools import (
-    GlobTool,
-    LSTool,
-    MultiEditTool,
-    WebFetchTool,
-    WebSearchTool,
-    TodoReadTool,
-    TodoWriteTool,
-    NotebookReadTool,
-    NotebookEditTool,
-    BackgroundTaskTool,
-    TaskTool,
-    AskUserQuestionTool,
-    get_claude_parity_tools,
-)
+    # Claude Code parity tools
+    from .claude_parity_tools import (
+        GlobTool,
+        LSTool,
+        MultiEditTool,
+        WebFetchTool,
+        WebSearchTool,
+        TodoReadTool,
+        TodoWriteTool,
+        NotebookReadTool,
+        NotebookEditTool,
+        BackgroundTaskTool,
+        TaskTool,
+        AskUserQuestionTool,
+        get_claude_parity_tools,
+    )
 
-# Plan mode tools
-from .plan_mode import (
-    EnterPlanModeTool,
-    ExitPlanModeTool,
-    AddPlanNoteTool,
-    GetPlanStatusTool,
-    get_plan_mode_tools,
-    EnterNoesisModeTool,
-    ExitNoesisModeTool,
-    GetNoesisStatusTool,
-    get_noesis_mode_tools,
-)
+    # Plan mode tools
+    from .plan_mode import (
+        EnterPlanModeTool,
+        ExitPlanModeTool,
+        AddPlanNoteTool,
+        GetPlanStatusTool,
+        get_plan_mode_tools,
+        EnterNoesisModeTool,
+        ExitNoesisModeTool,
+        GetNoesisStatusTool,
+        get_noesis_mode_tools,
+        get_plan_state,
+        reset_plan_state,
+    )
 
-# Media tools (Sprint 3)
-from .media_tools import (
-    ImageReadTool,
-    PDFReadTool,
-    ScreenshotReadTool,
-    get_media_tools,
-)
+    # Media tools (Sprint 3)
+    from .media_tools import ImageReadTool, PDFReadTool, ScreenshotReadTool, get_media_tools
 
-# Git workflow tools (Sprint 3)
-from .git_workflow import (
-    GitStatusEnhancedTool,
-    GitCommitTool,
-    GitLogTool,
-    GitDiffEnhancedTool,
-    GitPRCreateTool,
-    get_git_workflow_tools,
-    validate_git_command,
-)
+    # Git workflow tools (Sprint 3)
+    from .git_workflow import (
+        GitStatusEnhancedTool,
+        GitCommitTool,
+        GitLogTool,
+        GitDiffEnhancedTool,
+        GitPRCreateTool,
+        get_git_workflow_tools,
+        validate_git_command,
+    )
 
-# Execution tools
-from .exec_hardened import BashCommandTool
+    # Execution tools
+    from .exec_hardened import BashCommandTool
 
-# Git tools (legacy)
-from .git_ops import GitStatusTool, GitDiffTool
+    # Git tools (legacy)
+    from .git_ops import GitStatusTool, GitDiffTool
 
-# Context tools
-from .context import GetContextTool, SaveSessionTool, RestoreBackupTool
+    # Context tools
+    from .context import GetContextTool, SaveSessionTool, RestoreBackupTool
 
-# Terminal tools
-from .terminal import (
-    CdTool,
-    LsTool as TerminalLsTool,
-    PwdTool,
-    MkdirTool,
-    RmTool,
-    CpTool,
-    MvTool,
-    TouchTool,
-    CatTool,
-)
+    # Terminal tools
+    from .terminal import (
+        CdTool,
+        LsTool as TerminalLsTool,
+        PwdTool,
+        MkdirTool,
+        RmTool,
+        CpTool,
+        MvTool,
+        TouchTool,
+        CatTool,
+    )
+
+    # Validated tool base
+    from .validated import ValidatedTool
 
-# Validated tool base
-from .validated import ValidatedTool
+# Tool modules are imported on first access: most callers need a handful of
+# tools (or only their manifest schemas), not every implementation at once.
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    # File operations
+    "ReadFileTool": (".file_ops", "ReadFileTool"),
+    "WriteFileTool": (".file_ops", "WriteFileTool"),
+    "EditFileTool": (".file_ops", "EditFileTool"),
+    "ListDirectoryTool": (".file_ops", "ListDirectoryTool"),
+    "DeleteFileTool": (".file_ops", "DeleteFileTool"),
+    # File management
+    "MoveFileTool": (".file_mgmt", "MoveFileTool"),
+    "CopyFileTool": (".file_mgmt", "CopyFileTool"),
+    "CreateDirectoryTool": (".file_mgmt", "CreateDirectoryTool"),
+    "ReadMultipleFilesTool": (".file_mgmt", "ReadMultipleFilesTool"),
+    "InsertLinesTool": (".file_mgmt", "InsertLinesTool"),
+    # Search tools
+    "SearchFilesTool": (".search", "SearchFilesTool"),
+    "GetDirectoryTreeTool": (".search", "GetDirectoryTreeTool"),
+    # Claude Code parity tools
+    "GlobTool": (".claude_parity_tools", "GlobTool"),
+    "LSTool": (".claude_parity_tools", "LSTool"),
+    "MultiEditTool": (".claude_parity_tools", "MultiEditTool"),
+    "WebFetchTool": (".claude_parity_tools", "WebFetchTool"),
+    "WebSearchTool": (".claude_parity_tools", "WebSearchTool"),
+    "TodoReadTool": (".claude_parity_tools", "TodoReadTool"),
+    "TodoWriteTool": (".claude_parity_tools", "TodoWriteTool"),
+    "NotebookReadTool": (".claude_parity_tools", "NotebookReadTool"),
+    "NotebookEditTool": (".claude_parity_tools", "NotebookEditTool"),
+    "BackgroundTaskTool": (".claude_parity_tools", "BackgroundTaskTool"),
+    "TaskTool": (".claude_parity_tools", "TaskTool"),
+    "AskUserQuestionTool": (".claude_parity_tools", "AskUserQuestionTool"),
+    "get_claude_parity_tools": (".claude_parity_tools", "get_claude_parity_tools"),
+    # Plan mode tools
+    "EnterPlanModeTool": (".plan_mode", "EnterPlanModeTool"),
+    "ExitPlanModeTool": (".plan_mode", "ExitPlanModeTool"),
+    "AddPlanNoteTool": (".plan_mode", "AddPlanNoteTool"),
+    "GetPlanStatusTool": (".plan_mode", "GetPlanStatusTool"),
+    "get_plan_mode_tools": (".plan_mode", "get_plan_mode_tools"),
+    "EnterNoesisModeTool": (".plan_mode", "EnterNoesisModeTool"),
+    "ExitNoesisModeTool": (".plan_mode", "ExitNoesisModeTool"),
+    "GetNoesisStatusTool": (".plan_mode", "GetNoesisStatusTool"),
+    "get_noesis_mode_tools": (".plan_mode", "get_noesis_mode_tools"),
+    "get_plan_state": (".plan_mode", "get_plan_state"),
+    "reset_plan_state": (".plan_mode", "reset_plan_state"),
+    # Media tools (Sprint 3)
+    "ImageReadTool": (".media_tools", "ImageReadTool"),
+    "PDFReadTool": (".media_tools", "PDFReadTool"),
+    "ScreenshotReadTool": (".media_tools", "ScreenshotReadTool"),
+    "get_media_tools": (".media_tools", "get_media_tools"),
+    # Git workflow tools (Sprint 3)
+    "GitStatusEnhancedTool": (".git_workflow", "GitStatusEnhancedTool"),
+    "GitCommitTool": (".git_workflow", "GitCommitTool"),
+    "GitLogTool": (".git_workflow", "GitLogTool"),
+    "GitDiffEnhancedTool": (".git_workflow", "GitDiffEnhancedTool"),
+    "GitPRCreateTool": (".git_workflow", "GitPRCreateTool"),
+    "get_git_workflow_tools": (".git_workflow", "get_git_workflow_tools"),
+    "validate_git_command": (".git_workflow", "validate_git_command"),
+    # Execution tools
+    "BashCommandTool": (".exec_hardened", "BashCommandTool"),
+    # Git tools (legacy)
+    "GitStatusTool": (".git_ops", "GitStatusTool"),
+    "GitDiffTool": (".git_ops", "GitDiffTool"),
+    # Context tools
+    "GetContextTool": (".context", "GetContextTool"),
+    "SaveSessionTool": (".context", "SaveSessionTool"),
+    "RestoreBackupTool": (".context", "RestoreBackupTool"),
+    # Terminal tools
+    "CdTool": (".terminal", "CdTool"),
+    "TerminalLsTool": (".terminal", "LsTool"),
+    "PwdTool": (".terminal", "PwdTool"),
+    "MkdirTool": (".terminal", "MkdirTool"),
+    "RmTool": (".terminal", "RmTool"),
+    "CpTool": (".terminal", "CpTool"),
+    "MvTool": (".terminal", "MvTool"),
+    "TouchTool": (".terminal", "TouchTool"),
+    "CatTool": (".terminal", "CatTool"),
+    # Validated tool base
+    "ValidatedTool": (".validated", "ValidatedTool"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        module_path, attr_name = _LAZY_IMPORTS[name]
+        value = getattr(importlib.import_module(module_path, __name__), attr_name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+# Tools instantiated by get_all_tools(), in order
+_ALL_TOOLS = (
+    # File operations
+    "ReadFileTool",
+    "WriteFileTool",
+    "EditFileTool",
+    "ListDirectoryTool",
+    "DeleteFileTool",
+    "MoveFileTool",
+    "CopyFileTool",
+    "CreateDirectoryTool",
+    "ReadMultipleFilesTool",
+    "InsertLinesTool",
+    # Search
+    "SearchFilesTool",
+    "GetDirectoryTreeTool",
+    "GlobTool",
+    # Execution
+    "BashCommandTool",
+    "BackgroundTaskTool",
+    # Git
+    "GitStatusTool",
+    "GitDiffTool",
+    "GitStatusEnhancedTool",
+    "GitCommitTool",
+    "GitLogTool",
+    "GitDiffEnhancedTool",
+    "GitPRCreateTool",
+    # Context
+    "GetContextTool",
+    "SaveSessionTool",
+    "RestoreBackupTool",
+    # Claude parity
+    "LSTool",
+    "MultiEditTool",
+    "WebFetchTool",
+    "WebSearchTool",
+    "TodoReadTool",
+    "TodoWriteTool",
+    "NotebookReadTool",
+    "NotebookEditTool",
+    "TaskTool",
+    "AskUserQuestionTool",
+    # Plan mode
+    "EnterPlanModeTool",
+    "ExitPlanModeTool",
+    "AddPlanNoteTool",
+    "GetPlanStatusTool",
+    # Noesis mode
+    "EnterNoesisModeTool",
+    "ExitNoesisModeTool",
+    "GetNoesisStatusTool",
+    # Noesis mode
+    "EnterNoesisModeTool",
+    "ExitNoesisModeTool",
+    "GetNoesisStatusTool",
+    # Media
+    "ImageReadTool",
+    "PDFReadTool",
+    "ScreenshotReadTool",
+    # Terminal
+    "CdTool",
+    "TerminalLsTool",
+    "PwdTool",
+    "MkdirTool",
+    "RmTool",
+    "CpTool",
+    "MvTool",
+    "TouchTool",
+    "CatTool",
+)
 
 
 def get_all_tools():
     """Get all available tools for agents."""
-    return [
-        # File operations
-        ReadFileTool(),
-        WriteFileTool(),
-        EditFileTool(),
-        ListDirectoryTool(),
-        DeleteFileTool(),
-        MoveFileTool(),
-        CopyFileTool(),
-        CreateDirectoryTool(),
-        ReadMultipleFilesTool(),
-        InsertLinesTool(),
-        # Search
-        SearchFilesTool(),
-        GetDirectoryTreeTool(),
-        GlobTool(),
-        # Execution
-        BashCommandTool(),
-        BackgroundTaskTool(),
-        # Git
-        GitStatusTool(),
-        GitDiffTool(),
-        GitStatusEnhancedTool(),
-        GitCommitTool(),
-        GitLogTool(),
-        GitDiffEnhancedTool(),
-        GitPRCreateTool(),
-        # Context
-        GetContextTool(),
-        SaveSessionTool(),
-        RestoreBackupTool(),
-        # Claude parity
-        LSTool(),
-        MultiEditTool(),
-        WebFetchTool(),
-        WebSearchTool(),
-        TodoReadTool(),
-        TodoWriteTool(),
-        NotebookReadTool(),
-        NotebookEditTool(),
-        TaskTool(),
-        AskUserQuestionTool(),
-        # Plan mode
-        EnterPlanModeTool(),
-        ExitPlanModeTool(),
-        AddPlanNoteTool(),
-        GetPlanStatusTool(),
-        # Noesis mode
-        EnterNoesisModeTool(),
-        ExitNoesisModeTool(),
-        GetNoesisStatusTool(),
-        # Noesis mode
-        EnterNoesisModeTool(),
-        ExitNoesisModeTool(),
-        GetNoesisStatusTool(),
-        # Media
-        ImageReadTool(),
-        PDFReadTool(),
-        ScreenshotReadTool(),
-        # Terminal
-        CdTool(),
-        TerminalLsTool(),
-        PwdTool(),
-        MkdirTool(),
-        RmTool(),
-        CpTool(),
-        MvTool(),
-        TouchTool(),
-        CatTool(),
-    ]
+    return [__getattr__(name)() for name in _ALL_TOOLS]
 
 
 __all__ = [
@@ -1,15 +1,35 @@
 """
 Tool Caching Utilities.
 
-Provides decorators and mixins for caching tool results.
+Provides a shared, bounded cache for tool results and the decorator that
+puts tool methods behind it.
+
+Entries live in one process-wide LRU bounded by entry count and estimated
+bytes. Expired entries are dropped by a timer on the running event loop, not
+only when the same key is read again. Concurrent identical calls share one
+execution (single-flight), and entries can be tagged with the file paths
+they depend on so write/edit tools can invalidate exactly what they touched.
+Those paths' stat info is part of the key, so edits made outside the tools
+(an editor, a script) miss the stale entry as well.
 """
 
+import asyncio
+import copy
 import functools
+import inspect
+import os
+import sys
+import threading
 import time
-from typing import Dict, Any, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Sequence, Set, Tuple
+
+# Bounds for the shared cache
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
 
-# Async lock for thread/task safety
-from asyncio import Lock
+CacheKey = Tuple[str, Any]
 
 
 def _make_hashable(value: Any) -> Any:
@@ -21,63 +41,409 @@ def _make_hashable(value: Any) -> Any:
     return value
 
 
-def cache_tool_result(ttl_seconds: float = 60.0):
+def _path_state(path: str) -> Optional[Tuple[int, int, int]]:
+    """mtime, size and inode of a path (None if it doesn't exist)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _approx_size(value: Any, depth: int = 0) -> int:
+    """Rough memory footprint of a result (containers followed a few levels)."""
+    size = sys.getsizeof(value)
+    if depth >= 4:
+        return size
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += _approx_size(k, depth + 1) + _approx_size(v, depth + 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += _approx_size(item, depth + 1)
+    elif hasattr(value, "__dict__"):
+        size += _approx_size(vars(value), depth + 1)
+    return size
+
+
+def _copy_result(result: Any, **metadata: Any) -> Any:
+    """Shallow copy of a result with its own metadata dict."""
+    if not isinstance(getattr(result, "metadata", None), dict):
+        return result
+    result = copy.copy(result)
+    result.metadata = {**result.metadata, **metadata}
+    return result
+
+
+@dataclass
+class ToolCacheStats:
+    """Tool result cache statistics for one tool."""
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Calculate hit rate (coalesced calls count as hits)."""
+        hits = self.hits + self.coalesced
+        total = hits + self.misses
+        return hits / total if total > 0 else 0.0
+
+
+class _Entry:
+    __slots__ = ("tool", "result", "created", "expires_at", "size", "tags", "timer")
+
+    def __init__(
+        self, tool: str, result: Any, ttl: float, size: int, tags: Tuple[str, ...]
+    ) -> None:
+        self.tool = tool
+        self.result = result
+        self.created = time.monotonic()
+        self.expires_at = self.created + ttl
+        self.size = size
+        self.tags = tags
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class ToolResultCache:
+    """
+    LRU cache of tool results shared by every cached tool.
+
+    Thread-safe; the lock is never held across an await, so tool calls
+    don't serialize on the cache.
+    """
+
+    def __init__(
+        self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._tags: Dict[str, Set[CacheKey]] = {}
+        self._inflight: Dict[CacheKey, asyncio.Future] = {}
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats: Dict[str, ToolCacheStats] = {}
+
+    # =========================================================================
+    # Lookup
+    # =========================================================================
+
+    async def get_or_execute(
+        self,
+        key: CacheKey,
+        execute: Callable[[], Awaitable[Any]],
+        ttl: float,
+        tool: str,
+        tags: Iterable[str] = (),
+    ) -> Any:
+        """
+        Return the cached result for key, or run execute() once and cache it.
+
+        Callers arriving while the same key is executing await that execution
+        instead of starting their own. Failed results are not cached.
+        """
+        cached = self.get(key, tool)
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            pending = self._inflight.get(key)
+            if pending is None or pending.get_loop() is not loop:
+                pending = None
+                future = loop.create_future()
+                self._inflight[key] = future
+                self._tool_stats(tool).misses += 1
+            else:
+                self._tool_stats(tool).coalesced += 1
+
+        if pending is not None:
+            try:
+                result = await asyncio.shield(pending)
+                return _copy_result(result, coalesced=True)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The executing call was cancelled; run it ourselves
+                return await execute()
+
+        try:
+            result = await execute()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception()  # Mark retrieved when nobody is waiting
+            raise
+        finally:
+            with self._lock:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+
+        if getattr(result, "success", True):
+            self.put(key, result, ttl, tool, tags)
+        future.set_result(result)
+        return result
+
+    def get(self, key: CacheKey, tool: str = "") -> Optional[Any]:
+        """Return a copy of a live cached result, or None (not counted as a miss)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            now = time.monotonic()
+            if now >= entry.expires_at:
+                self._remove(key)
+                self._tool_stats(entry.tool).expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            self._tool_stats(tool or entry.tool).hits += 1
+            age = now - entry.created
+        return _copy_result(entry.result, cached=True, cache_age=round(age, 2))
+
+    def put(
+        self, key: CacheKey, result: Any, ttl: float, tool: str, tags: Iterable[str] = ()
+    ) -> None:
+        """Store a result; results larger than the byte bound are not cached."""
+        size = _approx_size(result)
+        if size > self._max_bytes or ttl <= 0:
+            return
+        entry = _Entry(tool, _copy_result(result), ttl, size, tuple(tags))
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = entry
+            self._bytes += size
+            for tag in entry.tags:
+                self._tags.setdefault(tag, set()).add(key)
+            if loop is not None:
+                entry.timer = loop.call_later(ttl, self._expire, key, entry)
+            self._evict()
+
+    # =========================================================================
+    # Invalidation
+    # =========================================================================
+
+    def invalidate_tag(self, tag: str) -> int:
+        """Drop entries carrying a tag. Returns the number dropped."""
+        with self._lock:
+            return self._invalidate_keys(self._tags.get(tag, ()))
+
+    def invalidate_path(self, path: Any) -> int:
+        """
+        Drop entries that depend on a path.
+
+        Matches entries tagged with the path itself, any directory containing
+        it (a listing or search of that directory), or anything below it.
+        """
+        target = os.path.abspath(path)
+        prefix = target.rstrip(os.sep) + os.sep
+        with self._lock:
+            keys: Set[CacheKey] = set()
+            current = target
+            while True:
+                keys.update(self._tags.get(current, ()))
+                parent = os.path.dirname(current)
+                if parent == current:
+                    break
+                current = parent
+            for tag, tagged in self._tags.items():
+                if tag.startswith(prefix):
+                    keys.update(tagged)
+            return self._invalidate_keys(keys)
+
+    def invalidate_tool(self, tool: str) -> int:
+        """Drop every entry cached for a tool."""
+        with self._lock:
+            return self._invalidate_keys([k for k, e in self._entries.items() if e.tool == tool])
+
+    def invalidate_namespace(self, namespace: str) -> int:
+        """Drop every entry whose key belongs to a namespace (one cached function)."""
+        with self._lock:
+            return self._invalidate_keys([k for k in self._entries if k[0] == namespace])
+
+    def clear(self) -> None:
+        """Drop all entries (statistics are kept)."""
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def _invalidate_keys(self, keys: Iterable[CacheKey]) -> int:
+        dropped = 0
+        for key in list(keys):
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._remove(key)
+                self._tool_stats(entry.tool).invalidations += 1
+                dropped += 1
+        return dropped
+
+    def _expire(self, key: CacheKey, entry: _Entry) -> None:
+        with self._lock:
+            if self._entries.get(key) is entry:
+                self._remove(key)
+                self._tool_stats(entry.tool).expirations += 1
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= entry.size
+        if entry.timer is not None:
+            entry.timer.cancel()
+        for tag in entry.tags:
+            tagged = self._tags.get(tag)
+            if tagged is not None:
+                tagged.discard(key)
+                if not tagged:
+                    del self._tags[tag]
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self._max_entries or self._bytes > self._max_bytes
+        ):
+            key, entry = next(iter(self._entries.items()))
+            self._remove(key)
+            self._tool_stats(entry.tool).evictions += 1
+
+    def _tool_stats(self, tool: str) -> ToolCacheStats:
+        stats = self._stats.get(tool)
+        if stats is None:
+            stats = self._stats[tool] = ToolCacheStats()
+        return stats
+
+    # =========================================================================
+    # Statistics
+    # =========================================================================
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics, overall and per tool."""
+        with self._lock:
+            tools = {
+                name: {
+                    "hits": s.hits,
+                    "misses": s.misses,
+                    "coalesced": s.coalesced,
+                    "hit_rate": s.hit_rate,
+                    "evictions": s.evictions,
+                    "expirations": s.expirations,
+                    "invalidations": s.invalidations,
+                }
+                for name, s in self._stats.items()
+            }
+            hits = sum(s.hits + s.coalesced for s in self._stats.values())
+            total = hits + sum(s.misses for s in self._stats.values())
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "in_flight": len(self._inflight),
+                "hits": hits,
+                "misses": total - hits,
+                "hit_rate": hits / total if total > 0 else 0.0,
+                "tools": tools,
+            }
+
+
+# =============================================================================
+# SINGLETON INSTANCE
+# =============================================================================
+
+_tool_result_cache: Optional[ToolResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_tool_result_cache() -> ToolResultCache:
+    """Get or create the process-wide ToolResultCache."""
+    global _tool_result_cache
+    if _tool_result_cache is None:
+        with _cache_lock:
+            if _tool_result_cache is None:
+                _tool_result_cache = ToolResultCache()
+    return _tool_result_cache
+
+
+def clear_cached_results() -> None:
+    """Drop every cached result (call after commands that may write anywhere)."""
+    if _tool_result_cache is not None:
+        _tool_result_cache.clear()
+
+
+def invalidate_cached_paths(*paths: Any) -> None:
+    """Invalidate cached results depending on paths (call after writing them)."""
+    if _tool_result_cache is None:
+        return
+    for path in paths:
+        if path is not None:
+            _tool_result_cache.invalidate_path(path)
+
+
+def cache_tool_result(ttl_seconds: float = 60.0, path_args: Sequence[str] = ()):
     """
-    Decorator to cache tool results for a specified duration.
+    Decorator to cache tool results in the shared ToolResultCache.
+
+    Args:
+        ttl_seconds: How long a result stays valid
+        path_args: Names of arguments holding file paths the result depends
+            on; writes to those paths (or below them) invalidate the entry,
+            and a changed mtime/size of the path itself misses it
 
     Usage:
-        @cache_tool_result(ttl_seconds=300)
+        @cache_tool_result(ttl_seconds=300, path_args=("path",))
         async def _execute_validated(self, **kwargs):
             ...
     """
 
     def decorator(func):
-        cache: Dict[Tuple, Tuple[float, Any]] = {}
-        lock = Lock()
+        namespace = f"{func.__module__}.{func.__qualname__}"
+        signature = inspect.signature(func)
 
         @functools.wraps(func)
-        async def wrapper(self, **kwargs):
-            # Create a stable cache key from kwargs
-            # We filter out 'indexer' or other non-serializable objects if needed,
-            # but usually tool args are JSON-serializable.
+        async def wrapper(self, *args, **kwargs):
+            try:
+                bound = signature.bind(self, *args, **kwargs)
+            except TypeError:
+                return await func(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            del arguments[next(iter(signature.parameters))]
 
-            # Simple approach: sorted tuple of items
+            tags = []
+            for name in path_args:
+                value = arguments.get(name)
+                if isinstance(value, (str, os.PathLike)):
+                    # Relative paths depend on the cwd
+                    value = arguments[name] = os.path.abspath(value)
+                    tags.append(value)
             try:
-                key = _make_hashable(kwargs)
+                state = tuple(_path_state(tag) for tag in tags)
+                key = (namespace, (_make_hashable(arguments), state))
+                hash(key)
             except TypeError:
                 # If args are not hashable, skip caching
-                return await func(self, **kwargs)
-
-            async with lock:
-                now = time.time()
-                if key in cache:
-                    ts, result = cache[key]
-                    if now - ts < ttl_seconds:
-                        # If result is a ToolResult, add metadata
-                        if hasattr(result, "metadata") and isinstance(result.metadata, dict):
-                            result.metadata["cached"] = True
-                            result.metadata["cache_age"] = round(now - ts, 2)
-                        return result
-                    else:
-                        del cache[key]
-
-            # Execute
-            result = await func(self, **kwargs)
-
-            # Cache if successful
-            should_cache = True
-            if hasattr(result, "success") and not result.success:
-                should_cache = False
-
-            if should_cache:
-                async with lock:
-                    cache[key] = (time.time(), result)
-
-            return result
+                return await func(self, *args, **kwargs)
+
+            tool = getattr(self, "name", None) or func.__qualname__.split(".")[0]
+            return await get_tool_result_cache().get_or_execute(
+                key, lambda: func(self, *args, **kwargs), ttl_seconds, tool, tags
+            )
 
         # Add method to clear cache
         def invalidate_cache():
-            cache.clear()
+            get_tool_result_cache().invalidate_namespace(namespace)
 
         wrapper.invalidate_cache = invalidate_cache
         return wrapper
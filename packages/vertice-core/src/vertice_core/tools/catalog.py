@@ -4,59 +4,18 @@ Tool Catalog - Unified Tool Registry Builder.
 
 Single source of truth for all tools in the system.
 Replaces registry_helper.py and logic in tools_bridge.py.
+
+Default and web tools are registered from the precompiled tool manifest
+(see manifest.py): their schemas are served without importing them.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Any, List, Optional, Type
-
-from vertice_core.tools.base import ToolRegistry, BaseTool
-
-# 1. File Operations (12 tools)
-from vertice_core.tools.file_ops import (
-    ReadFileTool,
-    WriteFileTool,
-    EditFileTool,
-    ListDirectoryTool,
-    DeleteFileTool,
-)
-from vertice_core.tools.file_mgmt import (
-    MoveFileTool,
-    CopyFileTool,
-    CreateDirectoryTool,
-    ReadMultipleFilesTool,
-    InsertLinesTool,
-)
-
-# 2. Terminal (9 tools)
-from vertice_core.tools.terminal import (
-    CdTool,
-    LsTool,
-    PwdTool,
-    MkdirTool,
-    RmTool,
-    CpTool,
-    MvTool,
-    TouchTool,
-    CatTool,
-)
-
-# 3. Execution (1 tool)
-from vertice_core.tools.exec_hardened import BashCommandTool
-
-# 4. Search (2 tools)
-from vertice_core.tools.search import SearchFilesTool, GetDirectoryTreeTool
-
-# 5. Git (2 tools)
-from vertice_core.tools.git_ops import GitStatusTool, GitDiffTool
-
-# 6. Context (3 tools)
-from vertice_core.tools.context import (
-    GetContextTool,
-    SaveSessionTool,
-    RestoreBackupTool,
-)
+from typing import Any, List, Optional
+
+from vertice_core.tools.base import ToolRegistry
+from vertice_core.tools.manifest import register_group
 
 logger = logging.getLogger(__name__)
 
@@ -70,66 +29,12 @@ class ToolCatalog:
 
     def add_defaults(self) -> "ToolCatalog":
         """Add standard file, terminal, execution, search, git, and context tools."""
-        tools = [
-            # File Ops
-            ReadFileTool,
-            WriteFileTool,
-            EditFileTool,
-            ListDirectoryTool,
-            DeleteFileTool,
-            MoveFileTool,
-            CopyFileTool,
-            CreateDirectoryTool,
-            ReadMultipleFilesTool,
-            InsertLinesTool,
-            # Terminal
-            CdTool,
-            LsTool,
-            PwdTool,
-            MkdirTool,
-            RmTool,
-            CpTool,
-            MvTool,
-            TouchTool,
-            CatTool,
-            # Execution
-            BashCommandTool,
-            # Search
-            SearchFilesTool,
-            GetDirectoryTreeTool,
-            # Git
-            GitStatusTool,
-            GitDiffTool,
-            # Context
-            GetContextTool,
-            SaveSessionTool,
-            RestoreBackupTool,
-        ]
-        self._register_batch("defaults", tools)
+        self._register_group("defaults")
         return self
 
     def add_web_tools(self) -> "ToolCatalog":
         """Add web search and access tools."""
-        try:
-            from vertice_core.tools.web_search import WebSearchTool, SearchDocumentationTool
-            from vertice_core.tools.web_access import (
-                FetchURLTool,
-                DownloadFileTool,
-                HTTPRequestTool,
-                PackageSearchTool,
-            )
-
-            tools = [
-                WebSearchTool,
-                SearchDocumentationTool,
-                FetchURLTool,
-                DownloadFileTool,
-                HTTPRequestTool,
-                PackageSearchTool,
-            ]
-            self._register_batch("web", tools)
-        except ImportError as e:
-            self.load_errors.append(f"web tools: {e}")
+        self._register_group("web")
         return self
 
     def add_parity_tools(self) -> "ToolCatalog":
@@ -223,13 +128,9 @@ class ToolCatalog:
             logger.warning(f"ToolCatalog load errors: {self.load_errors}")
         return self.registry
 
-    def _register_batch(self, category: str, tool_classes: List[Type[BaseTool]]) -> None:
-        """Helper to register a batch of tool classes."""
-        for tool_cls in tool_classes:
-            try:
-                self.registry.register(tool_cls())
-            except Exception as e:
-                self.load_errors.append(f"{category}/{tool_cls.__name__}: {e}")
+    def _register_group(self, group: str) -> None:
+        """Register a manifest group; its tools are imported on first use."""
+        self.load_errors.extend(register_group(self.registry, group))
 
 
 def get_catalog(
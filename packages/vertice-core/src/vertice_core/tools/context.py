@@ -1,5 +1,6 @@
 """Context and session management tools."""
 
+import asyncio
 import json
 from pathlib import Path
 from datetime import datetime
@@ -7,6 +8,7 @@ from typing import Optional
 
 from .base import ToolResult, ToolCategory
 from .validated import ValidatedTool
+from ..async_utils.files import write_atomic
 
 
 class GetContextTool(ValidatedTool):
@@ -157,6 +159,26 @@ class RestoreBackupTool(ValidatedTool):
             import shutil
             import glob
 
+            from ..core.blob_store import get_blob_store, list_backups
+
+            dest_path = Path(file)
+
+            # Edit backups live in the blob store; .qwen_backups is the legacy layout
+            backups = await asyncio.to_thread(list_backups, dest_path)
+            if backup_id:
+                backups = [b for b in backups if backup_id in (b[0], b[1])]
+            if backups:
+                ref, digest, _ = backups[-1]
+                content = await asyncio.to_thread(get_blob_store().get, digest)
+                result = await write_atomic(dest_path, content, create_dirs=False)
+                if not result.success:
+                    return ToolResult(success=False, error=result.error)
+                return ToolResult(
+                    success=True,
+                    data=f"Restored {file} from {ref.rsplit('@', 1)[-1]}",
+                    metadata={"file": str(dest_path), "backup": ref, "backup_blob": digest},
+                )
+
             backup_dir = Path(".qwen_backups")
 
             if not backup_dir.exists():
@@ -172,7 +194,6 @@ class RestoreBackupTool(ValidatedTool):
 
             # Use latest backup
             backup_path = Path(backups[0])
-            dest_path = Path(file)
 
             # Restore
             shutil.copy2(str(backup_path), str(dest_path))
@@ -11,25 +11,25 @@ Author: Boris Cherny (Linus mode)
 Date: 2025-11-21
 """
 
-import subprocess
 import asyncio
 import os
 import re
 import logging
 import resource
+import shlex
 import signal
 import sys
 import fcntl
 import termios
 import struct
-import pty
 import tty
-import select
 from pathlib import Path
 from typing import Optional, Dict, Set
 from dataclasses import dataclass
 
 from .base import ToolResult, ToolCategory
+from .caching import clear_cached_results
+from .pty_stream import PTYStream
 from .validated import ValidatedTool
 from ..core.validation import Required
 
@@ -184,6 +184,9 @@ class PTYExecutor:
     2. Real-time output streaming
     3. Proper signal handling (Ctrl+C, etc.)
     4. Color output preservation
+
+    Output and terminal input are both driven by event loop readers
+    (see PTYStream), so a running command never blocks the loop.
     """
 
     def __init__(
@@ -193,8 +196,7 @@ class PTYExecutor:
         self.cwd = cwd or os.getcwd()
         self.env = env or os.environ.copy()
         self.master_fd: Optional[int] = None
-        self.slave_fd: Optional[int] = None
-        self.process: Optional[subprocess.Popen] = None
+        self.process: Optional[asyncio.subprocess.Process] = None
 
     def _set_window_size(self):
         """Propagate window size from stdin to PTY master."""
@@ -210,94 +212,59 @@ class PTYExecutor:
             # Non-critical error, just log it
             logger.debug(f"Failed to set window size: {e}")
 
+    @staticmethod
+    def _forward_stdin(stream: PTYStream) -> None:
+        """Relay user keystrokes to the process (stdin reader callback)."""
+        try:
+            data = os.read(sys.stdin.fileno(), 1024)
+            if data:
+                stream.write(data)
+        except OSError:
+            pass
+
     async def run(self) -> ToolResult:
         """Run command in PTY and stream output."""
-        # Create PTY pair
-        self.master_fd, self.slave_fd = pty.openpty()
+        loop = asyncio.get_running_loop()
+        stream: Optional[PTYStream] = None
+        terminal = False
+        old_settings = None
 
         # Save old signal handler to restore later
         old_handler = signal.getsignal(signal.SIGWINCH)
 
         try:
-            # Save current terminal settings
-            old_settings = termios.tcgetattr(sys.stdin)
-
-            # Start process with slave PTY
             # SECURITY: Use shlex.split instead of shell=True
-            import shlex
-
-            args = shlex.split(self.command)
-            self.process = subprocess.Popen(
-                args,
-                shell=False,
-                stdin=self.slave_fd,
-                stdout=self.slave_fd,
-                stderr=self.slave_fd,
-                cwd=self.cwd,
-                env=self.env,
-                preexec_fn=os.setsid,  # New session
-            )
+            stream = PTYStream(shlex.split(self.command), cwd=self.cwd, env=self.env)
+            await stream.start()
+            terminal = sys.stdin.isatty()
+            self.master_fd, self.process = stream.master_fd, stream.process
 
-            # Close slave fd in parent
-            os.close(self.slave_fd)
-            self.slave_fd = None
+            if terminal:
+                # Save current terminal settings, then set raw mode for host terminal
+                old_settings = termios.tcgetattr(sys.stdin)
+                tty.setraw(sys.stdin.fileno())
 
-            # Set raw mode for host terminal
-            tty.setraw(sys.stdin.fileno())
+                # Register SIGWINCH handler and set initial size
+                signal.signal(signal.SIGWINCH, lambda signum, frame: self._set_window_size())
+                self._set_window_size()
 
-            # Register SIGWINCH handler
-            signal.signal(signal.SIGWINCH, lambda signum, frame: self._set_window_size())
-            # Set initial size
-            self._set_window_size()
+                loop.add_reader(sys.stdin.fileno(), self._forward_stdin, stream)
 
             # Output buffer for result
             output_buffer = []
+            async for data in stream:
+                # Write to host stdout and capture for result
+                os.write(sys.stdout.fileno(), data)
+                output_buffer.append(data)
 
-            # Event loop for I/O
-            while self.process.poll() is None:
-                r, w, x = select.select([self.master_fd, sys.stdin], [], [], 0.1)
-
-                if self.master_fd in r:
-                    # Read from process
-                    try:
-                        # Increased buffer size to 64KB (Performance Fix)
-                        data = os.read(self.master_fd, 65536)
-                        if data:
-                            # Write to host stdout
-                            os.write(sys.stdout.fileno(), data)
-                            # Capture for result
-                            output_buffer.append(data.decode(errors="replace"))
-                    except OSError:
-                        break
-
-                if sys.stdin in r:
-                    # Read from user
-                    try:
-                        data = os.read(sys.stdin.fileno(), 1024)
-                        if data:
-                            # Write to process
-                            os.write(self.master_fd, data)
-                    except OSError:
-                        break
-
-            # Restore terminal settings
-            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-
-            # Ensure process is finished and get exit code
-            # Added timeout to prevent hanging (Safety Fix)
-            try:
-                self.process.wait(timeout=5.0)
-            except subprocess.TimeoutExpired:
-                logger.warning("Process wait timed out, forcing kill")
-                self.process.kill()
-                self.process.wait()
+            returncode = await stream.wait()
 
             return ToolResult(
-                success=self.process.returncode == 0,
+                success=returncode == 0,
                 data={
-                    "stdout": "".join(output_buffer),
+                    "stdout": b"".join(output_buffer).decode(errors="replace"),
                     "stderr": "",  # Merged into stdout in PTY
-                    "exit_code": self.process.returncode,
+                    "exit_code": returncode,
                 },
                 metadata={"pty": True},
             )
@@ -307,20 +274,23 @@ class PTYExecutor:
             return ToolResult(success=False, error=str(e))
 
         finally:
-            # Cleanup
-            if self.master_fd:
-                os.close(self.master_fd)
-            if self.slave_fd:
-                os.close(self.slave_fd)
+            if terminal:
+                loop.remove_reader(sys.stdin.fileno())
+
+            # Kills the process group if still running (e.g. on cancel) and closes the PTY
+            if stream is not None:
+                await stream.aclose()
+            self.master_fd = None
 
             # Restore original signal handler (Side-Effect Fix)
             signal.signal(signal.SIGWINCH, old_handler)
 
             # Ensure terminal settings restored
-            try:
-                termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-            except (termios.error, ValueError, OSError):
-                pass
+            if old_settings is not None:
+                try:
+                    termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
+                except (termios.error, ValueError, OSError):
+                    pass
 
 
 class BashCommandToolHardened(ValidatedTool):
@@ -431,6 +401,61 @@ class BashCommandToolHardened(ValidatedTool):
             logger.error(f"Failed to set resource limits: {e}")
             # Don't fail here, limits are best-effort on some systems
 
+    @staticmethod
+    def _build_env(env: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """Start with clean environment, add safe defaults, then user vars."""
+        exec_env = os.environ.copy()
+        exec_env["BASH_ENV"] = ""  # No startup files
+        exec_env["ENV"] = ""
+        exec_env["PATH"] = "/usr/local/bin:/usr/bin:/bin"  # Restricted PATH
+
+        if env:
+            # Filter out dangerous env vars
+            safe_env = {
+                k: v
+                for k, v in env.items()
+                if k not in ["LD_PRELOAD", "LD_LIBRARY_PATH", "BASH_ENV"]
+            }
+            exec_env.update(safe_env)
+        return exec_env
+
+    async def stream(
+        self,
+        command: str,
+        cwd: Optional[str] = None,
+        timeout: Optional[int] = None,
+        env: Optional[Dict[str, str]] = None,
+    ) -> PTYStream:
+        """Start a validated command on a PTY and return its output stream.
+
+        Same validation, environment and resource limits as execute(); the
+        timeout and output cap kill the process group instead of waiting.
+        Use as ``async with await tool.stream(cmd) as out: async for chunk in out``.
+
+        Raises:
+            ValueError: If the command or working directory is rejected
+        """
+        is_valid, error_msg = self.validator.validate(command)
+        if not is_valid:
+            logger.error(f"VALIDATION FAILED: {error_msg}")
+            raise ValueError(f"Command validation failed: {error_msg}")
+        if cwd:
+            cwd = self.validator.sanitize_path(cwd)
+            if not Path(cwd).is_dir():
+                raise ValueError(f"Not a directory: {cwd}")
+
+        actual_timeout = min(timeout or self.limits.timeout_seconds, self.limits.timeout_seconds)
+        logger.info(f"STREAMING: {command} (timeout={actual_timeout}s, cwd={cwd or 'CWD'})")
+        stream = PTYStream(
+            command,
+            cwd,
+            self._build_env(env),
+            timeout=actual_timeout,
+            max_output_bytes=self.limits.max_output_bytes,
+            preexec_fn=self._setup_resource_limits,
+        )
+        return await stream.start()
+
     async def _execute_validated(
         self,
         command: str,
@@ -475,26 +500,16 @@ class BashCommandToolHardened(ValidatedTool):
         actual_timeout = min(timeout or self.limits.timeout_seconds, self.limits.timeout_seconds)
 
         # 4. SETUP ENVIRONMENT
-        # Start with clean environment, add safe defaults, then user vars
-        exec_env = os.environ.copy()
-        exec_env["BASH_ENV"] = ""  # No startup files
-        exec_env["ENV"] = ""
-        exec_env["PATH"] = "/usr/local/bin:/usr/bin:/bin"  # Restricted PATH
-
-        if env:
-            # Filter out dangerous env vars
-            safe_env = {
-                k: v
-                for k, v in env.items()
-                if k not in ["LD_PRELOAD", "LD_LIBRARY_PATH", "BASH_ENV"]
-            }
-            exec_env.update(safe_env)
+        exec_env = self._build_env(env)
 
         # 5. INTERACTIVE PTY EXECUTION
         if interactive:
             logger.info(f"EXECUTING INTERACTIVE: {command}")
             pty_exec = PTYExecutor(command, cwd, exec_env)
-            return await pty_exec.run()
+            try:
+                return await pty_exec.run()
+            finally:
+                clear_cached_results()  # The command may have written anywhere
 
         # 6. STANDARD EXECUTION PHASE
         try:
@@ -594,6 +609,9 @@ class BashCommandToolHardened(ValidatedTool):
                 metadata={"exception": str(e)},
             )
 
+        finally:
+            clear_cached_results()  # The command may have written anywhere
+
 
 # Alias for backward compatibility
 BashCommandTool = BashCommandToolHardened
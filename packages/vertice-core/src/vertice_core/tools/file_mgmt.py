@@ -6,6 +6,7 @@ from typing import Any, Dict
 
 from .base import ToolResult, ToolCategory
 from .validated import ValidatedTool
+from .caching import invalidate_cached_paths
 from ..core.validation import (
     Required,
 )
@@ -55,6 +56,7 @@ class MoveFileTool(ValidatedTool):
                 return ToolResult(success=False, error=f"Destination exists: {destination}")
 
             shutil.move(str(src), str(dst))
+            invalidate_cached_paths(src, dst)
 
             return ToolResult(
                 success=True,
@@ -102,6 +104,7 @@ class CopyFileTool(ValidatedTool):
                 shutil.copytree(str(src), str(dst))
             else:
                 shutil.copy2(str(src), str(dst))
+            invalidate_cached_paths(dst)
 
             return ToolResult(
                 success=True,
@@ -143,6 +146,7 @@ class CreateDirectoryTool(ValidatedTool):
                 return ToolResult(success=False, error=f"Directory already exists: {path}")
 
             dir_path.mkdir(parents=recursive, exist_ok=False)
+            invalidate_cached_paths(dir_path)
 
             return ToolResult(
                 success=True, data=f"Created directory: {path}", metadata={"path": str(dir_path)}
@@ -282,6 +286,7 @@ class InsertLinesTool(ValidatedTool):
 
             # Write back
             file_path.write_text("\n".join(lines))
+            invalidate_cached_paths(file_path)
 
             return ToolResult(
                 success=True,
@@ -1,5 +1,6 @@
 """File operation tools - read, write, edit files."""
 
+import asyncio
 import shutil
 from pathlib import Path
 from typing import Optional, Dict, Any, List
@@ -8,7 +9,19 @@ import logging
 
 from .base import ToolResult, ToolCategory
 from .validated import ValidatedTool
+from .caching import cache_tool_result, invalidate_cached_paths
+from ..async_utils.files import (
+    LARGE_FILE_THRESHOLD,
+    PREVIEW_BYTES,
+    count_lines,
+    read_file,
+    read_head,
+    read_lines,
+    write_atomic,
+)
+from ..core.blob_store import save_backup
 from ..core.validation import Required, TypeCheck
+from ..core.workspace_snapshot import DirEntry, get_workspace_snapshot
 from .smart_match import smart_find, apply_replacement, MatchType
 
 logger = logging.getLogger(__name__)
@@ -44,6 +57,7 @@ class ReadFileTool(ValidatedTool):
             "line_range": TypeCheck((list, tuple, type(None)), "line_range"),
         }
 
+    @cache_tool_result(ttl_seconds=300, path_args=("path",))
     async def _execute_validated(
         self, path: str, line_range: Optional[tuple] = None, **kwargs
     ) -> ToolResult:
@@ -57,14 +71,24 @@ class ReadFileTool(ValidatedTool):
             if not file_path.is_file():
                 return ToolResult(success=False, error=f"Path is not a file: {path}")
 
-            content = file_path.read_text()
-            lines = content.split("\n")
+            size = file_path.stat().st_size
+            truncated = False
 
-            # Apply line range if specified
             if line_range and len(line_range) == 2:
+                # Seek straight to the requested lines (1-indexed, inclusive)
                 start, end = line_range
-                lines = lines[start - 1 : end]  # 1-indexed
-                content = "\n".join(lines)
+                line_slice = await read_lines(file_path, start, end)
+                content = line_slice.content
+                line_count = line_slice.line_count
+                total_lines = line_slice.total_lines
+            elif size > LARGE_FILE_THRESHOLD:
+                # Huge file: bounded preview instead of loading it whole
+                content, truncated = await read_head(file_path, PREVIEW_BYTES)
+                line_count = content.count("\n") + 1
+                total_lines = await count_lines(file_path)
+            else:
+                content = await read_file(file_path)
+                line_count = total_lines = content.count("\n") + 1
 
             # Detect language
             suffix = file_path.suffix.lstrip(".")
@@ -82,14 +106,25 @@ class ReadFileTool(ValidatedTool):
             }
             language = lang_map.get(suffix, suffix or "text")
 
+            data = {"content": content, "lines": line_count, "path": str(file_path)}
+            if truncated:
+                data["truncated"] = True
+                data["total_lines"] = total_lines
+                data["note"] = (
+                    f"File is {size // (1024 * 1024)} MB; showing the first {line_count} "
+                    f"of {total_lines} lines. Use line_range to read other parts."
+                )
+
             return ToolResult(
                 success=True,
-                data={"content": content, "lines": len(lines), "path": str(file_path)},
+                data=data,
                 metadata={
                     "path": str(file_path),
-                    "lines": len(lines),
+                    "lines": line_count,
+                    "total_lines": total_lines,
+                    "truncated": truncated,
                     "language": language,
-                    "size": file_path.stat().st_size,
+                    "size": size,
                 },
             )
         except Exception as e:
@@ -130,7 +165,7 @@ class WriteFileTool(ValidatedTool):
                 if preview and console:
                     from ..tui.components.preview import EditPreview
 
-                    original_content = file_path.read_text()
+                    original_content = await read_file(file_path)
                     preview_component = EditPreview()
                     accepted = await preview_component.show_diff_interactive(
                         original_content=original_content,
@@ -151,11 +186,10 @@ class WriteFileTool(ValidatedTool):
                         error=f"File already exists: {path}. Use edit_file to modify.",
                     )
 
-            # Create parent directories if needed
-            if create_dirs and not file_path.parent.exists():
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-
-            file_path.write_text(content)
+            write_result = await write_atomic(file_path, content, create_dirs=create_dirs)
+            if not write_result.success:
+                return ToolResult(success=False, error=write_result.error)
+            invalidate_cached_paths(file_path)
 
             result = ToolResult(
                 success=True,
@@ -313,17 +347,15 @@ Example: [{"search": "def old_func():", "replace": "def new_func():"}]""",
                 return ToolResult(success=False, error=f"File not found: {path}")
 
             # Read current content
-            original_content = file_path.read_text()
+            original_content = await read_file(file_path)
             modified_content = original_content
 
-            # Create backup
-            backup_path = None
+            # Create backup (delta-encoded blob ref, restorable via RestoreBackupTool)
+            backup_ref = backup_blob = None
             if create_backup:
-                backup_dir = Path(".qwen_backups")
-                backup_dir.mkdir(exist_ok=True)
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                backup_path = backup_dir / f"{file_path.name}.{timestamp}.bak"
-                backup_path.write_text(original_content)
+                backup_ref, backup_blob = await asyncio.to_thread(
+                    save_backup, file_path, original_content
+                )
 
             # Apply edits with smart matching
             changes = 0
@@ -412,8 +444,11 @@ Example: [{"search": "def old_func():", "replace": "def new_func():"}]""",
                         error="Edit cancelled by user",
                     )
 
-            # Write modified content
-            file_path.write_text(modified_content)
+            # Write modified content (temp + fsync + rename, off the event loop)
+            write_result = await write_atomic(file_path, modified_content, create_dirs=False)
+            if not write_result.success:
+                return ToolResult(success=False, error=write_result.error)
+            invalidate_cached_paths(file_path)
 
             # Build result message
             result_msg = f"Applied {changes} edit(s) to {path}"
@@ -425,7 +460,8 @@ Example: [{"search": "def old_func():", "replace": "def new_func():"}]""",
                 data=result_msg,
                 metadata={
                     "path": str(file_path),
-                    "backup": str(backup_path) if backup_path else None,
+                    "backup": backup_ref,
+                    "backup_blob": backup_blob,
                     "changes": changes,
                     "lines_before": len(original_content.split("\n")),
                     "lines_after": len(modified_content.split("\n")),
@@ -506,6 +542,8 @@ class ListDirectoryTool(ValidatedTool):
     def get_validators(self):
         return {}
 
+    # Writes below path invalidate; other changes deeper than its own entries only expire
+    @cache_tool_result(ttl_seconds=30, path_args=("path",))
     async def _execute_validated(
         self, path: str = ".", recursive: bool = False, pattern: Optional[str] = None, **kwargs
     ) -> ToolResult:
@@ -519,34 +557,30 @@ class ListDirectoryTool(ValidatedTool):
             if not dir_path.is_dir():
                 return ToolResult(success=False, error=f"Path is not a directory: {path}")
 
-            # List files
-            if pattern:
-                if recursive:
-                    files = list(dir_path.rglob(pattern))
-                else:
-                    files = list(dir_path.glob(pattern))
+            # Multi-component patterns need pathlib's matcher
+            if pattern and ("/" in pattern or "**" in pattern):
+                matches = dir_path.rglob(pattern) if recursive else dir_path.glob(pattern)
+                entries = [(f, _stat_entry(f)) for f in matches]
             else:
-                if recursive:
-                    files = list(dir_path.rglob("*"))
-                else:
-                    files = list(dir_path.glob("*"))
+                # Listings are shared across tools and revalidated by directory mtime
+                entries = get_workspace_snapshot().glob(dir_path, pattern or "*", recursive)
 
             # Format results
             file_list = []
             dir_list = []
 
-            for f in files:
-                if f.name.startswith("."):
+            for f, entry in entries:
+                if entry.name.startswith("."):
                     continue  # Skip hidden files
 
                 info = {
-                    "name": f.name,
+                    "name": entry.name,
                     "path": str(f.relative_to(dir_path)),
-                    "type": "directory" if f.is_dir() else "file",
-                    "size": f.stat().st_size if f.is_file() else 0,
+                    "type": "directory" if entry.is_dir else "file",
+                    "size": entry.size,
                 }
 
-                if f.is_dir():
+                if entry.is_dir:
                     dir_list.append(info)
                 else:
                     file_list.append(info)
@@ -564,6 +598,13 @@ class ListDirectoryTool(ValidatedTool):
             return ToolResult(success=False, error=str(e))
 
 
+def _stat_entry(path: Path) -> DirEntry:
+    """Describe a path the way WorkspaceSnapshot listings do."""
+    is_dir = path.is_dir()
+    size = path.stat().st_size if path.is_file() else 0
+    return DirEntry(path.name, is_dir, path.is_symlink(), size, 0)
+
+
 class DeleteFileTool(ValidatedTool):
     """Delete file (moves to .trash for safety)."""
 
@@ -597,6 +638,7 @@ class DeleteFileTool(ValidatedTool):
                     shutil.rmtree(file_path)
                 else:
                     file_path.unlink()
+                invalidate_cached_paths(file_path)
 
                 return ToolResult(
                     success=True,
@@ -612,6 +654,7 @@ class DeleteFileTool(ValidatedTool):
                 trash_path = trash_dir / f"{file_path.name}.{timestamp}"
 
                 shutil.move(str(file_path), str(trash_path))
+                invalidate_cached_paths(file_path, trash_path)
 
                 return ToolResult(
                     success=True,
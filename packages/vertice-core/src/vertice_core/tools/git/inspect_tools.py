@@ -20,6 +20,7 @@ import re
 import subprocess
 from typing import Dict, List
 
+from vertice_core.core.workspace_snapshot import get_workspace_snapshot
 from vertice_core.tools.base import Tool, ToolCategory, ToolResult
 
 logger = logging.getLogger(__name__)
@@ -57,6 +58,35 @@ async def run_git_command(*args: str, timeout: int = 30) -> ToolResult:
         return ToolResult(success=False, error=str(e))
 
 
+async def run_snapshot_git_command(*args: str, timeout: int = 30) -> ToolResult:
+    """
+    Run a read-only git command through the shared workspace snapshot.
+
+    Output is reused until the index, HEAD or working tree changes.
+
+    Args:
+        *args: Git command arguments (without 'git')
+        timeout: Command timeout in seconds
+
+    Returns:
+        ToolResult with stdout/stderr
+    """
+    try:
+        result = get_workspace_snapshot().git(".", *args, timeout=timeout)
+        return ToolResult(
+            success=result.returncode == 0,
+            data=result.stdout,
+            error=result.stderr if result.returncode != 0 else None,
+        )
+    except subprocess.TimeoutExpired:
+        return ToolResult(success=False, error=f"Git command timed out after {timeout}s")
+    except FileNotFoundError:
+        return ToolResult(success=False, error="Git is not installed or not in PATH")
+    except Exception as e:
+        logger.error(f"Git command failed: {e}")
+        return ToolResult(success=False, error=str(e))
+
+
 # =============================================================================
 # GIT STATUS ENHANCED
 # =============================================================================
@@ -96,11 +126,11 @@ class GitStatusEnhancedTool(Tool):
 
         try:
             # Get current branch
-            branch_result = await run_git_command("rev-parse", "--abbrev-ref", "HEAD")
+            branch_result = await run_snapshot_git_command("rev-parse", "--abbrev-ref", "HEAD")
             current_branch = branch_result.data.strip() if branch_result.success else "unknown"
 
             # Get status (porcelain v2 for machine parsing)
-            status_result = await run_git_command("status", "--porcelain=v2", "--branch")
+            status_result = await run_snapshot_git_command("status", "--porcelain=v2", "--branch")
 
             if not status_result.success:
                 return ToolResult(success=False, error=status_result.error)
@@ -5,6 +5,7 @@ from typing import Optional
 
 from .base import ToolResult, ToolCategory
 from .validated import ValidatedTool
+from ..core.workspace_snapshot import get_workspace_snapshot
 
 
 class GitStatusTool(ValidatedTool):
@@ -29,57 +30,24 @@ class GitStatusTool(ValidatedTool):
     async def _execute_validated(self, path: str = ".") -> ToolResult:
         """Get git status."""
         try:
-            # Get branch
-            result = subprocess.run(
-                ["git", "-C", path, "rev-parse", "--abbrev-ref", "HEAD"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            branch = result.stdout.strip() if result.returncode == 0 else "unknown"
-
-            # Get status
-            result = subprocess.run(
-                ["git", "-C", path, "status", "--porcelain"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
+            # Shared with the other exploration tools; reused until the tree changes
+            status = get_workspace_snapshot().git_status(path)
 
-            if result.returncode != 0:
+            if status is None:
                 return ToolResult(success=False, error="Not a git repository or git not available")
 
-            lines = result.stdout.split("\n") if result.stdout else []
-
-            modified = []
-            untracked = []
-            staged = []
-
-            for line in lines:
-                if not line or not line.strip():
-                    continue
-                if len(line) < 3:
-                    continue
-                status = line[:2]
-                filename = line[3:].strip()  # Strip whitespace
-
-                if status[0] in ["M", "A", "D", "R"]:
-                    staged.append(filename)
-                if status[1] == "M":
-                    modified.append(filename)
-                if status == "??":
-                    untracked.append(filename)
+            modified, untracked, staged = status.modified, status.untracked, status.staged
 
             return ToolResult(
                 success=True,
                 data={
-                    "branch": branch,
+                    "branch": status.branch,
                     "modified": modified,
                     "untracked": untracked,
                     "staged": staged,
                 },
                 metadata={
-                    "branch": branch,
+                    "branch": status.branch,
                     "total_changes": len(modified) + len(untracked) + len(staged),
                 },
             )
@@ -0,0 +1,400 @@
+"""
+Tool Manifest - Precompiled tool schemas for lazy registration.
+
+``tool_manifest.json`` records every tool in TOOL_GROUPS: its name,
+description, parameters, category and JSON schema, the module and class
+implementing it, and the third-party packages that module imports.
+Registries built from the manifest hold LazyTool placeholders. Schemas and
+metadata come from the manifest, and the tool module is imported and the
+tool instantiated only on first use.
+
+Regenerate after changing a tool's name, description or parameters:
+
+    python -m vertice_core.tools.manifest           # rewrite the manifest
+    python -m vertice_core.tools.manifest --check   # exit 1 on drift
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import copy
+import importlib
+import importlib.util
+import json
+import logging
+import sys
+import threading
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from vertice_core.tools.base import BaseTool, ToolRegistry, ToolResult
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_PATH = Path(__file__).with_name("tool_manifest.json")
+MANIFEST_VERSION = 1
+
+# Tools constructible without arguments, by the group that registers them
+TOOL_GROUPS: Dict[str, List[str]] = {
+    # ToolCatalog.add_defaults()
+    "defaults": [
+        "vertice_core.tools.file_ops:ReadFileTool",
+        "vertice_core.tools.file_ops:WriteFileTool",
+        "vertice_core.tools.file_ops:EditFileTool",
+        "vertice_core.tools.file_ops:ListDirectoryTool",
+        "vertice_core.tools.file_ops:DeleteFileTool",
+        "vertice_core.tools.file_mgmt:MoveFileTool",
+        "vertice_core.tools.file_mgmt:CopyFileTool",
+        "vertice_core.tools.file_mgmt:CreateDirectoryTool",
+        "vertice_core.tools.file_mgmt:ReadMultipleFilesTool",
+        "vertice_core.tools.file_mgmt:InsertLinesTool",
+        "vertice_core.tools.terminal:CdTool",
+        "vertice_core.tools.terminal:LsTool",
+        "vertice_core.tools.terminal:PwdTool",
+        "vertice_core.tools.terminal:MkdirTool",
+        "vertice_core.tools.terminal:RmTool",
+        "vertice_core.tools.terminal:CpTool",
+        "vertice_core.tools.terminal:MvTool",
+        "vertice_core.tools.terminal:TouchTool",
+        "vertice_core.tools.terminal:CatTool",
+        "vertice_core.tools.exec_hardened:BashCommandTool",
+        "vertice_core.tools.search:SearchFilesTool",
+        "vertice_core.tools.search:GetDirectoryTreeTool",
+        "vertice_core.tools.git_ops:GitStatusTool",
+        "vertice_core.tools.git_ops:GitDiffTool",
+        "vertice_core.tools.context:GetContextTool",
+        "vertice_core.tools.context:SaveSessionTool",
+        "vertice_core.tools.context:RestoreBackupTool",
+    ],
+    # ToolCatalog.add_web_tools()
+    "web": [
+        "vertice_core.tools.web_search:WebSearchTool",
+        "vertice_core.tools.web_search:SearchDocumentationTool",
+        "vertice_core.tools.web_access:FetchURLTool",
+        "vertice_core.tools.web_access:DownloadFileTool",
+        "vertice_core.tools.web_access:HTTPRequestTool",
+        "vertice_core.tools.web_access:PackageSearchTool",
+    ],
+    # setup_default_tools() categories
+    "file_ops": [
+        "vertice_core.tools.file_ops:ReadFileTool",
+        "vertice_core.tools.file_ops:WriteFileTool",
+        "vertice_core.tools.file_ops:EditFileTool",
+        "vertice_core.tools.file_mgmt:CreateDirectoryTool",
+        "vertice_core.tools.file_mgmt:MoveFileTool",
+        "vertice_core.tools.file_mgmt:CopyFileTool",
+    ],
+    "bash": ["vertice_core.tools.exec:BashCommandTool"],
+    "search": [
+        "vertice_core.tools.search:SearchFilesTool",
+        "vertice_core.tools.search:GetDirectoryTreeTool",
+    ],
+    "git": [
+        "vertice_core.tools.git_ops:GitStatusTool",
+        "vertice_core.tools.git_ops:GitDiffTool",
+    ],
+    "think": ["vertice_core.tools.think_tool:ThinkTool"],
+}
+
+
+@dataclass
+class ToolSpec:
+    """Manifest entry for one tool."""
+
+    name: str
+    description: str
+    module: str
+    class_name: str
+    parameters: Dict[str, Any]
+    schema: Dict[str, Any]
+    category: Optional[str] = None
+    requires_approval: bool = False
+    requires: List[str] = field(default_factory=list)  # Third-party imports of the module
+
+    @property
+    def target(self) -> str:
+        return f"{self.module}:{self.class_name}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ToolSpec":
+        return cls(**data)
+
+
+class LazyTool(BaseTool):
+    """
+    Registry placeholder that serves a tool's manifest entry until first use.
+
+    Schema, name, description, parameters and category come from the
+    manifest. Executing the tool, or reading any other attribute, imports
+    and instantiates the real tool once and delegates to it.
+    """
+
+    def __init__(self, spec: ToolSpec):
+        self._tool: Optional[BaseTool] = None
+        self._lock = threading.Lock()
+        self.spec = spec
+        self.name = spec.name
+        self.description = spec.description
+        self.parameters = spec.parameters
+        self.category = spec.category
+        self.requires_approval = spec.requires_approval
+
+    @property
+    def loaded(self) -> bool:
+        return self._tool is not None
+
+    def load(self) -> BaseTool:
+        """Import and instantiate the real tool (once)."""
+        if self._tool is None:
+            with self._lock:
+                if self._tool is None:
+                    tool = load_tool_class(self.spec.target)()
+                    tool.name = self.spec.name
+                    self._tool = tool
+        return self._tool
+
+    def get_schema(self) -> Dict[str, Any]:
+        # Fresh containers, as BaseTool.get_schema() builds; leaf values are shared
+        schema = self.spec.schema
+        parameters = schema.get("parameters")
+        if not isinstance(parameters, dict):
+            return copy.deepcopy(schema)
+        return {
+            **schema,
+            "parameters": {
+                **parameters,
+                "properties": {k: dict(v) for k, v in parameters.get("properties", {}).items()},
+                "required": list(parameters.get("required", [])),
+            },
+        }
+
+    def execute(self, **kwargs: Any) -> ToolResult:
+        return self.load().execute(**kwargs)
+
+    def validate(self, **kwargs: Any) -> ToolResult:
+        return self.load().validate(**kwargs)
+
+    async def _execute_validated(self, **kwargs: Any) -> ToolResult:
+        try:
+            tool = self.load()
+        except Exception as e:
+            logger.error(f"Failed to load tool {self.spec.target}: {e}")
+            return ToolResult(success=False, error=f"Tool '{self.name}' unavailable: {e}")
+        return await tool._execute_validated(**kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes the manifest does not provide
+        if name.startswith("__") or name in ("_tool", "_lock", "spec"):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "lazy"
+        return f"LazyTool({self.spec.target}, {state})"
+
+
+def load_tool_class(target: str) -> Type[BaseTool]:
+    """Import the class named by a ``module:Class`` target."""
+    module_name, class_name = target.split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+@lru_cache(maxsize=8)
+def _read_manifest(path: str) -> Dict[str, Any]:
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if data.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported tool manifest version: {data.get('version')}")
+    return data
+
+
+def load_manifest(path: Optional[Path] = None) -> Dict[str, ToolSpec]:
+    """
+    Load manifest entries keyed by ``module:Class`` target.
+
+    Returns an empty dict (every tool then loads eagerly) when the manifest
+    is missing or unreadable.
+    """
+    try:
+        data = _read_manifest(str(path or MANIFEST_PATH))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Tool manifest unavailable, tools load eagerly: {e}")
+        return {}
+    return {target: ToolSpec.from_dict(entry) for target, entry in data["tools"].items()}
+
+
+def _missing_requirements(spec: ToolSpec) -> List[str]:
+    return [name for name in spec.requires if importlib.util.find_spec(name) is None]
+
+
+def register_group(registry: ToolRegistry, group: str, path: Optional[Path] = None) -> List[str]:
+    """
+    Register a TOOL_GROUPS group, lazily where the manifest has the tool.
+
+    Tools missing from the manifest are imported and instantiated now.
+
+    Returns:
+        Errors (``group/Class: reason``) for tools that were not registered.
+    """
+    manifest = load_manifest(path)
+    errors = []
+    for target in TOOL_GROUPS[group]:
+        class_name = target.split(":")[1]
+        spec = manifest.get(target)
+        try:
+            if spec is None:
+                registry.register(load_tool_class(target)())
+                continue
+            missing = _missing_requirements(spec)
+            if missing:
+                raise ImportError(f"No module named {missing[0]!r}")
+            registry.register(LazyTool(spec))
+        except Exception as e:
+            errors.append(f"{group}/{class_name}: {e}")
+    return errors
+
+
+def _module_requirements(module: Any) -> List[str]:
+    """Third-party packages imported unconditionally at the module's top level."""
+    source = Path(module.__file__).read_text(encoding="utf-8")
+    names = set()
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            names.add(node.module.split(".")[0])
+    stdlib = getattr(sys, "stdlib_module_names", frozenset())
+    return sorted(n for n in names if n not in stdlib and n not in ("vertice_core", "__future__"))
+
+
+def describe_tool(target: str) -> ToolSpec:
+    """Build a manifest entry by importing and instantiating the tool."""
+    tool_class = load_tool_class(target)
+    registry = ToolRegistry()
+    registry.register(tool_class())
+    [(name, tool)] = registry.get_all().items()
+
+    module_name, class_name = target.split(":")
+    category = getattr(tool, "category", None)
+    category = getattr(category, "value", category)
+    return ToolSpec(
+        name=name,
+        description=tool.description,
+        module=module_name,
+        class_name=class_name,
+        parameters=json.loads(json.dumps(tool.parameters, default=str)),
+        schema=json.loads(json.dumps(tool.get_schema(), default=str)),
+        category=None if category is None else str(category),
+        requires_approval=bool(getattr(tool, "requires_approval", False)),
+        requires=_module_requirements(sys.modules[module_name]),
+    )
+
+
+def build_manifest(
+    previous: Optional[Dict[str, Any]] = None,
+) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Describe every tool in TOOL_GROUPS.
+
+    Tools that cannot be imported here keep their entry from ``previous``.
+
+    Returns:
+        (manifest, errors)
+    """
+    old_tools = (previous or {}).get("tools", {})
+    tools: Dict[str, Any] = {}
+    errors = []
+    for target in sorted({t for targets in TOOL_GROUPS.values() for t in targets}):
+        try:
+            tools[target] = describe_tool(target).to_dict()
+        except Exception as e:
+            errors.append(f"{target}: {e}")
+            if target in old_tools:
+                tools[target] = old_tools[target]
+    return {"version": MANIFEST_VERSION, "groups": TOOL_GROUPS, "tools": tools}, errors
+
+
+def check_manifest(path: Optional[Path] = None) -> List[str]:
+    """
+    Compare the manifest with the tool code.
+
+    Tools that cannot be imported in this environment are not compared.
+
+    Returns:
+        Descriptions of every difference (empty when up to date).
+    """
+    path = path or MANIFEST_PATH
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        return [f"{path}: unreadable ({e})"]
+
+    drift = []
+    if data.get("version") != MANIFEST_VERSION:
+        drift.append(f"version {data.get('version')} != {MANIFEST_VERSION}")
+    if data.get("groups") != TOOL_GROUPS:
+        drift.append("groups differ from TOOL_GROUPS")
+
+    stored = data.get("tools", {})
+    targets = {t for targets in TOOL_GROUPS.values() for t in targets}
+    for target in sorted(set(stored) - targets):
+        drift.append(f"{target}: not in TOOL_GROUPS")
+    for target in sorted(targets):
+        try:
+            current = describe_tool(target).to_dict()
+        except Exception as e:
+            logger.info(f"Cannot verify {target} here: {e}")
+            continue
+        if target not in stored:
+            drift.append(f"{target}: missing")
+            continue
+        changed = sorted(k for k in current if current[k] != stored[target].get(k))
+        if changed:
+            drift.append(f"{target}: stale {', '.join(changed)}")
+    return drift
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate or check the tool manifest.")
+    parser.add_argument("--check", action="store_true", help="exit 1 if the manifest is stale")
+    parser.add_argument("--path", type=Path, default=MANIFEST_PATH)
+    args = parser.parse_args(argv)
+
+    if args.check:
+        drift = check_manifest(args.path)
+        for line in drift:
+            print(f"drift: {line}")
+        if drift:
+            print("Run: python -m vertice_core.tools.manifest")
+        return 1 if drift else 0
+
+    previous = json.loads(args.path.read_text(encoding="utf-8")) if args.path.exists() else None
+    manifest, errors = build_manifest(previous)
+    for line in errors:
+        print(f"skipped: {line}")
+    args.path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    print(f"Wrote {len(manifest['tools'])} tools to {args.path}")
+    return 0
+
+
+__all__ = [
+    "MANIFEST_PATH",
+    "TOOL_GROUPS",
+    "ToolSpec",
+    "LazyTool",
+    "load_manifest",
+    "load_tool_class",
+    "register_group",
+    "describe_tool",
+    "build_manifest",
+    "check_manifest",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,245 @@
+"""Asyncio-native PTY process streams.
+
+PTYStream runs a command on a pseudo-terminal and streams its output
+through an async iterator, with no thread or select loop per command:
+
+- The PTY master fd is registered with the event loop's reader, so output
+  is read only when the kernel says it is ready.
+- Backpressure: once ``max_buffered_chunks`` chunks are waiting, the reader
+  is removed. The PTY buffer then fills and the child blocks on write until
+  the consumer catches up.
+- The timeout is a single ``call_later`` and the output cap is checked per
+  read. Either one, or cancelling the consumer, kills the whole process
+  group.
+
+Example:
+    >>> async with PTYStream("yes | head -n 3", timeout=5) as stream:
+    ...     async for chunk in stream:
+    ...         print(chunk)
+    >>> stream.returncode
+    0
+"""
+
+import asyncio
+import collections
+import logging
+import os
+import pty
+import signal
+from typing import Callable, Deque, Dict, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+READ_SIZE = 65536
+
+
+class PTYStream:
+    """A command running on a PTY, read as an async iterator of byte chunks."""
+
+    def __init__(
+        self,
+        command: Union[str, Sequence[str]],
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+        *,
+        timeout: Optional[float] = None,
+        max_output_bytes: Optional[int] = None,
+        max_buffered_chunks: int = 16,
+        preexec_fn: Optional[Callable[[], None]] = None,
+    ):
+        """Configure the stream; call ``start()`` (or ``async with``) to run it.
+
+        Args:
+            command: Shell command string, or an argv list run without a shell
+            cwd: Working directory
+            env: Environment (default: inherit)
+            timeout: Seconds before the process group is killed
+            max_output_bytes: Output beyond this is dropped and the group killed
+            max_buffered_chunks: Unread chunks before reading pauses
+            preexec_fn: Run in the child before exec (e.g. resource limits)
+        """
+        self.command = command
+        self.cwd = cwd
+        self.env = env
+        self.timeout = timeout
+        self.max_output_bytes = max_output_bytes
+        self.max_buffered_chunks = max(1, max_buffered_chunks)
+        self.preexec_fn = preexec_fn
+
+        self.master_fd: Optional[int] = None
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.bytes_read = 0
+        self.timed_out = False
+        self.truncated = False
+        self.cancelled = False
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._chunks: Deque[bytes] = collections.deque()
+        self._waiter: Optional[asyncio.Future] = None
+        self._reading = False
+        self._eof = False
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def returncode(self) -> Optional[int]:
+        return self.process.returncode if self.process else None
+
+    async def start(self) -> "PTYStream":
+        """Spawn the command in a new session attached to a fresh PTY."""
+        self._loop = asyncio.get_running_loop()
+        master_fd, slave_fd = pty.openpty()
+        try:
+            kwargs = dict(
+                stdin=slave_fd,
+                stdout=slave_fd,
+                stderr=slave_fd,
+                cwd=self.cwd,
+                env=self.env,
+                start_new_session=True,  # Own process group, killed as a unit
+                preexec_fn=self.preexec_fn,
+            )
+            if isinstance(self.command, str):
+                self.process = await asyncio.create_subprocess_shell(self.command, **kwargs)
+            else:
+                self.process = await asyncio.create_subprocess_exec(*self.command, **kwargs)
+        except BaseException:
+            os.close(master_fd)
+            raise
+        finally:
+            os.close(slave_fd)
+
+        os.set_blocking(master_fd, False)
+        self.master_fd = master_fd
+        self._resume_reading()
+        if self.timeout is not None:
+            self._timer = self._loop.call_later(self.timeout, self._on_timeout)
+        return self
+
+    # -- reader callback -------------------------------------------------------
+
+    def _resume_reading(self) -> None:
+        if not self._reading and not self._eof:
+            self._loop.add_reader(self.master_fd, self._on_readable)
+            self._reading = True
+
+    def _pause_reading(self) -> None:
+        if self._reading:
+            self._loop.remove_reader(self.master_fd)
+            self._reading = False
+
+    def _on_readable(self) -> None:
+        try:
+            data = os.read(self.master_fd, READ_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:  # EIO: every slave fd is closed
+            data = b""
+        if not data:
+            self._finish()
+            return
+
+        cap = self.max_output_bytes
+        if cap is not None and self.bytes_read + len(data) > cap:
+            data = data[: cap - self.bytes_read]
+            self.truncated = True
+        self.bytes_read += len(data)
+        if data:
+            self._chunks.append(data)
+            if len(self._chunks) >= self.max_buffered_chunks:
+                self._pause_reading()
+        if self.truncated:
+            logger.warning(f"PTY output cap reached ({self.max_output_bytes} bytes)")
+            self.kill()
+            self._finish()
+        self._wake()
+
+    def _finish(self) -> None:
+        self._pause_reading()
+        self._eof = True
+        self._wake()
+
+    def _wake(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def _on_timeout(self) -> None:
+        logger.warning(f"PTY command timed out after {self.timeout}s")
+        self.timed_out = True
+        self.kill()
+
+    # -- consumer side -----------------------------------------------------------
+
+    def __aiter__(self) -> "PTYStream":
+        return self
+
+    async def __anext__(self) -> bytes:
+        while not self._chunks:
+            if self._eof:
+                raise StopAsyncIteration
+            self._waiter = self._loop.create_future()
+            try:
+                await self._waiter
+            except asyncio.CancelledError:
+                self.cancelled = True
+                self.kill()
+                raise
+            finally:
+                self._waiter = None
+
+        chunk = self._chunks.popleft()
+        if len(self._chunks) <= self.max_buffered_chunks // 2:
+            self._resume_reading()
+        return chunk
+
+    async def read_all(self) -> bytes:
+        """Read until EOF and return everything."""
+        return b"".join([chunk async for chunk in self])
+
+    def write(self, data: bytes) -> int:
+        """Send input to the command's terminal."""
+        return os.write(self.master_fd, data)
+
+    async def wait(self) -> int:
+        """Wait for the process to exit; kills the group if the wait is cancelled."""
+        try:
+            return await self.process.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            self.kill()
+            raise
+        finally:
+            if self.process.returncode is not None and self._timer is not None:
+                self._timer.cancel()
+
+    def kill(self) -> None:
+        """SIGKILL the whole process group (no-op once it has exited)."""
+        if self.process is None or self.process.returncode is not None:
+            return
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    async def aclose(self) -> None:
+        """Kill the group if still running, reap it and close the PTY."""
+        if self.process is None:
+            return
+        self.kill()
+        if self._timer is not None:
+            self._timer.cancel()
+        if self.master_fd is not None:
+            self._pause_reading()
+            self._eof = True
+            self._wake()
+            os.close(self.master_fd)
+            self.master_fd = None
+        await self.process.wait()
+
+    async def __aenter__(self) -> "PTYStream":
+        return self if self.process is not None else await self.start()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+
+__all__ = ["PTYStream"]
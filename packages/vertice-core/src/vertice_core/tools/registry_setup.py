@@ -20,6 +20,7 @@ from typing import List, Optional, Tuple
 import logging
 
 from vertice_core.tools.base import ToolRegistry
+from vertice_core.tools.manifest import register_group
 from vertice_core.core.mcp_client import MCPClient
 
 logger = logging.getLogger(__name__)
@@ -85,6 +86,8 @@ def setup_default_tools(
         ... )
 
     Note:
+        - Built-in tools come from the precompiled tool manifest: schemas are
+          served from it and each tool module is imported on first use
         - Tools are registered with their default names (e.g., 'read_file')
         - Duplicate registrations are handled safely (last wins)
         - Empty registry is valid but agents may fail if they need tools
@@ -94,80 +97,47 @@ def setup_default_tools(
 
     # File Operations Tools
     if include_file_ops:
-        try:
-            # Import tools dynamically to avoid circular imports
-            from vertice_core.tools.file_ops import ReadFileTool, WriteFileTool, EditFileTool
-            from vertice_core.tools.file_mgmt import CreateDirectoryTool, MoveFileTool, CopyFileTool
-
-            file_tools = [
-                ReadFileTool(),
-                WriteFileTool(),
-                EditFileTool(),
-                CreateDirectoryTool(),
-                MoveFileTool(),
-                CopyFileTool(),
-            ]
-
-            for tool in file_tools:
-                registry.register(tool)
-                tools_registered += 1
-
-            logger.debug(f"Registered {tools_registered} file operation tools")
-
-        except ImportError as e:
-            logger.error(f"Failed to import file operation tools: {e}")
+        count, errors = _register_group(registry, "file_ops")
+        tools_registered += count
+        logger.debug(f"Registered {count} file operation tools")
+        if errors:
+            logger.error(f"Failed to load file operation tools: {errors}")
             # Don't raise - allow partial setup
             logger.warning("Continuing without file operation tools")
 
     # Bash Execution Tool
     if include_bash:
-        try:
-            from vertice_core.tools.exec import BashCommandTool
-
-            tool = BashCommandTool()
-            registry.register(tool)
-            tools_registered += 1
-            logger.debug("Registered bash command tool")
-
-        except ImportError as e:
-            logger.error(f"Failed to import bash tool: {e}")
+        count, errors = _register_group(registry, "bash")
+        tools_registered += count
+        if errors:
+            logger.error(f"Failed to load bash tool: {errors}")
             raise ImportError(
-                f"Bash command tool not available: {e}. Ensure vertice_core is properly installed."
+                f"Bash command tool not available: {errors[0]}. "
+                "Ensure vertice_core is properly installed."
             )
+        logger.debug("Registered bash command tool")
 
     # Search and Tree Tools
     if include_search:
-        try:
-            from vertice_core.tools.search import SearchFilesTool, GetDirectoryTreeTool
-
-            for tool_class in [SearchFilesTool, GetDirectoryTreeTool]:
-                tool = tool_class()
-                registry.register(tool)
-                tools_registered += 1
-
-            logger.debug("Registered 2 search tools")
-
-        except ImportError as e:
-            logger.error(f"Failed to import search tools: {e}")
+        count, errors = _register_group(registry, "search")
+        tools_registered += count
+        if errors:
+            logger.error(f"Failed to load search tools: {errors}")
             raise ImportError(
-                f"Search tools not available: {e}. Ensure vertice_core is properly installed."
+                f"Search tools not available: {errors[0]}. "
+                "Ensure vertice_core is properly installed."
             )
+        logger.debug(f"Registered {count} search tools")
 
     # Git Operations Tools
     if include_git:
-        try:
-            from vertice_core.tools.git_ops import GitStatusTool, GitDiffTool
-
-            for tool_class in [GitStatusTool, GitDiffTool]:
-                tool = tool_class()
-                registry.register(tool)
-                tools_registered += 1
-
-            logger.debug("Registered 2 git tools")
-
-        except ImportError as e:
+        count, errors = _register_group(registry, "git")
+        tools_registered += count
+        if errors:
             # Git tools são opcionais, só avisar
-            logger.warning(f"Git tools not available: {e}")
+            logger.warning(f"Git tools not available: {errors}")
+        else:
+            logger.debug(f"Registered {count} git tools")
 
     # PROMETHEUS Tools
     if include_prometheus:
@@ -209,15 +179,12 @@ def setup_default_tools(
 
     # Think Tool (Reasoning)
     if include_think:
-        try:
-            from vertice_core.tools.think_tool import ThinkTool
-
-            tool = ThinkTool()
-            registry.register(tool)
-            tools_registered += 1
+        count, errors = _register_group(registry, "think")
+        tools_registered += count
+        if errors:
+            logger.warning(f"Think tool not available: {errors}")
+        else:
             logger.debug("Registered Think tool")
-        except ImportError as e:
-            logger.warning(f"Think tool not available: {e}")
 
     # Custom Tools
     if custom_tools:
@@ -242,6 +209,13 @@ def setup_default_tools(
     return registry, mcp
 
 
+def _register_group(registry: ToolRegistry, group: str) -> Tuple[int, List[str]]:
+    """Register a manifest group lazily; returns (tools registered, errors)."""
+    before = len(registry.tools)
+    errors = register_group(registry, group)
+    return len(registry.tools) - before, errors
+
+
 def setup_minimal_tools() -> Tuple[ToolRegistry, MCPClient]:
     """Setup with only essential tools (read, write, edit files).
 
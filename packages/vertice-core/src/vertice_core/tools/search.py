@@ -9,8 +9,9 @@ from pathlib import Path
 from typing import Optional
 
 from .base import ToolResult, ToolCategory
-from .validated import ValidatedTool
 from .caching import cache_tool_result
+from .validated import ValidatedTool
+from ..core.workspace_snapshot import get_workspace_snapshot
 
 
 class SearchFilesTool(ValidatedTool):
@@ -56,6 +57,7 @@ class SearchFilesTool(ValidatedTool):
             "max_results": lambda v: v is None or (isinstance(v, int) and 0 < v <= 1000),
         }
 
+    @cache_tool_result(ttl_seconds=30, path_args=("path",))
     async def _execute_validated(
         self,
         pattern: str,
@@ -221,7 +223,6 @@ class GetDirectoryTreeTool(ValidatedTool):
             "max_depth": lambda v: v is None or (isinstance(v, int) and 0 < v <= 10),
         }
 
-    @cache_tool_result(ttl_seconds=300)
     async def _execute_validated(self, path: str = ".", max_depth: int = 3) -> ToolResult:
         """Get directory tree."""
         try:
@@ -230,6 +231,9 @@ class GetDirectoryTreeTool(ValidatedTool):
             if not dir_path.is_dir():
                 return ToolResult(success=False, error=f"Not a directory: {path}")
 
+            # Listings are shared across tools and revalidated by directory mtime
+            snapshot = get_workspace_snapshot()
+
             def build_tree(dir_path: Path, prefix: str = "", depth: int = 0) -> list[str]:
                 """Recursively build tree structure."""
                 if depth > max_depth:
@@ -237,15 +241,14 @@ class GetDirectoryTreeTool(ValidatedTool):
 
                 lines = []
                 try:
-                    items = sorted(dir_path.iterdir(), key=lambda x: (not x.is_dir(), x.name))
-
                     # Skip hidden and common ignored directories
                     items = [
                         x
-                        for x in items
+                        for x in snapshot.list_dir(dir_path)
                         if not x.name.startswith(".")
                         and x.name not in ["__pycache__", "node_modules", "venv"]
                     ]
+                    items.sort(key=lambda x: (not x.is_dir, x.name))
 
                     for i, item in enumerate(items):
                         is_last = i == len(items) - 1
@@ -253,11 +256,13 @@ class GetDirectoryTreeTool(ValidatedTool):
                         next_prefix = "    " if is_last else "│   "
 
                         lines.append(
-                            f"{prefix}{current_prefix}{item.name}{'/' if item.is_dir() else ''}"
+                            f"{prefix}{current_prefix}{item.name}{'/' if item.is_dir else ''}"
                         )
 
-                        if item.is_dir():
-                            lines.extend(build_tree(item, prefix + next_prefix, depth + 1))
+                        if item.is_dir:
+                            lines.extend(
+                                build_tree(dir_path / item.name, prefix + next_prefix, depth + 1)
+                            )
                 except PermissionError as e:
                     logger.debug(f"Permission denied in directory tree: {e}")
 
@@ -8,6 +8,8 @@ from urllib.parse import urlparse
 import httpx
 from bs4 import BeautifulSoup
 
+from vertice_core.async_utils.http_clients import get_http_clients
+
 from .base import ToolResult, ToolCategory
 from .validated import ValidatedTool
 
@@ -66,7 +68,7 @@ class PackageSearchTool(ValidatedTool):
                 url = f"https://registry.npmjs.org/{package_name}"
 
             # Fetch package data
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with get_http_clients().httpx_client(timeout=10.0) as client:
                 resp = await client.get(url)
 
             if resp.status_code == 404:
@@ -186,7 +188,7 @@ class FetchURLTool(ValidatedTool):
             logger.info(f"Fetching URL: {url}")
 
             # Fetch content
-            async with httpx.AsyncClient(
+            async with get_http_clients().httpx_client(
                 timeout=30.0,
                 follow_redirects=True,
                 headers={"User-Agent": "Mozilla/5.0 (compatible; QwenDevCLI/1.0)"},
@@ -315,7 +317,9 @@ class DownloadFileTool(ValidatedTool):
             logger.info(f"Downloading {url} to {dest_path}")
 
             # Download file
-            async with httpx.AsyncClient(timeout=60.0, follow_redirects=True) as client:
+            async with get_http_clients().httpx_client(
+                timeout=60.0, follow_redirects=True
+            ) as client:
                 async with client.stream("GET", url) as resp:
                     resp.raise_for_status()
 
@@ -457,7 +461,7 @@ class HTTPRequestTool(ValidatedTool):
                     request_kwargs["content"] = body
 
             # Make request
-            async with httpx.AsyncClient() as client:
+            async with get_http_clients().httpx_client(timeout=5.0) as client:
                 resp = await client.request(**request_kwargs)
 
             # Parse response
@@ -272,6 +272,12 @@ class VerticeApp(App):
         # This loads providers and tool schemas without blocking the UI rendering
         self.run_worker(self.bridge.warmup(), name="bridge_warmup", group="system")
 
+    async def on_unmount(self) -> None:
+        """Drain in-flight HTTP requests and close the shared connection pool."""
+        from vertice_core.async_utils.http_clients import close_http_clients
+
+        await close_http_clients(timeout=2.0)
+
     async def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle user input submission with robust validation and error handling."""
         status = None
@@ -566,6 +572,7 @@ class VerticeApp(App):
     ) -> None:
         """Handle natural language chat via Gemini Open Responses streaming."""
         from vertice_core.tui.core.openresponses_events import (
+            OpenResponsesEvent,
             OpenResponsesParser,
             OpenResponsesOutputTextDeltaEvent,
         )
@@ -590,25 +597,31 @@ class VerticeApp(App):
         if perf is not None:
             perf.t_worker_start = time.perf_counter()
 
+        async def dispatch(event: OpenResponsesEvent) -> None:
+            if perf is not None and isinstance(event, OpenResponsesOutputTextDeltaEvent):
+                if perf.t_first_text_delta is None:
+                    perf.t_first_text_delta = time.perf_counter()
+                perf.text_chars += len(event.delta)
+            await view.handle_open_responses_event(event)
+
         try:
-            # bridge.chat primarily yields Open Responses SSE blocks, but some internal
-            # components may still emit plain text (e.g. tool execution summaries).
+            # bridge.chat yields typed Open Responses events in-process (no SSE
+            # encode/parse per token), but some internal components may still emit
+            # plain text or SSE strings (e.g. tool execution summaries, agents).
             # Keep the UI resilient by treating non-SSE lines as text deltas.
-            async for sse_chunk in self.bridge.chat(message):
+            async for sse_chunk in self.bridge.chat(message, as_events=True):
                 if perf is not None and perf.t_first_sse is None:
                     perf.t_first_sse = time.perf_counter()
 
+                if not isinstance(sse_chunk, str):
+                    await dispatch(OpenResponsesEvent.from_stream_event(sse_chunk))
+                    continue
+
                 # SSE chunks may contain multiple lines
                 for line in sse_chunk.splitlines(keepends=True):
                     event = parser.feed(line)
                     if event:
-                        if perf is not None and isinstance(
-                            event, OpenResponsesOutputTextDeltaEvent
-                        ):
-                            if perf.t_first_text_delta is None:
-                                perf.t_first_text_delta = time.perf_counter()
-                            perf.text_chars += len(event.delta)
-                        await view.handle_open_responses_event(event)
+                        await dispatch(event)
                         continue
 
                     # Non-SSE passthrough: allow legacy/plain text chunks to render.
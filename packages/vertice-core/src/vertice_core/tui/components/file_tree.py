@@ -21,11 +21,13 @@ Philosophy:
 Created: 2025-11-19 00:45 UTC
 """
 
-from typing import List, Optional, Dict, Set
+from typing import Any, Callable, List, Optional, Dict, Set
 from dataclasses import dataclass, field
 from pathlib import Path
 from enum import Enum
 import logging
+import os
+import subprocess
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +37,7 @@ from rich.tree import Tree
 from rich.panel import Panel
 from rich import box
 
+from ...core.workspace_snapshot import DirEntry, get_workspace_snapshot
 from ..theme import COLORS
 
 
@@ -172,6 +175,21 @@ def detect_file_type(path: Path) -> FileType:
     return type_map.get(suffix, FileType.UNKNOWN)
 
 
+def _parse_git_code(code: str) -> Optional[GitStatus]:
+    """Map a porcelain XY status code to a GitStatus."""
+    if code == "??":
+        return GitStatus.UNTRACKED
+    if "R" in code:
+        return GitStatus.RENAMED
+    if "D" in code:
+        return GitStatus.DELETED
+    if code[0] == "A":
+        return GitStatus.ADDED
+    if "M" in code:
+        return GitStatus.MODIFIED
+    return None
+
+
 class FileTree:
     """
     Interactive collapsible file tree.
@@ -227,10 +245,10 @@ class FileTree:
 
         return self.root_node
 
-    def _build_node(self, path: Path, depth: int) -> FileNode:
-        """Build node recursively."""
-        is_dir = path.is_dir()
-        file_type = detect_file_type(path)
+    def _build_node(self, path: Path, depth: int, entry: Optional[DirEntry] = None) -> FileNode:
+        """Build node recursively (children from the shared workspace snapshot)."""
+        is_dir = entry.is_dir if entry is not None else path.is_dir()
+        file_type = FileType.DIRECTORY if is_dir else detect_file_type(path)
 
         node = FileNode(
             name=path.name or str(path),
@@ -239,21 +257,22 @@ class FileTree:
             is_dir=is_dir,
             depth=depth,
             expanded=str(path) in self.expanded_paths,
+            size=entry.size if entry is not None and not is_dir else None,
         )
 
         # Build children for directories
         if is_dir and depth < self.max_depth:
             try:
-                for child_path in sorted(path.iterdir()):
+                for child in get_workspace_snapshot().list_dir(path):
                     # Skip hidden files
-                    if not self.show_hidden and child_path.name.startswith("."):
+                    if not self.show_hidden and child.name.startswith("."):
                         continue
 
                     # Skip ignored patterns
-                    if child_path.name in self.ignore_patterns:
+                    if child.name in self.ignore_patterns:
                         continue
 
-                    child_node = self._build_node(child_path, depth + 1)
+                    child_node = self._build_node(path / child.name, depth + 1, child)
                     node.add_child(child_node)
             except PermissionError as e:
                 logger.debug(f"Permission denied for {node.path}: {e}")
@@ -261,10 +280,30 @@ class FileTree:
         return node
 
     def _load_git_status(self) -> None:
-        """Load git status for files."""
-        # Git status detection deferred - requires gitpython dependency
-        # For now, just placeholder
-        pass
+        """Load git status for files from the shared workspace snapshot."""
+        self.git_status_cache.clear()
+        try:
+            status = get_workspace_snapshot().git_status(self.root_path)
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.debug(f"Git status unavailable for {self.root_path}: {e}")
+            return
+        if status is None:
+            return
+
+        for code, rel_path in status.entries:
+            git_status = _parse_git_code(code)
+            if git_status is not None:
+                # Renames are reported as "old -> new"
+                file_path = status.root / rel_path.split(" -> ")[-1]
+                self.git_status_cache[os.path.abspath(file_path)] = git_status
+
+        if self.git_status_cache and self.root_node is not None:
+            self._apply_git_status(self.root_node)
+
+    def _apply_git_status(self, node: FileNode) -> None:
+        node.git_status = self.git_status_cache.get(os.path.abspath(node.path))
+        for child in node.children:
+            self._apply_git_status(child)
 
     def toggle_node(self, node: FileNode) -> None:
         """Toggle expand/collapse for node."""
@@ -381,11 +420,39 @@ class FileTree:
         self.root_node = None
         self.build_tree()
 
+    def attach_watcher(self, watcher: Any) -> Callable[[], None]:
+        """Rebuild lazily (on next render) when a shared FileWatcher reports changes.
+
+        The tree subscribes to every file type without widening what the
+        watcher's other subscribers receive.
+
+        Returns:
+            The watcher's unsubscribe function
+        """
+        from ...core.file_watcher import ALL_FILES
+
+        return watcher.subscribe(self._on_file_events, extensions={ALL_FILES})
+
+    def _on_file_events(self, events: List[Any]) -> None:
+        root = str(self.root_path.resolve())
+        prefix = root.rstrip(os.sep) + os.sep
+        for event in events:
+            path = str(Path(event.path).resolve())
+            if path == root or path.startswith(prefix):
+                self.root_node = None
+                return
+
 
 def create_file_tree(
     root_path: str, console: Console, max_depth: int = 3, show_hidden: bool = False
 ) -> FileTree:
-    """Create configured file tree."""
-    return FileTree(
+    """Create configured file tree, rebuilt when the shared FileWatcher sees changes."""
+    from ...core.file_watcher import get_file_watcher
+
+    tree = FileTree(
         root_path=Path(root_path), console=console, max_depth=max_depth, show_hidden=show_hidden
     )
+    watcher = get_file_watcher(root_path)
+    tree.attach_watcher(watcher)
+    watcher.start_polling()
+    return tree
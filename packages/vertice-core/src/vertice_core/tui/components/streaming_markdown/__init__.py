@@ -19,6 +19,7 @@ Architecture:
     - types.py: RenderMode, PerformanceMetrics
     - renderers.py: Specialized block renderers
     - factory.py: BlockWidgetFactory
+    - block_cache.py: BlockRenderCache (finalized blocks rendered once)
     - fps_controller.py: AdaptiveFPSController
     - widget.py: StreamingMarkdownWidget
     - panel.py: StreamingMarkdownPanel
@@ -53,6 +54,7 @@ from .renderers import (
 
 # Factory
 from .factory import BlockWidgetFactory
+from .block_cache import BlockRenderCache, CachedBlockRenderable
 
 # FPS Controller
 from .fps_controller import AdaptiveFPSController
@@ -76,6 +78,8 @@ __all__ = [
     "STATUS_BADGE_STYLES",
     # Factory
     "BlockWidgetFactory",
+    "BlockRenderCache",
+    "CachedBlockRenderable",
     # FPS Controller
     "AdaptiveFPSController",
     # Widgets
@@ -0,0 +1,92 @@
+"""
+Streaming Markdown Block Cache - Render finalized blocks once.
+
+BlockDetector guarantees a finalized block never changes, so its Rich
+output can be rendered once per width and replayed on every later frame.
+Only the in-progress block is rebuilt while streaming.
+
+Philosophy:
+    "Never paint the same pixel twice."
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterable, List
+
+from rich.console import Console, ConsoleOptions, RenderableType, RenderResult
+from rich.measure import Measurement
+from rich.segment import Segment
+
+from .types import PerformanceMetrics
+
+if TYPE_CHECKING:
+    from ..block_detector import BlockInfo
+    from .factory import BlockWidgetFactory
+
+
+class CachedBlockRenderable:
+    """Renderable that renders its block once per width and replays the segments."""
+
+    def __init__(self, renderable: RenderableType, metrics: PerformanceMetrics) -> None:
+        self._renderable = renderable
+        self._metrics = metrics
+        self._lines: Dict[int, List[List[Segment]]] = {}
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        width = options.max_width
+        lines = self._lines.get(width)
+        if lines is None:
+            self._metrics.block_cache_misses += 1
+            lines = console.render_lines(self._renderable, options.update(height=None), pad=False)
+            self._lines[width] = lines
+        else:
+            self._metrics.block_cache_hits += 1
+
+        new_line = Segment.line()
+        for line in lines:
+            yield from line
+            yield new_line
+
+    def __rich_measure__(self, console: Console, options: ConsoleOptions) -> Measurement:
+        return Measurement.get(console, options, self._renderable)
+
+
+class BlockRenderCache:
+    """
+    Cached renderables for the finalized blocks of one stream.
+
+    Blocks are keyed by position: the detector only ever appends blocks, so
+    index ``i`` names the same block until ``reset()``. A complete block may
+    follow one that is still in progress, so the cache can have gaps.
+    """
+
+    def __init__(self, factory: "BlockWidgetFactory", metrics: PerformanceMetrics) -> None:
+        self._factory = factory
+        self.metrics = metrics
+        self._finalized: Dict[int, CachedBlockRenderable] = {}
+
+    def render(self, blocks: Iterable["BlockInfo"]) -> List[RenderableType]:
+        """Renderables for all blocks; only unfinished blocks are rebuilt."""
+        renderables: List[RenderableType] = []
+        for index, block in enumerate(blocks):
+            if not block.is_complete:
+                renderables.append(self._factory.render_block(block))
+                continue
+            cached = self._finalized.get(index)
+            if cached is None:
+                cached = self._finalized[index] = CachedBlockRenderable(
+                    self._factory.render_block(block), self.metrics
+                )
+            renderables.append(cached)
+        return renderables
+
+    def reset(self, metrics: PerformanceMetrics) -> None:
+        """Drop cached blocks (new stream)."""
+        self.metrics = metrics
+        self._finalized.clear()
+
+    def __len__(self) -> int:
+        return len(self._finalized)
+
+
+__all__ = ["CachedBlockRenderable", "BlockRenderCache"]
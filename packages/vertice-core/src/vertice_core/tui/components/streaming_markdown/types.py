@@ -31,6 +31,15 @@ class PerformanceMetrics:
     dropped_frames: int = 0
     fallback_count: int = 0
 
+    # Frame time: building the frame's renderable and handing it to the display
+    last_frame_time_ms: float = 0.0
+    max_frame_time_ms: float = 0.0
+
+    # Finalized blocks: cache hits replay stored segments, misses render with Rich
+    block_cache_hits: int = 0
+    block_cache_misses: int = 0
+    coalesced_chunks: int = 0  # Chunks folded into an already scheduled frame
+
     @property
     def avg_render_time_ms(self) -> float:
         """Calculate average render time in milliseconds."""
@@ -38,6 +47,21 @@ class PerformanceMetrics:
             return 0.0
         return self.total_render_time_ms / self.frames_rendered
 
+    @property
+    def block_cache_hit_rate(self) -> float:
+        """Fraction of finalized-block renders served from cache."""
+        total = self.block_cache_hits + self.block_cache_misses
+        return self.block_cache_hits / total if total > 0 else 0.0
+
+    def record_frame(self, frame_time_ms: float, budget_ms: float) -> None:
+        """Record one rendered frame."""
+        self.frames_rendered += 1
+        self.total_render_time_ms += frame_time_ms
+        self.last_frame_time_ms = frame_time_ms
+        self.max_frame_time_ms = max(self.max_frame_time_ms, frame_time_ms)
+        if frame_time_ms > budget_ms:
+            self.dropped_frames += 1
+
     @property
     def current_fps(self) -> float:
         """Return current FPS."""
@@ -11,6 +11,7 @@ Features:
 - Automatic fallback to plain text when FPS < 25
 - Pulsing cursor at end of content
 - Widget Factory for specialized blocks
+- Finalized blocks rendered once (BlockRenderCache); one render task per frame
 
 AIR GAPS CORRECTED:
 - [x] BlockWidgetFactory renders specialized blocks
@@ -41,6 +42,7 @@ from ..block_detector import BlockDetector, BlockInfo, BlockType
 
 from .types import RenderMode, PerformanceMetrics
 from .factory import BlockWidgetFactory
+from .block_cache import BlockRenderCache
 from .fps_controller import AdaptiveFPSController
 
 
@@ -143,9 +145,8 @@ class StreamingMarkdownWidget(Widget):
         self.frame_budget = 1.0 / target_fps  # 33.33ms for 30 FPS
         self.enable_adaptive_fps = enable_adaptive_fps
 
-        # State
-        self._content = ""
-        self._buffer = ""
+        # State: content kept as a chunk list, joined lazily (see _content)
+        self._chunks: List[str] = []
         self._cursor_index = 0
         self._last_render = time.perf_counter()
 
@@ -153,6 +154,7 @@ class StreamingMarkdownWidget(Widget):
         self._render_buffer = ""  # Back buffer for preparing next frame
         self._display_buffer = ""  # Front buffer currently displayed
         self._buffer_ready = False  # Flag for buffer swap
+        self._prepare_time_ms = 0.0  # Time spent building the back buffer
 
         # Viewport Buffering for large content
         self._viewport_start = 0
@@ -165,6 +167,7 @@ class StreamingMarkdownWidget(Widget):
         self._fps_controller = AdaptiveFPSController()
         self._metrics = PerformanceMetrics()
         self._widget_factory = BlockWidgetFactory()
+        self._block_cache = BlockRenderCache(self._widget_factory, self._metrics)
 
         # Internal markdown widget
         self._markdown_static: Optional[Static] = None
@@ -175,6 +178,16 @@ class StreamingMarkdownWidget(Widget):
         # Cursor animation task
         self._cursor_task: Optional[asyncio.Task] = None
 
+        # At most one pending frame; chunks arriving before it runs are coalesced
+        self._render_task: Optional[asyncio.Task] = None
+
+    @property
+    def _content(self) -> str:
+        """Full content; the chunk list is collapsed on read so joins stay amortized."""
+        if len(self._chunks) > 1:
+            self._chunks[:] = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
     def compose(self) -> ComposeResult:
         """Compose the widget."""
         self._markdown_static = Static("", id="markdown-content")
@@ -187,8 +200,7 @@ class StreamingMarkdownWidget(Widget):
     async def start_stream(self) -> None:
         """Start a streaming session."""
         self.is_streaming = True
-        self._content = ""
-        self._buffer = ""
+        self._chunks = []
         self._render_buffer = ""
         self._display_buffer = ""
         self._buffer_ready = False
@@ -199,8 +211,10 @@ class StreamingMarkdownWidget(Widget):
         self._fps_controller.reset()
         self._widget_factory.reset()
         self._metrics = PerformanceMetrics()
+        self._block_cache.reset(self._metrics)
         self._finalized_blocks_count = 0
         self._last_render = time.perf_counter()
+        self._prepare_time_ms = 0.0
 
         self.add_class("streaming")
         self.post_message(self.StreamStarted())
@@ -218,8 +232,7 @@ class StreamingMarkdownWidget(Widget):
         if not self.is_streaming:
             return
 
-        self._buffer += chunk
-        self._content += chunk
+        self._chunks.append(chunk)
 
         # Update line cache for viewport buffering
         self._update_line_cache(chunk)
@@ -237,17 +250,24 @@ class StreamingMarkdownWidget(Widget):
             self.current_block_type = current.block_type
             self.post_message(self.BlockDetected(current.block_type, current))
 
-        # Double buffering: Prepare render in background
-        if not self._buffer_ready:
-            asyncio.create_task(self._prepare_render_buffer())
+        self._finalized_blocks_count = len(self._block_detector.blocks)
+        self._schedule_render()
 
-        # Check if should update display (respecting frame budget)
-        now = time.perf_counter()
-        elapsed = now - self._last_render
-
-        if elapsed >= self.frame_budget:
-            await self._swap_and_render()
-            self._last_render = now
+    def _schedule_render(self) -> None:
+        """Schedule the next frame unless one is already pending."""
+        if self._render_task is not None and not self._render_task.done():
+            self._metrics.coalesced_chunks += 1
+            return
+        self._render_task = asyncio.create_task(self._render_next_frame())
+
+    async def _render_next_frame(self) -> None:
+        """Wait out the rest of the frame budget, then prepare and show one frame."""
+        delay = self.frame_budget - (time.perf_counter() - self._last_render)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await self._prepare_render_buffer()
+        await self._swap_and_render()
+        self._last_render = time.perf_counter()
 
     async def _render_frame(self) -> None:
         """Render a frame."""
@@ -285,11 +305,7 @@ class StreamingMarkdownWidget(Widget):
 
         # Update metrics
         render_time = (time.perf_counter() - render_start) * 1000
-        self._metrics.frames_rendered += 1
-        self._metrics.total_render_time_ms += render_time
-
-        if render_time > self.frame_budget * 1000:
-            self._metrics.dropped_frames += 1
+        self._metrics.record_frame(render_time, self.frame_budget * 1000)
 
     def _update_line_cache(self, chunk: str) -> None:
         """Update line cache for viewport buffering."""
@@ -304,32 +320,14 @@ class StreamingMarkdownWidget(Widget):
 
     async def _prepare_render_buffer(self) -> None:
         """Prepare next frame in background buffer (Double Buffering)."""
+        prepare_start = time.perf_counter()
         try:
-            # Calculate viewport content
-            viewport_end = min(self._viewport_start + self._viewport_size, self._total_lines)
-            viewport_lines = self._line_cache[self._viewport_start : viewport_end]
-            viewport_content = "\n".join(viewport_lines)
-
-            # Create renderable for viewport
-            if self.render_mode == RenderMode.PLAIN_TEXT:
-                renderable = self._create_plain_text_renderable()
-            else:
-                # Use viewport content for rendering
-                temp_content = self._content
-                self._content = viewport_content
-                try:
-                    renderable = self._create_block_based_renderable()
-                finally:
-                    self._content = temp_content
-
-            # Store in back buffer
-            self._render_buffer = renderable
-            self._buffer_ready = True
-
+            self._render_buffer = self._create_renderable()
         except Exception as _:
             # Fallback to simple rendering
             self._render_buffer = Text(self._content[:1000] + "...")
-            self._buffer_ready = True
+        self._buffer_ready = True
+        self._prepare_time_ms = (time.perf_counter() - prepare_start) * 1000
 
     async def _swap_and_render(self) -> None:
         """Swap buffers and render (Double Buffering)."""
@@ -343,17 +341,9 @@ class StreamingMarkdownWidget(Widget):
             if self._markdown_static:
                 self._markdown_static.update(self._display_buffer)
 
-            # Update metrics
-            render_time = (time.perf_counter() - render_start) * 1000
-            self._metrics.frames_rendered += 1
-            self._metrics.total_render_time_ms += render_time
-
-            if render_time > self.frame_budget * 1000:
-                self._metrics.dropped_frames += 1
-
-            # Start preparing next buffer
-            if self.is_streaming:
-                asyncio.create_task(self._prepare_render_buffer())
+            # Update metrics (frame time includes preparing the back buffer)
+            render_time = (time.perf_counter() - render_start) * 1000 + self._prepare_time_ms
+            self._metrics.record_frame(render_time, self.frame_budget * 1000)
         else:
             # No buffer ready, render directly (fallback)
             await self._render_frame()
@@ -407,13 +397,8 @@ class StreamingMarkdownWidget(Widget):
                 content += self.CURSOR_FRAMES[self._cursor_index]
             return RichMarkdown(content) if content else Text("")
 
-        # Render each block with specialized widget
-        renderables: List[RenderableType] = []
-
-        for block in blocks:
-            # Use Widget Factory to render specialized block
-            rendered = self._widget_factory.render_block(block)
-            renderables.append(rendered)
+        # Finalized blocks come from the cache; only the in-progress one is rebuilt
+        renderables: List[RenderableType] = self._block_cache.render(blocks)
 
         # Add cursor at end if streaming
         if self.is_streaming and self.show_cursor:
@@ -430,10 +415,8 @@ class StreamingMarkdownWidget(Widget):
         while self.is_streaming:
             self._cursor_index = (self._cursor_index + 1) % len(self.CURSOR_FRAMES)
 
-            # Force re-render for cursor
-            if self._markdown_static:
-                renderable = self._create_renderable()
-                self._markdown_static.update(renderable)
+            # Re-render for cursor (coalesced with chunk-driven frames)
+            self._schedule_render()
 
             await asyncio.sleep(self.CURSOR_INTERVAL)
 
@@ -451,6 +434,15 @@ class StreamingMarkdownWidget(Widget):
                 pass
             self._cursor_task = None
 
+        # Drop any pending frame; the final render below supersedes it
+        if self._render_task:
+            self._render_task.cancel()
+            try:
+                await self._render_task
+            except asyncio.CancelledError:
+                pass
+            self._render_task = None
+
         # Final render
         await self._render_frame()
 
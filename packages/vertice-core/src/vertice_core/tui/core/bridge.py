@@ -18,7 +18,7 @@ import os
 import threading
 import time
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
 # Core systems
 from vertice_core.tui.core.resilience import AsyncLock
@@ -38,6 +38,9 @@ from .parallel_executor import ParallelExecutionResult, ParallelToolExecutor
 from .chat import ChatController, ChatConfig
 from .protocol_bridge import ProtocolBridgeMixin
 
+if TYPE_CHECKING:
+    from vertice_core.openresponses_stream import StreamEvent
+
 # Managers
 from .managers import (
     TodoManager,
@@ -520,8 +523,14 @@ Working directory: {os.getcwd()}"""
             logger.warning(f"Agentic system prompt failed, using fallback: {e}")
             return self._build_fallback_system_prompt()
 
-    async def chat(self, message: str, auto_route: bool = True) -> AsyncIterator[str]:
-        """Handle chat message with streaming response and circuit breaker protection."""
+    async def chat(
+        self, message: str, auto_route: bool = True, as_events: bool = False
+    ) -> AsyncIterator[Union[str, "StreamEvent"]]:
+        """Handle chat message with streaming response and circuit breaker protection.
+
+        With as_events=True the LLM stream is yielded as typed StreamEvent
+        objects instead of SSE text; status and tool output stay strings.
+        """
         import asyncio
 
         # Circuit breaker check
@@ -578,6 +587,7 @@ Working directory: {os.getcwd()}"""
             system_prompt=system_prompt,
             provider_name=provider_name if self._provider_manager.mode == "auto" else "",
             skip_routing=skip_routing,
+            as_events=as_events,
         ):
             yield chunk
 
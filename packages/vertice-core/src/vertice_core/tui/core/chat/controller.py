@@ -16,7 +16,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from vertice_core.openresponses_stream import OutputTextDeltaEvent, StreamEvent
 
 from ..llm_client import ToolCallParser
 from ..parsing.stream_filter import StreamFilter
@@ -209,7 +211,8 @@ class ChatController:
         client: LLMClientProtocol,
         message: str,
         system_prompt: str,
-    ) -> AsyncIterator[str]:
+        as_events: bool = False,
+    ) -> AsyncIterator[Union[str, StreamEvent]]:
         """Run the agentic tool execution loop with ThoughtSignatures.
 
         Implements Gemini 3-style reasoning continuity:
@@ -221,6 +224,7 @@ class ChatController:
             client: LLM client
             message: Current message
             system_prompt: System instructions
+            as_events: Yield typed StreamEvent objects instead of SSE text
 
         Yields:
             Response chunks
@@ -252,17 +256,21 @@ class ChatController:
             StreamFilter()
 
             # Stream using Open Responses protocol
+            stream_kwargs: Dict[str, Any] = {"as_events": True} if as_events else {}
             async for sse_event in client.stream_open_responses(
                 current_message,
                 system_prompt=system_prompt,
                 context=self.history.get_context(),
                 tools=self.tools.get_schemas_for_llm(),
+                **stream_kwargs,
             ):
                 yield sse_event
-                # Extract text for tool call detection (legacy support)
-                # In a full OR implementation, we'd detect via events
-                # But for now, we still need to buffer for extraction
-                response_chunks.append(sse_event)
+                # Buffer text for tool call detection. Typed events carry the
+                # raw delta; SSE/plain chunks are buffered as-is (legacy).
+                if isinstance(sse_event, OutputTextDeltaEvent):
+                    response_chunks.append(sse_event.delta)
+                elif isinstance(sse_event, str):
+                    response_chunks.append(sse_event)
 
             # Check for tool calls
             accumulated = "".join(response_chunks)
@@ -350,7 +358,8 @@ class ChatController:
         system_prompt: str,
         provider_name: str = "",
         skip_routing: bool = False,
-    ) -> AsyncIterator[str]:
+        as_events: bool = False,
+    ) -> AsyncIterator[Union[str, StreamEvent]]:
         """Execute a chat interaction.
 
         Args:
@@ -359,6 +368,8 @@ class ChatController:
             system_prompt: System instructions
             provider_name: Provider name for display
             skip_routing: Skip agent routing
+            as_events: Yield the LLM stream as typed StreamEvent objects
+                instead of SSE text (in-process consumers only)
 
         Yields:
             Response chunks for streaming display
@@ -403,7 +414,9 @@ class ChatController:
                 yield f"{suggestion}\n\n"
 
         # Run agentic loop
-        async for chunk in self._run_agentic_loop(client, message, system_prompt):
+        async for chunk in self._run_agentic_loop(
+            client, message, system_prompt, as_events=as_events
+        ):
             yield chunk
 
         # Add response to context
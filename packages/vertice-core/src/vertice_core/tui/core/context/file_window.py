@@ -17,6 +17,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from vertice_core.async_utils.line_index import get_line_index_cache
+
 # Token estimation (4 chars per token is a reasonable heuristic)
 CHARS_PER_TOKEN = 4
 
@@ -51,19 +53,19 @@ class FileContextEntry:
         if not path.is_file():
             raise ValueError(f"Not a file: {filepath}")
 
-        # Read file
-        full_content = path.read_text(encoding="utf-8", errors="replace")
-        lines = full_content.splitlines(keepends=True)
+        # Shared line index: slice the range instead of reading the whole file
+        index = get_line_index_cache().get(path)
+        line_count = index.splitlines_count
 
         # Handle line range (1-indexed)
         actual_start = (start_line - 1) if start_line else 0
-        actual_end = end_line if end_line else len(lines)
+        actual_end = end_line if end_line else line_count
 
         # Clamp to valid range
-        actual_start = max(0, min(actual_start, len(lines)))
-        actual_end = max(actual_start, min(actual_end, len(lines)))
+        actual_start = max(0, min(actual_start, line_count))
+        actual_end = max(actual_start, min(actual_end, line_count))
 
-        content = "".join(lines[actual_start:actual_end])
+        content = index.read_span(actual_start, actual_end, errors="replace")
         tokens = len(content) // CHARS_PER_TOKEN
 
         # Detect language from extension
@@ -2,7 +2,9 @@
 HTTP Connection Pooling and Optimization for Vertice-Code.
 
 Provides efficient HTTP connection reuse, automatic retries,
-and performance optimization for API calls.
+and performance optimization for API calls. Connections come from the
+process-wide pool in vertice_core.async_utils.http_clients, shared with
+the providers.
 """
 
 import asyncio
@@ -14,12 +16,18 @@ import aiohttp
 from aiohttp import ClientTimeout, ClientError
 import backoff
 
+from vertice_core.async_utils.http_clients import get_http_clients
+
 logger = logging.getLogger(__name__)
 
 
 @dataclass
 class ConnectionPoolConfig:
-    """Configuration for HTTP connection pooling."""
+    """Configuration for HTTP connection pooling.
+
+    Connection limits and keep-alive are set on the shared pool
+    (HttpPoolConfig); the fields here are kept for compatibility.
+    """
 
     max_connections: int = 100
     max_connections_per_host: int = 20
@@ -82,25 +90,15 @@ class HTTPConnectionPool:
             sock_connect=self.config.timeout / 3,
         )
 
-        connector = aiohttp.TCPConnector(
-            limit=self.config.max_connections,
-            limit_per_host=self.config.max_connections_per_host,
-            keepalive_timeout=self.config.keepalive_timeout,
-            enable_cleanup_closed=True,
-        )
-
-        self._session = aiohttp.ClientSession(
-            connector=connector,
+        self._session = get_http_clients().aiohttp_session(
             timeout=timeout,
             trust_env=True,  # Use environment proxy settings
         )
 
-        logger.info(
-            f"HTTP connection pool initialized: max={self.config.max_connections}, per_host={self.config.max_connections_per_host}"
-        )
+        logger.info("HTTP connection pool initialized on the shared connector")
 
     async def close(self):
-        """Close the connection pool."""
+        """Close this pool's session (shared connections stay open)."""
         if self._session:
             await self._session.close()
             self._session = None
@@ -246,6 +244,7 @@ class HTTPConnectionPool:
                     if self._session
                     else 0
                 ),
+                "shared_pool": get_http_clients().get_stats(),
                 "circuit_breakers": {
                     host: {
                         "failures": data["failures"],
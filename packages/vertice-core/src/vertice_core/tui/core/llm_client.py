@@ -24,10 +24,10 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
-from typing import Any, AsyncIterator, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, AsyncIterator, Dict, List, Optional, TYPE_CHECKING, Union
 
 if TYPE_CHECKING:
-    pass  # Future type hints if needed
+    from vertice_core.openresponses_stream import StreamEvent
 
 # Import from canonical resilience module
 from vertice_core.resilience import (
@@ -379,12 +379,17 @@ class GeminiClient:
         system_prompt: str = "",
         context: Optional[List[Dict[str, str]]] = None,
         tools: Optional[List[Dict[str, Any]]] = None,
+        as_events: bool = False,
         **kwargs: Any,
-    ) -> AsyncIterator[str]:
-        """Stream using Open Responses semantic protocol."""
+    ) -> AsyncIterator[Union[str, "StreamEvent"]]:
+        """Stream using Open Responses semantic protocol.
+
+        With as_events=True, yields typed StreamEvent objects instead of SSE
+        text so in-process consumers skip the JSON encode/parse round trip.
+        """
         if self._vertice_coreent:
             async for sse_chunk in self._stream_open_responses_via_client(
-                prompt, system_prompt, context, tools, **kwargs
+                prompt, system_prompt, context, tools, as_events=as_events, **kwargs
             ):
                 yield sse_chunk
             return
@@ -394,28 +399,27 @@ class GeminiClient:
 
         builder = OpenResponsesStreamBuilder(model=self.model_name)
         builder.start()
-        for event in builder.get_events():
-            yield event.to_sse()
-        builder.clear_events()
+        for event in builder.drain(as_events):
+            yield event
 
         msg_item = builder.add_message()  # Default assistant message
-        for event in builder.get_events():
-            yield event.to_sse()
-        builder.clear_events()
+        for event in builder.drain(as_events):
+            yield event
 
         async for chunk in self._stream_via_gemini(prompt, system_prompt, context, tools):
             builder.text_delta(msg_item, chunk)
-            yield builder.get_last_event_sse()
-            builder.clear_events()
+            for event in builder.drain(as_events):
+                yield event
 
         builder.complete()
-        for event in builder.get_events():
-            yield event.to_sse()
-        yield builder.done()
+        for event in builder.drain(as_events):
+            yield event
+        if not as_events:
+            yield builder.done()
 
     async def _stream_open_responses_via_client(
-        self, prompt, system_prompt, context, tools, **kwargs
-    ) -> AsyncIterator[str]:
+        self, prompt, system_prompt, context, tools, as_events=False, **kwargs
+    ) -> AsyncIterator[Union[str, "StreamEvent"]]:
         """Stream via VerticeClient using Open Responses mode."""
         messages = []
         if context:
@@ -425,7 +429,7 @@ class GeminiClient:
         # Use the native Open Responses method of the router if it exists
         if hasattr(self._vertice_coreent, "stream_open_responses"):
             async for sse_event in self._vertice_coreent.stream_open_responses(
-                messages, system_prompt=system_prompt, tools=tools, **kwargs
+                messages, system_prompt=system_prompt, tools=tools, as_events=as_events, **kwargs
             ):
                 yield sse_event
         else:
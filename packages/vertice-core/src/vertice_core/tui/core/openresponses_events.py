@@ -68,6 +68,21 @@ class OpenResponsesEvent:
 
         return None
 
+    @classmethod
+    def from_stream_event(cls, event: Any) -> "OpenResponsesEvent":
+        """
+        Wrap an in-process StreamEvent without an SSE round trip.
+
+        Used when the bridge streams typed events (as_events=True): the
+        payload is the same dict the SSE encoder would have serialized.
+        """
+        event_class = EVENT_TYPE_TO_CLASS.get(event.type, cls)
+        return event_class(
+            event_type=event.type,
+            sequence_number=event.sequence_number,
+            raw_data=event.to_dict(),
+        )
+
 
 @dataclass
 class OpenResponsesDoneEvent(OpenResponsesEvent):
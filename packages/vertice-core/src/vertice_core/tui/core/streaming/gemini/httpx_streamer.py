@@ -39,9 +39,9 @@ class GeminiHTTPXStreamer(BaseStreamer):
             return True
 
         try:
-            import httpx
+            from vertice_core.async_utils.http_clients import get_http_clients
 
-            self._client = httpx.AsyncClient(timeout=self.config.stream_timeout)
+            self._client = get_http_clients().httpx_client(timeout=self.config.stream_timeout)
             self._initialized = True
             logger.info("GeminiHTTPXStreamer initialized")
             return True
@@ -67,6 +67,8 @@ class GeminiHTTPXStreamer(BaseStreamer):
 
         import httpx
 
+        from vertice_core.async_utils.http_clients import get_http_clients
+
         url = (
             f"https://generativelanguage.googleapis.com/v1beta/models/"
             f"{self.config.model_name}:streamGenerateContent?key={self.config.api_key}"
@@ -96,7 +98,9 @@ class GeminiHTTPXStreamer(BaseStreamer):
             payload["systemInstruction"] = {"parts": [{"text": full_system_instruction}]}
 
         try:
-            async with httpx.AsyncClient(timeout=self.config.stream_timeout) as client:
+            async with get_http_clients().httpx_client(
+                timeout=self.config.stream_timeout
+            ) as client:
                 async with client.stream("POST", url, json=payload) as response:
                     if response.status_code != 200:
                         error_text = await response.aread()
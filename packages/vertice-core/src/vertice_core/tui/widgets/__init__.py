@@ -22,6 +22,7 @@ if TYPE_CHECKING:
     from vertice_core.tui.widgets.autocomplete import AutocompleteDropdown
     from vertice_core.tui.widgets.selectable import SelectableStatic
     from vertice_core.tui.widgets.response_view import ResponseView
+    from vertice_core.tui.widgets.transcript import TranscriptModel, TranscriptHistory
     from vertice_core.tui.widgets.status_bar import StatusBar
     from vertice_core.tui.widgets.token_meter import (
         TokenBreakdown,
@@ -92,6 +93,8 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
     "AutocompleteDropdown": ("vertice_core.tui.widgets.autocomplete", "AutocompleteDropdown"),
     "SelectableStatic": ("vertice_core.tui.widgets.selectable", "SelectableStatic"),
     "ResponseView": ("vertice_core.tui.widgets.response_view", "ResponseView"),
+    "TranscriptModel": ("vertice_core.tui.widgets.transcript", "TranscriptModel"),
+    "TranscriptHistory": ("vertice_core.tui.widgets.transcript", "TranscriptHistory"),
     "StatusBar": ("vertice_core.tui.widgets.status_bar", "StatusBar"),
     # Token Dashboard
     "TokenBreakdown": ("vertice_core.tui.widgets.token_meter", "TokenBreakdown"),
@@ -1,14 +1,16 @@
 """
-Session Search Modal - Fuzzy search across sessions
+Session Search Modal - Full-text search across sessions
 ===============================================
 
-Modal de busca com fuzzy matching para histórico de sessões.
-Inclui busca em sessão atual e sessões passadas.
+Modal de busca no histórico de sessões.
+Consulta o catálogo FTS5 do SessionManager (prefixos de palavras, ranking
+bm25), sem carregar os arquivos de sessão.
 """
 
 from __future__ import annotations
 
-from typing import List, Optional, Dict, Any
+import asyncio
+from typing import List, Optional, Any
 from dataclasses import dataclass
 
 from textual.app import ComposeResult
@@ -18,17 +20,10 @@ from textual.widget import Widget
 from textual.message import Message
 from textual.binding import Binding
 
-try:
-    from rapidfuzz import fuzz
-
-    FUZZY_AVAILABLE = True
-except ImportError:
-    FUZZY_AVAILABLE = False
-
 
 @dataclass
 class SearchResult:
-    """Result of a fuzzy search."""
+    """Result of a session search."""
 
     session_id: str
     message_index: int
@@ -39,10 +34,10 @@ class SearchResult:
 
 class FuzzySearchModal(Widget):
     """
-    Modal for fuzzy search across sessions.
+    Modal for searching across sessions.
 
     Features:
-    - Fuzzy matching with rapidfuzz
+    - Indexed full-text search over all sessions (word-prefix matching)
     - Real-time search as you type
     - Context preview
     - Keyboard navigation
@@ -99,6 +94,8 @@ class FuzzySearchModal(Widget):
     }
     """
 
+    MAX_RESULTS = 20
+
     BINDINGS = [
         Binding("escape", "close", "Close search"),
         Binding("enter", "select", "Select result"),
@@ -138,9 +135,7 @@ class FuzzySearchModal(Widget):
         with Container():
             with Vertical():
                 # Search input
-                yield Input(
-                    placeholder="Search across sessions (fuzzy matching)...", id="search-input"
-                )
+                yield Input(placeholder="Search across sessions...", id="search-input")
 
                 # Results list
                 yield ListView(id="results-list")
@@ -166,88 +161,56 @@ class FuzzySearchModal(Widget):
                 await self._clear_results()
 
     async def _perform_search(self, query: str) -> None:
-        """Perform fuzzy search across sessions."""
-        if not FUZZY_AVAILABLE:
-            await self._show_fallback_results(query)
+        """Search all catalogued sessions; the catalog query runs off the UI thread."""
+        manager = self._get_session_manager()
+        if manager is None:
+            await self._clear_results()
             return
 
         try:
-            # Search current session
-            results = []
-            if self.current_session_id:
-                current_results = await self._search_session(
-                    self.current_session_id, query, "current"
-                )
-                results.extend(current_results)
-
-            # Search other sessions (limit to recent 5)
-            other_sessions = await self._get_recent_sessions(5)
-            for session_id in other_sessions:
-                if session_id != self.current_session_id:
-                    session_results = await self._search_session(session_id, query, "past")
-                    results.extend(session_results)
-
-            # Sort by score (best matches first)
-            results.sort(key=lambda x: x.score, reverse=True)
-            self.search_results = results[:20]  # Limit to 20 results
-
-            await self._display_results()
-
+            hits = await asyncio.to_thread(manager.search_messages, query, self.MAX_RESULTS)
         except Exception as e:
             self.notify(f"Search error: {e}", severity="error")
+            return
 
-    async def _search_session(
-        self, session_id: str, query: str, session_type: str
-    ) -> List[SearchResult]:
-        """Search within a specific session."""
-        results = []
+        self.search_results = self._to_results(hits, query)
+        await self._display_results()
 
-        try:
-            # Load session data (this would need to be implemented in SessionManager)
-            session_data = await self._load_session_messages(session_id)
-
-            for i, message in enumerate(session_data):
-                content = message.get("content", "")
-                if not content:
-                    continue
-
-                # Fuzzy search
-                score = fuzz.partial_ratio(query.lower(), content.lower())
-                if score > 60:  # Minimum score threshold
-                    # Extract context (50 chars around match)
-                    context = self._extract_context(content, query)
-
-                    result = SearchResult(
-                        session_id=session_id,
-                        message_index=i,
-                        content=content[:100] + "..." if len(content) > 100 else content,
-                        score=score,
-                        context=context,
-                    )
-                    results.append(result)
+    def _get_session_manager(self) -> Any:
+        """Session manager to search, defaulting to the global one."""
+        if not hasattr(self.session_manager, "search_messages"):
+            from vertice_core.core.session_manager import get_session_manager
 
-        except Exception as e:
-            print(f"Error searching session {session_id}: {e}")
+            self.session_manager = get_session_manager()
 
-        return results
+        if self.current_session_id is None:
+            current = getattr(self.session_manager, "current_session", None)
+            self.current_session_id = getattr(current, "session_id", None)
+        return self.session_manager
 
-    async def _load_session_messages(self, session_id: str) -> List[Dict[str, Any]]:
-        """Load messages from a session. This needs SessionManager integration."""
-        # Placeholder - would integrate with actual SessionManager
-        try:
-            # This would call session_manager.get_session_messages(session_id)
-            return []  # Placeholder
-        except Exception as e:
+    def _to_results(self, hits: List[Any], query: str) -> List[SearchResult]:
+        """Convert catalog hits to results scored 0-100 relative to the best hit."""
+        if not hits:
             return []
 
-    async def _get_recent_sessions(self, limit: int) -> List[str]:
-        """Get recent session IDs."""
-        # Placeholder - would integrate with SessionManager
-        try:
-            # This would call session_manager.get_recent_sessions(limit)
-            return []  # Placeholder
-        except Exception as e:
-            return []
+        best_rank = min(hit.rank for hit in hits)
+        results = []
+        for hit in hits:
+            score = 100.0 * hit.rank / best_rank if best_rank < 0 else 100.0
+            content = hit.content
+            results.append(
+                SearchResult(
+                    session_id=hit.session_id,
+                    message_index=hit.message_index,
+                    content=content[:100] + "..." if len(content) > 100 else content,
+                    score=score,
+                    context=hit.snippet or self._extract_context(content, query),
+                )
+            )
+
+        # Best matches first, the current session's hits ahead on ties
+        results.sort(key=lambda r: (-r.score, r.session_id != self.current_session_id))
+        return results
 
     def _extract_context(self, content: str, query: str) -> str:
         """Extract context around search query."""
@@ -305,15 +268,6 @@ class FuzzySearchModal(Widget):
 
         return container
 
-    async def _show_fallback_results(self, query: str) -> None:
-        """Show basic results when fuzzy search is not available."""
-        # Simple substring search as fallback
-        results = []
-        # This would do basic substring search across sessions
-
-        self.search_results = results
-        await self._display_results()
-
     async def _clear_results(self) -> None:
         """Clear search results."""
         list_view = self.query_one("#results-list", ListView)
@@ -27,6 +27,7 @@ class PerformanceHUD(Widget):
     - Confidence Score
     - Throughput (tokens/seg)
     - Queue time
+    - Tool result cache hit rate (per-tool counts in the tooltip)
     - Toggleable (F12)
     """
 
@@ -93,6 +94,8 @@ class PerformanceHUD(Widget):
         self._confidence_widget: Static | None = None
         self._throughput_widget: Static | None = None
         self._queue_widget: Static | None = None
+        self._cache_widget: Static | None = None
+        self._cache_hit_rate = 0.0
         self._last_rendered: dict[str, str] = {}
 
     def compose(self) -> ComposeResult:
@@ -102,6 +105,8 @@ class PerformanceHUD(Widget):
             yield Static("", id="confidence-metric", classes="metric")
             yield Static("", id="throughput-metric", classes="metric")
             yield Static("", id="queue-metric", classes="metric")
+            self._cache_widget = Static("", id="cache-metric", classes="metric")
+            yield self._cache_widget
 
     def on_mount(self) -> None:
         """Initialize HUD."""
@@ -110,6 +115,9 @@ class PerformanceHUD(Widget):
         self._throughput_widget = self.query_one("#throughput-metric", Static)
         self._queue_widget = self.query_one("#queue-metric", Static)
         self._update_display()
+        # Tool cache stats change without MetricsUpdate messages; poll them
+        self._update_cache_metric()
+        self.set_interval(2.0, self._update_cache_metric)
         if not self.visible:
             self.add_class("hidden")
 
@@ -189,6 +197,28 @@ class PerformanceHUD(Widget):
         self._update_metric("throughput", throughput_widget, f"[blue]{throughput_text}[/blue]")
         self._update_metric("queue", queue_widget, f"[yellow]{queue_text}[/yellow]")
 
+    def _update_cache_metric(self) -> None:
+        """Show the shared tool result cache hit rate."""
+        from vertice_core.tools.caching import get_tool_result_cache
+
+        stats = get_tool_result_cache().get_stats()
+        cache_widget = self._cache_widget
+        self._cache_hit_rate = stats["hit_rate"] * 100
+
+        if stats["hits"] + stats["misses"]:
+            cache_text = f"💾 {self._cache_hit_rate:.0f}%"
+        else:
+            cache_text = "💾 --"
+        self._update_metric("cache", cache_widget, f"[cyan]{cache_text}[/cyan]")
+
+        tooltip = "\n".join(
+            f"{name}: {tool['hits'] + tool['coalesced']} hits, {tool['misses']} misses"
+            for name, tool in sorted(stats["tools"].items())
+        )
+        if self._last_rendered.get("cache_tooltip") != tooltip:
+            cache_widget.tooltip = tooltip or None
+            self._last_rendered["cache_tooltip"] = tooltip
+
     def _update_metric(self, key: str, widget: Static, markup: str) -> None:
         if self._last_rendered.get(key) == markup:
             return
@@ -221,5 +251,6 @@ class PerformanceHUD(Widget):
             "confidence": self._confidence,
             "throughput": self._throughput,
             "queue_time": self._queue_time,
+            "cache_hit_rate": self._cache_hit_rate,
             "last_update": self._last_update,
         }
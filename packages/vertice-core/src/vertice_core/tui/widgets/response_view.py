@@ -4,6 +4,11 @@ Response View Widget - Phase 9 Visual Refresh.
 Smooth 60fps Response Viewport for streaming AI responses.
 Enhanced code blocks with headers, diffs, and Slate theme.
 
+Scrollback is virtualized: every block is recorded in a TranscriptModel and
+widgets that scroll more than a margin above the viewport are dematerialized
+into a TranscriptHistory, which repaints them from source only when they
+scroll back into view.
+
 Follows CODE_CONSTITUTION: <500 lines, 100% type hints
 """
 
@@ -21,14 +26,17 @@ from textual.widgets import Static, Markdown as TextualMarkdown
 
 from rich.syntax import Syntax
 from rich.panel import Panel
-from rich.markdown import Markdown as RichMarkdown
-from rich.text import Text
-from rich import box
 
 from vertice_core.tui.constants import BANNER
 from vertice_core.tui.widgets.selectable import SelectableStatic
 from vertice_core.tui.widgets.expandable_blocks import ExpandableCodeBlock, ExpandableDiffBlock
-from vertice_core.tui.core.formatting import OutputFormatter, Colors, Icons
+from vertice_core.tui.widgets.transcript import (
+    TranscriptBlock,
+    TranscriptHistory,
+    TranscriptModel,
+    build_renderable,
+)
+from vertice_core.tui.core.formatting import Colors, Icons
 from vertice_core.tui.core.streaming.soft_buffer import SoftBuffer
 
 if TYPE_CHECKING:
@@ -44,6 +52,7 @@ class ResponseView(VerticalScroll):
     - AI streaming responses
     - Code blocks with syntax highlighting
     - Action indicators
+    - Virtualized scrollback (trimmed history is repainted on scroll-up)
     """
 
     DEFAULT_CSS = """
@@ -116,6 +125,8 @@ class ResponseView(VerticalScroll):
         self._thinking_widget: Static | None = None
         self._use_textual_markdown_stream: bool = True
         self._max_view_items = self._get_max_view_items()
+        self._viewport_margin = self._get_viewport_margin()
+        self._trim_scheduled = False
         self._scrollback_rich_tail = self._get_scrollback_rich_tail()
         self._scrollback_compact_batch = self._get_scrollback_compact_batch()
         self._pending_stream_chunks: list[str] = []
@@ -124,18 +135,36 @@ class ResponseView(VerticalScroll):
         self._flush_lock = asyncio.Lock()
         self._flush_scheduled = False
         self._stream_flush_interval_s = self._get_stream_flush_interval_s()
+        # Virtualized scrollback: blocks [0, _first_live_block) are painted by _history
+        self.transcript = TranscriptModel()
+        self._widget_blocks: dict[Widget, int] = {}
+        self._history: TranscriptHistory | None = None
+        self._first_live_block = 0
+        self._response_block: TranscriptBlock | None = None
 
     def _get_max_view_items(self) -> int:
         """
-        Max number of non-banner widgets kept in the scrollback.
+        Hard cap on mounted non-banner widgets.
 
-        This prevents long sessions from degrading due to mounting unbounded widgets.
+        Widgets are normally dematerialized as they scroll out of view; this
+        bounds bursts that are mounted faster than layout can place them.
         """
         try:
             return int(os.getenv("VERTICE_TUI_MAX_VIEW_ITEMS", "300"))
         except ValueError:
             return 300
 
+    def _get_viewport_margin(self) -> float:
+        """
+        Screens of scrolled-past content kept mounted above the viewport.
+
+        Anything further up is dematerialized into the transcript history.
+        """
+        try:
+            return max(float(os.getenv("VERTICE_TUI_VIEWPORT_MARGIN", "1")), 0.0)
+        except ValueError:
+            return 1.0
+
     def _get_stream_flush_interval_s(self) -> float:
         """
         Flush cadence for streaming updates.
@@ -219,26 +248,69 @@ class ResponseView(VerticalScroll):
             return
         self._schedule_flush()
 
-    def _trim_view_items(self) -> None:
-        """Trim old widgets to keep the view responsive in long sessions."""
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        # Scrolling down moves widgets above the viewport; trim once layout settles
+        if new_value > old_value and not self._trim_scheduled:
+            self._trim_scheduled = True
+            self.call_after_refresh(self._trim_after_scroll)
+
+    def _trim_after_scroll(self) -> None:
+        self._trim_scheduled = False
+        self._trim_view_items(compact=False)
+
+    def _scrolled_past(self, widgets: list[Widget]) -> int:
+        """Number of leading widgets that end more than the margin above the viewport."""
+        cutoff = self.scroll_y - self.size.height * self._viewport_margin
+        count = 0
+        for child in widgets:
+            region = child.virtual_region_with_margin
+            # Unplaced widgets (height 0) have no position yet
+            if not region.height or region.bottom > cutoff:
+                break
+            count += 1
+        return count
+
+    def _trim_view_items(self, compact: bool = True) -> None:
+        """Dematerialize widgets scrolled out of view, within the hard widget cap."""
+        self._forget_removed_widgets()
         max_items = self._max_view_items
-        if max_items <= 0:
-            return
 
-        candidates = [child for child in self.children if not child.has_class("banner")]
-        excess = len(candidates) - max_items
+        candidates = self._live_children()
+        removable = [
+            child
+            for child in candidates
+            if child is not self._history and child is not self._thinking_widget
+        ]
+        excess = self._scrolled_past(removable)
+        if max_items > 0:
+            excess = max(excess, len(candidates) - max_items)
         if excess > 0:
-            for child in candidates[:excess]:
-                if child is self._thinking_widget:
-                    continue
-                child.remove()
+            self._dematerialize(removable[:excess])
 
-        # When the view reaches its steady-state max size, compact older expensive renderables
+        # When bursts hit the hard cap, compact older expensive renderables
         # (code/diff blocks) to keep long-session scrolling responsive.
-        candidates = [child for child in self.children if not child.has_class("banner")]
-        if len(candidates) >= max_items:
+        candidates = self._live_children()
+        if compact and max_items > 0 and len(candidates) >= max_items:
             self._compact_old_renderables(candidates)
 
+    def _live_children(self) -> list[Widget]:
+        """Non-banner children that are not already being removed."""
+        return [
+            child
+            for child in self.children
+            if not child.has_class("banner") and not self._is_removed(child)
+        ]
+
+    def _is_removed(self, widget: Widget) -> bool:
+        return widget.parent is not self or getattr(widget, "_pruning", False)
+
+    def _forget_removed_widgets(self) -> None:
+        """Drop block mappings of widgets removed outside _dematerialize."""
+        gone = [widget for widget in self._widget_blocks if self._is_removed(widget)]
+        for widget in gone:
+            del self._widget_blocks[widget]
+
     def _compact_old_renderables(self, candidates: list[Widget]) -> None:
         rich_tail = self._scrollback_rich_tail
         if rich_tail <= 0:
@@ -312,10 +384,45 @@ class ResponseView(VerticalScroll):
             )
             replacement.add_class("compacted")
 
+            if child in self._widget_blocks:
+                self._widget_blocks[replacement] = self._widget_blocks.pop(child)
             self.mount(replacement, before=child)
             child.remove()
             compacted += 1
 
+    def _dematerialize(self, widgets: list[Widget]) -> None:
+        """Remove leading widgets; the history widget repaints them from the transcript."""
+        if not any(child in self._widget_blocks for child in widgets):
+            for child in widgets:
+                child.remove()
+            return
+
+        if self._history is None:
+            self._history = TranscriptHistory(self.transcript)
+            self.mount(self._history, before=widgets[0])
+
+        for child in widgets:
+            index = self._widget_blocks.pop(child, None)
+            if index is not None:
+                block = self.transcript[index]
+                # Keep the exact look and height so the swap does not move the viewport.
+                # Vertical margins between siblings collapse, so only the excess over
+                # the previous block's bottom margin is painted above this one.
+                margin = child.styles.margin
+                previous_bottom = self.transcript[index - 1].margin_bottom if index else 0
+                block.margin_top = max(margin.top - previous_bottom, 0)
+                block.margin_bottom = margin.bottom
+                block.style = child.rich_style
+                if child.outer_size.height:
+                    block.heights[child.size.width] = (
+                        block.margin_top + child.outer_size.height + block.margin_bottom
+                    )
+                # Blocks whose widgets were removed some other way are covered too
+                self._first_live_block = max(self._first_live_block, index + 1)
+            child.remove()
+
+        self._history.extend(self._first_live_block)
+
     @staticmethod
     def _get_static_renderable(widget: Widget) -> object | None:
         """
@@ -345,38 +452,27 @@ class ResponseView(VerticalScroll):
         self.mount(widget)
         self._trim_view_items()
 
-    def add_user_message(self, message: str) -> None:
-        """Add user message with prompt icon."""
-        content = Text()
-        content.append("❯ ", style=f"bold {Colors.PRIMARY}")
-        content.append(message)
+    def _add_block(self, kind: str, source: str, css_class: str, **meta) -> TranscriptBlock:
+        """Record a block in the transcript and mount its live widget."""
+        block = self.transcript.append(kind, source, css_class, **meta)
+        widget = SelectableStatic(build_renderable(block), classes=css_class)
+        self._mount_block(widget, block)
+        return block
 
-        widget = SelectableStatic(content, classes="user-message")
+    def _mount_block(self, widget: Widget, block: TranscriptBlock, scroll: bool = True) -> None:
+        self._widget_blocks[widget] = block.index
         self.mount(widget)
         self._trim_view_items()
-        self.scroll_end(animate=False)
+        if scroll:
+            self.scroll_end(animate=False)
+
+    def add_user_message(self, message: str) -> None:
+        """Add user message with prompt icon."""
+        self._add_block("user", message, "user-message")
 
     def add_system_message(self, message: str) -> None:
         """Add system/help message with premium Panel styling."""
-        # Detect Rich markup tags - if present, use Text.from_markup()
-        if "[bold" in message or "[cyan]" in message or "[dim]" in message:
-            content = Text.from_markup(message)
-        else:
-            # Standard markdown in a styled panel
-            content = RichMarkdown(message)
-
-        # Wrap in a premium panel
-        panel = Panel(
-            content,
-            border_style=Colors.BORDER,
-            box=box.ROUNDED,
-            padding=(0, 1),
-        )
-
-        widget = SelectableStatic(panel, classes="system-message")
-        self.mount(widget)
-        self._trim_view_items()
-        self.scroll_end(animate=False)
+        self._add_block("system", message, "system-message")
 
     def start_thinking(self) -> None:
         """Show advanced reasoning stream indicator."""
@@ -425,6 +521,7 @@ class ResponseView(VerticalScroll):
         # Reset for next response
         self.current_response = ""
         self._response_widget = None
+        self._response_block = None
         self._pending_stream_chunks.clear()
         self._soft_buffer = SoftBuffer()
 
@@ -449,14 +546,14 @@ class ResponseView(VerticalScroll):
                 self._thinking_widget = None
 
             if self._use_textual_markdown_stream:
+                self._response_block = self.transcript.append("markdown", "", "ai-response")
                 self._response_widget = TextualMarkdown("", classes="ai-response")
-                self.mount(self._response_widget)
-                self._trim_view_items()
+                self._mount_block(self._response_widget, self._response_block, scroll=False)
                 self._markdown_stream = TextualMarkdown.get_stream(self._response_widget)
             else:
+                self._response_block = self.transcript.append("markup", "", "ai-response")
                 self._response_widget = SelectableStatic("", classes="ai-response")
-                self.mount(self._response_widget)
-                self._trim_view_items()
+                self._mount_block(self._response_widget, self._response_block, scroll=False)
             # First token latency: flush as soon as possible, then keep cadence via timer.
             self._schedule_flush()
 
@@ -482,6 +579,9 @@ class ResponseView(VerticalScroll):
             if self._response_widget is None:
                 return
 
+            if self._response_block is not None:
+                self.transcript.append_source(self._response_block, safe)
+
             if (
                 self._use_textual_markdown_stream
                 and isinstance(self._response_widget, TextualMarkdown)
@@ -569,6 +669,8 @@ class ResponseView(VerticalScroll):
 
             case OpenResponsesOutputTextDoneEvent(text=text):
                 self.current_response = text
+                if self._response_block is not None:
+                    self.transcript.update_source(self._response_block, text)
 
             case OpenResponsesResponseCompletedEvent():
                 await self.end_thinking()
@@ -602,6 +704,9 @@ class ResponseView(VerticalScroll):
         line_count = stripped.count("\n") + 1 if stripped else 0
 
         if max_lines > 0 and line_count > max_lines:
+            block = self.transcript.append(
+                "code", stripped, "code-block", language=language, title=title, file_path=file_path
+            )
             widget = ExpandableCodeBlock(
                 stripped,
                 language=language,
@@ -609,42 +714,13 @@ class ResponseView(VerticalScroll):
                 file_path=file_path,
                 max_preview_lines=max_lines,
             )
-            self.mount(widget)
-            self._trim_view_items()
-            self.scroll_end(animate=False)
+            self._mount_block(widget, block)
             return
 
-        syntax = Syntax(
-            stripped,
-            language,
-            theme="one-dark",
-            line_numbers=True,
-            word_wrap=True,
-            background_color=Colors.SURFACE,
-        )
-
-        # Build header: icon + language + optional path
-        header_parts = [f"{Icons.CODE_FILE} {language.upper()}"]
-        if file_path:
-            header_parts.append(f"[{Colors.MUTED}]{file_path}[/]")
-        elif title:
-            header_parts.append(f"[{Colors.MUTED}]{title}[/]")
-
-        panel_title = " ".join(header_parts)
-        panel = Panel(
-            syntax,
-            title=f"[bold {Colors.PRIMARY}]{panel_title}[/]",
-            title_align="left",
-            border_style=Colors.BORDER,
-            box=box.ROUNDED,
-            padding=(0, 1),
+        self._add_block(
+            "code", stripped, "code-block", language=language, title=title, file_path=file_path
         )
 
-        widget = SelectableStatic(panel, classes="code-block")
-        self.mount(widget)
-        self._trim_view_items()
-        self.scroll_end(animate=False)
-
     def add_diff_block(
         self, diff_content: str, title: str = "Diff", file_path: str | None = None
     ) -> None:
@@ -661,108 +737,73 @@ class ResponseView(VerticalScroll):
         line_count = stripped.count("\n") + 1 if stripped else 0
 
         if max_lines > 0 and line_count > max_lines:
+            block = self.transcript.append(
+                "diff", stripped, "diff-block", title=title, file_path=file_path
+            )
             widget = ExpandableDiffBlock(
                 stripped,
                 title=title,
                 file_path=file_path,
                 max_preview_lines=max_lines,
             )
-            self.mount(widget)
-            self._trim_view_items()
-            self.scroll_end(animate=False)
+            self._mount_block(widget, block)
             return
 
-        lines = stripped.split("\n")
-        result = Text()
-
-        for line in lines:
-            if line.startswith("+") and not line.startswith("+++"):
-                result.append(line + "\n", style=f"bold {Colors.SUCCESS}")
-            elif line.startswith("-") and not line.startswith("---"):
-                result.append(line + "\n", style=f"bold {Colors.ERROR}")
-            elif line.startswith("@@"):
-                result.append(line + "\n", style=f"bold {Colors.ACCENT}")
-            else:
-                result.append(line + "\n", style=Colors.MUTED)
-
-        # Header
-        header = f"{Icons.GIT} {title}"
-        if file_path:
-            header += f" [{Colors.MUTED}]{file_path}[/]"
-
-        panel = Panel(
-            result,
-            title=f"[bold {Colors.PRIMARY}]{header}[/]",
-            title_align="left",
-            border_style=Colors.BORDER,
-            box=box.ROUNDED,
-            padding=(0, 1),
-        )
-
-        widget = SelectableStatic(panel, classes="diff-block")
-        self.mount(widget)
-        self._trim_view_items()
-        self.scroll_end(animate=False)
+        self._add_block("diff", stripped, "diff-block", title=title, file_path=file_path)
 
     def add_action(self, action: str) -> None:
         """Add action indicator with accent color."""
-        widget = SelectableStatic(
+        self._add_block(
+            "markup",
             f"[bold {Colors.ACCENT}]{Icons.EXECUTING}[/] [{Colors.MUTED}]{action}[/]",
-            classes="action",
+            "action",
         )
-        self.mount(widget)
-        self._trim_view_items()
-        self.scroll_end(animate=False)
 
     def add_warning(self, message: str) -> None:
         """Add warning message with triangle icon."""
-        widget = SelectableStatic(
+        self._add_block(
+            "markup",
             f"[bold {Colors.WARNING}]{Icons.WARNING}[/] [{Colors.WARNING}]{message}[/]",
-            classes="warning",
+            "warning",
         )
-        self.mount(widget)
-        self._trim_view_items()
-        self.scroll_end(animate=False)
 
     def add_success(self, message: str) -> None:
         """Add success message with checkmark."""
-        widget = SelectableStatic(
+        self._add_block(
+            "markup",
             f"[bold {Colors.SUCCESS}]{Icons.SUCCESS}[/] [{Colors.SUCCESS}]{message}[/]",
-            classes="success",
+            "success",
         )
-        self.mount(widget)
-        self._trim_view_items()
-        self.scroll_end(animate=False)
 
     def add_error(self, message: str) -> None:
         """Add error message with X."""
-        widget = SelectableStatic(
-            f"[bold {Colors.ERROR}]{Icons.ERROR}[/] [{Colors.ERROR}]{message}[/]", classes="error"
+        self._add_block(
+            "markup", f"[bold {Colors.ERROR}]{Icons.ERROR}[/] [{Colors.ERROR}]{message}[/]", "error"
         )
-        self.mount(widget)
-        self._trim_view_items()
-        self.scroll_end(animate=False)
 
     def add_tool_result(
         self, tool_name: str, success: bool, data: str | None = None, error: str | None = None
     ) -> None:
         """Add tool execution result with Panel formatting."""
-        panel = OutputFormatter.format_tool_result(tool_name, success, data, error)
-        widget = SelectableStatic(panel, classes="tool-result")
-        self.mount(widget)
-        self._trim_view_items()
-        self.scroll_end(animate=False)
+        self._add_block(
+            "tool_result",
+            data or "",
+            "tool-result",
+            tool_name=tool_name,
+            success=success,
+            error=error,
+        )
 
     def add_response_panel(self, text: str, title: str = "Response") -> None:
         """Add a formatted response panel."""
-        panel = OutputFormatter.format_response(text, title)
-        widget = SelectableStatic(panel, classes="ai-response")
-        self.mount(widget)
-        self._trim_view_items()
-        self.scroll_end(animate=False)
+        self._add_block("response", text, "ai-response", title=title)
 
     def add_info_panel(
-        self, message: str, title: str = "Info", icon: str = "ℹ️", border_color: str = Colors.PRIMARY
+        self,
+        message: str,
+        title: str = "Info",
+        icon: str = "ℹ️",
+        border_color: str = Colors.PRIMARY,
     ) -> None:
         """Add a premium info panel with title, icon, and styled border.
 
@@ -772,22 +813,10 @@ class ResponseView(VerticalScroll):
             icon: Emoji icon for the panel header
             border_color: Border color (from Colors constants)
         """
-        content = RichMarkdown(message)
-
-        panel = Panel(
-            content,
-            title=f"[bold {border_color}]{icon} {title}[/]",
-            title_align="left",
-            border_style=border_color,
-            box=box.ROUNDED,
-            padding=(1, 2),
+        self._add_block(
+            "info", message, "info-panel", title=title, icon=icon, border_color=border_color
         )
 
-        widget = SelectableStatic(panel, classes="info-panel")
-        self.mount(widget)
-        self._trim_view_items()
-        self.scroll_end(animate=False)
-
     def add_markdown_response(self, text: str, title: str = "Response") -> None:
         """Add markdown response with syntax highlighting for code blocks."""
         self._render_markdown_with_syntax(text, title)
@@ -795,11 +824,6 @@ class ResponseView(VerticalScroll):
     def _render_markdown_with_syntax(self, text: str, title: str) -> None:
         """Render markdown text with proper syntax highlighting for code blocks."""
         import re
-        from rich.markdown import Markdown
-        from rich.text import Text
-        from rich.panel import Panel
-        from rich.console import Group
-        from rich.box import ROUNDED
 
         # Split text into markdown and code blocks
         parts = []
@@ -829,39 +853,26 @@ class ResponseView(VerticalScroll):
 
         # If no code blocks found, render as regular markdown
         if not any(part[0] == "code" for part in parts):
-            panel = OutputFormatter.format_response(text, title)
-            widget = SelectableStatic(panel, classes="ai-response")
-            self.mount(widget)
-            self._trim_view_items()
-            self.scroll_end(animate=False)
+            self._add_block("response", text, "ai-response", title=title)
             return
 
-        # Render parts
-        rendered_parts = []
+        # Code blocks are mounted first; the prose follows in one panel
+        markdown_parts = []
         for part_type, content in parts:
             if part_type == "markdown":
-                try:
-                    rendered_parts.append(Markdown(content))
-                except (ValueError, TypeError):
-                    rendered_parts.append(Text(content))
+                markdown_parts.append(content)
             elif part_type == "code":
                 language, code = content
                 self.add_code_block(code, language)
 
-        # Create panel with all parts
-        if rendered_parts:
-            content = Group(*rendered_parts)
-            panel = Panel(
-                content,
-                title=f"[bold {Colors.PRIMARY}]{title}[/]",
-                title_align="left",
-                border_style=Colors.BORDER,
-                box=ROUNDED,
-                padding=(1, 2),
+        if markdown_parts:
+            self._add_block(
+                "markdown_parts",
+                "".join(markdown_parts),
+                "ai-response",
+                parts=markdown_parts,
+                title=title,
             )
-            widget = SelectableStatic(panel, classes="ai-response")
-            self.mount(widget)
-            self._trim_view_items()
 
         self.scroll_end(animate=False)
 
@@ -869,7 +880,13 @@ class ResponseView(VerticalScroll):
         """Clear all content."""
         self.current_response = ""
         self._response_widget = None
+        self._response_block = None
         self._thinking_widget = None
 
         for child in list(self.children):
             child.remove()
+
+        self.transcript.clear()
+        self._widget_blocks.clear()
+        self._history = None
+        self._first_live_block = 0
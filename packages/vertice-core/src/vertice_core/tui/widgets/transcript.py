@@ -0,0 +1,429 @@
+"""
+Transcript Model - virtualized scrollback for ResponseView.
+
+Every block shown in the ResponseView is recorded here as source text plus
+metadata, so widgets can be dropped from the DOM (dematerialized) without
+losing history: scrolling back re-renders it from the source on demand.
+
+- TranscriptBlock: one message/code/diff/panel, with its last laid-out height
+- TranscriptModel: append-only block list + LRU cache of rendered strips
+  keyed by (block, width)
+- build_renderable: the single place a block kind becomes a Rich renderable,
+  used by both the live add_* paths and rematerialization
+- TranscriptHistory: Line API widget that paints the dematerialized prefix,
+  rendering only the lines that scroll into view
+
+Author: JuanCS Dev
+Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from rich import box
+from rich.console import Console, Group, RenderableType
+from rich.markdown import Markdown as RichMarkdown
+from rich.panel import Panel
+from rich.style import Style
+from rich.syntax import Syntax
+from rich.text import Text
+from textual.geometry import Size
+from textual.strip import Strip
+from textual.widget import Widget
+
+from vertice_core.tui.core.formatting import Colors, Icons, OutputFormatter
+
+# Bound on rendered lines kept across all (block, width) cache entries
+DEFAULT_MAX_CACHED_LINES = 20_000
+
+
+@dataclass
+class TranscriptBlock:
+    """One block of the transcript, stored as source so it can be re-rendered."""
+
+    index: int
+    kind: str
+    source: str
+    css_class: str
+    meta: Dict[str, Any] = field(default_factory=dict)
+    # Captured from the live widget when it is dematerialized
+    heights: Dict[int, int] = field(default_factory=dict)  # width -> outer height
+    margin_top: int = 0
+    margin_bottom: int = 0
+    style: Optional[Style] = None
+
+    def __post_init__(self) -> None:
+        self._chunks: List[str] = []  # Streamed text not yet joined into source
+
+    def flush(self) -> str:
+        """Join streamed chunks into ``source`` and return it."""
+        if self._chunks:
+            self.source = "".join([self.source, *self._chunks])
+            self._chunks.clear()
+        return self.source
+
+    def estimate_height(self) -> int:
+        """Height to reserve before the block has been rendered at a width."""
+        if self.heights:
+            return next(reversed(self.heights.values()))
+        return self.flush().count("\n") + 3
+
+
+@dataclass
+class TranscriptCacheStats:
+    """Render cache statistics."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Calculate hit rate."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+
+# =============================================================================
+# BLOCK RENDERERS
+# =============================================================================
+
+
+def _render_user(block: TranscriptBlock) -> RenderableType:
+    content = Text()
+    content.append("❯ ", style=f"bold {Colors.PRIMARY}")
+    content.append(block.source)
+    return content
+
+
+def _render_system(block: TranscriptBlock) -> RenderableType:
+    message = block.source
+    # Detect Rich markup tags - if present, use Text.from_markup()
+    if "[bold" in message or "[cyan]" in message or "[dim]" in message:
+        content: RenderableType = Text.from_markup(message)
+    else:
+        content = RichMarkdown(message)
+    return Panel(content, border_style=Colors.BORDER, box=box.ROUNDED, padding=(0, 1))
+
+
+def _render_code(block: TranscriptBlock) -> RenderableType:
+    language = block.meta.get("language", "text")
+    syntax = Syntax(
+        block.source,
+        language,
+        theme="one-dark",
+        line_numbers=True,
+        word_wrap=True,
+        background_color=Colors.SURFACE,
+    )
+
+    # Header: icon + language + optional path
+    header_parts = [f"{Icons.CODE_FILE} {language.upper()}"]
+    if block.meta.get("file_path"):
+        header_parts.append(f"[{Colors.MUTED}]{block.meta['file_path']}[/]")
+    elif block.meta.get("title"):
+        header_parts.append(f"[{Colors.MUTED}]{block.meta['title']}[/]")
+
+    return Panel(
+        syntax,
+        title=f"[bold {Colors.PRIMARY}]{' '.join(header_parts)}[/]",
+        title_align="left",
+        border_style=Colors.BORDER,
+        box=box.ROUNDED,
+        padding=(0, 1),
+    )
+
+
+def _render_diff(block: TranscriptBlock) -> RenderableType:
+    result = Text()
+    for line in block.source.split("\n"):
+        if line.startswith("+") and not line.startswith("+++"):
+            result.append(line + "\n", style=f"bold {Colors.SUCCESS}")
+        elif line.startswith("-") and not line.startswith("---"):
+            result.append(line + "\n", style=f"bold {Colors.ERROR}")
+        elif line.startswith("@@"):
+            result.append(line + "\n", style=f"bold {Colors.ACCENT}")
+        else:
+            result.append(line + "\n", style=Colors.MUTED)
+
+    header = f"{Icons.GIT} {block.meta.get('title', 'Diff')}"
+    if block.meta.get("file_path"):
+        header += f" [{Colors.MUTED}]{block.meta['file_path']}[/]"
+
+    return Panel(
+        result,
+        title=f"[bold {Colors.PRIMARY}]{header}[/]",
+        title_align="left",
+        border_style=Colors.BORDER,
+        box=box.ROUNDED,
+        padding=(0, 1),
+    )
+
+
+def _render_markup(block: TranscriptBlock) -> RenderableType:
+    # Live widgets get the markup string; Static parses it on its own.
+    return block.source
+
+
+def _render_markdown(block: TranscriptBlock) -> RenderableType:
+    return RichMarkdown(block.source)
+
+
+def _render_tool_result(block: TranscriptBlock) -> RenderableType:
+    return OutputFormatter.format_tool_result(
+        block.meta["tool_name"],
+        block.meta["success"],
+        block.source or None,
+        block.meta.get("error"),
+    )
+
+
+def _render_response(block: TranscriptBlock) -> RenderableType:
+    return OutputFormatter.format_response(block.source, block.meta.get("title", "Response"))
+
+
+def _render_info(block: TranscriptBlock) -> RenderableType:
+    border_color = block.meta.get("border_color", Colors.PRIMARY)
+    return Panel(
+        RichMarkdown(block.source),
+        title=f"[bold {border_color}]{block.meta.get('icon', 'ℹ️')} {block.meta.get('title', 'Info')}[/]",
+        title_align="left",
+        border_style=border_color,
+        box=box.ROUNDED,
+        padding=(1, 2),
+    )
+
+
+def _render_markdown_parts(block: TranscriptBlock) -> RenderableType:
+    rendered_parts: List[RenderableType] = []
+    for part in block.meta.get("parts", [block.source]):
+        try:
+            rendered_parts.append(RichMarkdown(part))
+        except (ValueError, TypeError):
+            rendered_parts.append(Text(part))
+    return Panel(
+        Group(*rendered_parts),
+        title=f"[bold {Colors.PRIMARY}]{block.meta.get('title', 'Response')}[/]",
+        title_align="left",
+        border_style=Colors.BORDER,
+        box=box.ROUNDED,
+        padding=(1, 2),
+    )
+
+
+_RENDERERS: Dict[str, Callable[[TranscriptBlock], RenderableType]] = {
+    "user": _render_user,
+    "system": _render_system,
+    "code": _render_code,
+    "diff": _render_diff,
+    "markup": _render_markup,
+    "markdown": _render_markdown,
+    "tool_result": _render_tool_result,
+    "response": _render_response,
+    "info": _render_info,
+    "markdown_parts": _render_markdown_parts,
+}
+
+
+def build_renderable(block: TranscriptBlock) -> RenderableType:
+    """Build the Rich renderable for a block from its stored source."""
+    block.flush()
+    return _RENDERERS[block.kind](block)
+
+
+# =============================================================================
+# MODEL
+# =============================================================================
+
+
+class TranscriptModel:
+    """
+    Append-only transcript plus an LRU cache of rendered strips.
+
+    Strips are cached per (block index, width) and bounded by total line
+    count, so scrolling back over dematerialized history re-renders each
+    block at most once per terminal width.
+    """
+
+    def __init__(self, max_cached_lines: int = DEFAULT_MAX_CACHED_LINES) -> None:
+        self._blocks: List[TranscriptBlock] = []
+        self._strips: "OrderedDict[Tuple[int, int], List[Strip]]" = OrderedDict()
+        self._widths: Dict[int, Set[int]] = {}  # block index -> widths with cached strips
+        self._cached_lines = 0
+        self._max_cached_lines = max_cached_lines
+        self._stats = TranscriptCacheStats()
+
+    def append(self, kind: str, source: str, css_class: str, **meta: Any) -> TranscriptBlock:
+        """Record a new block at the end of the transcript."""
+        if kind not in _RENDERERS:
+            raise ValueError(f"Unknown transcript block kind: {kind}")
+        block = TranscriptBlock(len(self._blocks), kind, source, css_class, meta)
+        self._blocks.append(block)
+        return block
+
+    def update_source(self, block: TranscriptBlock, source: str) -> None:
+        """Replace a block's source and drop its rendered strips."""
+        block._chunks.clear()
+        block.source = source
+        self._invalidate(block)
+
+    def append_source(self, block: TranscriptBlock, delta: str) -> None:
+        """Append streamed text to a block; chunks are joined when it is next read."""
+        block._chunks.append(delta)
+        self._invalidate(block)
+
+    def _invalidate(self, block: TranscriptBlock) -> None:
+        for width in list(self._widths.get(block.index, ())):
+            self._drop((block.index, width))
+
+    def render_lines(self, block: TranscriptBlock, width: int, console: Console) -> List[Strip]:
+        """Rendered strips for a block at a given width (cached)."""
+        key = (block.index, width)
+        strips = self._strips.get(key)
+        if strips is not None:
+            self._strips.move_to_end(key)
+            self._stats.hits += 1
+            return strips
+
+        self._stats.misses += 1
+        renderable = build_renderable(block)
+        if isinstance(renderable, str):
+            renderable = Text.from_markup(renderable)
+        options = console.options.update_width(max(width, 1))
+        lines = console.render_lines(renderable, options, pad=True)
+        strips = [Strip(line, width) for line in lines]
+
+        self._strips[key] = strips
+        self._widths.setdefault(block.index, set()).add(width)
+        self._cached_lines += len(strips)
+        while self._cached_lines > self._max_cached_lines and len(self._strips) > 1:
+            self._drop(next(iter(self._strips)))
+            self._stats.evictions += 1
+        return strips
+
+    def _drop(self, key: Tuple[int, int]) -> None:
+        strips = self._strips.pop(key, None)
+        if strips is not None:
+            self._cached_lines -= len(strips)
+            widths = self._widths[key[0]]
+            widths.discard(key[1])
+            if not widths:
+                del self._widths[key[0]]
+
+    def clear(self) -> None:
+        """Drop all blocks and cached strips."""
+        self._blocks.clear()
+        self._strips.clear()
+        self._widths.clear()
+        self._cached_lines = 0
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    def __getitem__(self, index: int) -> TranscriptBlock:
+        return self._blocks[index]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get transcript and render cache statistics."""
+        return {
+            "blocks": len(self._blocks),
+            "cached_entries": len(self._strips),
+            "cached_lines": self._cached_lines,
+            "hits": self._stats.hits,
+            "misses": self._stats.misses,
+            "hit_rate": self._stats.hit_rate,
+            "evictions": self._stats.evictions,
+        }
+
+
+# =============================================================================
+# HISTORY WIDGET
+# =============================================================================
+
+
+class TranscriptHistory(Widget):
+    """
+    Paints the dematerialized prefix of a transcript from cached strips.
+
+    Stands in for the widgets trimmed from the top of the ResponseView. Only
+    lines inside the viewport are ever requested, so scrolling back renders
+    just the blocks that come into view, each once per width.
+    """
+
+    DEFAULT_CSS = """
+    TranscriptHistory {
+        height: auto;
+    }
+    """
+
+    def __init__(self, model: TranscriptModel, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.model = model
+        self.count = 0
+        self._width = -1
+        self._offsets: List[int] = [0]
+
+    def extend(self, count: int) -> None:
+        """Cover blocks ``[0, count)`` of the transcript."""
+        if count == self.count:
+            return
+        for index in range(self.count, count):
+            self._offsets.append(self._offsets[-1] + self._block_height(self.model[index]))
+        self.count = count
+        self.refresh(layout=True)
+
+    def _block_height(self, block: TranscriptBlock) -> int:
+        return block.heights.get(self._width) or block.estimate_height()
+
+    def _ensure_offsets(self, width: int) -> None:
+        if width == self._width:
+            return
+        self._width = width
+        self._offsets = [0]
+        for index in range(self.count):
+            self._offsets.append(self._offsets[-1] + self._block_height(self.model[index]))
+
+    @property
+    def virtual_height(self) -> int:
+        """Total height of the covered blocks at the current width."""
+        return self._offsets[-1]
+
+    def get_content_height(self, container: Size, viewport: Size, width: int) -> int:
+        self._ensure_offsets(width)
+        return self._offsets[-1]
+
+    def render_line(self, y: int) -> Strip:
+        width = self.size.width
+        self._ensure_offsets(width)
+        index = bisect_right(self._offsets, y) - 1
+        if not 0 <= index < self.count:
+            return Strip.blank(width, self.rich_style)
+
+        block = self.model[index]
+        strips = self.model.render_lines(block, width, self.app.console)
+        height = block.margin_top + len(strips) + block.margin_bottom
+        if block.heights.get(width) != height:
+            # The height hint was an estimate (or measured at another width):
+            # record the real one and re-layout on the next frame.
+            block.heights[width] = height
+            self._width = -1
+            self.call_later(self.refresh, layout=True)
+
+        line = y - self._offsets[index] - block.margin_top
+        style = self.rich_style + block.style if block.style else self.rich_style
+        if not 0 <= line < len(strips):
+            return Strip.blank(width, style)
+        return strips[line].apply_style(style)
+
+
+__all__ = [
+    "TranscriptBlock",
+    "TranscriptCacheStats",
+    "TranscriptModel",
+    "TranscriptHistory",
+    "build_renderable",
+]
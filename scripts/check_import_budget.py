@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""Check import budget - startup time guardrail for the Vertice entry points.
+
+Imports each entry point in a fresh interpreter under ``python -X importtime``,
+keeps the raw import tree, and compares the number of modules loaded against
+the budget stored in import_budget.json. Wall-clock import time depends on the
+machine and its load, so going over the time budget only warns unless
+--strict-time is given.
+
+Usage:
+    python scripts/check_import_budget.py                    # check all entry points
+    python scripts/check_import_budget.py tui --top 15       # heaviest imports for one
+    python scripts/check_import_budget.py --save-trees DIR   # keep raw importtime trees
+    python scripts/check_import_budget.py --strict-time      # fail on time too
+    python scripts/check_import_budget.py --update           # re-baseline the budget
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+BUDGET_FILE = Path(__file__).resolve().parent / "import_budget.json"
+
+# name -> (directory put on sys.path, module imported)
+ENTRY_POINTS = {
+    "vertice": ("apps/cli", "main"),
+    "tui": ("apps/tui", "main"),
+    "gateway": ("apps/agent-gateway/app", "main"),
+}
+
+ROUNDS = 3
+# Headroom applied by --update; module counts are stable, wall time is not
+MODULE_HEADROOM = 1.05
+TIME_HEADROOM = 1.5
+
+
+@dataclass
+class ImportRecord:
+    """One line of ``-X importtime`` output."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class Measurement:
+    """Modules and time spent importing one entry point."""
+
+    modules: int
+    import_ms: float
+    tree: str
+    records: List[ImportRecord]
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """Parse ``-X importtime`` lines (children are reported before parents)."""
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line[len("import time:") :].split("|")
+        if not fields[0].strip().isdigit():
+            continue  # Header line
+        name = fields[2].rstrip()
+        stripped = name.lstrip()
+        depth = (len(name) - len(stripped) - 1) // 2
+        records.append(ImportRecord(stripped, int(fields[0]), int(fields[1]), depth))
+    return records
+
+
+def entry_subtree(records: List[ImportRecord], module: str) -> List[ImportRecord]:
+    """Records imported on behalf of the top-level import of ``module``."""
+    start = 0
+    for i, record in enumerate(records):
+        if record.depth == 0:
+            if record.module == module:
+                return records[start : i + 1]
+            start = i + 1
+    raise ValueError(f"{module} not found at top level of the import tree")
+
+
+def measure(name: str, python: str = sys.executable) -> Measurement:
+    """Import an entry point in a fresh interpreter and measure it."""
+    path, module = ENTRY_POINTS[name]
+    code = f"import sys; sys.path.insert(0, {str(ROOT / path)!r}); import {module}"
+    env = dict(os.environ, PYTHONPATH=str(ROOT / "src"))
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env=env,
+    )
+    if result.returncode != 0:
+        last = result.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        raise RuntimeError(f"{name}: import failed: {last[0]}")
+
+    records = entry_subtree(parse_importtime(result.stderr), module)
+    return Measurement(
+        modules=len(records),
+        import_ms=records[-1].cumulative_us / 1000,
+        tree=result.stderr,
+        records=records,
+    )
+
+
+def measure_median(name: str, rounds: int = ROUNDS) -> Measurement:
+    """Median run of several (after a discarded run that warms the .pyc caches)."""
+    runs = [measure(name) for _ in range(rounds + 1)][1:]
+    return sorted(runs, key=lambda m: m.import_ms)[len(runs) // 2]
+
+
+def load_budget(path: Path = BUDGET_FILE) -> Dict[str, dict]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())["entry_points"]
+
+
+def check(name: str, measured: Measurement, budget: Optional[dict]) -> List[str]:
+    """Return module count violations for one entry point."""
+    if budget is None:
+        return [f"{name}: no budget recorded (run with --update)"]
+    if measured.modules > budget["modules"]:
+        return [f"{name}: {measured.modules} modules imported (budget: {budget['modules']})"]
+    return []
+
+
+def check_time(name: str, measured: Measurement, budget: Optional[dict]) -> Optional[str]:
+    """Return the import time overrun for one entry point, if any."""
+    if budget is None or measured.import_ms <= budget["import_ms"]:
+        return None
+    return f"{name}: {measured.import_ms:.0f} ms to import (budget: {budget['import_ms']} ms)"
+
+
+def write_budget(results: Dict[str, Measurement], path: Path = BUDGET_FILE) -> None:
+    budget = load_budget(path)
+    for name, measured in results.items():
+        budget[name] = {
+            "modules": int(measured.modules * MODULE_HEADROOM) + 1,
+            "import_ms": round(measured.import_ms * TIME_HEADROOM),
+            "measured_modules": measured.modules,
+            "measured_ms": round(measured.import_ms, 1),
+        }
+    data = {
+        "python": f"{sys.version_info.major}.{sys.version_info.minor}",
+        "entry_points": dict(sorted(budget.items())),
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n")
+
+
+def heaviest(measured: Measurement, top: int) -> List[ImportRecord]:
+    """Slowest imports under the entry point, by cumulative time."""
+    return sorted(measured.records, key=lambda r: r.cumulative_us, reverse=True)[1 : top + 1]
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Check startup import budget")
+    parser.add_argument("entry_points", nargs="*", help=f"default: {', '.join(ENTRY_POINTS)}")
+    parser.add_argument("--update", action="store_true", help="rewrite the stored budget")
+    parser.add_argument("--save-trees", metavar="DIR", help="write raw -X importtime trees")
+    parser.add_argument("--top", type=int, default=0, help="show the N heaviest imports")
+    parser.add_argument("--rounds", type=int, default=ROUNDS)
+    parser.add_argument(
+        "--strict-time", action="store_true", help="fail, not warn, on import time overruns"
+    )
+    args = parser.parse_args()
+
+    names = args.entry_points or list(ENTRY_POINTS)
+    unknown = set(names) - set(ENTRY_POINTS)
+    if unknown:
+        parser.error(f"unknown entry points: {', '.join(sorted(unknown))}")
+    budget = load_budget()
+    results: Dict[str, Measurement] = {}
+    failed = False
+
+    for name in names:
+        try:
+            measured = results[name] = measure_median(name, args.rounds)
+        except RuntimeError as e:
+            print(f"ERROR: {e}")
+            failed = True
+            continue
+
+        print(f"{name:<10} {measured.modules:>5} modules {measured.import_ms:>9.1f} ms")
+        for record in heaviest(measured, args.top):
+            print(f"    {record.cumulative_us / 1000:>9.1f} ms  {record.module}")
+
+        if args.save_trees:
+            trees = Path(args.save_trees)
+            trees.mkdir(parents=True, exist_ok=True)
+            (trees / f"{name}.importtime.txt").write_text(measured.tree)
+
+        if not args.update:
+            for failure in check(name, measured, budget.get(name)):
+                print(f"FAIL: {failure}")
+                failed = True
+            overrun = check_time(name, measured, budget.get(name))
+            if overrun:
+                print(f"{'FAIL' if args.strict_time else 'WARN'}: {overrun}")
+                failed = failed or args.strict_time
+
+    if args.update:
+        write_budget(results)
+        print(f"Budget written to {BUDGET_FILE.relative_to(ROOT)}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
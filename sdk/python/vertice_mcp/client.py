@@ -5,9 +5,13 @@ Generated with ❤️ by Vertex AI Codey
 For seamless integration with the collective AI ecosystem.
 """
 
+from __future__ import annotations
+
 import asyncio
-import aiohttp
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
+
+if TYPE_CHECKING:
+    import aiohttp
 
 from vertice_mcp.types import (
     MCPClientConfig,
@@ -36,6 +40,8 @@ class MCPClient:
         self._session = None
 
     def __enter__(self):
+        import aiohttp  # Deferred: aiohttp takes ~0.3s to import
+
         self._session = aiohttp.ClientSession(
             timeout=aiohttp.ClientTimeout(total=self.config.timeout)
         )
@@ -247,6 +253,8 @@ class MCPClient:
 
     async def _handle_error_response(self, response: aiohttp.ClientResponse):
         """Handle error responses from the server."""
+        import aiohttp
+
         try:
             error_data = await response.json()
             error = error_data.get("error", {})
@@ -289,6 +297,8 @@ class AsyncMCPClient:
         self.session = None
 
     async def __aenter__(self):
+        import aiohttp
+
         self.session = aiohttp.ClientSession(
             timeout=aiohttp.ClientTimeout(total=self.config.timeout)
         )
@@ -472,6 +482,8 @@ class AsyncMCPClient:
 
     async def _handle_error_response(self, response: aiohttp.ClientResponse):
         """Handle error responses."""
+        import aiohttp
+
         try:
             error_data = await response.json()
             error = error_data.get("error", {})
@@ -0,0 +1,103 @@
+"""
+A2A TaskStore listing latency with 100k tasks.
+
+Fills each store with tasks spread over 1,000 contexts, completes a third
+of them, then times filtered first pages and a deep cursor walk. The
+legacy column is the previous list_tasks (filter the whole dict, sort by
+updated_at, slice), which scanned every task on every call.
+
+Run: PYTHONPATH=src python tests/benchmarks/a2a_task_store.py
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path.cwd() / "src"))
+
+from vertice_core.a2a.grpc_task_store import TaskQuery, TaskStore, TaskStoreConfig  # noqa: E402
+from vertice_core.a2a.proto import Message, MessageRole, TaskState  # noqa: E402
+from vertice_core.a2a.sqlite_task_store import SqliteTaskStore  # noqa: E402
+
+TASKS = 100_000
+CONTEXTS = 1_000
+PAGE = 50
+REPEAT = 20
+COMPLETED = TaskState.TASK_STATE_COMPLETED
+CONFIG = TaskStoreConfig(terminal_ttl=None, max_tasks=None)
+
+
+async def fill(store) -> float:
+    start = time.perf_counter()
+    for i in range(TASKS):
+        msg = Message(
+            id=str(uuid.uuid4()),
+            role=MessageRole.MESSAGE_ROLE_USER,
+            context_id=f"ctx-{i % CONTEXTS}",
+        )
+        task = await store.create_task(msg)
+        if i % 3 == 0:
+            await store.update_task(task.id, state=COMPLETED)
+    return time.perf_counter() - start
+
+
+async def first_page_ms(store, query: TaskQuery) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        await store.list_tasks_page(query, limit=PAGE)
+    return (time.perf_counter() - start) / REPEAT * 1000
+
+
+async def walk_ms(store, query: TaskQuery) -> float:
+    """Time per page when walking 20 pages deep with the cursor."""
+    start = time.perf_counter()
+    cursor = ""
+    for _ in range(REPEAT):
+        page = await store.list_tasks_page(query, limit=PAGE, cursor=cursor)
+        cursor = page.next_cursor
+    return (time.perf_counter() - start) / REPEAT * 1000
+
+
+def legacy_ms(store: TaskStore, query: TaskQuery) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        tasks = [t for t in store._tasks.values() if query.matches(t)]
+        tasks.sort(key=lambda t: t.updated_at.ToDatetime(), reverse=True)
+        tasks[:PAGE]
+    return (time.perf_counter() - start) / REPEAT * 1000
+
+
+QUERIES = {
+    "all": TaskQuery(),
+    "state=completed": TaskQuery(states=[COMPLETED]),
+    "context": TaskQuery(context_id="ctx-7"),
+}
+
+
+async def run(name: str, store) -> None:
+    elapsed = await fill(store)
+    print(f"\n{name}: {TASKS:,} tasks stored at {TASKS / elapsed:,.0f} creates/s")
+    print(f"{'query':>16} {'first page':>12} {'cursor walk':>13} {'legacy scan':>13}")
+    for label, query in QUERIES.items():
+        first = await first_page_ms(store, query)
+        walk = await walk_ms(store, query)
+        legacy = f"{legacy_ms(store, query):>10.2f} ms" if isinstance(store, TaskStore) else "-"
+        print(f"{label:>16} {first:>9.2f} ms {walk:>10.2f} ms {legacy:>13}")
+
+
+def main():
+    print("\n⚡ BENCHMARK: A2A TaskStore pagination (100k tasks)")
+    print("=" * 60)
+    asyncio.run(run("memory", TaskStore(CONFIG)))
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SqliteTaskStore(Path(tmp) / "tasks.db", CONFIG)
+        asyncio.run(run("sqlite", store))
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Multi-edit refactor: stateless re-parsing vs an incremental EditSession.
+
+Renames a series of identifiers in a large file and, after every rename,
+checks syntax and lists symbols - the loop an agent runs while refactoring.
+The legacy path parses from scratch on every call (parse cache disabled);
+the session path edits its tree and reparses incrementally. Both must end
+with identical content and symbols.
+
+Run: PYTHONPATH=src python tests/benchmarks/ast_edit_session.py
+"""
+
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path.cwd() / "src"))
+
+from vertice_core.code.ast import ASTEditor  # noqa: E402
+
+SOURCE = Path.cwd() / "src" / "vertice_core" / "code" / "ast" / "editor.py"
+COPIES = 8
+RENAMES = [
+    ("content_bytes", "source_bytes"),
+    ("language", "lang"),
+    ("matches", "found"),
+    ("node_text", "text_of_node"),
+    ("include_strings", "with_strings"),
+    ("line_idx", "row"),
+    ("parsed", "parse_result"),
+    ("context", "ctx"),
+    ("location", "loc"),
+    ("tree", "syntax_tree"),
+]
+ROUNDS = 3
+
+
+def legacy_refactor(content: str):
+    editor = ASTEditor()
+    editor.PARSE_CACHE_SIZE = 0
+    for old, new in RENAMES:
+        content = editor.replace_in_code(content, old, new, "python").content
+        assert editor.is_valid_syntax(content, "python")[0]
+        symbols = editor.get_symbols(content, "python")
+    return content, symbols, editor.get_parse_stats()
+
+
+def session_refactor(content: str):
+    editor = ASTEditor()
+    session = editor.open_session(content, "python")
+    for old, new in RENAMES:
+        session.replace_in_code(old, new)
+        assert session.is_valid_syntax()[0]
+        symbols = session.get_symbols()
+    return session.content, symbols, editor.get_parse_stats()
+
+
+def measure(fn, content: str):
+    samples = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        result = fn(content)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples), result
+
+
+def main():
+    print("\n⚡ BENCHMARK: AST EDIT SESSION")
+    print("=" * 60)
+
+    content = "\n".join([SOURCE.read_text()] * COPIES)
+    print(f"File: {len(content.splitlines())} lines, {len(RENAMES)} renames")
+
+    legacy_time, (legacy_content, legacy_symbols, legacy_stats) = measure(legacy_refactor, content)
+    session_time, (session_content, session_symbols, session_stats) = measure(
+        session_refactor, content
+    )
+
+    assert session_content == legacy_content
+    assert session_symbols == legacy_symbols
+
+    print(f"Legacy:  {legacy_time * 1000:8.1f} ms  {legacy_stats['full_parses']} full parses")
+    print(
+        f"Session: {session_time * 1000:8.1f} ms  {session_stats['full_parses']} full parse, "
+        f"{session_stats['incremental_parses']} incremental"
+    )
+    print(f"Speedup: {legacy_time / session_time:.1f}x")
+    print("Content and symbols identical ✓")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Snapshot storage for a large file edited many times.
+
+Records N small edits of a 10 MB text file in UndoManager, once with
+per-operation snapshot files (the previous layout: a full copy per edit)
+and once through the content-addressed BlobStore, then compares bytes on
+disk, record time and the time to read a snapshot back.
+
+Run: PYTHONPATH=src python tests/benchmarks/blob_store.py
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path.cwd() / "src"))
+
+from vertice_core.core.blob_store import BlobStore  # noqa: E402
+from vertice_core.core.undo_manager import UndoManager  # noqa: E402
+
+FILE_MB = 10
+EDITS = [10, 50, 100]
+
+
+def versions(count: int) -> list:
+    rng = random.Random(0)
+    content = os.urandom(FILE_MB * 1024 * 1024 // 2).hex().encode()
+    result = [content]
+    for _ in range(count):
+        pos = rng.randrange(len(content) - 100)
+        content = (
+            content[:pos] + rng.randbytes(rng.randrange(1, 50)).hex().encode() + content[pos + 50 :]
+        )
+        result.append(content)
+    return [v.decode() for v in result]
+
+
+def legacy(contents: list, root: Path) -> tuple:
+    snapshots = root / "snapshots"
+    snapshots.mkdir()
+    start = time.perf_counter()
+    for i, content in enumerate(contents[:-1]):
+        (snapshots / f"undo_{i}.snapshot").write_text(content)
+    elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    (snapshots / "undo_0.snapshot").read_text()
+    read_ms = (time.perf_counter() - start) * 1000
+    size = sum(p.stat().st_size for p in snapshots.iterdir())
+    return size, elapsed, read_ms
+
+
+def blobs(contents: list, root: Path) -> tuple:
+    store = BlobStore(root / "blobs")
+    manager = UndoManager(working_dir=str(root), persist_state=False, blob_store=store)
+    start = time.perf_counter()
+    for old, new in zip(contents, contents[1:]):
+        manager.record_file_edit(str(root / "big.txt"), old, new)
+    elapsed = time.perf_counter() - start
+
+    cold = BlobStore(root / "blobs")
+    newest = manager.get_history(1)[0].new_blob
+    start = time.perf_counter()
+    cold.get(newest)
+    read_ms = (time.perf_counter() - start) * 1000
+    cold.close()
+    size = store.stats()["stored_bytes"]
+    manager.close()
+    store.close()
+    return size, elapsed, read_ms
+
+
+def main():
+    print(f"\n⚡ BENCHMARK: Undo snapshots of a {FILE_MB} MB file (full copies vs BlobStore)")
+    print("=" * 60)
+    print(f"{'edits':>6} {'layout':>8} {'on disk':>10} {'record':>9} {'cold read':>11}")
+    for count in EDITS:
+        contents = versions(count)
+        for name, run in (("legacy", legacy), ("blobs", blobs)):
+            with tempfile.TemporaryDirectory() as tmp:
+                size, elapsed, read_ms = run(contents, Path(tmp))
+            print(
+                f"{count:>6} {name:>8} {size / 1e6:>7.1f} MB {elapsed:>7.2f} s {read_ms:>8.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
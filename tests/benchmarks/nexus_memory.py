@@ -0,0 +1,87 @@
+"""
+NEXUS HierarchicalMemory insert throughput as a level fills and evicts.
+
+Stores N blocks into L2 episodic memory with a token limit that holds a
+quarter of them, so every insert past that point evicts. The heap-indexed
+levels keep insert + evict at O(log n); the legacy path (re-summing the
+level and re-sorting it for every eviction) is only run for the smallest
+size. Top-k retrieval still scans the level and is reported separately.
+
+Run: PYTHONPATH=src python tests/benchmarks/nexus_memory.py
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add gateway app to path
+sys.path.append(str(Path.cwd() / "apps" / "agent-gateway" / "app"))
+
+import nexus.memory as nexus_memory  # noqa: E402
+from nexus.config import NexusConfig  # noqa: E402
+from nexus.types import MemoryBlock, MemoryLevel  # noqa: E402
+
+ITEM_COUNTS = [1_000, 10_000, 100_000]
+LEGACY_MAX = 5_000
+CONTENT = "observation " * 20  # 60 tokens
+
+
+def make_memory(items: int) -> nexus_memory.HierarchicalMemory:
+    nexus_memory.FIRESTORE_AVAILABLE = False
+    tokens = len(CONTENT) // 4
+    config = NexusConfig(project_id="bench", l2_episodic_memory_tokens=items * tokens // 4)
+    return nexus_memory.HierarchicalMemory(config)
+
+
+async def fill(memory: nexus_memory.HierarchicalMemory, items: int) -> float:
+    start = time.perf_counter()
+    for i in range(items):
+        await memory.store(CONTENT, MemoryLevel.L2_EPISODIC, importance=(i * 7919 % 100) / 100)
+    return time.perf_counter() - start
+
+
+async def retrieve_ms(memory: nexus_memory.HierarchicalMemory) -> float:
+    """Top-5 retrieval, which still scans the level (O(n log k))."""
+    start = time.perf_counter()
+    for _ in range(20):
+        await memory.retrieve(MemoryLevel.L2_EPISODIC, limit=5)
+    return (time.perf_counter() - start) / 20 * 1000
+
+
+def legacy_fill(items: int, limit: int) -> float:
+    """The previous algorithm: re-sum the level, re-sort it for each eviction."""
+    blocks = []
+    tokens = len(CONTENT) // 4
+    start = time.perf_counter()
+    for i in range(items):
+        current = sum(b.token_count for b in blocks)
+        while current + tokens > limit and blocks:
+            evicted = sorted(
+                blocks, key=lambda b: (b.importance, -b.access_count, b.created_at.timestamp())
+            )[0]
+            blocks.remove(evicted)
+            current -= evicted.token_count
+        blocks.append(
+            MemoryBlock(content=CONTENT, token_count=tokens, importance=(i * 7919 % 100) / 100)
+        )
+    return time.perf_counter() - start
+
+
+def main():
+    print("\n⚡ BENCHMARK: NEXUS memory insert throughput (with eviction)")
+    print("=" * 60)
+    print(f"{'items':>8} {'heap index':>16} {'legacy re-sort':>18} {'retrieve top-5':>16}")
+    for items in ITEM_COUNTS:
+        memory = make_memory(items)
+        elapsed = asyncio.run(fill(memory, items))
+        retrieve = asyncio.run(retrieve_ms(memory))
+        legacy = "-"
+        if items <= LEGACY_MAX:
+            legacy_s = legacy_fill(items, memory._token_limits[MemoryLevel.L2_EPISODIC])
+            legacy = f"{items / legacy_s:,.0f} ops/s"
+        print(f"{items:>8} {items / elapsed:>12,.0f} ops/s {legacy:>18} {retrieve:>13.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Concurrent PTY command throughput and cancellation latency.
+
+Runs N `yes | head` pipelines at once on a single event loop through
+PTYStream, then starts N endless `yes` commands and measures how long it
+takes from cancelling their readers until every process group is dead.
+
+Run: PYTHONPATH=src python tests/benchmarks/pty_stream.py
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path.cwd() / "src"))
+
+from vertice_core.tools.pty_stream import PTYStream  # noqa: E402
+
+CONCURRENCY = [1, 10, 50, 100]
+LINES = 200_000
+
+
+async def run_one() -> int:
+    async with PTYStream(f"yes | head -n {LINES}", timeout=60) as stream:
+        size = 0
+        async for chunk in stream:
+            size += len(chunk)
+        await stream.wait()
+        return size
+
+
+async def throughput(n: int) -> tuple:
+    start = time.perf_counter()
+    sizes = await asyncio.gather(*(run_one() for _ in range(n)))
+    elapsed = time.perf_counter() - start
+    return elapsed, sum(sizes) / elapsed / 1e6
+
+
+async def cancel_latency(n: int) -> float:
+    streams = [await PTYStream("yes").start() for _ in range(n)]
+    readers = [asyncio.create_task(stream.read_all()) for stream in streams]
+    await asyncio.sleep(0.2)
+
+    start = time.perf_counter()
+    for reader in readers:
+        reader.cancel()
+    await asyncio.gather(*readers, return_exceptions=True)
+    await asyncio.gather(*(stream.wait() for stream in streams))
+    elapsed = time.perf_counter() - start
+    for stream in streams:
+        await stream.aclose()
+    return elapsed * 1000
+
+
+def main():
+    print("\n⚡ BENCHMARK: Async PTY streams (yes | head, one event loop)")
+    print("=" * 60)
+    print(f"{'commands':>9} {'wall':>10} {'throughput':>14} {'cancel all':>12}")
+    for n in CONCURRENCY:
+        elapsed, mbps = asyncio.run(throughput(n))
+        cancel_ms = asyncio.run(cancel_latency(n))
+        print(f"{n:>9} {elapsed:>8.2f} s {mbps:>9.1f} MB/s {cancel_ms:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
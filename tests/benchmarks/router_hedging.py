@@ -0,0 +1,84 @@
+"""
+Tail latency of VerticeRouter.generate() with and without hedged requests.
+
+Two fake providers answer in ~20 ms, but one request in twenty hits a 500 ms
+stall. Without hedging a stall is paid in full; with hedging the second
+provider is started once the primary passes its p95 latency, so the tail is
+bounded by roughly p95 plus the backup's latency.
+
+Run: PYTHONPATH=src python tests/benchmarks/router_hedging.py
+"""
+
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path.cwd() / "src"))
+
+from vertice_core.providers.routing_stats import AdaptiveRoutingConfig  # noqa: E402
+from vertice_core.providers.vertice_router import VerticeRouter  # noqa: E402
+
+REQUESTS = 400
+FAST = 0.02
+STALL = 0.5
+STALL_RATE = 0.05
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+class StallingProvider:
+    """Answers in FAST seconds, stalling for STALL seconds on STALL_RATE of requests."""
+
+    def __init__(self, name: str, rng: random.Random):
+        self.name = name
+        self.rng = rng
+
+    def is_available(self) -> bool:
+        return True
+
+    def get_model_info(self):
+        return {"model": f"{self.name}-model", "provider": self.name}
+
+    async def generate(self, messages, **kwargs) -> str:
+        stalled = self.rng.random() < STALL_RATE
+        await asyncio.sleep(STALL if stalled else FAST * self.rng.uniform(0.8, 1.2))
+        return "ok"
+
+
+async def measure(hedge: bool) -> list:
+    rng = random.Random(42)
+    providers = {name: StallingProvider(name, rng) for name in ("groq", "cerebras")}
+    router = VerticeRouter(providers=providers, routing=AdaptiveRoutingConfig(hedge=hedge))
+    latencies = []
+    for _ in range(REQUESTS):
+        t0 = time.perf_counter()
+        await router.generate(MESSAGES)
+        latencies.append((time.perf_counter() - t0) * 1000)
+    return latencies
+
+
+def percentile(values: list, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def main():
+    print("\n⚡ BENCHMARK: Router tail latency (hedged vs unhedged generate)")
+    print("=" * 60)
+    print(f"{'mode':>10} {'p50':>10} {'p95':>10} {'p99':>10} {'max':>10}")
+    for hedge in (False, True):
+        latencies = asyncio.run(measure(hedge))
+        print(
+            f"{'hedged' if hedge else 'plain':>10}"
+            f" {statistics.median(latencies):>7.1f} ms"
+            f" {percentile(latencies, 0.95):>7.1f} ms"
+            f" {percentile(latencies, 0.99):>7.1f} ms"
+            f" {max(latencies):>7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
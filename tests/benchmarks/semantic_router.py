@@ -0,0 +1,179 @@
+"""
+SemanticRouter latency: per-route cosine loops vs the exemplar matrix, and
+sequential route() vs batched route_many(), with and without the LLM fallback.
+
+Embeddings are 384-dimensional feature-hashed bags of words, so near-duplicate
+subtasks (re-cased, punctuated) score close together like real sentence
+embeddings and can be answered by the semantic decision cache.
+The LLM classifier is simulated with a 20 ms await.
+
+Run: PYTHONPATH=src python tests/benchmarks/semantic_router.py
+"""
+
+import asyncio
+import hashlib
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path.cwd() / "src"))
+
+from vertice_core.agents.router import (  # noqa: E402
+    AgentType,
+    RouteDefinition,
+    RouteMatrix,
+    SemanticRouter,
+    SimilarityEngine,
+)
+
+DIM = 384
+LLM_LATENCY = 0.02
+ROUNDS = 5
+
+ROUTES = [
+    RouteDefinition(
+        name="planner",
+        agent_type=AgentType.PLANNER,
+        description="task planning decomposition and workflow orchestration",
+        examples=["plan the migration steps", "break this feature into tasks"],
+    ),
+    RouteDefinition(
+        name="executor",
+        agent_type=AgentType.EXECUTOR,
+        description="code implementation and execution of planned tasks",
+        examples=["implement the login endpoint", "write the parser function"],
+    ),
+    RouteDefinition(
+        name="reviewer",
+        agent_type=AgentType.REVIEWER,
+        description="code review quality assurance and improvement suggestions",
+        examples=["review this diff for bugs", "check code quality of the module"],
+    ),
+    RouteDefinition(
+        name="architect",
+        agent_type=AgentType.ARCHITECT,
+        description="system design architecture decisions and technical planning",
+        examples=["design the service architecture", "choose a database schema"],
+    ),
+    RouteDefinition(
+        name="chat",
+        agent_type=AgentType.CHAT,
+        description="general conversation and assistance",
+        examples=["hello how are you", "explain what this means"],
+    ),
+]
+
+# Subtasks of decomposed requests: exemplar-like ones take the fast path,
+# the vague ones need the LLM, and half of those are near-duplicates.
+CONFIDENT = [
+    "implement the login endpoint",
+    "review this diff for bugs",
+    "plan the migration steps",
+    "design the service architecture",
+    "write the parser function",
+    "hello how are you",
+]
+VAGUE = [
+    "sort out the flaky thing on staging",
+    "make the nightly job less annoying",
+    "deal with the customer ticket backlog",
+    "tidy up whatever broke yesterday",
+]
+VAGUE_DUPLICATES = [query.capitalize() + "." for query in VAGUE]
+
+
+def embed(text: str):
+    vector = [0.0] * DIM
+    for word in text.lower().replace(".", " ").split():
+        digest = hashlib.blake2b(word.encode(), digest_size=8).digest()
+        vector[int.from_bytes(digest[:4], "little") % DIM] += 1.0 if digest[4] & 1 else -1.0
+    return vector
+
+
+async def classify(query, options):
+    await asyncio.sleep(LLM_LATENCY)
+    return options[0].split(":")[0]
+
+
+def make_router(with_llm: bool) -> SemanticRouter:
+    return SemanticRouter(
+        routes=list(ROUTES),
+        embed_func=embed,
+        llm_classify_func=classify if with_llm else None,
+    )
+
+
+def bench_scoring():
+    exemplars = [
+        (route.name, embed(text))
+        for route in ROUTES
+        for text in [route.description, *route.examples]
+    ]
+    queries = [embed(q) for q in CONFIDENT + VAGUE] * 20
+
+    def legacy():
+        for query in queries:
+            best = {}
+            for name, vector in exemplars:
+                score = SimilarityEngine.cosine_similarity(query, vector)
+                best[name] = max(best.get(name, score), score)
+            sorted(best.items(), key=lambda item: item[1], reverse=True)
+
+    matrix = RouteMatrix(exemplars)
+
+    def vectorized():
+        matrix.score_many(queries)
+
+    for label, fn in (("cosine loop", legacy), ("matrix", vectorized)):
+        times = []
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+        per_query = statistics.median(times) / len(queries) * 1e6
+        print(f"  {label:<28} {per_query:8.1f} µs/query")
+
+
+async def bench_routing(queries, with_llm: bool):
+    results = {}
+    for label in ("route() sequential", "route_many()"):
+        times = []
+        for _ in range(ROUNDS):
+            router = make_router(with_llm)
+            await router.initialize()
+            start = time.perf_counter()
+            if label == "route_many()":
+                await router.route_many(queries)
+            else:
+                for query in queries:
+                    await router.route(query)
+            times.append(time.perf_counter() - start)
+        results[label] = statistics.median(times)
+        stats = router.get_cache_stats()
+        print(
+            f"  {label:<28} {results[label] * 1000:8.2f} ms"
+            f"  (semantic hits: {stats['semantic_hits']})"
+        )
+    return results
+
+
+async def main():
+    print("\n⚡ BENCHMARK: SemanticRouter scoring and batch routing")
+    print("=" * 60)
+
+    print("\nScoring only (description + examples per route):")
+    bench_scoring()
+
+    print(f"\nFast path only ({len(CONFIDENT)} subtasks, no LLM):")
+    await bench_routing(CONFIDENT, with_llm=False)
+
+    queries = CONFIDENT + VAGUE + VAGUE_DUPLICATES
+    print(f"\nWith LLM fallback ({len(queries)} subtasks, {LLM_LATENCY * 1000:.0f} ms per call):")
+    results = await bench_routing(queries, with_llm=True)
+    print(f"  speedup: {results['route() sequential'] / results['route_many()']:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,127 @@
+"""
+Session search latency: scanning session files vs the FTS5 session catalog.
+
+Builds a history of 2,000 sessions x 20 messages over a 5,000-word
+vocabulary, with each topic term planted in ~1% of sessions. The scan path
+loads and decompresses session files and substring-matches their messages
+until it has 10 hits, which is what SessionManager.search_sessions() used
+to do; the catalog path ranks all matches from the SQLite index without
+touching session files. "common" matches every session: the scan stops
+after 10 files while the catalog ranks all of them (the catalog's worst case).
+
+Run: PYTHONPATH=src python tests/benchmarks/session_catalog.py
+"""
+
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path.cwd() / "src"))
+
+from vertice_core.core.session_manager import SessionCatalog  # noqa: E402
+from vertice_core.core.session_manager.storage import (  # noqa: E402
+    get_session_path,
+    load_session,
+    save_session,
+)
+from vertice_core.core.session_manager.types import (  # noqa: E402
+    ConversationMessage,
+    SessionSnapshot,
+    SessionState,
+)
+
+SESSIONS = 2_000
+MESSAGES = 20
+ROUNDS = 5
+TOPICS = ["retry policy", "kubernetes deploy", "parser", "flaky timeout"]
+QUERIES = TOPICS + ["nonexistent", "common"]
+TOPIC_RATE = 0.01
+
+VOCABULARY = [f"w{i}x" for i in range(5_000)]
+
+
+def make_snapshot(rng: random.Random, i: int) -> SessionSnapshot:
+    messages = []
+    for m in range(MESSAGES):
+        words = [rng.choice(VOCABULARY) for _ in range(rng.randint(20, 80))]
+        words.append("common")
+        for topic in TOPICS:
+            if rng.random() < TOPIC_RATE / MESSAGES:
+                words.insert(rng.randrange(len(words)), topic)
+        messages.append(
+            ConversationMessage(
+                role="user" if m % 2 == 0 else "assistant",
+                content=" ".join(words),
+                metadata={"tokens": rng.randint(50, 500)},
+            )
+        )
+    return SessionSnapshot(
+        session_id=f"session_{i:05d}",
+        state=SessionState.COMPLETED,
+        created_at=float(i),
+        updated_at=float(i),
+        checksum="",
+        messages=messages,
+        context={},
+        working_directory="/work",
+        open_files=[],
+        pending_operations=[],
+    )
+
+
+def scan(session_dir: Path, query: str, limit: int = 10):
+    """Legacy search: load every session and substring-match its messages."""
+    results = []
+    for i in range(SESSIONS):
+        session = load_session(get_session_path(session_dir, f"session_{i:05d}", True))
+        if any(query in m.content.lower() for m in session.messages):
+            results.append(session.session_id)
+            if len(results) >= limit:
+                break
+    return results
+
+
+def timed(fn) -> float:
+    times = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    print("\n⚡ BENCHMARK: Session search (file scan vs FTS5 catalog)")
+    print("=" * 60)
+
+    rng = random.Random(42)
+    with tempfile.TemporaryDirectory() as tmp:
+        session_dir = Path(tmp)
+        catalog = SessionCatalog(session_dir / "sessions_catalog.db")
+
+        start = time.perf_counter()
+        for i in range(SESSIONS):
+            snapshot = make_snapshot(rng, i)
+            save_session(snapshot, get_session_path(session_dir, snapshot.session_id, True))
+            catalog.index_session(snapshot, snapshot.messages[0].content[:100])
+        print(
+            f"Built {SESSIONS} sessions x {MESSAGES} messages in {time.perf_counter() - start:.1f}s"
+        )
+
+        print(f"\n{'query':<22} {'file scan':>12} {'catalog':>12} {'messages':>12}")
+        for query in QUERIES:
+            scan_ms = timed(lambda: scan(session_dir, query))
+            catalog_ms = timed(lambda: catalog.search_sessions(query))
+            messages_ms = timed(lambda: catalog.search_messages(query))
+            print(f"{query:<22} {scan_ms:>9.1f} ms {catalog_ms:>9.2f} ms {messages_ms:>9.2f} ms")
+
+        print(f"\nrecent(20): {timed(lambda: catalog.recent(20)):.3f} ms")
+        catalog.close()
+
+
+if __name__ == "__main__":
+    main()
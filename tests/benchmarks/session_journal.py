@@ -0,0 +1,73 @@
+"""
+Session save latency vs conversation length: journal append vs full snapshot.
+
+For sessions of 10 to 10k turns, measures the cost of saving one more turn.
+The journal path (SessionManager.save()) appends the new records with one
+fsync; the snapshot path (save(compact=True)) rewrites the whole session,
+which is what every save used to do.
+
+Run: PYTHONPATH=src python tests/benchmarks/session_journal.py
+"""
+
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path.cwd() / "src"))
+
+from vertice_core.core.session_manager import SessionManager  # noqa: E402
+
+TURN_COUNTS = [10, 100, 1_000, 10_000]
+SAVES = 20
+USER_TEXT = "please refactor the session storage module " * 3
+ASSISTANT_TEXT = "Here is the plan: read the file, extract helpers, add tests. " * 8
+
+
+def add_turn(manager: SessionManager, i: int) -> None:
+    manager.add_message("user", f"{i}: {USER_TEXT}")
+    manager.add_message("assistant", f"{i}: {ASSISTANT_TEXT}", metadata={"tokens": 120})
+
+
+def measure(manager: SessionManager, start: int, compact: bool) -> float:
+    times = []
+    for i in range(SAVES):
+        add_turn(manager, start + i)
+        t0 = time.perf_counter()
+        manager.save(compact=compact)
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times) * 1000
+
+
+def main():
+    print("\n⚡ BENCHMARK: Session save latency (journal vs full snapshot)")
+    print("=" * 60)
+    print(f"{'turns':>8} {'journal save':>16} {'snapshot save':>16} {'journal size':>14}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = SessionManager(session_dir=tmp, auto_save_interval=3600)
+        manager.start_session()
+        turns = 0
+        try:
+            for target in TURN_COUNTS:
+                while turns < target:
+                    add_turn(manager, turns)
+                    turns += 1
+                manager.save(compact=True)
+
+                journal_ms = measure(manager, turns, compact=False)
+                journal_kb = manager._journal.size / 1024
+                snapshot_ms = measure(manager, turns + SAVES, compact=True)
+                turns += 2 * SAVES
+                print(
+                    f"{target:>8} {journal_ms:>13.2f} ms {snapshot_ms:>13.2f} ms"
+                    f" {journal_kb:>11.1f} KB"
+                )
+        finally:
+            manager.end_session()
+
+
+if __name__ == "__main__":
+    main()
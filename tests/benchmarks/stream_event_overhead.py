@@ -0,0 +1,140 @@
+"""
+Per-token overhead: SSE text vs in-process typed events.
+
+Compares the two ways Bridge.chat can hand an Open Responses stream to the TUI:
+
+- SSE: builder -> to_sse (json.dumps) -> splitlines -> OpenResponsesParser
+  (json.loads) -> TUI event. This is what network consumers still get.
+- Typed: builder -> StreamEvent -> OpenResponsesEvent.from_stream_event.
+
+Also reports the envelope encoders alone (Open Responses delta to_sse and the
+gateway's AG-UI sse_encode_event), fast path vs the generic dict/model_dump path.
+
+Run: PYTHONPATH=src python tests/benchmarks/stream_event_overhead.py
+"""
+
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path.cwd() / "src"))
+
+from vertice_core.agui.protocol import AGUIEvent, sse_encode_event  # noqa: E402
+from vertice_core.openresponses_stream import (  # noqa: E402
+    OpenResponsesStreamBuilder,
+    OutputTextDeltaEvent,
+    StreamEvent,
+)
+from vertice_core.tui.core.openresponses_events import (  # noqa: E402
+    OpenResponsesEvent,
+    OpenResponsesParser,
+)
+
+TOKENS = 20_000
+ROUNDS = 5
+# Typical streamed chunk: a few words with quotes/newlines that need escaping
+CHUNK = 'def f(x):\n    return "value" + x  '
+
+
+def run_sse() -> int:
+    builder = OpenResponsesStreamBuilder(model="bench")
+    builder.start()
+    item = builder.add_message()
+    builder.clear_events()
+    parser = OpenResponsesParser()
+    received = 0
+
+    for _ in range(TOKENS):
+        builder.text_delta(item, CHUNK)
+        for sse_chunk in builder.drain():
+            for line in sse_chunk.splitlines(keepends=True):
+                if parser.feed(line) is not None:
+                    received += 1
+    return received
+
+
+def run_typed() -> int:
+    builder = OpenResponsesStreamBuilder(model="bench")
+    builder.start()
+    item = builder.add_message()
+    builder.clear_events()
+    received = 0
+
+    for _ in range(TOKENS):
+        builder.text_delta(item, CHUNK)
+        for event in builder.drain(as_events=True):
+            OpenResponsesEvent.from_stream_event(event)
+            received += 1
+    return received
+
+
+def run_or_encode_generic() -> int:
+    event = OutputTextDeltaEvent(sequence_number=1, item_id="msg_1", delta=CHUNK)
+    for _ in range(TOKENS):
+        StreamEvent.to_sse(event)
+    return TOKENS
+
+
+def run_or_encode_fast() -> int:
+    event = OutputTextDeltaEvent(sequence_number=1, item_id="msg_1", delta=CHUNK)
+    for _ in range(TOKENS):
+        event.to_sse()
+    return TOKENS
+
+
+def run_agui_encode_generic() -> int:
+    event = AGUIEvent.delta(CHUNK, session_id="bench")
+    for _ in range(TOKENS):
+        data = json.dumps(event.model_dump(), separators=(",", ":"), ensure_ascii=False)
+        f"event: {event.type.value}\ndata: {data}\n\n"
+    return TOKENS
+
+
+def run_agui_encode_fast() -> int:
+    event = AGUIEvent.delta(CHUNK, session_id="bench")
+    for _ in range(TOKENS):
+        sse_encode_event(event)
+    return TOKENS
+
+
+def measure(fn) -> float:
+    """Median per-token cost in microseconds."""
+    samples = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        received = fn()
+        elapsed = time.perf_counter() - start
+        assert received == TOKENS, received
+        samples.append(elapsed / TOKENS * 1e6)
+    return statistics.median(samples)
+
+
+def main():
+    print("\n⚡ BENCHMARK: PER-TOKEN STREAM OVERHEAD (builder -> TUI event)")
+    print("=" * 60)
+
+    sse_us = measure(run_sse)
+    typed_us = measure(run_typed)
+
+    print(f"SSE text path:      {sse_us:8.2f} µs/token")
+    print(f"Typed event path:   {typed_us:8.2f} µs/token")
+    print(f"Speedup:            {sse_us / typed_us:8.2f}x")
+
+    print("\nEnvelope encoding only")
+    for name, generic, fast in (
+        ("Open Responses delta", run_or_encode_generic, run_or_encode_fast),
+        ("AG-UI delta", run_agui_encode_generic, run_agui_encode_fast),
+    ):
+        generic_us = measure(generic)
+        fast_us = measure(fast)
+        print(
+            f"{name:22s} generic {generic_us:6.2f} µs  fast {fast_us:6.2f} µs  "
+            f"({generic_us / fast_us:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
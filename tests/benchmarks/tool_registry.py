@@ -0,0 +1,77 @@
+"""
+Tool registry build cost: instantiating every tool vs the schema manifest.
+
+Each measurement runs in a fresh interpreter. "eager" imports and
+instantiates every default tool, as ToolCatalog.add_defaults() used to;
+"manifest" registers LazyTool placeholders from tool_manifest.json. Both
+then produce the LLM schema list. Reported: time to build registry +
+schemas, memory allocated while doing so, and tool modules imported.
+
+Run: PYTHONPATH=src python tests/benchmarks/tool_registry.py
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path.cwd() / "src"))
+
+ROUNDS = 5
+
+SNIPPET = """
+import json, sys, time, tracemalloc
+import vertice_core.tools.base
+from vertice_core.tools.base import ToolRegistry
+from vertice_core.tools.manifest import TOOL_GROUPS, load_tool_class, register_group
+
+tools_before = {m for m in sys.modules if m.startswith("vertice_core.tools.")}
+tracemalloc.start()
+start = time.perf_counter()
+registry = ToolRegistry()
+if MODE == "eager":
+    for target in TOOL_GROUPS["defaults"]:
+        registry.register(load_tool_class(target)())
+else:
+    register_group(registry, "defaults")
+schemas = registry.get_schemas()
+elapsed = time.perf_counter() - start
+_, peak = tracemalloc.get_traced_memory()
+tools_after = {m for m in sys.modules if m.startswith("vertice_core.tools.")}
+print(json.dumps({"ms": elapsed * 1000, "kb": peak / 1024, "schemas": len(schemas),
+                  "modules": len(tools_after - tools_before)}))
+"""
+
+
+def run(mode: str) -> dict:
+    env = dict(os.environ, PYTHONPATH=str(Path.cwd() / "src"))
+    out = subprocess.run(
+        [sys.executable, "-c", f"MODE = {mode!r}\n{SNIPPET}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    print("\n⚡ BENCHMARK: Tool registry build (eager instances vs manifest)")
+    print("=" * 60)
+    print(f"{'mode':<10} {'build+schemas':>14} {'peak alloc':>12} {'modules':>8} {'schemas':>8}")
+
+    for mode in ("eager", "manifest"):
+        runs = [run(mode) for _ in range(ROUNDS)]
+        ms = statistics.median(r["ms"] for r in runs)
+        kb = statistics.median(r["kb"] for r in runs)
+        print(
+            f"{mode:<10} {ms:>11.2f} ms {kb:>9.1f} KB"
+            f" {runs[0]['modules']:>8} {runs[0]['schemas']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Tests for ASTEditor parse caching and incremental EditSession reparsing.
+
+Every incrementally maintained tree must equal a from-scratch parse of the
+same text, and session queries must answer like the stateless editor API.
+"""
+
+import random
+
+import pytest
+
+from vertice_core.code.ast import TREE_SITTER_AVAILABLE, ASTEditor, EditSession
+from vertice_core.code.ast.editor import advance_point
+
+pytestmark = pytest.mark.skipif(
+    not TREE_SITTER_AVAILABLE or not ASTEditor().is_language_supported("python"),
+    reason="tree-sitter python grammar not installed",
+)
+
+SOURCE = '''
+import os
+
+
+class Greeter:
+    """Says hello to ``name``."""
+
+    def greet(self, name):
+        # greet name politely
+        return f"hello {name}"
+
+
+def helper(name, count):
+    message = "name"
+    return [Greeter().greet(name) for _ in range(count)]
+'''
+
+
+def fresh_sexp(content):
+    """S-expression of a from-scratch parse, bypassing every cache."""
+    editor = ASTEditor()
+    editor.PARSE_CACHE_SIZE = 0
+    return str(editor._parse(content, "python").root_node)
+
+
+class TestParseCache:
+    def test_repeated_queries_parse_once(self):
+        editor = ASTEditor()
+        editor.get_symbols(SOURCE, "python")
+        editor.find_in_code(SOURCE, "name", "python")
+        editor.is_valid_syntax(SOURCE, "python")
+        editor.get_node_at_position(SOURCE, 8, 9, "python")
+
+        stats = editor.get_parse_stats()
+        assert stats["full_parses"] == 1
+        assert stats["cache_hits"] == 3
+
+    def test_cache_is_bounded(self):
+        editor = ASTEditor()
+        editor.PARSE_CACHE_SIZE = 2
+        for i in range(5):
+            editor.is_valid_syntax(f"x = {i}\n", "python")
+        assert editor.get_parse_stats()["cached_trees"] == 2
+
+    def test_replace_result_reparses_incrementally(self):
+        editor = ASTEditor()
+        result = editor.replace_in_code(SOURCE, "name", "who", "python")
+
+        assert editor.is_valid_syntax(result.content, "python") == (True, None)
+        stats = editor.get_parse_stats()
+        assert stats["full_parses"] == 1
+        assert stats["incremental_parses"] == 1
+        assert str(editor._parse(result.content, "python").root_node) == fresh_sexp(result.content)
+
+    def test_replace_with_multiline_and_unicode_text(self):
+        editor = ASTEditor()
+        content = 'def f(ñame):\n    return ñame + "ñame"\n'
+        result = editor.replace_in_code(content, "return", "x = 1\n    return", "python")
+        tree = editor._parse(result.content, "python")
+        assert str(tree.root_node) == fresh_sexp(result.content)
+
+
+class TestEditSession:
+    def test_session_matches_stateless_api(self):
+        editor = ASTEditor()
+        session = editor.open_session(SOURCE, "python")
+        assert isinstance(session, EditSession)
+
+        result = session.replace_in_code("name", "who")
+        expected = ASTEditor().replace_in_code(SOURCE, "name", "who", "python")
+        assert result.content == expected.content
+        assert result.changes_made == expected.changes_made
+
+        fresh = ASTEditor()
+        assert session.get_symbols() == fresh.get_symbols(result.content, "python")
+        assert session.find_in_code("who") == fresh.find_in_code(result.content, "who", "python")
+        assert session.find_symbol("greet") == fresh.find_symbol(result.content, "greet", "python")
+        assert session.get_node_at_position(8, 20) == fresh.get_node_at_position(
+            result.content, 8, 20, "python"
+        )
+
+    def test_character_edits_track_fresh_parse(self):
+        session = ASTEditor().open_session(SOURCE, "python")
+        rng = random.Random(3)
+        snippets = ["x", "ü", "\n", "  pass\n", "(", "def g():\n    return 1\n", ""]
+
+        for _ in range(60):
+            start = rng.randrange(len(session.content) + 1)
+            end = min(len(session.content), start + rng.randrange(4))
+            session.edit(start, end, rng.choice(snippets))
+            assert str(session.tree.root_node) == fresh_sexp(session.content)
+
+        assert session.edit_count == 60
+        assert session.incremental_parses == 60
+
+    def test_syntax_errors_follow_edits(self):
+        session = ASTEditor().open_session("def f():\n    return 1\n", "python")
+        assert session.is_valid_syntax() == (True, None)
+
+        session.edit(7, 8, "")  # drop the colon
+        valid, error = session.is_valid_syntax()
+        assert not valid
+        assert error.startswith("Syntax error at line 1")
+
+        session.edit(7, 7, ":")
+        assert session.is_valid_syntax() == (True, None)
+
+    def test_edits_do_not_touch_cached_trees(self):
+        editor = ASTEditor()
+        before = str(editor._parse(SOURCE, "python").root_node)
+        session = editor.open_session(SOURCE, "python")
+        session.edit(0, 0, "x = 1\n")
+        session.get_symbols()
+        assert str(editor._parse(SOURCE, "python").root_node) == before
+
+    def test_sessions_are_reused_by_path(self):
+        editor = ASTEditor()
+        session = editor.open_session(SOURCE, "app.py", path="app.py")
+        assert session.language == "python"
+        assert editor.open_session(SOURCE, "python", path="app.py") is session
+
+        session.edit(0, 0, "# header\n")
+        assert editor.open_session(session.content, "python", path="app.py") is session
+        assert editor.open_session(SOURCE, "python", path="app.py") is not session
+
+        editor.close_session("app.py")
+        assert editor.get_parse_stats()["sessions"] == 0
+
+    def test_invalid_range(self):
+        session = ASTEditor().open_session("x = 1\n", "python")
+        with pytest.raises(ValueError):
+            session.edit(3, 100, "")
+
+
+def test_advance_point():
+    assert advance_point((2, 4), b"abc") == (2, 7)
+    assert advance_point((2, 4), b"a\nbc") == (3, 2)
+    assert advance_point((2, 4), b"a\n") == (3, 0)
@@ -149,6 +149,18 @@ def temp_workspace(tmp_path):
     return workspace
 
 
+@pytest.fixture(autouse=True)
+def isolated_blob_store(tmp_path, monkeypatch):
+    """Keep backups and undo snapshots out of the repo's .vertice/blobs."""
+    from vertice_core.core import blob_store
+
+    monkeypatch.setattr(blob_store, "DEFAULT_BLOB_DIR", str(tmp_path / ".vertice" / "blobs"))
+    monkeypatch.setattr(blob_store, "_stores", {})
+    yield
+    for store in blob_store._stores.values():
+        store.close()
+
+
 # =============================================================================
 # AZURE EMBEDDINGS FIXTURES (Sprint 0: Test Hygiene)
 # =============================================================================
@@ -16,6 +16,10 @@ from vertice_core.async_utils import (
     list_dir,
     read_bytes,
     write_bytes,
+    read_lines,
+    count_lines,
+    read_head,
+    write_atomic,
     AIOFILES_AVAILABLE,
 )
 
@@ -153,6 +157,83 @@ class TestListDir:
         assert all(p.suffix == ".txt" for p in result)
 
 
+class TestLineRangeReads:
+    """Test indexed line-range reads and bounded previews."""
+
+    @pytest.mark.asyncio
+    async def test_read_lines_matches_split_semantics(self, tmp_path):
+        """Test read_lines returns the same lines as slicing split()."""
+        test_file = tmp_path / "lines.txt"
+        text = "".join(f"line {i}\n" for i in range(1, 101))
+        test_file.write_text(text)
+        lines = text.split("\n")
+
+        for start, end in [(1, 1), (10, 20), (95, 200), (101, 101), (150, 160)]:
+            result = await read_lines(test_file, start, end)
+            expected = lines[start - 1 : end]
+            assert result.content == "\n".join(expected)
+            assert result.line_count == len(expected)
+            assert result.total_lines == len(lines)
+
+    @pytest.mark.asyncio
+    async def test_read_lines_without_trailing_newline(self, tmp_path):
+        """Test last line is returned when file lacks a trailing newline."""
+        test_file = tmp_path / "no_newline.txt"
+        test_file.write_text("a\nb\nc")
+
+        result = await read_lines(test_file, 2, 3)
+
+        assert result.content == "b\nc"
+        assert result.total_lines == 3
+
+    @pytest.mark.asyncio
+    async def test_read_lines_index_invalidated_on_change(self, tmp_path):
+        """Test cached line index is rebuilt when the file changes."""
+        test_file = tmp_path / "changing.txt"
+        test_file.write_text("one\ntwo\n")
+        assert (await read_lines(test_file, 2, 2)).content == "two"
+
+        test_file.write_text("zero\none\ntwo\nthree\n")
+
+        assert (await read_lines(test_file, 2, 2)).content == "one"
+        assert await count_lines(test_file) == 5
+
+    @pytest.mark.asyncio
+    async def test_read_head_truncates_at_line_boundary(self, tmp_path):
+        """Test read_head stops at the last full line within the budget."""
+        test_file = tmp_path / "big.txt"
+        test_file.write_text("x" * 9 + "\n" + "y" * 9 + "\n")
+
+        content, truncated = await read_head(test_file, max_bytes=15)
+
+        assert truncated is True
+        assert content == "x" * 9
+
+    @pytest.mark.asyncio
+    async def test_write_atomic_preserves_mode(self, tmp_path):
+        """Test atomic writes replace content and keep file permissions."""
+        test_file = tmp_path / "script.sh"
+        test_file.write_text("old")
+        test_file.chmod(0o755)
+
+        result = await write_atomic(test_file, "new")
+
+        assert result.success
+        assert test_file.read_text() == "new"
+        assert test_file.stat().st_mode & 0o777 == 0o755
+
+    @pytest.mark.asyncio
+    async def test_write_atomic_new_file_follows_umask(self, tmp_path):
+        """Test new files get the mode a plain open() would give them."""
+        plain = tmp_path / "plain.txt"
+        plain.write_text("x")
+
+        result = await write_atomic(tmp_path / "new.txt", "x")
+
+        assert result.success
+        assert (tmp_path / "new.txt").stat().st_mode == plain.stat().st_mode
+
+
 class TestAiofilesAvailability:
     """Test aiofiles detection."""
 
@@ -0,0 +1,247 @@
+"""
+Tests for the shared HTTP client manager against a local test server.
+"""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+from aiohttp import web
+
+from vertice_core.async_utils.http_clients import HttpClientManager, HttpPoolConfig
+
+
+class LocalServer:
+    """aiohttp test server recording the client port of every request."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.peers = []
+        self.active = 0
+        self.peak = 0
+        self.runner = None
+        self.url = ""
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.peers.append(request.transport.get_extra_info("peername")[1])
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(float(request.query.get("delay", self.delay)))
+        finally:
+            self.active -= 1
+        return web.json_response({"path": request.path, "key": request.headers.get("x-key")})
+
+    async def start(self) -> "LocalServer":
+        app = web.Application()
+        app.router.add_get("/{tail:.*}", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+        return self
+
+    @property
+    def host(self) -> str:
+        return self.url.removeprefix("http://")
+
+
+@pytest.fixture
+async def server():
+    srv = await LocalServer().start()
+    yield srv
+    await srv.runner.cleanup()
+
+
+@pytest.fixture
+async def manager():
+    clients = HttpClientManager(HttpPoolConfig(max_connections_per_host=2))
+    yield clients
+    await clients.aclose(timeout=1.0)
+
+
+class TestConnectionReuse:
+    """Clients and sessions from one manager share connections."""
+
+    async def test_httpx_clients_share_one_connection(self, server, manager):
+        """Test differently configured httpx clients reuse one keep-alive connection."""
+        async with manager.httpx_client(base_url=server.url, headers={"x-key": "a"}) as first:
+            for _ in range(3):
+                assert (await first.get("/a")).json() == {"path": "/a", "key": "a"}
+        async with manager.httpx_client(headers={"x-key": "b"}) as second:
+            for _ in range(3):
+                assert (await second.get(f"{server.url}/b")).json()["key"] == "b"
+
+        assert len(set(server.peers)) == 1
+        stats = manager.get_stats()["hosts"][server.host]
+        assert stats["requests"] == 6
+        assert stats["new_connections"] == 1
+        assert stats["reused_connections"] == 5
+        assert stats["in_flight"] == 0
+
+    async def test_aiohttp_sessions_share_connector(self, server, manager):
+        """Test aiohttp sessions reuse the shared connector's connections."""
+        for key in ("a", "b"):
+            async with manager.aiohttp_session(headers={"x-key": key}) as session:
+                async with session.get(f"{server.url}/x") as resp:
+                    assert (await resp.json())["key"] == key
+
+        assert len(set(server.peers)) == 1
+        stats = manager.get_stats()["hosts"][server.host]
+        assert stats["requests"] == 2 and stats["new_connections"] == 1
+
+    async def test_new_event_loop_gets_fresh_pool(self, server, manager):
+        """Test pools of another loop are closed on that loop, not reused."""
+
+        async def fetch():
+            async with manager.httpx_client() as client:
+                await client.get(server.url)
+            async with manager.aiohttp_session() as session:
+                async with session.get(server.url) as resp:
+                    await resp.read()
+            return manager._transport, manager._connector
+
+        other = asyncio.new_event_loop()
+        thread = threading.Thread(target=other.run_forever)
+        thread.start()
+        try:
+            transport, connector = await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(fetch(), other)
+            )
+            await fetch()
+            for _ in range(100):
+                if connector.closed and not transport._pool.connections:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            other.call_soon_threadsafe(other.stop)
+            thread.join()
+            other.close()
+
+        assert connector.closed and not transport._pool.connections
+        assert manager.get_stats()["hosts"][server.host]["new_connections"] == 4
+
+
+class TestLimitsAndStats:
+    """Per-host limit, queueing and saturation."""
+
+    async def test_per_host_limit_queues_httpx_requests(self, server, manager):
+        """Test requests beyond the per-host limit wait for a slot."""
+        async with manager.httpx_client(base_url=server.url) as client:
+            requests = [asyncio.create_task(client.get("/?delay=0.05")) for _ in range(6)]
+            await asyncio.sleep(0.02)
+            live = manager.get_stats()["hosts"][server.host]
+            await asyncio.gather(*requests)
+
+        assert server.peak == 2
+        assert live["saturation"] == 1.0 and live["queued"] == 4
+        stats = manager.get_stats()["hosts"][server.host]
+        assert stats["peak_in_flight"] == 2
+        assert stats["queued_total"] == 4
+        assert stats["max_queue_ms"] >= 40
+        assert stats["new_connections"] == 2
+
+    async def test_queued_request_times_out_as_pool_timeout(self, server, manager):
+        """Test a request waiting for a slot longer than its pool timeout fails."""
+        timeout = httpx.Timeout(5.0, pool=0.05)
+        async with manager.httpx_client(base_url=server.url, timeout=timeout) as client:
+            busy = [asyncio.create_task(client.get("/?delay=0.3")) for _ in range(2)]
+            await asyncio.sleep(0.02)
+            with pytest.raises(httpx.PoolTimeout):
+                await client.get("/")
+            await asyncio.gather(*busy)
+
+        stats = manager.get_stats()["hosts"][server.host]
+        assert stats["queued"] == 0 and stats["failures"] == 1 and stats["in_flight"] == 0
+
+    async def test_aiohttp_queue_time_is_tracked(self, server, manager):
+        """Test aiohttp requests queued by the connector are measured."""
+
+        async def fetch(session):
+            async with session.get(f"{server.url}/?delay=0.05") as resp:
+                await resp.read()
+
+        async with manager.aiohttp_session() as session:
+            await asyncio.gather(*(fetch(session) for _ in range(4)))
+
+        assert server.peak == 2
+        stats = manager.get_stats()["hosts"][server.host]
+        assert stats["queued_total"] == 2 and stats["max_queue_ms"] >= 40
+
+    async def test_streamed_response_holds_slot_until_closed(self, server, manager):
+        """Test a streaming response keeps its slot until the body is closed."""
+        async with manager.httpx_client(base_url=server.url) as client:
+            async with client.stream("GET", "/") as response:
+                assert manager.get_stats()["hosts"][server.host]["in_flight"] == 1
+                await response.aread()
+            assert manager.get_stats()["in_flight"] == 0
+
+    async def test_failed_request_is_counted(self, manager):
+        """Test connection errors are counted and free their slot."""
+        async with manager.httpx_client() as client:
+            with pytest.raises(httpx.ConnectError):
+                await client.get("http://127.0.0.1:9/")
+
+        stats = manager.get_stats()["hosts"]["127.0.0.1:9"]
+        assert stats["failures"] == 1 and stats["in_flight"] == 0
+
+
+class TestShutdown:
+    """Graceful shutdown of the shared pools."""
+
+    async def test_close_waits_for_in_flight_requests(self, server, manager):
+        """Test aclose lets running requests finish and closes the pool."""
+        client = manager.httpx_client(base_url=server.url)
+        pending = asyncio.create_task(client.get("/?delay=0.1"))
+        await asyncio.sleep(0.02)
+
+        await manager.aclose(timeout=2.0)
+
+        assert pending.done() and (await pending).status_code == 200
+        assert manager._transport is None
+
+    async def test_requests_rejected_while_draining(self, server, manager):
+        """Test new requests fail fast during shutdown."""
+        client = manager.httpx_client(base_url=server.url)
+        pending = asyncio.create_task(client.get("/?delay=0.1"))
+        await asyncio.sleep(0.02)
+        closing = asyncio.create_task(manager.aclose(timeout=2.0))
+        await asyncio.sleep(0)
+
+        with pytest.raises(httpx.ConnectError, match="shutting down"):
+            await client.get("/")
+        await closing
+        await pending
+
+    def test_pools_closed_when_asyncio_run_returns(self):
+        """Test asyncio.run closes the pools before closing their loop."""
+        manager = HttpClientManager()
+
+        async def main():
+            srv = await LocalServer().start()
+            try:
+                async with manager.httpx_client() as client:
+                    await client.get(srv.url)
+                async with manager.aiohttp_session() as session:
+                    async with session.get(srv.url) as resp:
+                        await resp.read()
+                return manager._transport, manager._connector
+            finally:
+                await srv.runner.cleanup()
+
+        transport, connector = asyncio.run(main())
+
+        assert connector.closed and not transport._pool.connections
+        assert manager._transport is None and manager._connector is None
+
+    async def test_closing_a_client_keeps_the_pool(self, server, manager):
+        """Test closing one client does not close connections of the others."""
+        async with manager.httpx_client() as client:
+            await client.get(server.url)
+        async with manager.httpx_client() as client:
+            await client.get(server.url)
+
+        assert len(set(server.peers)) == 1
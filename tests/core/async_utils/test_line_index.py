@@ -0,0 +1,149 @@
+"""
+Tests for the shared line-offset index cache.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from vertice_core.async_utils.line_index import LineIndexCache
+from vertice_core.tui.core.context.file_window import FileContextEntry
+
+
+class TestFileLineIndex:
+    """Test line range access on a single index."""
+
+    def test_read_lines_matches_split(self, tmp_path):
+        """Test every range matches slicing text.split('\\n')."""
+        path = tmp_path / "sample.txt"
+        text = "alpha\nbeta\n\ngamma\ndelta"
+        path.write_text(text)
+        lines = text.split("\n")
+        index = LineIndexCache().get(path)
+
+        assert index.line_count == len(lines)
+        for start in range(0, 7):
+            for end in range(0, 7):
+                expected = lines[start - 1 : end]
+                assert index.read_lines(start, end).content == "\n".join(expected)
+
+    def test_read_span_matches_splitlines(self, tmp_path):
+        """Test read_span matches slicing splitlines(keepends=True)."""
+        path = tmp_path / "sample.py"
+        text = "import os\r\n\ndef f():\n    return 1\n"
+        path.write_bytes(text.encode())
+        lines = text.replace("\r\n", "\n").splitlines(keepends=True)
+        index = LineIndexCache().get(path)
+
+        assert index.splitlines_count == len(lines)
+        assert index.read_span(1, 3) == "".join(lines[1:3])
+        assert index.read_text() == "".join(lines)
+
+    def test_empty_file(self, tmp_path):
+        """Test an empty file has one (empty) line."""
+        path = tmp_path / "empty.txt"
+        path.write_text("")
+        index = LineIndexCache().get(path)
+
+        assert index.line_count == 1
+        assert index.splitlines_count == 0
+        assert index.read_lines(1, 10).content == ""
+
+    def test_bare_cr_does_not_end_a_line(self, tmp_path):
+        """Test only "\\n" ends lines (documented difference from splitlines)."""
+        path = tmp_path / "old_mac.txt"
+        path.write_bytes(b"one\rtwo\r\nthree\n")
+        index = LineIndexCache().get(path)
+
+        assert index.splitlines_count == 2
+        assert index.read_span(0, 1) == "one\rtwo\n"
+
+    def test_file_truncated_in_place_reads_short(self, tmp_path):
+        """Test reading after an in-place truncation returns less text, not SIGBUS."""
+        path = tmp_path / "shrinking.log"
+        path.write_text("x" * 10000 + "\nlast line\n")
+        index = LineIndexCache().get(path)
+
+        with open(path, "r+b") as f:
+            f.truncate(0)
+
+        assert index.read_lines(1, 2).content == ""
+        assert index.read_text() == ""
+        index.close()
+
+
+class TestLineIndexCache:
+    """Test caching, invalidation and stats."""
+
+    def test_hit_then_rebuild_on_change(self, tmp_path):
+        """Test unchanged files hit and modified files are re-indexed."""
+        path = tmp_path / "file.txt"
+        path.write_text("one\n")
+        cache = LineIndexCache()
+
+        first = cache.get(path)
+        assert cache.get(path) is first
+
+        path.write_text("one\ntwo\nthree\n")
+        second = cache.get(path)
+
+        assert second is not first
+        assert second.read_lines(3, 3).content == "three"
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+
+    def test_watcher_event_invalidates(self, tmp_path):
+        """Test FileWatcher events drop the cached entry."""
+        path = tmp_path / "watched.py"
+        path.write_text("x = 1\n")
+        subscribers = []
+        watcher = SimpleNamespace(subscribe=subscribers.append)
+        cache = LineIndexCache()
+        cache.attach_watcher(watcher)
+        cache.get(path)
+
+        subscribers[0]([SimpleNamespace(path=str(path), event_type="modified")])
+
+        assert len(cache) == 0
+        assert cache.get_stats()["invalidations"] == 1
+
+    def test_peek_does_not_build(self, tmp_path):
+        """Test peek only returns entries that were already indexed."""
+        path = tmp_path / "lazy.txt"
+        path.write_text("data\n")
+        cache = LineIndexCache()
+
+        assert cache.peek(path) is None
+        cache.get(path)
+        assert cache.peek(path) is not None
+
+    def test_lru_bound(self, tmp_path):
+        """Test entry count is bounded."""
+        cache = LineIndexCache(max_entries=2)
+        for i in range(4):
+            path = tmp_path / f"f{i}.txt"
+            path.write_text(f"{i}\n")
+            cache.get(path)
+
+        assert len(cache) == 2
+        assert cache.get_stats()["evictions"] == 2
+
+
+class TestFileContextEntry:
+    """Test the TUI context window reads ranges through the index."""
+
+    @pytest.mark.parametrize("start,end", [(None, None), (2, 3), (3, 99), (10, 20)])
+    def test_ranges_match_splitlines(self, tmp_path, start, end):
+        """Test from_file slices the same lines as before."""
+        path = tmp_path / "mod.py"
+        text = "a = 1\nb = 2\nc = 3\nd = 4\n"
+        path.write_text(text)
+        lines = text.splitlines(keepends=True)
+
+        entry = FileContextEntry.from_file(str(path), start_line=start, end_line=end)
+
+        lo = max(0, min((start - 1) if start else 0, len(lines)))
+        hi = max(lo, min(end if end else len(lines), len(lines)))
+        assert entry.content == "".join(lines[lo:hi])
+        assert (entry.start_line, entry.end_line) == (lo + 1, hi)
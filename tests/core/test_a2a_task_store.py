@@ -0,0 +1,236 @@
+"""
+Tests for the indexed A2A task stores (in-memory and SQLite).
+"""
+
+import threading
+import time
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import grpc
+import pytest
+
+from vertice_core.a2a.grpc_service import A2AServiceImpl
+from vertice_core.a2a.grpc_task_store import TaskQuery, TaskStore, TaskStoreConfig
+from vertice_core.a2a.proto import AgentCard, ListTasksRequest, Message, MessageRole, TaskState
+from vertice_core.a2a.sqlite_task_store import SqliteTaskStore
+
+WORKING = TaskState.TASK_STATE_WORKING
+COMPLETED = TaskState.TASK_STATE_COMPLETED
+
+
+def message(context_id: str = "") -> Message:
+    return Message(id=str(uuid.uuid4()), role=MessageRole.MESSAGE_ROLE_USER, context_id=context_id)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_store(request, tmp_path):
+    stores = []
+
+    def make(**config):
+        if request.param == "memory":
+            store = TaskStore(TaskStoreConfig(**config))
+        else:
+            store = SqliteTaskStore(tmp_path / f"tasks{len(stores)}.db", TaskStoreConfig(**config))
+        stores.append(store)
+        return store
+
+    yield make
+    for store in stores:
+        if isinstance(store, SqliteTaskStore):
+            store.close()
+
+
+async def page_ids(store, query=None, limit=3):
+    """Walk every page of a listing, returning the ids page by page."""
+    pages, cursor = [], ""
+    while True:
+        page = await store.list_tasks_page(query, limit=limit, cursor=cursor)
+        pages.append([t.id for t in page.tasks])
+        if not page.next_cursor:
+            return pages
+        cursor = page.next_cursor
+
+
+async def all_ids(store, query=None, limit=3):
+    return [task_id for page in await page_ids(store, query, limit) for task_id in page]
+
+
+class TestPagination:
+    """Cursor pagination over secondary indexes."""
+
+    async def test_pages_walk_newest_first_without_gaps(self, make_store):
+        """Test paging returns every task once, most recently updated first."""
+        store = make_store()
+        ids = [(await store.create_task(message())).id for _ in range(8)]
+        await store.update_task(ids[2], state=WORKING)
+
+        pages = await page_ids(store)
+
+        expected = [ids[2]] + ids[::-1][:5] + ids[::-1][6:]
+        assert pages == [expected[:3], expected[3:6], expected[6:]]
+
+    async def test_updates_between_pages_are_not_repeated(self, make_store):
+        """Test a task updated after the first page does not reappear on later pages."""
+        store = make_store()
+        ids = [(await store.create_task(message())).id for _ in range(6)]
+
+        first = await store.list_tasks_page(limit=3)
+        await store.update_task(ids[5], state=WORKING)  # Was on the first page
+        second = await store.list_tasks_page(limit=3, cursor=first.next_cursor)
+
+        assert [t.id for t in second.tasks] == ids[2::-1]
+        assert second.next_cursor == ""
+
+    async def test_filters_by_state_context_and_agent(self, make_store):
+        """Test each secondary index and combined filters."""
+        store = make_store()
+        a = [(await store.create_task(message("ctx-a"))).id for _ in range(4)]
+        b = [(await store.create_task(message("ctx-b"))).id for _ in range(3)]
+        await store.update_task(a[0], state=WORKING)
+        await store.update_task(b[1], state=COMPLETED)
+
+        by_context = await all_ids(store, TaskQuery(context_id="ctx-a"), limit=2)
+        assert by_context == [a[0], a[3], a[2], a[1]]
+        assert await all_ids(store, TaskQuery(states=[WORKING, COMPLETED])) == [b[1], a[0]]
+        query = TaskQuery(states=[TaskState.TASK_STATE_SUBMITTED], context_id="ctx-b")
+        assert await all_ids(store, query) == [b[2], b[0]]
+        assert await store.list_tasks(agent_id="nobody") == []
+
+    async def test_list_tasks_keeps_legacy_signature(self, make_store):
+        """Test list_tasks still filters by state and returns the newest first."""
+        store = make_store()
+        ids = [(await store.create_task(message())).id for _ in range(3)]
+        await store.update_task(ids[0], state=WORKING)
+
+        tasks = await store.list_tasks(states=[WORKING])
+        assert [t.id for t in tasks] == [ids[0]]
+        assert len(await store.list_tasks(limit=2)) == 2
+
+    async def test_invalid_cursor_raises(self, make_store):
+        """Test malformed cursors are rejected."""
+        store = make_store()
+        for cursor in ("not-a-cursor", "cjE6eA=="):  # Garbage and "r1:x"
+            with pytest.raises(ValueError, match="Invalid page cursor"):
+                await store.list_tasks_page(cursor=cursor)
+
+
+class TestEviction:
+    """TTL and size bounds on terminal tasks."""
+
+    async def test_size_limit_evicts_oldest_terminal_tasks_only(self, make_store):
+        """Test active tasks survive while the oldest finished ones are dropped."""
+        store = make_store(terminal_ttl=None, max_tasks=4)
+        ids = [(await store.create_task(message())).id for _ in range(4)]
+        await store.update_task(ids[1], state=COMPLETED)
+        await store.update_task(ids[3], state=COMPLETED)
+
+        await store.create_task(message())
+        assert await store.get_task(ids[1]) is None
+        assert await store.get_task(ids[3]) is not None
+
+        for _ in range(3):
+            await store.create_task(message())
+        assert await store.get_task(ids[3]) is None
+        assert await store.get_task(ids[0]) is not None
+        assert await store.count() == 6
+        listed = await all_ids(store)
+        assert ids[1] not in listed and ids[3] not in listed
+
+    async def test_ttl_evicts_expired_terminal_tasks(self, make_store, monkeypatch):
+        """Test terminal tasks older than the TTL are evicted, active ones kept."""
+        store = make_store(terminal_ttl=60.0, max_tasks=None)
+        done = await store.create_task(message())
+        active = await store.create_task(message())
+        await store.update_task(done.id, state=COMPLETED)
+        assert await store.evict_expired() == 0
+
+        real_time = time.time
+        monkeypatch.setattr(time, "time", lambda: real_time() + 120)
+        assert await store.evict_expired() == 1
+        assert await store.get_task(done.id) is None
+        assert await store.get_task(active.id) is not None
+
+
+class TestBackends:
+    """Backend-specific behaviour."""
+
+    async def test_sqlite_store_persists_across_instances(self, tmp_path):
+        """Test tasks, indexes and revisions survive reopening the database."""
+        store = SqliteTaskStore(tmp_path / "tasks.db")
+        first = await store.create_task(message("ctx"))
+        await store.update_task(first.id, state=WORKING)
+        store.close()
+
+        reopened = SqliteTaskStore(tmp_path / "tasks.db")
+        second = await reopened.create_task(message("ctx"))
+        tasks = await reopened.list_tasks(context_id="ctx")
+        assert [t.id for t in tasks] == [second.id, first.id]
+        assert tasks[1].state == WORKING and len(tasks[1].history) == 1
+        reopened.close()
+
+    async def test_sqlite_queries_run_off_the_event_loop(self, tmp_path):
+        """Test database calls are made from a worker thread, not the loop's."""
+        store = SqliteTaskStore(tmp_path / "tasks.db")
+        conn, threads = store._conn, set()
+
+        class RecordingConnection:
+            def __getattr__(self, name):
+                threads.add(threading.get_ident())
+                return getattr(conn, name)
+
+            def __enter__(self):
+                return conn.__enter__()
+
+            def __exit__(self, *exc_info):
+                return conn.__exit__(*exc_info)
+
+        store._conn = RecordingConnection()
+        task = await store.create_task(message("ctx"))
+        await store.get_task(task.id)
+        await store.list_tasks(context_id="ctx")
+        await store.evict_expired()
+        store._conn = conn
+        store.close()
+
+        assert threads and threading.get_ident() not in threads
+
+    async def test_memory_indexes_compact(self):
+        """Test superseded index entries are compacted away."""
+        store = TaskStore()
+        task = await store.create_task(message("ctx"))
+        for _ in range(3000):
+            await store.update_task(task.id, message=message())
+
+        assert len(store._log) < 1100
+        assert [t.id for t in await store.list_tasks(context_id="ctx")] == [task.id]
+
+
+class TestServiceListTasks:
+    """ListTasks RPC over an injected store."""
+
+    async def test_list_tasks_rpc_pages_with_cursor(self, tmp_path):
+        """Test the servicer forwards filters and returns next_cursor."""
+        store = SqliteTaskStore(tmp_path / "tasks.db")
+        service = A2AServiceImpl(AgentCard(name="test"), task_store=store)
+        ids = [(await store.create_task(message("ctx"))).id for _ in range(3)]
+        context = MagicMock()
+
+        first = await service.ListTasks(ListTasksRequest(limit=2, context_id="ctx"), context)
+        second = await service.ListTasks(
+            ListTasksRequest(limit=2, context_id="ctx", cursor=first.next_cursor), context
+        )
+
+        assert [t.id for t in first.tasks] == ids[:0:-1]
+        assert [t.id for t in second.tasks] == ids[:1] and second.next_cursor == ""
+        store.close()
+
+    async def test_list_tasks_rpc_rejects_bad_cursor(self):
+        """Test a malformed cursor aborts with INVALID_ARGUMENT."""
+        service = A2AServiceImpl(AgentCard(name="test"))
+        context = MagicMock()
+        context.abort = AsyncMock()
+
+        await service.ListTasks(ListTasksRequest(cursor="bogus"), context)
+
+        assert context.abort.call_args[0][0] == grpc.StatusCode.INVALID_ARGUMENT
@@ -0,0 +1,262 @@
+"""
+Tests for the content-addressed snapshot store and its users
+(UndoManager, AtomicFileOps and the edit tool's backups).
+"""
+
+import gc
+import os
+import random
+
+import pytest
+
+from vertice_core.core.atomic_ops import AtomicFileOps
+from vertice_core.core.blob_store import (
+    BlobStore,
+    apply_delta,
+    list_backups,
+    make_delta,
+    save_backup,
+)
+from vertice_core.core.undo_manager import UndoManager
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = BlobStore(tmp_path / "blobs")
+    yield store
+    store.close()
+
+
+def edited(data: bytes, rng: random.Random) -> bytes:
+    """data with a small random region rewritten."""
+    pos = rng.randrange(len(data) - 100)
+    return data[:pos] + rng.randbytes(rng.randrange(1, 50)).hex().encode() + data[pos + 50 :]
+
+
+class TestDelta:
+    """Prefix/suffix delta encoding."""
+
+    @pytest.mark.parametrize(
+        "base,data",
+        [
+            (b"", b""),
+            (b"abc", b""),
+            (b"", b"abc"),
+            (b"hello world", b"hello there world"),
+            (b"aaaa", b"aaaaaa"),
+            (b"x" * 200_000 + b"1" + b"y" * 70_000, b"x" * 200_000 + b"22" + b"y" * 70_000),
+        ],
+    )
+    def test_round_trip(self, base, data):
+        assert apply_delta(base, make_delta(base, data)) == data
+
+    def test_delta_holds_only_the_change(self):
+        base = os.urandom(1_000_000)
+        data = base[:500_000] + b"changed" + base[500_010:]
+        assert len(make_delta(base, data)) < 100
+
+
+class TestBlobStore:
+    """Deduplication, deltas and reference counting."""
+
+    def test_identical_content_is_stored_once(self, store):
+        a = store.put("same", ref="a")
+        b = store.put("same", ref="b")
+
+        assert a == b == BlobStore.digest_of("same")
+        assert store.stats()["blobs"] == 1
+        assert store.read_ref("b") == b"same"
+
+    def test_similar_content_is_delta_encoded(self, store):
+        base_data = os.urandom(200_000)
+        base = store.put(base_data, ref="v1")
+        new_data = base_data[:1000] + b"edit" + base_data[1000:]
+        digest = store.put(new_data, ref="v2", base=base)
+
+        stats = store.stats()
+        assert stats["delta_blobs"] == 1
+        assert stats["stored_bytes"] < 210_000
+        assert BlobStore(store.root).get(digest) == new_data
+
+    def test_delta_chain_is_capped(self, tmp_path):
+        store = BlobStore(tmp_path / "blobs", max_delta_depth=3)
+        data, digest = os.urandom(10_000), None
+        rng = random.Random(1)
+        for i in range(8):
+            data = edited(data, rng)
+            digest = store.put(data, ref=f"v{i}", base=digest)
+
+        depths = [row[0] for row in store._conn.execute("SELECT depth FROM blobs")]
+        assert max(depths) == 3 and depths.count(0) == 2
+        assert store.get(digest) == data
+        store.close()
+
+    def test_dropping_refs_frees_blobs_and_bases(self, store):
+        base = store.put(b"a" * 10_000, ref="old")
+        store.put(b"a" * 10_000 + b"b", ref="new", base=base)
+
+        store.drop_ref("old")
+        assert store.stats()["blobs"] == 2  # Still the delta's base
+        assert store.read_ref("new") == b"a" * 10_000 + b"b"
+
+        store.drop_ref("new")
+        assert store.stats()["blobs"] == 0
+        assert not list((store.root / "objects").glob("*/*"))
+
+    def test_moving_a_ref_releases_the_old_blob(self, store):
+        store.put(b"one", ref="r")
+        store.put(b"two", ref="r")
+
+        assert store.stats()["blobs"] == 1
+        assert store.read_ref("r") == b"two"
+
+    def test_gc_sweeps_unreferenced_blobs_and_orphans(self, store):
+        store.put(b"kept", ref="r")
+        store.put(b"loose")
+        orphan = store.objects_dir / "ff" / "orphan"
+        orphan.parent.mkdir()
+        orphan.write_bytes(b"x")
+
+        assert store.gc() == 1
+        assert store.stats()["blobs"] == 1 and not orphan.exists()
+
+    def test_missing_blob_raises_key_error(self, store):
+        with pytest.raises(KeyError):
+            store.get("0" * 64)
+
+    def test_backups_are_pruned_per_file(self, store, tmp_path):
+        path = tmp_path / "f.py"
+        for i in range(5):
+            ref, _ = save_backup(path, f"version {i}", store=store, keep=3)
+
+        backups = list_backups(path, store)
+        assert [store.get(digest) for _, digest, _ in backups] == [
+            b"version 2",
+            b"version 3",
+            b"version 4",
+        ]
+        assert backups[-1][0] == ref
+
+
+class TestUndoManagerSnapshots:
+    """UndoManager keeps its snapshots in the blob store."""
+
+    @pytest.fixture
+    def manager(self, tmp_path, store):
+        return UndoManager(working_dir=str(tmp_path), persist_state=False, blob_store=store)
+
+    def test_undo_redo_through_blobs(self, manager, tmp_path):
+        path = tmp_path / "a.txt"
+        path.write_text("v2")
+        op = manager.record_file_edit(str(path), "v1", "v2")
+
+        assert op.original_content is None and op.original_blob
+        assert manager.undo().success and path.read_text() == "v1"
+        assert manager.redo().success and path.read_text() == "v2"
+
+    def test_large_file_edited_many_times_stays_small(self, manager, store, tmp_path):
+        path = tmp_path / "big.txt"
+        rng = random.Random(0)
+        content = os.urandom(1024 * 1024).hex()  # 2 MB of text
+        first = content
+        for _ in range(100):
+            new = edited(content.encode(), rng).decode()
+            manager.record_file_edit(str(path), content, new)
+            content = new
+        path.write_text(content)
+
+        stats = store.stats()
+        assert stats["logical_bytes"] > 100 * 2 * 1024 * 1024
+        assert stats["stored_bytes"] < 3 * 2 * 1024 * 1024  # A few full copies, not 100
+
+        for _ in range(100):
+            assert manager.undo().success
+        assert path.read_text() == first
+
+    def test_history_eviction_releases_snapshots(self, tmp_path, store):
+        manager = UndoManager(
+            max_size=2, working_dir=str(tmp_path), persist_state=False, blob_store=store
+        )
+        for i in range(5):
+            manager.record_file_edit(str(tmp_path / f"{i}.txt"), f"old {i}", f"new {i}")
+        assert store.stats()["refs"] == 4
+
+        manager.undo()
+        manager.record_file_edit(str(tmp_path / "x.txt"), "a", "b")  # Drops the redo branch
+        assert store.stats()["refs"] == 4
+
+        manager.clear_history()
+        assert store.stats() == {
+            "blobs": 0,
+            "delta_blobs": 0,
+            "refs": 0,
+            "logical_bytes": 0,
+            "stored_bytes": 0,
+        }
+
+    def test_non_persistent_manager_releases_snapshots(self, tmp_path, store):
+        """Test snapshots go away on close() or when the manager is collected."""
+        closed = UndoManager(working_dir=str(tmp_path), persist_state=False, blob_store=store)
+        dropped = UndoManager(working_dir=str(tmp_path), persist_state=False, blob_store=store)
+        kept = UndoManager(working_dir=str(tmp_path), persist_state=True, blob_store=store)
+        for manager in (closed, dropped, kept):
+            manager.record_file_edit(str(tmp_path / "a.txt"), "old", f"new {id(manager)}")
+        assert len(store.refs("undo/")) == 6
+
+        closed.close()
+        assert len(store.refs("undo/")) == 4 and not closed.can_undo()
+        del dropped
+        gc.collect()
+        op = kept.get_history()[0]
+        assert {name for name, _, _ in store.refs("undo/")} == {
+            f"undo/{op.id}/original",
+            f"undo/{op.id}/new",
+        }
+        kept.close()  # Persistent history outlives the manager
+        assert len(store.refs("undo/")) == 2
+
+    def test_legacy_content_still_undoes(self, manager, tmp_path):
+        path = tmp_path / "legacy.txt"
+        path.write_text("new")
+        op = manager.record_file_edit(str(path), "old", "new")
+        op.original_blob = None
+        op.original_content = "old"
+
+        assert manager.undo().success and path.read_text() == "old"
+
+
+class TestAtomicBackups:
+    """AtomicFileOps backups as blob refs."""
+
+    def test_rollback_restores_from_blob(self, tmp_path, store):
+        ops = AtomicFileOps(blob_store=store)
+        path = tmp_path / "config.py"
+        path.write_text("original")
+
+        result = ops.write_atomic(path, "modified")
+        assert result.backup_path is None and result.backup_blob
+
+        assert ops.rollback(result.checkpoint).success
+        assert path.read_text() == "original"
+
+    def test_delete_rollback_and_cleanup(self, tmp_path, store):
+        ops = AtomicFileOps(blob_store=store)
+        path = tmp_path / "gone.txt"
+        path.write_text("keep me")
+
+        result = ops.delete_atomic(path)
+        assert not path.exists()
+        assert ops.rollback(result.checkpoint).success
+        assert path.read_text() == "keep me"
+
+        assert ops.cleanup_backups(max_age_hours=0) == 1
+        assert store.stats()["blobs"] == 0
+
+    def test_explicit_backup_dir_keeps_file_copies(self, tmp_path):
+        ops = AtomicFileOps(backup_dir=str(tmp_path / "bak"))
+        path = tmp_path / "f.txt"
+        path.write_text("before")
+
+        result = ops.write_atomic(path, "after")
+        assert result.backup_blob is None
+        assert open(result.backup_path).read() == "before"
@@ -14,8 +14,10 @@ Soli Deo Gloria
 
 from __future__ import annotations
 
+import asyncio
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -723,6 +725,38 @@ class TestCodebaseIndexer:
         assert progress2.skipped_files > 0
         assert progress2.processed_files < first_count
 
+    @pytest.mark.asyncio
+    async def test_changes_during_indexing_are_reindexed_after(
+        self, sample_project, mock_azure_env
+    ):
+        """Test watcher events that arrive mid-pass are indexed once the pass ends."""
+        config = IndexerConfig(
+            root_dir=str(sample_project),
+            index_dir=str(sample_project / ".index"),
+            embedding_config=EmbeddingConfig(
+                use_local_fallback=True, dimensions=64, cache_dir=str(sample_project / ".cache")
+            ),
+            vector_config=VectorStoreConfig(
+                use_chromadb=False, persist_dir=str(sample_project / ".vectors")
+            ),
+        )
+        indexer = CodebaseIndexer(config)
+        late = sample_project / "src" / "late.py"
+        process_batch = indexer._process_batch
+
+        async def process_and_edit(batch):
+            if not late.exists():
+                late.write_text("def late(): return 1")
+                indexer._on_file_events([SimpleNamespace(path=str(late), event_type="created")])
+                await asyncio.sleep(0)  # Let the re-index task see the pass running
+            await process_batch(batch)
+
+        indexer._process_batch = process_and_edit
+        await indexer.index_codebase()
+
+        assert await indexer._reindex_task > 0
+        assert not indexer._dirty_files
+
     @pytest.mark.asyncio
     async def test_search(self, sample_project, sample_python_code, mock_azure_env):
         """Test searching indexed codebase."""
@@ -1311,8 +1311,8 @@ class TestObservabilityMixin:
 class TestEdgeCases:
     """Additional tests for edge cases to improve coverage."""
 
-    def test_histogram_percentile_returns_last_bucket(self):
-        """Test histogram percentile returns last bucket when no buckets match."""
+    def test_histogram_percentile_beyond_last_bucket(self):
+        """Test histogram percentile is accurate past the last bucket boundary."""
         from core.observability.metrics import Histogram
 
         hist = Histogram(name="test")
@@ -1321,9 +1321,9 @@ class TestEdgeCases:
         hist.observe(100)
         hist.observe(200)
 
-        # The loop won't find any matching buckets, so returns last bucket
+        # The sketch is independent of bucket boundaries
         p50 = hist.percentile(50)
-        assert p50 == hist.buckets[-1]  # 10.0
+        assert p50 == pytest.approx(100, rel=0.01)
 
     def test_span_exporter_flush_empty_batch(self):
         """Test flushing empty batch."""
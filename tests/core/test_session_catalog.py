@@ -0,0 +1,202 @@
+"""
+Tests for the SQLite FTS5 session catalog behind SessionManager search.
+"""
+
+import pytest
+
+from vertice_core.core.session_manager import SessionCatalog, SessionManager, SessionState
+from vertice_core.core.session_manager import manager as manager_module
+from vertice_core.core.session_manager.types import ConversationMessage, SessionSnapshot
+
+
+def make_manager(session_dir, **kwargs):
+    return SessionManager(session_dir=str(session_dir), auto_save_interval=3600, **kwargs)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = make_manager(tmp_path)
+    yield manager
+    manager._stop_auto_save_thread()
+    manager._close_journal()
+
+
+def make_snapshot(session_id, *contents, updated_at=1.0):
+    return SessionSnapshot(
+        session_id=session_id,
+        state=SessionState.ACTIVE,
+        created_at=1.0,
+        updated_at=updated_at,
+        checksum="",
+        messages=[ConversationMessage(role="user", content=c) for c in contents],
+        context={},
+        working_directory="/work",
+        open_files=[],
+        pending_operations=[],
+    )
+
+
+def add_session(manager, *contents):
+    session = manager.start_session(working_directory="/work")
+    for i, content in enumerate(contents):
+        manager.add_message("user" if i % 2 == 0 else "assistant", content)
+    manager.save()
+    manager.end_session()
+    return session.session_id
+
+
+class TestSessionCatalog:
+    @pytest.fixture
+    def catalog(self, tmp_path):
+        catalog = SessionCatalog(tmp_path / "catalog.db")
+        yield catalog
+        catalog.close()
+
+    def test_prefix_terms_must_all_match(self, catalog):
+        catalog.index_session(make_snapshot("a", "fix the login bug"), "fix the login bug")
+        catalog.index_session(make_snapshot("b", "login page styling"), "login page styling")
+
+        assert [s.session_id for s in catalog.search_sessions("log bug")] == ["a"]
+        assert {s.session_id for s in catalog.search_sessions("login")} == {"a", "b"}
+        assert catalog.search_sessions("logout") == []
+
+    def test_title_outranks_message_body(self, catalog):
+        catalog.index_session(
+            make_snapshot("body", "intro", "something about parser internals"), "intro"
+        )
+        catalog.index_session(make_snapshot("title", "parser rewrite"), "parser rewrite")
+
+        assert [s.session_id for s in catalog.search_sessions("parser")] == ["title", "body"]
+
+    def test_incremental_index_appends_and_adds_tokens(self, catalog):
+        snapshot = make_snapshot("a", "first question")
+        snapshot.messages[0].metadata = {"tokens": 10}
+        catalog.index_session(snapshot, "first question")
+
+        snapshot.messages.append(
+            ConversationMessage(
+                role="assistant",
+                content="second answer",
+                metadata={"model": "m-1", "input_tokens": 4, "output_tokens": 6},
+            )
+        )
+        catalog.index_session(snapshot, "first question", start=1)
+
+        [info] = catalog.recent()
+        assert (info.message_count, info.model) == (2, "m-1")
+        assert (info.input_tokens, info.output_tokens) == (14, 6)
+        assert catalog.indexed_count("a") == 2
+        assert [h.message_index for h in catalog.search_messages("second")] == [1]
+
+        # A full re-index replaces rather than duplicates
+        catalog.index_session(snapshot, "renamed")
+        assert len(catalog.search_messages("first")) == 1
+        assert [h.message_index for h in catalog.search_messages("renamed")] == [-1]
+        assert catalog.recent()[0].input_tokens == 14
+
+    def test_search_messages_snippet_and_session_filter(self, catalog):
+        catalog.index_session(make_snapshot("a", "the cache eviction policy is LRU"), "a")
+        catalog.index_session(make_snapshot("b", "cache warmup"), "b")
+
+        hits = catalog.search_messages("evict", session_id="a")
+        assert [(h.session_id, h.message_index, h.role) for h in hits] == [("a", 0, "user")]
+        assert "[eviction]" in hits[0].snippet
+        assert {h.session_id for h in catalog.search_messages("cache")} == {"a", "b"}
+
+    @pytest.mark.parametrize("query", ["", "   ", '"', "***", "a OR b NOT", "x' --"])
+    def test_query_syntax_is_never_interpreted(self, catalog, query):
+        catalog.index_session(make_snapshot("a", "a b x"), "a")
+        catalog.search_sessions(query)
+        catalog.search_messages(query)
+
+    def test_diacritics_are_folded(self, catalog):
+        catalog.index_session(make_snapshot("a", "revisar o código da sessão"), "a")
+        assert [s.session_id for s in catalog.search_sessions("codigo sessao")] == ["a"]
+
+    def test_like_fallback_without_fts(self, catalog):
+        catalog.index_session(make_snapshot("a", "100% done_now"), "a")
+        catalog.fts_enabled = False
+
+        assert [s.session_id for s in catalog.search_sessions("done")] == ["a"]
+        assert catalog.search_sessions("100 x") == []
+        assert catalog.search_messages("done")[0].snippet
+
+
+class TestManagerIntegration:
+    def test_search_and_list_do_not_load_sessions(self, manager, monkeypatch):
+        first = add_session(manager, "refactor the storage layer", "done")
+        second = add_session(manager, "add retry to http client", "ok, retries added")
+
+        monkeypatch.setattr(
+            manager_module, "load_session", lambda *a: pytest.fail("session file loaded")
+        )
+        assert [s.session_id for s in manager.search_sessions("retr")] == [second]
+        assert [s.session_id for s in manager.list_sessions()] == [second, first]
+        assert manager.list_sessions()[0].state == SessionState.COMPLETED
+
+        hits = manager.search_messages("retries")
+        assert [(h.session_id, h.message_index) for h in hits] == [(second, 1)]
+
+    def test_saves_index_only_new_messages(self, manager, monkeypatch):
+        manager.start_session()
+        manager.add_message("user", "alpha")
+        manager.save()
+
+        starts = []
+        index_session = SessionCatalog.index_session
+        monkeypatch.setattr(
+            SessionCatalog,
+            "index_session",
+            lambda self, snapshot, title, start=0: starts.append(start)
+            or index_session(self, snapshot, title, start),
+        )
+        manager.add_message("assistant", "beta")
+        manager.save()
+        manager.save()
+
+        assert starts == [1, 2]
+        assert len(manager.search_messages("alpha")) == 2  # Title and message
+
+    def test_resume_continues_incremental_index(self, manager):
+        session_id = add_session(manager, "first message")
+
+        resumed = make_manager(manager.session_dir)
+        try:
+            resumed.resume_session(session_id)
+            resumed.add_message("assistant", "second message")
+            resumed.save()
+        finally:
+            resumed._stop_auto_save_thread()
+            resumed._close_journal()
+
+        hits = manager.search_messages("message", session_id=session_id)
+        assert sorted(h.message_index for h in hits) == [-1, 0, 1]
+
+    def test_missing_catalog_is_rebuilt_from_sessions(self, manager):
+        session_id = add_session(manager, "legacy session about kubernetes")
+        manager._catalog.close()
+        (manager.session_dir / manager.CATALOG_FILE).unlink()
+
+        fresh = make_manager(manager.session_dir)
+        assert [s.session_id for s in fresh.search_sessions("kubernetes")] == [session_id]
+
+    def test_pruned_sessions_leave_catalog(self, tmp_path):
+        manager = make_manager(tmp_path, max_sessions=2)
+        ids = [add_session(manager, f"topic{i} common") for i in range(3)]
+
+        assert {s.session_id for s in manager.search_sessions("common")} == set(ids[1:])
+        assert manager._catalog.count() == 2
+
+    def test_catalog_failure_does_not_fail_save(self, manager, monkeypatch):
+        def broken(self, *args, **kwargs):
+            raise manager_module.sqlite3.OperationalError("disk I/O error")
+
+        manager.start_session()
+        monkeypatch.setattr(SessionCatalog, "index_session", broken)
+        manager.add_message("user", "still saved")
+        assert manager.save()
+
+        monkeypatch.undo()
+        manager.add_message("user", "later")
+        manager.save()
+        assert len(manager.search_messages("still saved")) == 2  # Re-indexed from scratch
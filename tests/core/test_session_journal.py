@@ -0,0 +1,294 @@
+"""
+Tests for the append-only session journal behind SessionManager.save().
+"""
+
+import os
+import shutil
+import threading
+
+import pytest
+
+from vertice_core.core.session_manager import SessionManager, SessionState
+from vertice_core.core.session_manager import storage
+from vertice_core.core.session_manager.journal import (
+    SessionJournal,
+    encode_record,
+    read_journal,
+)
+from vertice_core.core.session_manager.storage import get_journal_path
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = SessionManager(session_dir=str(tmp_path), auto_save_interval=3600)
+    yield manager
+    manager._stop_auto_save_thread()
+    manager._close_journal()
+
+
+def reload(manager):
+    fresh = SessionManager(session_dir=str(manager.session_dir), auto_save_interval=3600)
+    return fresh._load_session(manager.current_session.session_id)
+
+
+def comparable(snapshot):
+    data = snapshot.to_dict()
+    for key in ("updated_at", "checksum", "journal_seq"):
+        data.pop(key)
+    for key in ("read_files", "modified_files", "deleted_files"):
+        data[key] = sorted(data[key])
+    return data
+
+
+def journal_path(manager):
+    return get_journal_path(manager.session_dir, manager.current_session.session_id)
+
+
+def snapshot_files(manager):
+    session_id = manager.current_session.session_id
+    return sorted(
+        p for p in manager.session_dir.iterdir() if p.name.startswith(session_id + ".json")
+    )
+
+
+class TestReplay:
+    def test_round_trip(self, manager):
+        manager.start_session(working_directory="/work")
+        manager.add_message("user", "fix the login bug", metadata={"turn": 1})
+        manager.add_message("assistant", "done ✓")
+        manager.update_context("model", {"name": "x", "tools": ["read"]})
+        manager.track_file_operation("read", "/work/a.py")
+        manager.track_file_operation("modify", "/work/b.py")
+        manager.add_pending_operation({"op": "write", "path": "/work/b.py"})
+        manager.save()
+        manager.clear_pending_operations()
+        manager.capture_environment()
+        manager.save()
+
+        loaded = reload(manager)
+        assert comparable(loaded) == comparable(manager.current_session)
+        assert loaded.journal_seq == 8
+
+    def test_save_appends_only_new_records(self, manager):
+        manager.start_session()
+        manager.add_message("user", "first")
+        manager.save()
+        snapshot_before = {p: p.read_bytes() for p in snapshot_files(manager)}
+        size_before = journal_path(manager).stat().st_size
+
+        manager.add_message("user", "second")
+        manager.save()
+
+        assert {p: p.read_bytes() for p in snapshot_files(manager)} == snapshot_before
+        records, _ = read_journal(journal_path(manager))
+        assert journal_path(manager).stat().st_size > size_before
+        assert [r["message"]["content"] for r in records] == ["first", "second"]
+        assert [r["seq"] for r in records] == [1, 2]
+
+    def test_save_without_changes_writes_nothing(self, manager):
+        manager.start_session()
+        manager.add_message("user", "first")
+        manager.save()
+        size = journal_path(manager).stat().st_size
+        manager.save()
+        assert journal_path(manager).stat().st_size == size
+
+    def test_does_not_call_global_sync(self, manager, monkeypatch):
+        monkeypatch.setattr(os, "sync", lambda: pytest.fail("os.sync() called"), raising=False)
+        manager.start_session()
+        manager.add_message("user", "hello")
+        assert manager.save()
+        assert manager.save(compact=True)
+
+    def test_changes_do_not_wait_for_a_save_in_progress(self, manager):
+        manager.start_session()
+        manager.add_message("user", "first")
+        syncing, release = threading.Event(), threading.Event()
+        sync_file = manager._journal._sync_file
+
+        def slow_sync():
+            syncing.set()
+            assert release.wait(5)
+            sync_file()
+
+        manager._journal._sync_file = slow_sync
+        saver = threading.Thread(target=manager.save)
+        saver.start()
+        try:
+            assert syncing.wait(5)
+            manager.add_message("user", "during save")  # Must not block on the fsync
+        finally:
+            release.set()
+            saver.join()
+
+        assert manager._dirty
+        manager.save()
+        assert [m.content for m in reload(manager).messages] == ["first", "during save"]
+
+
+class TestCrashSafety:
+    def test_torn_tail_is_ignored_and_truncated(self, manager):
+        manager.start_session()
+        manager.add_message("user", "kept")
+        manager.save()
+        path = journal_path(manager)
+        intact = path.stat().st_size
+
+        torn = encode_record({"op": "message", "seq": 2, "message": {"role": "user"}})
+        with open(path, "ab") as f:
+            f.write(torn[:-3])
+
+        assert [m.content for m in reload(manager).messages] == ["kept"]
+
+        journal = SessionJournal(path)
+        assert path.stat().st_size == intact
+        journal.append([{"op": "state", "state": "paused"}])
+        journal.close()
+
+        loaded = reload(manager)
+        assert loaded.state == SessionState.PAUSED
+        assert loaded.journal_seq == 2
+
+    def test_failed_append_is_rolled_back(self, tmp_path, monkeypatch):
+        path = tmp_path / "s.journal"
+        journal = SessionJournal(path)
+        journal.append([{"op": "state", "state": "active"}])
+        intact = path.stat().st_size
+
+        real_write = os.write
+        calls = []
+
+        def short_write(fd, data):  # Disk fills up partway through the frame
+            calls.append(fd)
+            if len(calls) > 1:
+                raise OSError(28, "No space left on device")
+            return real_write(fd, bytes(data[:5]))
+
+        monkeypatch.setattr(os, "write", short_write)
+        with pytest.raises(OSError):
+            journal.append([{"op": "state", "state": "paused"}])
+        monkeypatch.undo()
+
+        assert path.stat().st_size == intact
+        journal.append([{"op": "state", "state": "paused"}])
+        journal.close()
+        records, valid = read_journal(path)
+        assert [r["state"] for r in records] == ["active", "paused"]
+        assert valid == path.stat().st_size
+
+    def test_corrupt_record_stops_replay(self, manager):
+        manager.start_session()
+        for content in ("one", "two", "three"):
+            manager.add_message("user", content)
+            manager.save()
+
+        path = journal_path(manager)
+        data = bytearray(path.read_bytes())
+        second = len(encode_record(read_journal(path)[0][0]))
+        data[second + 12] ^= 0xFF  # inside the second record's payload
+        path.write_bytes(bytes(data))
+
+        assert [m.content for m in reload(manager).messages] == ["one"]
+
+    def test_crash_between_snapshot_and_truncate(self, manager, tmp_path):
+        manager.start_session()
+        manager.add_message("user", "one")
+        manager.add_message("user", "two")
+        manager.save()
+        stale_journal = tmp_path / "stale.journal"
+        shutil.copy(journal_path(manager), stale_journal)
+
+        manager.save(compact=True)
+        # Simulate the truncate never reaching disk
+        shutil.copy(stale_journal, journal_path(manager))
+
+        assert [m.content for m in reload(manager).messages] == ["one", "two"]
+
+    def test_crash_recovery_replays_journal(self, manager):
+        manager.start_session()
+        manager.add_message("user", "unfinished work")
+        manager.save()
+
+        fresh = SessionManager(session_dir=str(manager.session_dir), auto_save_interval=3600)
+        crashed = fresh.check_for_crash_recovery()
+        assert crashed.state == SessionState.CRASHED
+        assert [m.content for m in crashed.messages] == ["unfinished work"]
+
+
+class TestCompaction:
+    def test_journal_is_compacted_periodically(self, manager):
+        manager.JOURNAL_COMPACT_BYTES = 2_000
+        manager.start_session()
+        compactions = 0
+        for i in range(200):
+            manager.add_message("user", f"message {i} " + "x" * 40)
+            size_before = manager._journal.size
+            manager.save()
+            compactions += manager._journal.size < size_before
+
+        # Threshold doubles with the folded data, so compactions stay rare
+        assert 2 <= compactions <= 6
+        loaded = reload(manager)
+        assert [m.content for m in loaded.messages] == [
+            m.content for m in manager.current_session.messages
+        ]
+
+    def test_resume_continues_journal(self, manager):
+        session = manager.start_session()
+        manager.add_message("user", "before")
+        manager.save()
+
+        resumed = SessionManager(session_dir=str(manager.session_dir), auto_save_interval=3600)
+        try:
+            resumed.resume_session(session.session_id)
+            resumed.add_message("assistant", "after")
+            resumed.save()
+        finally:
+            resumed._stop_auto_save_thread()
+            resumed._close_journal()
+
+        loaded = reload(manager)
+        assert [m.content for m in loaded.messages] == ["before", "after"]
+        assert loaded.state == SessionState.RECOVERED
+
+    def test_end_session_leaves_single_snapshot(self, manager):
+        session = manager.start_session()
+        manager.add_message("user", "hello")
+        manager.save()
+        path = journal_path(manager)
+        manager.end_session()
+
+        assert not path.exists()
+        loaded = SessionManager(session_dir=str(manager.session_dir))._load_session(
+            session.session_id
+        )
+        assert loaded.state == SessionState.COMPLETED
+        assert [m.content for m in loaded.messages] == ["hello"]
+
+    def test_save_session_for_other_snapshot_drops_its_journal(self, manager):
+        session = manager.start_session()
+        manager.add_message("user", "hello")
+        manager.save()
+        other = SessionManager(session_dir=str(manager.session_dir))._load_session(
+            session.session_id
+        )
+        other.messages.append(other.messages[0])
+
+        # Writing a foreign copy of the session replaces its journal too
+        manager._close_journal()
+        manager._current_session = None
+        assert manager.save_session(other)
+        assert not get_journal_path(manager.session_dir, session.session_id).exists()
+        assert len(manager._load_session(session.session_id).messages) == 2
+
+
+def test_snapshot_compression_replaces_plain_file(manager):
+    manager.COMPRESSION_THRESHOLD = 500
+    manager.start_session()
+    plain = storage.get_session_path(manager.session_dir, manager.current_session.session_id, True)
+    assert plain.with_suffix(".json").exists()
+
+    manager.add_message("user", "x" * 1_000)
+    manager.save(compact=True)
+    assert plain.with_suffix(".json.gz").exists()
+    assert not plain.with_suffix(".json").exists()
@@ -0,0 +1,300 @@
+"""
+Tests for the shared workspace snapshot and the tools that read from it.
+"""
+
+import os
+import shutil
+import subprocess
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from vertice_core.core.workspace_snapshot import WorkspaceSnapshot
+from vertice_core.tools.file_ops import ListDirectoryTool
+from vertice_core.tools.git_ops import GitStatusTool
+from vertice_core.tools.search import GetDirectoryTreeTool
+
+requires_git = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def age(*paths):
+    """Backdate mtimes so listings are outside the racy window."""
+    past = time.time_ns() - 10_000_000_000
+    for path in paths:
+        os.utime(path, ns=(past, past))
+
+
+class FakeWatcher:
+    def __init__(self, watches_all_files=True):
+        self.callbacks = []
+        self.watches_all_files = watches_all_files
+
+    def subscribe(self, callback, extensions=None):
+        self.callbacks.append(callback)
+        return lambda: self.callbacks.remove(callback)
+
+    def emit(self, *paths):
+        for callback in self.callbacks:
+            callback([SimpleNamespace(path=str(p), event_type="modified") for p in paths])
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "ws"
+    (root / "src" / "pkg").mkdir(parents=True)
+    (root / "docs").mkdir()
+    (root / ".hidden").mkdir()
+    (root / "src" / "app.py").write_text("print('app')\n")
+    (root / "src" / "pkg" / "mod.py").write_text("x = 1\n")
+    (root / "src" / "pkg" / "data.json").write_text("{}")
+    (root / "docs" / "index.md").write_text("# docs\n")
+    (root / ".hidden" / "secret.py").write_text("")
+    (root / "README.md").write_text("readme\n")
+    (root / "link").symlink_to(root / "src", target_is_directory=True)
+    age(root, root / "src", root / "src" / "pkg", root / "docs", root / ".hidden")
+    return root
+
+
+def run(coro):
+    import asyncio
+
+    return asyncio.run(coro)
+
+
+class TestListings:
+    def test_list_dir_is_sorted_and_reused(self, tree):
+        snapshot = WorkspaceSnapshot()
+        entries = snapshot.list_dir(tree)
+
+        assert [e.name for e in entries] == sorted(os.listdir(tree))
+        readme = next(e for e in entries if e.name == "README.md")
+        assert not readme.is_dir and readme.size == len("readme\n")
+        link = next(e for e in entries if e.name == "link")
+        assert link.is_dir and link.is_symlink
+
+        assert snapshot.list_dir(tree) is entries
+        assert snapshot.get_stats()["dir_hits"] == 1
+
+    def test_created_and_deleted_entries_are_seen(self, tree):
+        snapshot = WorkspaceSnapshot()
+        snapshot.list_dir(tree / "src")
+
+        (tree / "src" / "new.py").write_text("")
+        assert "new.py" in [e.name for e in snapshot.list_dir(tree / "src")]
+
+        (tree / "src" / "app.py").unlink()
+        assert "app.py" not in [e.name for e in snapshot.list_dir(tree / "src")]
+
+    def test_racy_listing_is_rescanned(self, tmp_path):
+        snapshot = WorkspaceSnapshot()
+        snapshot.list_dir(tmp_path)
+        snapshot.list_dir(tmp_path)
+        assert snapshot.get_stats()["dir_misses"] == 2
+
+    def test_watcher_event_refreshes_in_place_edit(self, tree):
+        snapshot = WorkspaceSnapshot()
+        watcher = FakeWatcher()
+        snapshot.attach_watcher(watcher)
+        path = tree / "src" / "app.py"
+        snapshot.list_dir(tree / "src")
+
+        with open(path, "a") as f:
+            f.write("more\n")
+        watcher.emit(path)
+
+        app = next(e for e in snapshot.list_dir(tree / "src") if e.name == "app.py")
+        assert app.size == path.stat().st_size
+        assert snapshot.get_stats()["invalidations"] == 1
+
+    @pytest.mark.parametrize("watches_all_files", [None, False])
+    def test_in_place_edit_seen_without_unfiltered_watcher(self, tree, watches_all_files):
+        snapshot = WorkspaceSnapshot()
+        if watches_all_files is not None:
+            snapshot.attach_watcher(FakeWatcher(watches_all_files))
+        path = tree / "src" / "app.py"
+        first = snapshot.list_dir(tree / "src")
+        assert snapshot.list_dir(tree / "src") is first  # Unchanged files: same listing
+
+        with open(path, "a") as f:
+            f.write("more\n")
+
+        app = next(e for e in snapshot.list_dir(tree / "src") if e.name == "app.py")
+        assert app.size == path.stat().st_size
+        assert snapshot.get_stats()["dir_misses"] == 1
+
+    def test_detach_stops_invalidation(self, tree):
+        snapshot = WorkspaceSnapshot()
+        watcher = FakeWatcher()
+        detach = snapshot.attach_watcher(watcher)
+        detach()
+        assert watcher.callbacks == []
+        assert snapshot.get_stats()["watchers"] == 0
+
+    def test_walk_matches_rglob(self, tree):
+        snapshot = WorkspaceSnapshot()
+        walked = {str(path) for path, _ in snapshot.walk(tree)}
+        assert walked == {str(path) for path in tree.rglob("*")}
+
+    @pytest.mark.parametrize("pattern", ["*", "*.py", "mod.py", "[ad]*", "*.none"])
+    @pytest.mark.parametrize("recursive", [False, True])
+    def test_glob_matches_pathlib(self, tree, pattern, recursive):
+        snapshot = WorkspaceSnapshot()
+        expected = tree.rglob(pattern) if recursive else tree.glob(pattern)
+        matched = snapshot.glob(tree, pattern, recursive)
+        assert sorted(str(path) for path, _ in matched) == sorted(str(p) for p in expected)
+
+    def test_lru_bound(self, tree):
+        snapshot = WorkspaceSnapshot(max_dirs=2)
+        for directory in ("src", "docs", ".hidden"):
+            snapshot.list_dir(tree / directory)
+        stats = snapshot.get_stats()
+        assert stats["directories"] == 2
+        assert stats["evictions"] == 1
+
+
+def git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tree):
+    git(tree, "init", "-q", "-b", "main")
+    git(tree, "add", "src", "docs")
+    git(tree, "commit", "-q", "-m", "init")
+    return tree
+
+
+@requires_git
+class TestGitStatus:
+    def test_not_cached_without_watcher(self, repo):
+        snapshot = WorkspaceSnapshot()
+        snapshot.git_status(repo)
+        snapshot.git_status(repo)
+        assert snapshot.get_stats()["git_hits"] == 0
+
+    def test_cached_until_change(self, repo):
+        snapshot = WorkspaceSnapshot()
+        watcher = FakeWatcher()
+        snapshot.attach_watcher(watcher)
+
+        status = snapshot.git_status(repo)
+        assert status.branch == "main"
+        assert status.root == repo
+        assert sorted(status.untracked) == [".hidden/", "README.md", "link"]
+        assert snapshot.git_status(repo) == status
+        assert snapshot.get_stats()["git_hits"] == 2
+
+        # Working tree change reported by the watcher
+        (repo / "src" / "app.py").write_text("changed\n")
+        watcher.emit(repo / "src" / "app.py")
+        assert snapshot.git_status(repo).modified == ["src/app.py"]
+
+        # Index change made behind our back
+        git(repo, "add", "src/app.py")
+        status = snapshot.git_status(repo)
+        assert status.staged == ["src/app.py"]
+        assert status.modified == []
+
+        # HEAD moves
+        git(repo, "commit", "-q", "-m", "second")
+        assert snapshot.git_status(repo).staged == []
+        git(repo, "checkout", "-q", "-b", "feature")
+        assert snapshot.git_status(repo).branch == "feature"
+
+    def test_not_cached_with_extension_filtered_watcher(self, repo):
+        snapshot = WorkspaceSnapshot()
+        snapshot.attach_watcher(FakeWatcher(watches_all_files=False))
+        snapshot.git_status(repo)
+
+        # An edit the watcher does not see
+        (repo / "docs" / "index.md").write_text("changed\n")
+        assert snapshot.git_status(repo).modified == ["docs/index.md"]
+        assert snapshot.get_stats()["git_hits"] == 0
+
+    def test_lru_bound(self, repo):
+        snapshot = WorkspaceSnapshot(max_git=2)
+        snapshot.attach_watcher(FakeWatcher())
+        for args in (("status",), ("rev-parse", "HEAD"), ("log", "-1")):
+            snapshot.git(repo, *args)
+        stats = snapshot.get_stats()
+        assert stats["git_entries"] == 2
+        assert stats["evictions"] == 1
+
+    def test_subdirectory_and_non_repo(self, repo, tmp_path):
+        snapshot = WorkspaceSnapshot()
+        assert snapshot.git_status(repo / "src").root == repo
+        outside = tmp_path / "plain"
+        outside.mkdir()
+        assert snapshot.git_status(outside) is None
+
+
+class TestTools:
+    def test_list_directory(self, tree):
+        result = run(ListDirectoryTool()._execute_validated(path=str(tree), recursive=True))
+        assert result.success
+        files = {f["path"]: f["size"] for f in result.data["files"]}
+        assert files[str(Path("src") / "app.py")] == len("print('app')\n")
+        assert str(Path(".hidden") / "secret.py") in files
+        assert {d["path"] for d in result.data["directories"]} == {
+            "src",
+            "docs",
+            "link",
+            str(Path("src") / "pkg"),
+        }
+
+        result = run(ListDirectoryTool()._execute_validated(path=str(tree), pattern="*.md"))
+        assert [f["name"] for f in result.data["files"]] == ["README.md"]
+
+        result = run(ListDirectoryTool()._execute_validated(path=str(tree), pattern="src/*.py"))
+        assert [f["name"] for f in result.data["files"]] == ["app.py"]
+
+    def test_directory_tree_sees_new_files(self, tree):
+        tool = GetDirectoryTreeTool()
+        first = run(tool._execute_validated(path=str(tree), max_depth=1))
+        assert first.data.splitlines() == [
+            "ws/",
+            "├── docs/",
+            "│   └── index.md",
+            "├── link/",
+            "│   ├── pkg/",
+            "│   └── app.py",
+            "├── src/",
+            "│   ├── pkg/",
+            "│   └── app.py",
+            "└── README.md",
+        ]
+
+        (tree / "docs" / "guide.md").write_text("")
+        second = run(tool._execute_validated(path=str(tree), max_depth=1))
+        assert "│   ├── guide.md" in second.data.splitlines()
+
+    @requires_git
+    def test_git_status_tool(self, repo):
+        (repo / "src" / "app.py").write_text("changed\n")
+        result = run(GitStatusTool()._execute_validated(path=str(repo)))
+        assert result.success
+        assert result.data["branch"] == "main"
+        assert result.data["modified"] == ["src/app.py"]
+        assert result.metadata["total_changes"] == 4
+
+    @requires_git
+    def test_file_tree_marks_git_status(self, repo):
+        file_tree_module = pytest.importorskip("vertice_core.tui.components.file_tree")
+        FileTree, GitStatus = file_tree_module.FileTree, file_tree_module.GitStatus
+        (repo / "src" / "app.py").write_text("changed\n")
+        file_tree = FileTree(repo, console=None, max_depth=3)
+        root = file_tree.build_tree()
+
+        nodes = {node.name: node for node in root.children}
+        assert nodes["README.md"].git_status == GitStatus.UNTRACKED
+        assert nodes["README.md"].size == len("readme\n")
+        src = {node.name: node for node in nodes["src"].children}
+        assert src["app.py"].git_status == GitStatus.MODIFIED
+        assert ".hidden" not in nodes
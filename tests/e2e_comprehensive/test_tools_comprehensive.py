@@ -249,10 +249,11 @@ class TestFileOperationsComprehensive:
 
         assert result.success
         # Check backup was created
-        backup_dir = Path(".qwen_backups")
-        assert backup_dir.exists()
-        backups = list(backup_dir.glob("backup.py.*.bak"))
-        assert len(backups) > 0
+        from vertice_core.core.blob_store import get_blob_store, list_backups
+
+        backups = list_backups(test_file)
+        assert backups[-1][0] == result.metadata["backup"]
+        assert get_blob_store().get(backups[-1][1]) == original.encode()
 
     @pytest.mark.asyncio
     async def test_list_directory_basic(self, temp_project):
@@ -19,6 +19,7 @@ from vertice_core.openresponses_types import (
 )
 from vertice_core.openresponses_stream import (
     OpenResponsesStreamBuilder,
+    StreamEvent,
 )
 from vertice_core.openresponses_multimodal import (
     InputImageContent,
@@ -218,6 +219,100 @@ class TestStreamingIntegration:
         assert done == "data: [DONE]\n\n"
 
 
+class TestStreamCoalescing:
+    """Testes de coalescing, buffer limitado e encoder rápido."""
+
+    @staticmethod
+    def _deltas(events):
+        return [e for e in events if e.type == "response.output_text.delta"]
+
+    def test_fast_delta_sse_matches_generic_encoder(self):
+        """O SSE rápido dos deltas é idêntico ao gerado via to_dict."""
+        builder = OpenResponsesStreamBuilder(model="gemini-3-pro")
+        builder.start()
+        message = builder.add_message()
+        reasoning = builder.add_reasoning()
+        builder.text_delta(message, 'diz "olá"\n\t✓')
+        builder.reasoning_delta(reasoning, "\\ passo 1")
+
+        for event in builder.get_events():
+            generic = StreamEvent.to_sse(event)
+            assert event.to_sse() == generic
+
+    def test_coalescing_preserves_text_and_order(self):
+        """Deltas agrupados mantêm o texto e sequence numbers crescentes."""
+        builder = OpenResponsesStreamBuilder(model="gemini-3-pro", coalesce_ms=60_000)
+        builder.start()
+        message = builder.add_message()
+        chunks = [f"token{i} " for i in range(50)]
+        for chunk in chunks:
+            builder.text_delta(message, chunk)
+        builder.complete()
+
+        events = builder.get_events()
+        deltas = self._deltas(events)
+
+        # Primeiro delta sai na hora; o resto fica num único evento
+        assert [d.delta for d in deltas] == [chunks[0], "".join(chunks[1:])]
+        assert [e.sequence_number for e in events] == sorted(e.sequence_number for e in events)
+        done = next(e for e in events if e.type == "response.output_text.done")
+        assert done.text == "".join(chunks)
+
+    def test_coalescing_byte_budget(self):
+        """coalesce_bytes emite assim que o buffer atinge o limite."""
+        builder = OpenResponsesStreamBuilder(model="gemini-3-pro", coalesce_bytes=8)
+        builder.start()
+        message = builder.add_message()
+        for chunk in ["abc", "def", "ghi", "j"]:
+            builder.text_delta(message, chunk)
+
+        assert [d.delta for d in self._deltas(builder.drain(as_events=True))] == ["abcdefghi"]
+
+        builder.complete()
+        assert [d.delta for d in self._deltas(builder.get_events())] == ["j"]
+
+    def test_coalescing_flushes_before_next_item(self):
+        """Raciocínio pendente é emitido antes do item seguinte."""
+        builder = OpenResponsesStreamBuilder(model="gemini-3-pro", coalesce_bytes=1024)
+        builder.start()
+        reasoning = builder.add_reasoning()
+        builder.reasoning_delta(reasoning, "pensando")
+        builder.add_message()
+
+        types = [e.type for e in builder.get_events()]
+        assert types.index("response.reasoning_content.delta") < types.index(
+            "response.output_item.added", types.index("response.reasoning_content.delta")
+        )
+
+    def test_pending_events_are_bounded(self):
+        """Sem drain, deltas consecutivos são compactados."""
+        builder = OpenResponsesStreamBuilder(model="gemini-3-pro", max_pending_events=64)
+        builder.start()
+        message = builder.add_message()
+        for i in range(1000):
+            builder.text_delta(message, f"{i},")
+
+        events = builder.get_events()
+        assert len(events) <= 64
+        assert "".join(d.delta for d in self._deltas(events)) == "".join(
+            f"{i}," for i in range(1000)
+        )
+
+    def test_compaction_leaves_queued_events_untouched(self):
+        """A compactação cria um evento novo em vez de alterar o enfileirado."""
+        builder = OpenResponsesStreamBuilder(model="gemini-3-pro", max_pending_events=64)
+        builder.start()
+        message = builder.add_message()
+        builder.text_delta(message, "first,")
+        queued = self._deltas(builder.get_events())[0]
+
+        for i in range(1000):
+            builder.text_delta(message, f"{i},")
+
+        assert queued.delta == "first,"
+        assert self._deltas(builder.get_events())[0].delta.startswith("first,0,")
+
+
 class TestTUIEventParsing:
     """Testes de parsing de eventos para TUI."""
 
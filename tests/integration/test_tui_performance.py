@@ -320,6 +320,7 @@ class TestScrollbackCompaction:
 
         monkeypatch.setenv("VERTICE_TUI_MAX_VIEW_ITEMS", "6")
         monkeypatch.setenv("VERTICE_TUI_SCROLLBACK_RICH_TAIL", "2")
+        monkeypatch.setenv("VERTICE_TUI_VIEWPORT_MARGIN", "100")  # Count cap only
         monkeypatch.setenv("VERTICE_TUI_SCROLLBACK_COMPACT_BATCH", "10")
 
         # Ensure code blocks are initially rendered as expensive Syntax panels (SelectableStatic),
@@ -357,6 +358,7 @@ class TestScrollbackCompaction:
 
         monkeypatch.setenv("VERTICE_TUI_MAX_VIEW_ITEMS", "6")
         monkeypatch.setenv("VERTICE_TUI_SCROLLBACK_RICH_TAIL", "1")
+        monkeypatch.setenv("VERTICE_TUI_VIEWPORT_MARGIN", "100")  # Count cap only
         monkeypatch.setenv("VERTICE_TUI_SCROLLBACK_COMPACT_BATCH", "1")
         monkeypatch.setenv("VERTICE_TUI_MAX_CODE_LINES", "1000")
 
@@ -519,5 +521,251 @@ class TestLongSessionStability:
             ), "Expected compaction to produce at least one compacted ExpandableCodeBlock"
 
 
+class TestVirtualizedScrollback:
+    """Trimmed history stays in the transcript and is repainted on scroll-up."""
+
+    @pytest.mark.asyncio
+    async def test_scrolling_back_repaints_trimmed_blocks(self, monkeypatch) -> None:
+        from textual.app import App, ComposeResult
+
+        from vertice_tui.widgets.response_view import ResponseView
+        from vertice_tui.widgets.transcript import TranscriptHistory
+
+        monkeypatch.setenv("VERTICE_TUI_MAX_VIEW_ITEMS", "30")
+
+        class _App(App):
+            def compose(self) -> ComposeResult:
+                yield ResponseView(id="response")
+
+        app = _App()
+        async with app.run_test() as pilot:
+            view = pilot.app.query_one("#response", ResponseView)
+
+            for i in range(200):
+                view.add_user_message(f"message {i}")
+                if i % 10 == 0:
+                    await pilot.pause(0)
+            await pilot.pause()
+
+            history = view.query_one(TranscriptHistory)
+            assert len(view.transcript) == 200
+            assert len(view.children) <= 30
+            assert history.count == len(view.transcript) - (len(view.children) - 1)
+
+            # Nothing trimmed is rendered until it scrolls into view
+            assert view.transcript.get_stats()["misses"] == 0
+
+            view.scroll_home(animate=False, immediate=True)
+            await pilot.pause()
+            await pilot.pause()
+
+            top = history.render_line(0).text + history.render_line(1).text
+            assert "message 0" in top
+            # Only the blocks around the viewport were rendered
+            assert 0 < view.transcript.get_stats()["misses"] <= view.size.height + 2
+
+    @pytest.mark.asyncio
+    async def test_only_the_viewport_and_margin_stay_mounted(self, monkeypatch) -> None:
+        from textual.app import App, ComposeResult
+
+        from vertice_tui.widgets.response_view import ResponseView
+        from vertice_tui.widgets.transcript import TranscriptHistory
+
+        monkeypatch.setenv("VERTICE_TUI_MAX_VIEW_ITEMS", "0")  # No count cap
+        monkeypatch.setenv("VERTICE_TUI_VIEWPORT_MARGIN", "1")
+
+        class _App(App):
+            def compose(self) -> ComposeResult:
+                yield ResponseView(id="response")
+
+        app = _App()
+        async with app.run_test() as pilot:
+            view = pilot.app.query_one("#response", ResponseView)
+
+            for i in range(200):
+                view.add_user_message(f"message {i}")
+                if i % 10 == 0:
+                    await pilot.pause(0)
+            await pilot.pause()
+            await pilot.pause()
+
+            history = view.query_one(TranscriptHistory)
+            live = [child for child in view.children if child is not history]
+            # Everything mounted sits within two screens of the bottom
+            assert len(live) < 200
+            assert all(
+                child.virtual_region.bottom >= view.scroll_y - view.size.height for child in live
+            )
+            assert history.count == len(view.transcript) - len(live)
+            assert set(view._widget_blocks) == set(live)
+
+    @pytest.mark.asyncio
+    async def test_removed_widgets_leave_no_block_mapping(self, monkeypatch) -> None:
+        from textual.app import App, ComposeResult
+
+        from vertice_tui.widgets.response_view import ResponseView
+
+        class _App(App):
+            def compose(self) -> ComposeResult:
+                yield ResponseView(id="response")
+
+        app = _App()
+        async with app.run_test() as pilot:
+            view = pilot.app.query_one("#response", ResponseView)
+            for i in range(5):
+                view.add_action(f"action {i}")
+            await pilot.pause()
+
+            await view.remove_children()
+            view.add_action("fresh")
+            await pilot.pause()
+
+            assert list(view._widget_blocks) == list(view.children)
+
+    @pytest.mark.asyncio
+    async def test_clear_all_resets_transcript(self, monkeypatch) -> None:
+        from textual.app import App, ComposeResult
+
+        from vertice_tui.widgets.response_view import ResponseView
+
+        monkeypatch.setenv("VERTICE_TUI_MAX_VIEW_ITEMS", "5")
+
+        class _App(App):
+            def compose(self) -> ComposeResult:
+                yield ResponseView(id="response")
+
+        app = _App()
+        async with app.run_test() as pilot:
+            view = pilot.app.query_one("#response", ResponseView)
+            for i in range(20):
+                view.add_action(f"action {i}")
+            await pilot.pause()
+
+            view.clear_all()
+            view.add_action("fresh")
+            await pilot.pause()
+
+            assert len(view.transcript) == 1
+            assert len(view.children) == 1
+
+
+    def test_streamed_chunks_are_joined_lazily(self) -> None:
+        from rich.console import Console
+
+        from vertice_tui.widgets.transcript import TranscriptModel
+
+        model = TranscriptModel()
+        console = Console(width=40)
+        done = model.append("markdown", "finished", "ai-response")
+        streaming = model.append("markdown", "", "ai-response")
+        model.render_lines(done, 40, console)
+        model.render_lines(streaming, 40, console)
+
+        for i in range(1000):
+            model.append_source(streaming, f"chunk {i} ")
+        assert streaming.source == "" and len(streaming._chunks) == 1000
+        assert model.get_stats()["cached_entries"] == 1  # Only the streaming block dropped
+
+        lines = model.render_lines(streaming, 40, console)
+        assert streaming.source.startswith("chunk 0 chunk 1 ") and not streaming._chunks
+        assert len(lines) > 1 and model.get_stats()["cached_entries"] == 2
+
+        model.update_source(streaming, "final")
+        assert streaming.flush() == "final"
+
+
+class TestStreamingMarkdownBlockCache:
+    """Finalized blocks are rendered once; frames are coalesced."""
+
+    def test_finalized_blocks_are_built_once(self) -> None:
+        from rich.console import Console
+
+        from vertice_tui.components.block_detector import BlockDetector
+        from vertice_tui.components.streaming_markdown import (
+            BlockRenderCache,
+            BlockWidgetFactory,
+            PerformanceMetrics,
+        )
+
+        factory = BlockWidgetFactory()
+        built = []
+        render_block = factory.render_block
+        factory.render_block = lambda block: (
+            built.append((id(block), block.is_complete)) or render_block(block)
+        )
+
+        metrics = PerformanceMetrics()
+        cache = BlockRenderCache(factory, metrics)
+        detector = BlockDetector()
+        console = Console(width=80, file=open(os.devnull, "w"))
+
+        text = "".join(f"Paragraph {i}.\n\n" for i in range(20)) + "Tail in progr"
+        for i in range(0, len(text), 5):
+            detector.process_chunk(text[i : i + 5])
+            console.print(*cache.render(detector.get_all_blocks()))
+
+        finalized = len(detector.blocks)
+        assert finalized == 20
+        assert len(cache) == finalized
+        finalized_builds = [block_id for block_id, complete in built if complete]
+        assert len(finalized_builds) == len(set(finalized_builds)) == finalized
+        # One Rich render per finalized block at this width; everything else replayed
+        assert metrics.block_cache_misses == finalized
+        assert metrics.block_cache_hits > metrics.block_cache_misses
+        assert 0.0 < metrics.block_cache_hit_rate < 1.0
+
+    def test_complete_block_after_an_incomplete_one(self) -> None:
+        from vertice_tui.components.block_detector import BlockInfo, BlockType
+        from vertice_tui.components.streaming_markdown import (
+            BlockRenderCache,
+            BlockWidgetFactory,
+            PerformanceMetrics,
+        )
+
+        factory = BlockWidgetFactory()
+        built = []
+        render_block = factory.render_block
+        factory.render_block = lambda block: built.append(block.content) or render_block(block)
+        cache = BlockRenderCache(factory, PerformanceMetrics())
+
+        streaming = BlockInfo(BlockType.PARAGRAPH, 0, content="still streaming")
+        done = BlockInfo(BlockType.PARAGRAPH, 1, 1, is_complete=True, content="done")
+        first = cache.render([streaming, done])
+        streaming.is_complete = True
+        second = cache.render([streaming, done])
+
+        assert second[1] is first[1]
+        assert built == ["still streaming", "done", "still streaming"]
+        assert len(cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_chunks_share_one_render_task_per_frame(self) -> None:
+        from textual.app import App, ComposeResult
+
+        from vertice_tui.components.streaming_markdown import StreamingMarkdownWidget
+
+        class _App(App):
+            def compose(self) -> ComposeResult:
+                yield StreamingMarkdownWidget(id="stream")
+
+        app = _App()
+        async with app.run_test() as pilot:
+            widget = pilot.app.query_one("#stream", StreamingMarkdownWidget)
+            await widget.start_stream()
+
+            text = "".join(f"## Part {i}\n\nBody {i}.\n\n" for i in range(30))
+            for i in range(0, len(text), 3):
+                await widget.append_chunk(text[i : i + 3])
+
+            metrics = widget.get_metrics()
+            assert metrics.coalesced_chunks > 0
+            await pilot.pause(0.1)
+            await widget.end_stream()
+
+            assert widget.get_content() == text
+            assert metrics.frames_rendered < len(text) // 3
+            assert metrics.max_frame_time_ms >= metrics.last_frame_time_ms > 0.0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--asyncio-mode=auto"])
@@ -0,0 +1,232 @@
+"""
+Tests for SemanticIndexer symbol search, reindexing and on-disk store.
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+from vertice_core.intelligence.indexer import SemanticIndexer, Symbol
+
+
+def reference_search(indexer, query, limit=10):
+    """Original search_symbols: substring test over every name."""
+    query_lower = query.lower()
+    results = []
+    for name, symbols in indexer.symbol_index.items():
+        if query_lower in name.lower():
+            results.extend(symbols)
+
+    def sort_key(symbol):
+        name_lower = symbol.name.lower()
+        if name_lower == query_lower:
+            return (0, symbol.name)
+        elif name_lower.startswith(query_lower):
+            return (1, symbol.name)
+        return (2, symbol.name)
+
+    results.sort(key=sort_key)
+    return results[:limit]
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "project"
+    root.mkdir()
+    (root / "models.py").write_text(
+        "class UserModel:\n"
+        "    def save(self):\n"
+        "        pass\n"
+        "\n"
+        "    class Meta:\n"
+        "        def describe(self, verbose):\n"
+        "            pass\n"
+        "\n"
+        "def load_user(user_id):\n"
+        "    pass\n"
+    )
+    (root / "views.py").write_text(
+        "from models import UserModel\n"
+        "\n"
+        "def user_view(request):\n"
+        "    pass\n"
+        "\n"
+        "def save(obj):\n"
+        "    pass\n"
+    )
+    (root / "pkg").mkdir()
+    (root / "pkg" / "__init__.py").write_text("import os\n\nclass Loader:\n    pass\n")
+    return root
+
+
+def make_indexer(root, **kwargs):
+    return SemanticIndexer(str(root), cache_dir=str(root.parent / "cache"), **kwargs)
+
+
+def symbols_by_file(indexer):
+    return {
+        path: [(s.name, s.type, s.line_number, s.parent, s.signature) for s in idx.symbols]
+        for path, idx in indexer.file_index.items()
+    }
+
+
+class TestSearch:
+    @pytest.mark.parametrize(
+        "query", ["", "u", "us", "user", "USER", "save", "load", "ode", "xyz", "er_", "Meta"]
+    )
+    @pytest.mark.parametrize("limit", [1, 3, 10])
+    def test_matches_reference(self, project, query, limit):
+        indexer = make_indexer(project)
+        indexer.index_codebase()
+        assert indexer.search_symbols(query, limit) == reference_search(indexer, query, limit)
+
+    def test_search_after_names_removed(self, project):
+        indexer = make_indexer(project)
+        indexer.index_codebase()
+        (project / "models.py").write_text("def fresh_name():\n    pass\n")
+        indexer.index_codebase()
+
+        assert indexer.search_symbols("usermodel") == []
+        assert [s.name for s in indexer.search_symbols("fre")] == ["fresh_name"]
+        assert [s.name for s in indexer.search_symbols("fr")] == ["fresh_name"]
+        assert "rmo" not in indexer._trigram_index
+
+
+class TestReindex:
+    def test_methods_get_outermost_class(self, project):
+        indexer = make_indexer(project)
+        indexer.index_codebase()
+        symbols = {s.name: s for s in indexer.file_index["models.py"].symbols}
+        assert symbols["save"].type == "method"
+        assert symbols["save"].parent == "UserModel"
+        assert symbols["describe"].parent == "UserModel"
+        assert symbols["describe"].signature == "describe(self, verbose)"
+        assert symbols["load_user"].type == "function"
+
+    def test_changed_file_replaces_its_symbols(self, project):
+        indexer = make_indexer(project)
+        indexer.index_codebase()
+        (project / "views.py").write_text("def save(obj, force):\n    pass\n")
+
+        assert indexer.index_codebase() == 1
+
+        saves = indexer.find_symbol("save")
+        assert sorted((s.file_path, s.type) for s in saves) == [
+            ("models.py", "method"),
+            ("views.py", "function"),
+        ]
+        assert indexer.find_symbol("user_view") == []
+        assert "user_view" not in indexer.symbol_index
+        assert indexer.import_graph["views.py"] == set()
+
+    def test_deleted_file_is_dropped(self, project):
+        indexer = make_indexer(project)
+        indexer.index_codebase()
+        (project / "pkg" / "__init__.py").unlink()
+        indexer.index_codebase()
+
+        assert "pkg/__init__.py" not in indexer.file_index
+        assert indexer.find_symbol("Loader") == []
+
+    def test_force_reindex_does_not_duplicate(self, project):
+        indexer = make_indexer(project)
+        indexer.index_codebase()
+        before = indexer.get_stats()
+        indexer.index_codebase(force=True)
+        assert indexer.get_stats() == before
+
+    def test_parallel_parse_matches_serial(self, project, monkeypatch):
+        for i in range(12):
+            (project / f"mod_{i}.py").write_text(
+                f"class C{i}:\n    def m{i}(self):\n        pass\n"
+            )
+
+        serial = make_indexer(project, max_workers=1)
+        serial.index_codebase()
+
+        monkeypatch.setattr(SemanticIndexer, "PARALLEL_MIN_FILES", 2)
+        parallel = SemanticIndexer(
+            str(project), cache_dir=str(project.parent / "cache2"), max_workers=3
+        )
+        assert parallel.index_codebase() == len(serial.file_index)
+        assert symbols_by_file(parallel) == symbols_by_file(serial)
+
+
+class TestStore:
+    def test_round_trip(self, project):
+        indexer = make_indexer(project)
+        indexer.index_codebase()
+
+        loaded = make_indexer(project)
+        assert loaded.load_cache()
+        assert symbols_by_file(loaded) == symbols_by_file(indexer)
+        assert loaded.import_graph == indexer.import_graph
+        assert loaded.index_codebase() == 0
+
+    def test_only_changed_files_are_rewritten(self, project):
+        indexer = make_indexer(project)
+        indexer.index_codebase()
+        db = project.parent / "cache" / SemanticIndexer.CACHE_DB
+
+        def rowids():
+            with sqlite3.connect(db) as conn:
+                return dict(conn.execute("SELECT path, rowid FROM files"))
+
+        before = rowids()
+        (project / "views.py").write_text("def other():\n    pass\n")
+        (project / "models.py").unlink()
+        indexer.index_codebase()
+        after = rowids()
+
+        assert set(after) == {"views.py", "pkg/__init__.py"}
+        assert after["pkg/__init__.py"] == before["pkg/__init__.py"]
+        assert after["views.py"] != before["views.py"]
+
+    def test_unloaded_index_rewrites_store(self, project):
+        make_indexer(project).index_codebase()
+        (project / "views.py").unlink()
+
+        # A fresh indexer that skipped load_cache must not leave stale rows
+        make_indexer(project).index_codebase()
+        loaded = make_indexer(project)
+        loaded.load_cache()
+        assert "views.py" not in loaded.file_index
+
+    def test_migrates_legacy_json(self, project):
+        cache = project.parent / "cache"
+        cache.mkdir()
+        symbol = Symbol(name="legacy", type="function", file_path="old.py", line_number=1)
+        (cache / "index.json").write_text(
+            json.dumps(
+                {
+                    "file_index": {
+                        "old.py": {
+                            "path": "old.py",
+                            "hash": "abc",
+                            "symbols": [
+                                {
+                                    "name": symbol.name,
+                                    "type": symbol.type,
+                                    "file_path": symbol.file_path,
+                                    "line_number": symbol.line_number,
+                                    "docstring": None,
+                                    "signature": None,
+                                    "parent": None,
+                                }
+                            ],
+                            "imports": [],
+                            "last_modified": 0.0,
+                        }
+                    }
+                }
+            )
+        )
+
+        indexer = make_indexer(project)
+        assert indexer.load_cache()
+        assert indexer.find_symbol("legacy")[0].file_path == "old.py"
+
+        indexer.index_codebase()
+        assert (cache / SemanticIndexer.CACHE_DB).exists()
+        assert "old.py" not in indexer.file_index
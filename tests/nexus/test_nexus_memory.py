@@ -194,3 +194,70 @@ class TestHierarchicalMemory:
         assert count == 2
         retrieved = await memory.retrieve(MemoryLevel.L1_WORKING)
         assert len(retrieved) == 0
+
+
+class TestLevelIndex:
+    """Tests for running token totals, heap eviction and moves between levels."""
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_important_then_least_used(self, memory):
+        """Test eviction order follows importance, then access count, then age."""
+        level = MemoryLevel.L1_WORKING
+        index = memory._levels[level]
+        keep = await memory.store("k" * 1200, level, importance=0.9)
+        used = await memory.store("u" * 1200, level, importance=0.3)
+        unused = await memory.store("n" * 1200, level, importance=0.3)
+        # keep is never used but most important; used is the older of the 0.3 blocks
+        used.access_count, unused.access_count = 5, 1
+        used.last_accessed = unused.last_accessed.replace(year=2000)
+        index.touch(used)
+        index.touch(unused)
+
+        newest = await memory.store("z" * 1200, level, importance=0.5)
+
+        assert {b.block_id for b in index} == {keep.block_id, used.block_id, newest.block_id}
+
+    @pytest.mark.asyncio
+    async def test_running_total_matches_blocks(self, memory):
+        """Test the token total stays exact through stores, evictions and clears."""
+        level = MemoryLevel.L2_EPISODIC
+        for i in range(200):
+            await memory.store("x" * (40 * (i % 7 + 1)), level, importance=(i % 10) / 10)
+            if i % 13 == 0:
+                await memory.retrieve(level, limit=3)
+
+        index = memory._levels[level]
+        assert index.tokens == sum(b.token_count for b in index)
+        assert index.tokens <= memory._token_limits[level]
+        assert len(index._heap) <= 2 * len(index) + 64
+
+        await memory.clear_level(level)
+        assert memory._current_level_tokens(level) == 0
+
+    @pytest.mark.asyncio
+    async def test_move_block_between_levels(self, memory):
+        """Test promotion moves a block and its tokens without copying it."""
+        block = await memory.store("e" * 400, MemoryLevel.L2_EPISODIC)
+
+        moved = await memory.move_block(block, MemoryLevel.L3_SEMANTIC)
+
+        assert moved is block and block.level == MemoryLevel.L3_SEMANTIC
+        assert memory._current_level_tokens(MemoryLevel.L2_EPISODIC) == 0
+        assert memory._current_level_tokens(MemoryLevel.L3_SEMANTIC) == 100
+        assert await memory.retrieve(MemoryLevel.L3_SEMANTIC) == [block]
+        with pytest.raises(KeyError):
+            await memory.move_block(
+                MemoryBlock(level=MemoryLevel.L1_WORKING), MemoryLevel.L4_PROCEDURAL
+            )
+
+    @pytest.mark.asyncio
+    async def test_move_block_evicts_in_target_level(self, memory):
+        """Test moving into a full level makes room there first."""
+        resident = await memory.store("p" * 1600, MemoryLevel.L4_PROCEDURAL, importance=0.1)
+        block = await memory.store("e" * 800, MemoryLevel.L2_EPISODIC, importance=0.9)
+
+        await memory.move_block(block, MemoryLevel.L4_PROCEDURAL)
+
+        procedural = memory._levels[MemoryLevel.L4_PROCEDURAL]
+        assert resident.block_id not in procedural.blocks
+        assert procedural.tokens == 200
@@ -193,25 +193,18 @@ class TestCreateHttpClient:
         )
         assert client.timeout.read == 60.0
 
-    def test_applies_connection_limits(self) -> None:
-        """HYPOTHESIS: Client uses connection pool config."""
+    def test_pool_config_is_deprecated(self) -> None:
+        """HYPOTHESIS: pool_config is ignored with a DeprecationWarning (limits are shared)."""
         pool_config: ConnectionPoolConfig = ConnectionPoolConfig(
             max_connections=50,
             max_keepalive=10,
         )
-        client: httpx.AsyncClient = create_http_client(
-            "http://test:8000",
-            pool_config=pool_config,
-        )
-        # Verify client is created with limits (internal structure varies by version)
-        assert client is not None
-        # Check limits via transport if accessible
-        transport = client._transport
-        if hasattr(transport, "_pool") and hasattr(transport._pool, "_limits"):
-            assert transport._pool._limits.max_connections == 50
-        else:
-            # Fallback: just verify client was created successfully
-            assert isinstance(client, httpx.AsyncClient)
+        with pytest.warns(DeprecationWarning, match="pool_config"):
+            client: httpx.AsyncClient = create_http_client(
+                "http://test:8000",
+                pool_config=pool_config,
+            )
+        assert isinstance(client, httpx.AsyncClient)
 
 
 class TestCallWithResilience:
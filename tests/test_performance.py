@@ -8,7 +8,13 @@ import time
 
 from vertice_core.core.cache import LRUCache, DiskCache, PerformanceCache, cache_key
 from vertice_core.core.async_executor import AsyncExecutor, ToolCall, detect_dependencies
-from vertice_core.core.file_watcher import FileWatcher, RecentFilesTracker
+from vertice_core.core.file_watcher import (
+    ALL_FILES,
+    FileEvent,
+    FileWatcher,
+    RecentFilesTracker,
+    get_file_watcher,
+)
 
 
 class TestLRUCache:
@@ -201,6 +207,187 @@ class TestFileWatcher:
             assert len(events) == 1
             assert events[0].event_type == "modified"
 
+    @pytest.mark.parametrize("backend", ["polling", "auto"])
+    def test_batches_are_coalesced(self, backend):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "a.py").write_text("a = 1")
+
+            watcher = FileWatcher(tmpdir, backend=backend)
+            watcher.start()
+            batches = []
+            watcher.subscribe(batches.append)
+
+            time.sleep(0.01)
+            (root / "a.py").write_text("a = 2")
+            (root / "b.py").write_text("b = 1")
+            (root / "b.py").write_text("b = 2")
+            (root / "tmp.py").write_text("")
+            (root / "tmp.py").unlink()
+            (root / "sub").mkdir()
+            (root / "sub" / "c.py").write_text("c = 1")
+            watcher.check_updates()
+
+            assert len(batches) == 1
+            kinds = {Path(e.path).relative_to(root).as_posix(): e.event_type for e in batches[0]}
+            assert kinds == {"a.py": "modified", "b.py": "created", "sub/c.py": "created"}
+
+    def test_polling_ignores_touch_without_content_change(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "test.py"
+            test_file.write_text("x = 1")
+            watcher = FileWatcher(tmpdir, backend="polling")
+            watcher.start()
+
+            test_file.write_text("x = 2")
+            watcher.check_updates()
+            time.sleep(0.01)
+            test_file.touch()
+            watcher.check_updates()
+
+            assert [e.event_type for e in watcher.recent_events] == ["modified"]
+
+    def test_debounce_holds_batch_until_quiet(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            watcher = FileWatcher(tmpdir, backend="polling", debounce_seconds=0.2)
+            watcher.start()
+            batches = []
+            unsubscribe = watcher.subscribe(batches.append)
+
+            (Path(tmpdir) / "new.py").write_text("")
+            watcher.check_updates()
+            assert batches == []
+
+            time.sleep(0.25)
+            watcher.check_updates()
+            assert len(batches) == 1
+
+            unsubscribe()
+            (Path(tmpdir) / "other.py").write_text("")
+            time.sleep(0.25)
+            watcher.check_updates()
+            watcher.check_updates()
+            assert len(batches) == 1
+
+    def test_added_extensions_join_baseline(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "a.py").write_text("")
+            (Path(tmpdir) / "notes.md").write_text("v1")
+            watcher = FileWatcher(tmpdir, backend="polling")
+            watcher.start()
+            assert watcher.tracked_files == 1
+
+            watcher.add_extensions({".md"})
+            assert watcher.tracked_files == 2
+            watcher.check_updates()
+            assert watcher.recent_events == []  # Baseline, not "created"
+
+            (Path(tmpdir) / "notes.md").write_text("v2 longer")
+            watcher.check_updates()
+            assert [e.event_type for e in watcher.recent_events] == ["modified"]
+
+    def test_all_files_mode(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            watcher = FileWatcher(tmpdir, watch_extensions={ALL_FILES})
+            watcher.start()
+            (Path(tmpdir) / "README").write_text("")
+            (Path(tmpdir) / "config.yaml").write_text("")
+            watcher.check_updates()
+
+            assert watcher.watches_all_files
+            assert len(watcher.recent_events) == 2
+
+    def test_subscribers_get_only_their_extensions(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            watcher = FileWatcher(tmpdir, backend="polling")
+            watcher.start()
+            own, everything, events = [], [], []
+            watcher.subscribe(own.append)
+            watcher.subscribe(everything.append, extensions={ALL_FILES})
+            watcher.add_callback(events.append)
+
+            (Path(tmpdir) / "a.py").write_text("")
+            (Path(tmpdir) / "poetry.lock").write_text("")
+            watcher.check_updates()
+
+            assert [Path(e.path).name for e in own[0]] == ["a.py"]
+            assert {Path(e.path).name for e in everything[0]} == {"a.py", "poetry.lock"}
+            assert [Path(e.path).name for e in events] == ["a.py"]
+            assert watcher.watches_all_files  # Scans for the widest subscriber
+
+    def test_directory_that_cannot_be_watched_is_skipped(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            watcher = FileWatcher(tmpdir)
+            watcher.start()
+            if watcher.backend != "inotify":
+                pytest.skip("inotify not available")
+
+            def no_watches_left(directory):
+                raise OSError(28, "No space left on device")
+
+            watcher._backend._add_watch = no_watches_left
+            (Path(tmpdir) / "sub").mkdir()
+            (Path(tmpdir) / "sub" / "new.py").write_text("")
+            watcher.check_updates()
+
+            assert [e.event_type for e in watcher.recent_events] == ["created"]
+            (Path(tmpdir) / "later.py").write_text("")
+            watcher.check_updates()
+            assert len(watcher.recent_events) == 2
+
+    @pytest.mark.asyncio
+    async def test_start_polling_drives_check_updates(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            watcher = FileWatcher(tmpdir, backend="polling")
+            watcher.start()
+            watcher.stop()  # The task also ends once the watcher stops
+            watcher._running = True
+            batches = []
+            watcher.subscribe(batches.append)
+
+            task = watcher.start_polling()
+            assert watcher.start_polling() is task
+            (Path(tmpdir) / "new.py").write_text("")
+            await asyncio.sleep(watcher.poll_interval + 0.2)
+            assert len(batches) == 1
+
+            watcher.stop()
+            await asyncio.wait_for(task, watcher.poll_interval + 1)
+
+    def test_file_tree_ignores_sibling_prefix(self):
+        create_file_tree = pytest.importorskip(
+            "vertice_core.tui.components.file_tree"
+        ).create_file_tree
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "foo").mkdir()
+            (Path(tmpdir) / "foobar").mkdir()
+            tree = create_file_tree(str(Path(tmpdir) / "foo"), console=None)
+            tree.build_tree()
+
+            event = FileEvent(str(Path(tmpdir) / "foobar" / "x.py"), "created", time.time())
+            tree._on_file_events([event])
+            assert tree.root_node is not None
+
+            event = FileEvent(str(Path(tmpdir) / "foo" / "x.py"), "created", time.time())
+            tree._on_file_events([event])
+            assert tree.root_node is None
+
+    def test_file_tree_is_rebuilt_from_shared_watcher(self):
+        create_file_tree = pytest.importorskip(
+            "vertice_core.tui.components.file_tree"
+        ).create_file_tree
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tree = create_file_tree(tmpdir, console=None)
+            tree.build_tree()
+            watcher = get_file_watcher(tmpdir)
+
+            (Path(tmpdir) / "README.md").write_text("")
+            watcher.check_updates()
+
+            assert watcher.watches_all_files
+            assert tree.root_node is None
+            watcher.stop()
+
 
 class TestRecentFilesTracker:
     """Test recent files tracking."""
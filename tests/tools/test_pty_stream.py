@@ -0,0 +1,146 @@
+"""Tests for the asyncio PTY stream behind hardened shell execution."""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from vertice_core.tools.exec_hardened import BashCommandToolHardened, ExecutionLimits, PTYExecutor
+from vertice_core.tools.pty_stream import PTYStream
+
+
+def alive(pid: int) -> bool:
+    """Whether pid is running (killed zombies awaiting init count as dead)."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+async def wait_dead(pid: int, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while alive(pid) and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+    return not alive(pid)
+
+
+class TestStreaming:
+    """Output streaming and concurrency."""
+
+    async def test_fifty_concurrent_commands(self):
+        """Test 50 concurrent pipelines stream all their output on one loop."""
+
+        async def run():
+            async with PTYStream("yes | head -n 20000", timeout=30) as stream:
+                output = await stream.read_all()
+                return output.count(b"y"), await stream.wait()
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(run() for _ in range(50)))
+        elapsed = time.perf_counter() - start
+
+        assert results == [(20000, 0)] * 50
+        assert elapsed < 20
+
+    async def test_backpressure_pauses_reading(self):
+        """Test an unread stream stops reading instead of buffering unboundedly."""
+        async with PTYStream("yes", max_buffered_chunks=4) as stream:
+            await asyncio.sleep(0.3)
+            assert len(stream._chunks) == 4 and not stream._reading
+            buffered = stream.bytes_read
+
+            await stream.__anext__()
+            await stream.__anext__()
+            await asyncio.sleep(0.1)
+            assert stream.bytes_read > buffered
+            assert len(stream._chunks) <= 4
+
+    async def test_argv_runs_without_shell(self):
+        """Test an argv list is executed directly."""
+        async with PTYStream(["echo", "a | b"]) as stream:
+            assert (await stream.read_all()).strip() == b"a | b"
+
+
+class TestLimits:
+    """Timeouts, output caps and cancellation kill the process group."""
+
+    async def test_timeout_kills_process_group(self):
+        """Test the timeout kills the shell and its children."""
+        async with PTYStream("sleep 30 & echo $!; wait", timeout=0.3) as stream:
+            child = int((await stream.__anext__()).strip())
+            start = time.perf_counter()
+            await stream.read_all()
+            assert await stream.wait() < 0
+
+        assert stream.timed_out
+        assert time.perf_counter() - start < 2
+        assert await wait_dead(child)
+
+    async def test_output_cap_truncates_and_kills(self):
+        """Test output beyond the cap is dropped and the producer killed."""
+        async with PTYStream("yes", max_output_bytes=100_000) as stream:
+            output = await stream.read_all()
+            assert await stream.wait() < 0
+
+        assert len(output) == 100_000 and stream.truncated
+
+    async def test_cancelling_consumer_kills_promptly(self):
+        """Test cancelling a reader kills the whole group within milliseconds."""
+        stream = await PTYStream("sleep 30 & echo $!; wait").start()
+        child = int((await stream.__anext__()).strip())
+        reader = asyncio.create_task(stream.read_all())
+        await asyncio.sleep(0.05)
+
+        start = time.perf_counter()
+        reader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await reader
+        await stream.wait()
+
+        assert stream.cancelled
+        assert await wait_dead(child)
+        assert time.perf_counter() - start < 1
+        await stream.aclose()
+
+    async def test_cancelling_fifty_commands(self):
+        """Test cancelling 50 streaming commands leaves none running."""
+        streams = [await PTYStream("yes").start() for _ in range(50)]
+        readers = [asyncio.create_task(stream.read_all()) for stream in streams]
+        await asyncio.sleep(0.2)
+
+        for reader in readers:
+            reader.cancel()
+        await asyncio.gather(*readers, return_exceptions=True)
+        codes = await asyncio.wait_for(asyncio.gather(*(s.wait() for s in streams)), 5)
+
+        assert all(code < 0 for code in codes)
+        for stream in streams:
+            await stream.aclose()
+
+
+class TestToolIntegration:
+    """Hardened tool and PTYExecutor on the async stream."""
+
+    async def test_tool_stream_applies_limits(self):
+        """Test stream() validates and enforces the tool's output cap."""
+        tool = BashCommandToolHardened(ExecutionLimits(max_output_bytes=1000))
+        async with await tool.stream("yes") as stream:
+            assert len(await stream.read_all()) == 1000
+        assert stream.truncated
+
+        with pytest.raises(ValueError, match="validation failed"):
+            await tool.stream("rm -rf /")
+
+    async def test_pty_executor_collects_output(self, monkeypatch):
+        """Test the PTY executor captures output and the exit code."""
+        read_fd, write_fd = os.pipe()
+        with os.fdopen(read_fd, "rb") as echoed, os.fdopen(write_fd, "w") as stdout:
+            monkeypatch.setattr("sys.stdout", stdout)
+            result = await PTYExecutor("printf hello").run()
+            stdout.close()
+            assert echoed.read() == b"hello"
+
+        assert result.success
+        assert result.data["stdout"] == "hello" and result.data["exit_code"] == 0
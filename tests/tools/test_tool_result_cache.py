@@ -0,0 +1,240 @@
+"""
+Tests for the shared tool result cache behind cache_tool_result.
+"""
+
+import asyncio
+
+import pytest
+
+from vertice_core.tools import caching
+from vertice_core.tools.base import ToolResult
+from vertice_core.tools.caching import (
+    ToolResultCache,
+    cache_tool_result,
+    get_tool_result_cache,
+    invalidate_cached_paths,
+)
+from vertice_core.tools.exec_hardened import BashCommandTool
+from vertice_core.tools.file_ops import ReadFileTool, WriteFileTool
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    cache = ToolResultCache()
+    monkeypatch.setattr(caching, "_tool_result_cache", cache)
+    return cache
+
+
+class CountingTool:
+    name = "counting"
+
+    def __init__(self, delay=0.0, success=True):
+        self.calls = 0
+        self.delay = delay
+        self.success = success
+
+    @cache_tool_result(ttl_seconds=60, path_args=("path",))
+    async def _execute_validated(self, path=".", query=""):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return ToolResult(success=self.success, data=f"{path}:{query}", metadata={"n": 1})
+
+
+class FailingTool:
+    name = "failing"
+
+    def __init__(self):
+        self.calls = 0
+
+    @cache_tool_result()
+    async def _execute_validated(self, query=""):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+
+class TestLookup:
+    async def test_hit_returns_copy(self):
+        tool = CountingTool()
+        first = await tool._execute_validated(query="a")
+        second = await tool._execute_validated(query="a")
+
+        assert tool.calls == 1
+        assert second.data == first.data
+        assert second.metadata["cached"] is True
+        assert "cached" not in first.metadata
+
+        second.metadata["mutated"] = True
+        third = await tool._execute_validated(query="a")
+        assert "mutated" not in third.metadata
+
+    async def test_failed_results_not_cached(self):
+        tool = CountingTool(success=False)
+        await tool._execute_validated(query="a")
+        await tool._execute_validated(query="a")
+        assert tool.calls == 2
+
+    async def test_shared_across_instances(self):
+        first, second = CountingTool(), CountingTool()
+        await first._execute_validated(query="a")
+        await second._execute_validated(query="a")
+        assert second.calls == 0
+
+    async def test_unhashable_args_bypass_cache(self):
+        tool = CountingTool()
+        await tool._execute_validated(query={1, 2})
+        await tool._execute_validated(query={1, 2})
+        assert tool.calls == 2
+
+
+class TestSingleFlight:
+    async def test_concurrent_calls_share_execution(self, fresh_cache):
+        tool = CountingTool(delay=0.05)
+        results = await asyncio.gather(*(tool._execute_validated(query="a") for _ in range(5)))
+
+        assert tool.calls == 1
+        assert {r.data for r in results} == {".:a"}
+        assert sum(bool(r.metadata.get("coalesced")) for r in results) == 4
+        stats = fresh_cache.get_stats()["tools"]["counting"]
+        assert (stats["misses"], stats["coalesced"]) == (1, 4)
+
+    async def test_exceptions_reach_every_caller(self):
+        tool = FailingTool()
+        results = await asyncio.gather(
+            *(tool._execute_validated(query="a") for _ in range(3)), return_exceptions=True
+        )
+        assert tool.calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+        with pytest.raises(RuntimeError):
+            await tool._execute_validated(query="a")
+        assert tool.calls == 2
+
+    async def test_cancelled_leader_hands_over(self):
+        tool = CountingTool(delay=0.05)
+        leader = asyncio.ensure_future(tool._execute_validated(query="a"))
+        await asyncio.sleep(0.01)
+        follower = asyncio.ensure_future(tool._execute_validated(query="a"))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        result = await follower
+        assert result.data == ".:a"
+        assert tool.calls == 2
+
+
+class TestBounds:
+    async def test_lru_entry_bound(self, monkeypatch):
+        monkeypatch.setattr(caching, "_tool_result_cache", ToolResultCache(max_entries=2))
+        tool = CountingTool()
+        for query in ("a", "b", "a", "c"):
+            await tool._execute_validated(query=query)
+
+        cache = get_tool_result_cache()
+        assert len(cache) == 2
+        assert cache.get_stats()["tools"]["counting"]["evictions"] == 1
+        await tool._execute_validated(query="a")  # recently used, still cached
+        assert tool.calls == 3
+
+    def test_byte_bound(self):
+        cache = ToolResultCache(max_bytes=10_000)
+        cache.put(("k", 1), ToolResult(data="x" * 4_000), 60, "t")
+        cache.put(("k", 2), ToolResult(data="x" * 4_000), 60, "t")
+        cache.put(("k", 3), ToolResult(data="x" * 4_000), 60, "t")
+        cache.put(("k", 4), ToolResult(data="x" * 20_000), 60, "t")
+
+        assert cache.get(("k", 1)) is None
+        assert cache.get(("k", 3)) is not None
+        assert cache.get(("k", 4)) is None
+        assert cache.get_stats()["bytes"] <= 10_000
+
+    async def test_entries_expire_without_reads(self, fresh_cache):
+        fresh_cache.put(("k", 1), ToolResult(data="x"), 0.02, "t")
+        assert len(fresh_cache) == 1
+        await asyncio.sleep(0.05)
+        assert len(fresh_cache) == 0
+        assert fresh_cache.get_stats()["tools"]["t"]["expirations"] == 1
+
+
+class TestInvalidation:
+    async def test_path_tags(self, tmp_path):
+        tool = CountingTool()
+        await tool._execute_validated(path=str(tmp_path), query="dir")
+        await tool._execute_validated(path=str(tmp_path / "a.py"), query="file")
+        await tool._execute_validated(path=str(tmp_path / "other.py"), query="file")
+
+        invalidate_cached_paths(tmp_path / "a.py")
+
+        await tool._execute_validated(path=str(tmp_path), query="dir")
+        await tool._execute_validated(path=str(tmp_path / "a.py"), query="file")
+        await tool._execute_validated(path=str(tmp_path / "other.py"), query="file")
+        assert tool.calls == 5
+
+    async def test_default_path_is_tagged(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        tool = CountingTool()
+        await tool._execute_validated(query="a")
+        invalidate_cached_paths("sub/file.py")
+        await tool._execute_validated(query="a")
+        assert tool.calls == 2
+
+    async def test_removed_directory_drops_entries_below(self, tmp_path):
+        tool = CountingTool()
+        await tool._execute_validated(path=str(tmp_path / "pkg" / "mod.py"))
+        invalidate_cached_paths(tmp_path / "pkg")
+        await tool._execute_validated(path=str(tmp_path / "pkg" / "mod.py"))
+        assert tool.calls == 2
+
+    async def test_write_tool_invalidates(self, tmp_path):
+        tool = CountingTool()
+        target = tmp_path / "new.py"
+        await tool._execute_validated(path=str(tmp_path))
+
+        result = await WriteFileTool()._execute_validated(path=str(target), content="x = 1\n")
+        assert result.success
+
+        await tool._execute_validated(path=str(tmp_path))
+        assert tool.calls == 2
+
+    async def test_invalidate_cache_helper(self, fresh_cache):
+        tool = CountingTool()
+        await tool._execute_validated(query="a")
+        CountingTool._execute_validated.invalidate_cache()
+        await tool._execute_validated(query="a")
+        assert tool.calls == 2
+        assert fresh_cache.get_stats()["tools"]["counting"]["invalidations"] == 1
+
+
+class TestReadTools:
+    async def test_read_file_is_cached_until_the_file_changes(self, tmp_path, fresh_cache):
+        path = tmp_path / "a.py"
+        path.write_text("one\n")
+        tool = ReadFileTool()
+
+        assert (await tool._execute_validated(path=str(path))).data["content"] == "one\n"
+        assert (await tool._execute_validated(path=str(path))).metadata["cached"]
+
+        path.write_text("two, edited outside the tools\n")
+        assert (await tool._execute_validated(path=str(path))).data["content"].startswith("two")
+
+    async def test_relative_paths_are_keyed_by_cwd(self, tmp_path, monkeypatch):
+        for name in ("x", "y"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "f.txt").write_text(name)
+        tool = ReadFileTool()
+
+        monkeypatch.chdir(tmp_path / "x")
+        assert (await tool._execute_validated(path="f.txt")).data["content"] == "x"
+        monkeypatch.chdir(tmp_path / "y")
+        assert (await tool._execute_validated(path="f.txt")).data["content"] == "y"
+
+    async def test_positional_arguments_share_the_key(self):
+        tool = CountingTool()
+        await tool._execute_validated(".", "a")
+        await tool._execute_validated(path=".", query="a")
+        assert tool.calls == 1
+
+    async def test_bash_commands_clear_the_cache(self, fresh_cache):
+        await CountingTool()._execute_validated(query="a")
+        await BashCommandTool()._execute_validated(command="true")
+        assert len(fresh_cache) == 0
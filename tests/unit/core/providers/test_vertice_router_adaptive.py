@@ -0,0 +1,263 @@
+"""Tests for adaptive, latency-aware routing and hedged requests in VerticeRouter."""
+
+import asyncio
+
+import pytest
+
+from vertice_core.providers.routing_stats import AdaptiveRoutingConfig, ProviderStats
+from vertice_core.providers.vertice_router import VerticeRouter
+
+
+class FakeProvider:
+    """Provider with a scripted latency per call (a number, or an exception to raise)."""
+
+    def __init__(self, name, script=(0.0,), chunks=("hello ", "world")):
+        self.name = name
+        self.script = list(script)
+        self.chunks = chunks
+        self.calls = 0
+        self.cancelled = 0
+        self.closed = 0
+
+    def _next(self):
+        step = self.script[min(self.calls, len(self.script) - 1)]
+        self.calls += 1
+        return step
+
+    def is_available(self):
+        return True
+
+    def get_model_info(self):
+        return {"model": f"{self.name}-model", "provider": self.name}
+
+    async def generate(self, messages, **kwargs):
+        step = self._next()
+        if isinstance(step, Exception):
+            raise step
+        try:
+            await asyncio.sleep(step)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return f"{self.name}: {''.join(self.chunks)}"
+
+    async def stream_chat(self, messages, **kwargs):
+        step = self._next()
+        if isinstance(step, Exception):
+            raise step
+        try:
+            await asyncio.sleep(step)
+            for chunk in self.chunks:
+                yield f"{self.name}:{chunk}"
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.closed += 1
+
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+def make_router(**providers):
+    config = providers.pop("config", None) or AdaptiveRoutingConfig(min_samples=2)
+    named = {name.replace("_", "-"): p for name, p in providers.items()}
+    return VerticeRouter(providers=named, routing=config)
+
+
+def warm(router, name, ttft, count=3):
+    for _ in range(count):
+        router._status[name].record_success(ttft)
+
+
+class TestProviderStats:
+    def test_expected_cost_penalises_errors(self):
+        config = AdaptiveRoutingConfig(min_samples=1, ewma_alpha=0.5)
+        reliable, flaky = ProviderStats(config), ProviderStats(config)
+        reliable.record_success(1.0)
+        flaky.record_success(0.6)
+        flaky.record_failure()
+
+        assert flaky.error_rate == 0.5
+        assert flaky.expected_cost() == pytest.approx(1.2)
+        assert reliable.expected_cost() < flaky.expected_cost()
+
+    def test_circuit_opens_and_recovers(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr("vertice_core.providers.routing_stats.time.monotonic", lambda: now[0])
+        stats = ProviderStats(AdaptiveRoutingConfig(failure_threshold=2, recovery_timeout=10))
+
+        stats.record_failure()
+        assert stats.circuit_state == "closed"
+        stats.record_failure(rate_limited=True)
+        assert stats.circuit_state == "open" and not stats.allows_request()
+
+        now[0] += 11
+        assert stats.circuit_state == "half_open" and stats.allows_request()
+        stats.record_success(0.1)
+        assert stats.circuit_state == "closed"
+
+    def test_half_open_admits_a_single_probe(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr("vertice_core.providers.routing_stats.time.monotonic", lambda: now[0])
+        stats = ProviderStats(AdaptiveRoutingConfig(failure_threshold=1, recovery_timeout=10))
+        stats.record_failure()
+
+        now[0] += 11
+        assert stats.admit()
+        assert not stats.admit() and not stats.allows_request()
+        stats.record_failure()  # Failed probe re-opens for another cooldown
+        assert stats.circuit_state == "open" and not stats.admit()
+
+        now[0] += 11
+        assert stats.admit()
+        stats.release_probe()  # Abandoned without a verdict
+        assert stats.admit() and not stats.admit()
+        stats.record_success(0.1)
+        assert stats.circuit_state == "closed" and stats.admit() and stats.admit()
+
+    def test_latency_window_is_bounded(self):
+        stats = ProviderStats(AdaptiveRoutingConfig(latency_window=3))
+        for ttft in (5.0, 1.0, 2.0, 3.0):
+            stats.record_success(ttft)
+        assert list(stats.recent_ttft) == [1.0, 2.0, 3.0]
+
+
+class TestAdaptiveRouting:
+    def test_cold_router_keeps_static_order(self):
+        router = make_router(groq=FakeProvider("groq"), cerebras=FakeProvider("cerebras"))
+
+        decision = router.route()
+        assert decision.provider_name == "groq"
+        assert decision.fallback_providers == ["cerebras"]
+
+    def test_fastest_provider_within_tier_is_preferred(self):
+        router = make_router(groq=FakeProvider("groq"), cerebras=FakeProvider("cerebras"))
+        warm(router, "groq", 0.8)
+        warm(router, "cerebras", 0.2)
+
+        decision = router.route()
+        assert decision.provider_name == "cerebras"
+        assert "adaptive" in decision.reasoning
+
+    def test_cost_tier_is_respected(self):
+        router = make_router(
+            anthropic_vertex=FakeProvider("anthropic-vertex"), groq=FakeProvider("groq")
+        )
+        warm(router, "anthropic-vertex", 2.0)
+        warm(router, "groq", 0.1)
+
+        assert router.route().provider_name == "anthropic-vertex"
+        router.cost_tier = "free"
+        assert router.route().provider_name == "groq"
+
+    def test_disabled_adaptive_routing_uses_priorities(self):
+        config = AdaptiveRoutingConfig(enabled=False, min_samples=1)
+        router = make_router(
+            groq=FakeProvider("groq"), cerebras=FakeProvider("cerebras"), config=config
+        )
+        warm(router, "cerebras", 0.01)
+
+        assert router.route().provider_name == "groq"
+
+    @pytest.mark.asyncio
+    async def test_failing_provider_is_skipped_after_circuit_opens(self):
+        config = AdaptiveRoutingConfig(failure_threshold=2)
+        groq = FakeProvider("groq", script=[RuntimeError("boom")])
+        cerebras = FakeProvider("cerebras")
+        router = make_router(groq=groq, cerebras=cerebras, config=config)
+
+        for _ in range(3):
+            assert (await router.generate(MESSAGES)).startswith("cerebras")
+
+        assert groq.calls == 2
+        assert router.get_routing_stats()["groq"]["circuit"] == "open"
+        assert "❌ groq" in router.get_status_report()
+
+    @pytest.mark.asyncio
+    async def test_half_open_provider_gets_one_probe(self):
+        config = AdaptiveRoutingConfig(failure_threshold=1, recovery_timeout=0)
+        groq = FakeProvider("groq", script=[RuntimeError("boom"), 0.05])
+        router = make_router(groq=groq, config=config)
+        with pytest.raises(RuntimeError):
+            await router.generate(MESSAGES)
+
+        results = await asyncio.gather(
+            *(router.generate(MESSAGES) for _ in range(3)), return_exceptions=True
+        )
+        assert groq.calls == 2
+        assert sum(isinstance(r, str) for r in results) == 1
+        assert router.get_routing_stats()["groq"]["circuit"] == "closed"
+
+
+class TestHedging:
+    @pytest.mark.asyncio
+    async def test_hedged_generate_wins_on_fast_backup(self):
+        config = AdaptiveRoutingConfig(hedge=True, hedge_default_delay=0.02, hedge_min_delay=0)
+        groq = FakeProvider("groq", script=[1.0])
+        cerebras = FakeProvider("cerebras", script=[0.01])
+        router = make_router(groq=groq, cerebras=cerebras, config=config)
+
+        result = await asyncio.wait_for(router.generate(MESSAGES), timeout=0.5)
+
+        assert result.startswith("cerebras")
+        assert groq.cancelled == 1
+        assert router.get_routing_stats()["groq"]["failures"] == 0
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_is_not_hedged(self):
+        config = AdaptiveRoutingConfig(hedge=True, hedge_default_delay=0.2)
+        groq, cerebras = FakeProvider("groq", script=[0.01]), FakeProvider("cerebras")
+        router = make_router(groq=groq, cerebras=cerebras, config=config)
+
+        assert (await router.generate(MESSAGES)).startswith("groq")
+        assert cerebras.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_hedge_starts_at_once_when_primary_fails(self):
+        config = AdaptiveRoutingConfig(hedge=True, hedge_default_delay=5.0)
+        groq = FakeProvider("groq", script=[ConnectionError("reset")])
+        router = make_router(groq=groq, cerebras=FakeProvider("cerebras"), config=config)
+
+        result = await asyncio.wait_for(router.generate(MESSAGES), timeout=0.5)
+        assert result.startswith("cerebras")
+
+    def test_hedge_delay_follows_primary_p95(self):
+        config = AdaptiveRoutingConfig(hedge=True, min_samples=3, hedge_min_delay=0.05)
+        router = make_router(groq=FakeProvider("groq"), config=config)
+
+        assert router._hedge_delay("groq") == config.hedge_default_delay
+        for ttft in (0.1, 0.2, 0.3, 0.4):
+            router._status["groq"].record_success(ttft)
+        assert router._hedge_delay("groq") == 0.4
+        router._status["groq"].stats.recent_ttft.clear()
+        router._status["groq"].record_success(0.001)
+        assert router._hedge_delay("groq") == 0.05
+
+    @pytest.mark.asyncio
+    async def test_hedged_stream_keeps_first_stream_to_produce(self, capsys):
+        config = AdaptiveRoutingConfig(hedge=True, hedge_default_delay=0.02, hedge_min_delay=0)
+        groq = FakeProvider("groq", script=[1.0])
+        cerebras = FakeProvider("cerebras", script=[0.01])
+        router = make_router(groq=groq, cerebras=cerebras, config=config)
+
+        chunks = [chunk async for chunk in router.stream_chat(MESSAGES)]
+
+        assert chunks == ["cerebras:hello ", "cerebras:world"]
+        assert groq.cancelled == 1 and groq.closed == 1
+        stats = router.get_routing_stats()["cerebras"]
+        assert stats["samples"] == 1 and stats["ttft"] >= 0.01
+        assert capsys.readouterr().out == ""
+
+    @pytest.mark.asyncio
+    async def test_stream_falls_back_after_hedged_pair_fails(self):
+        config = AdaptiveRoutingConfig(hedge=True, hedge_default_delay=0.01)
+        router = make_router(
+            groq=FakeProvider("groq", script=[RuntimeError("a")]),
+            cerebras=FakeProvider("cerebras", script=[RuntimeError("b")]),
+            openrouter=FakeProvider("openrouter"),
+            config=config,
+        )
+
+        chunks = [chunk async for chunk in router.stream_chat(MESSAGES)]
+        assert chunks[0] == "openrouter:hello "
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import time
 
-from vertice_core.agui.protocol import AGUIEvent, AGUIEventType, sse_encode_event
+from vertice_core.agui.protocol import (
+    AGUIDeltaCoalescer,
+    AGUIEvent,
+    AGUIEventType,
+    coalesce_deltas,
+    sse_encode_event,
+)
 
 
 def test_sse_encode_event_roundtrip_json() -> None:
@@ -21,3 +29,64 @@ def test_sse_encode_event_roundtrip_json() -> None:
     assert payload["session_id"] == "s1"
     assert payload["data"]["text"] == "hello"
     assert payload["data"]["metadata"]["k"] == "v"
+
+
+def test_sse_encode_delta_fast_path_matches_model_dump() -> None:
+    event = AGUIEvent(
+        type=AGUIEventType.DELTA,
+        session_id="s1",
+        data={"text": 'say "olá"\n', "frame": "thought", "channel": "thought"},
+    )
+
+    expected = json.dumps(event.model_dump(), separators=(",", ":"), ensure_ascii=False)
+
+    assert sse_encode_event(event) == f"event: delta\ndata: {expected}\n\n"
+
+
+def test_delta_coalescer_merges_burst_and_flushes_on_final() -> None:
+    coalescer = AGUIDeltaCoalescer(window_ms=60_000)
+    sent = []
+    for text in ["a", "b", "c"]:
+        sent += coalescer.push(AGUIEvent.delta(text, session_id="s1"))
+
+    # First delta leaves immediately, the rest wait for the window.
+    assert [ev.data["text"] for ev in sent] == ["a"]
+
+    sent += coalescer.push(AGUIEvent.final("abc", session_id="s1"))
+
+    assert [ev.type for ev in sent] == [AGUIEventType.DELTA] * 2 + [AGUIEventType.FINAL]
+    assert "".join(ev.data["text"] for ev in sent[:-1]) == "abc"
+
+
+def test_delta_coalescer_keeps_redacted_deltas_separate() -> None:
+    coalescer = AGUIDeltaCoalescer(max_bytes=1024)
+    redacted = {"text": "[REDACTED]", "frame": "thought", "redacted": True}
+    events = [AGUIEvent(type=AGUIEventType.DELTA, data=dict(redacted)) for _ in range(2)]
+
+    sent = [out for ev in events for out in coalescer.push(ev)] + coalescer.flush()
+
+    assert [ev.data["text"] for ev in sent] == ["[REDACTED]", "[REDACTED]"]
+
+
+def test_coalesce_deltas_flushes_when_upstream_stalls() -> None:
+    async def upstream():
+        yield AGUIEvent.delta("a")
+        yield AGUIEvent.delta("b")
+        await asyncio.sleep(0.2)
+        yield AGUIEvent.final("ab")
+
+    async def collect():
+        out = []
+        async for ev in coalesce_deltas(upstream(), window_ms=20):
+            out.append((ev.type, ev.data.get("text"), time.monotonic()))
+        return out
+
+    events = asyncio.run(collect())
+
+    assert [(t, text) for t, text, _ in events] == [
+        (AGUIEventType.DELTA, "a"),
+        (AGUIEventType.DELTA, "b"),
+        (AGUIEventType.FINAL, "ab"),
+    ]
+    # "b" went out on the window deadline, not with the final event.
+    assert events[2][2] - events[1][2] > 0.1
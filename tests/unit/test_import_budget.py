@@ -0,0 +1,114 @@
+"""Tests for the lazy package surface and the import budget harness."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from scripts.check_import_budget import (
+    Measurement,
+    check,
+    check_time,
+    entry_subtree,
+    parse_importtime,
+)
+
+ROOT = Path(__file__).resolve().parents[2]
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 | _io
+import time:       900 |       1500 | site
+import time:        50 |         50 |     leaf
+import time:       200 |        250 |   child
+import time:       300 |        300 |   other
+import time:       400 |        950 | main
+"""
+
+
+def imported_after(code: str) -> set:
+    """Modules loaded by running ``code`` in a fresh interpreter."""
+    script = f"import sys\n{code}\nprint('\\n'.join(sys.modules))"
+    env = dict(os.environ, PYTHONPATH=str(ROOT / "src"))
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, env=env, check=True
+    )
+    return set(result.stdout.split())
+
+
+class TestLazySurface:
+    @pytest.mark.parametrize(
+        "code, heavy",
+        [
+            ("import vertice_core", ["grpc", "pydantic", "vertice_core.a2a"]),
+            (
+                "from vertice_core.tools.base import ToolRegistry",
+                ["vertice_core.tools.file_ops", "vertice_core.core.governance_pipeline"],
+            ),
+            ("import vertice_core.memory.cortex", ["sqlalchemy"]),
+        ],
+    )
+    def test_heavy_modules_not_imported(self, code, heavy):
+        assert not set(heavy) & imported_after(code)
+
+    def test_lazy_names_resolve(self):
+        import vertice_core
+        from vertice_core import tools
+        from vertice_core import core
+        from vertice_core.a2a import TaskStore
+
+        assert vertice_core.TaskStatus.__module__ == "vertice_core.a2a.types"
+        assert set(vertice_core.__all__) <= set(dir(vertice_core))
+        assert tools.TerminalLsTool.__name__ == "LsTool"
+        assert core.SessionState.__module__.startswith("vertice_core.core.session_manager")
+        assert TaskStore.__name__ == "TaskStore"
+        with pytest.raises(AttributeError):
+            vertice_core.NotAName
+
+
+    def test_unknown_core_name_imports_nothing(self):
+        baseline = imported_after("import vertice_core.core")
+        probed = imported_after("import vertice_core.core as core\nhasattr(core, 'NotAName')")
+        assert probed == baseline
+
+    def test_core_export_map_covers_module_all(self):
+        import importlib
+
+        from vertice_core import core
+
+        for module_path, names in core._STAR_EXPORTS.items():
+            module = importlib.import_module(module_path, core.__name__)
+            exported = set(getattr(module, "__all__", names)) - core._submodule_names()
+            assert exported <= set(names), module_path
+            assert all(hasattr(module, name) for name in names), module_path
+
+
+class TestImportBudget:
+    def test_entry_subtree_and_depth(self):
+        records = entry_subtree(parse_importtime(IMPORTTIME), "main")
+
+        assert [(r.module, r.depth) for r in records] == [
+            ("leaf", 2),
+            ("child", 1),
+            ("other", 1),
+            ("main", 0),
+        ]
+        assert records[-1].cumulative_us == 950
+
+    def test_regressions_are_reported(self):
+        measured = Measurement(modules=400, import_ms=90.0, tree="", records=[])
+        assert check("tui", measured, {"modules": 500, "import_ms": 100}) == []
+        assert check("tui", measured, {"modules": 300, "import_ms": 50}) == [
+            "tui: 400 modules imported (budget: 300)",
+        ]
+        assert "no budget" in check("tui", measured, None)[0]
+
+    def test_time_overrun_is_separate(self):
+        measured = Measurement(modules=400, import_ms=90.0, tree="", records=[])
+        assert check("tui", measured, {"modules": 500, "import_ms": 50}) == []
+        assert check_time("tui", measured, {"modules": 500, "import_ms": 50}) == (
+            "tui: 90 ms to import (budget: 50 ms)"
+        )
+        assert check_time("tui", measured, {"modules": 500, "import_ms": 100}) is None
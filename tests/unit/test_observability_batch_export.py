@@ -0,0 +1,260 @@
+"""
+Tests for the background span export pipeline (BatchSpanProcessor).
+
+A local HTTP server stands in for the OTLP collector so retries, gzip
+bodies and batching are exercised over a real socket.
+"""
+
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from vertice_core.observability import (
+    AgentTracer,
+    BatchSpanProcessor,
+    ObservabilityConfig,
+    ObservabilityMixin,
+    SpanExporter,
+)
+from vertice_core.observability.exporter import BaseExporter
+
+
+class OTLPStandIn:
+    """Minimal OTLP/HTTP collector: records /v1/traces posts."""
+
+    def __init__(self):
+        self.requests = []
+        self.fail_next = 0
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                if self.headers.get("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+                if stand_in.fail_next > 0:
+                    stand_in.fail_next -= 1
+                    self.send_response(503)
+                else:
+                    stand_in.requests.append(
+                        {
+                            "path": self.path,
+                            "encoding": self.headers.get("Content-Encoding"),
+                            "payload": json.loads(body),
+                        }
+                    )
+                    self.send_response(200)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.endpoint = f"http://127.0.0.1:{self.server.server_port}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def spans(self):
+        return [
+            span
+            for request in self.requests
+            for resource in request["payload"]["resourceSpans"]
+            for scope in resource["scopeSpans"]
+            for span in scope["spans"]
+        ]
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class BlockingExporter(BaseExporter):
+    """Exporter that waits on an event, standing in for a stalled backend."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.batches = []
+
+    def export(self, data):
+        self.release.wait(5)
+        self.batches.append(list(data))
+        return True
+
+    def shutdown(self):
+        pass
+
+
+@pytest.fixture
+def collector():
+    stand_in = OTLPStandIn()
+    yield stand_in
+    stand_in.close()
+
+
+def make_config(**overrides):
+    settings = {
+        "sampling_enabled": False,
+        "batch_size": 10,
+        "export_interval_seconds": 60,
+        "export_retry_backoff_seconds": 0.0,
+    }
+    settings.update(overrides)
+    return ObservabilityConfig(**settings)
+
+
+def spans(count, start=0):
+    return [{"spanId": str(i), "name": f"span{i}"} for i in range(start, start + count)]
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestBatchSpanProcessor:
+    def test_worker_ships_full_batches_to_otlp(self, collector):
+        config = make_config(otlp_endpoint=collector.endpoint)
+        processor = BatchSpanProcessor(SpanExporter(config), config)
+
+        processor.enqueue(spans(25))
+
+        # Two full batches go out without waiting for the export interval
+        assert wait_for(lambda: len(collector.spans) >= 20)
+        assert processor.shutdown(timeout=5)
+        assert [s["spanId"] for s in collector.spans] == [str(i) for i in range(25)]
+        assert {r["path"] for r in collector.requests} == {"/v1/traces"}
+        assert {r["encoding"] for r in collector.requests} == {"gzip"}
+
+        stats = processor.get_stats()
+        assert stats["spans_exported"] == 25
+        assert stats["spans_dropped"] == 0
+        assert stats["queue_depth"] == 0
+        assert stats["export_count"] == 3
+
+    def test_uncompressed_when_disabled(self, collector):
+        config = make_config(otlp_endpoint=collector.endpoint, export_compression=False)
+        processor = BatchSpanProcessor(SpanExporter(config), config)
+        processor.enqueue(spans(3))
+        assert processor.force_flush()
+        assert collector.requests[0]["encoding"] is None
+
+    def test_enqueue_does_not_wait_for_exporter(self):
+        exporter = BlockingExporter()
+        config = make_config(batch_size=1)
+        processor = BatchSpanProcessor(exporter, config)
+
+        start = time.perf_counter()
+        processor.enqueue(spans(50))
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 1.0
+        exporter.release.set()
+        processor.shutdown(timeout=5)
+        assert sum(len(batch) for batch in exporter.batches) == 50
+
+    def test_full_ring_buffer_drops_oldest(self):
+        exporter = BlockingExporter()
+        config = make_config(export_queue_size=5, batch_size=100)
+        processor = BatchSpanProcessor(exporter, config)
+
+        processor.enqueue(spans(8))
+
+        stats = processor.get_stats()
+        assert stats["queue_depth"] == 5
+        assert stats["spans_dropped"] == 3
+        exporter.release.set()
+        processor.shutdown(timeout=5)
+        assert [s["spanId"] for s in exporter.batches[0]] == ["3", "4", "5", "6", "7"]
+
+    def test_retries_until_collector_recovers(self, collector):
+        collector.fail_next = 2
+        config = make_config(otlp_endpoint=collector.endpoint, export_max_retries=3)
+        processor = BatchSpanProcessor(SpanExporter(config), config)
+
+        processor.enqueue(spans(4))
+        assert processor.force_flush()
+
+        stats = processor.get_stats()
+        assert stats["export_retries"] == 2
+        assert stats["spans_exported"] == 4
+        assert len(collector.spans) == 4
+
+    def test_batch_dropped_after_retries(self, collector):
+        collector.fail_next = 10
+        config = make_config(otlp_endpoint=collector.endpoint, export_max_retries=1)
+        processor = BatchSpanProcessor(SpanExporter(config), config)
+
+        processor.enqueue(spans(4))
+        assert processor.force_flush() is False
+
+        stats = processor.get_stats()
+        assert stats["failed_batches"] == 1
+        assert stats["spans_dropped"] == 4
+        assert collector.spans == []
+
+    def test_file_export_appends_valid_json(self, tmp_path):
+        path = tmp_path / "spans.json"
+        path.write_text(json.dumps([{"spanId": "old"}], indent=2))
+        config = make_config(batch_size=2)
+        processor = BatchSpanProcessor(SpanExporter(config, path), config)
+
+        processor.enqueue(spans(5))
+        assert processor.shutdown(timeout=5)
+
+        ids = [span["spanId"] for span in json.loads(path.read_text())]
+        assert ids == ["old", "0", "1", "2", "3", "4"]
+
+    def test_file_export_into_empty_array(self, tmp_path):
+        path = tmp_path / "spans.json"
+        path.write_text("[]\n")
+        exporter = SpanExporter(make_config(), path)
+        assert exporter.export_batch(spans(2))
+        assert [s["spanId"] for s in json.loads(path.read_text())] == ["0", "1"]
+
+
+class TestTracerIntegration:
+    def test_tracer_streams_finished_spans(self, collector):
+        config = make_config(otlp_endpoint=collector.endpoint)
+        processor = BatchSpanProcessor(SpanExporter(config), config)
+        tracer = AgentTracer(config, span_processor=processor)
+
+        with tracer.start_agent_span(operation_name="task", agent_id="agent_1"):
+            with tracer.start_llm_span(model="gemini"):
+                pass
+            with tracer.start_tool_span(tool_name="read_file"):
+                pass
+
+        processor.shutdown(timeout=5)
+        names = sorted(span["name"] for span in collector.spans)
+        assert names == ["llm.chat", "task", "tool.read_file"]
+
+    def test_tracer_retains_bounded_history(self):
+        tracer = AgentTracer(make_config(max_retained_spans=10))
+        for _ in range(100):
+            with tracer.start_tool_span(tool_name="noop"):
+                pass
+        assert 10 <= len(tracer._tool_spans) <= 13
+        assert tracer.get_trace_stats()["total_tool_spans"] == len(tracer._tool_spans)
+
+    def test_mixin_uses_background_export(self, tmp_path):
+        class Agent(ObservabilityMixin):
+            agent_id = "agent_1"
+
+        agent = Agent()
+        agent._init_observability(make_config(), traces_path=tmp_path / "traces.json")
+        with agent.trace_operation("task"):
+            pass
+
+        assert agent.export_traces()
+        assert agent.get_observability_stats()["export"]["spans_exported"] == 1
+        agent.shutdown_observability()
+        assert len(json.loads((tmp_path / "traces.json").read_text())) == 1
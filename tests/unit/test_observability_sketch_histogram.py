@@ -0,0 +1,183 @@
+"""
+Tests for the sketch-backed Histogram and pre-bound metric handles.
+
+Quantiles are checked against exact order statistics: the sketch promises
+each estimate within relative_accuracy of the true value.
+"""
+
+import json
+import random
+
+import pytest
+
+from vertice_core.observability import (
+    BoundCounter,
+    BoundHistogram,
+    Histogram,
+    MetricsCollector,
+)
+from vertice_core.observability.exporter import MetricsExporter
+
+
+def exact_quantile(values, p):
+    ordered = sorted(values)
+    return ordered[int(p / 100 * (len(ordered) - 1))]
+
+
+def lognormal(count, seed=7):
+    rng = random.Random(seed)
+    return [rng.lognormvariate(3, 1.5) for _ in range(count)]
+
+
+class TestSketchAccuracy:
+    @pytest.mark.parametrize("p", [1, 25, 50, 90, 95, 99, 99.9])
+    def test_quantiles_within_relative_accuracy(self, p):
+        values = lognormal(20_000)
+        hist = Histogram(name="latency")
+        for value in values:
+            hist.observe(value)
+        assert hist.percentile(p) == pytest.approx(exact_quantile(values, p), rel=0.01)
+
+    def test_negative_and_zero_values(self):
+        values = [-50.0, -5.0, 0.0, 0.0, 3.0, 30.0, 300.0]
+        hist = Histogram(name="delta")
+        for value in values:
+            hist.observe(value)
+        for p in (0, 20, 40, 60, 80, 100):
+            assert hist.percentile(p) == pytest.approx(exact_quantile(values, p), rel=0.01)
+
+    def test_extremes_clamped_to_observed_range(self):
+        hist = Histogram(name="x")
+        hist.observe(42.0)
+        assert hist.percentile(0) == 42.0
+        assert hist.percentile(100) == 42.0
+
+    def test_bins_stay_bounded(self):
+        values = [step * 10.0**exponent for exponent in range(-8, 9) for step in range(1, 100)]
+        hist = Histogram(name="wide", max_bins=64)
+        for value in values:
+            hist.observe(value)
+        assert len(hist._bins) <= 64
+        # Collapsing only merges the low end; the tail stays accurate
+        assert hist.percentile(99) == pytest.approx(exact_quantile(values, 99), rel=0.01)
+
+    def test_invalid_accuracy(self):
+        with pytest.raises(ValueError):
+            Histogram(name="x", relative_accuracy=0)
+
+
+class TestPrometheusBuckets:
+    def test_counts_are_cumulative_and_exact(self):
+        hist = Histogram(name="x", buckets=[1.0, 5.0])
+        for value in (0.5, 1.0, 2.0, 5.0, 9.0):
+            hist.observe(value)
+        assert hist.counts == {1.0: 2, 5.0: 4, float("inf"): 5}
+
+    def test_exporter_emits_buckets_and_quantiles(self):
+        collector = MetricsCollector()
+        for value in (5.0, 50.0, 500.0):
+            collector.record_ttft("gemini", value)
+
+        text = MetricsExporter().to_prometheus_format(collector.get_all_metrics())
+        prefix = "gen_ai_server_time_to_first_token"
+        labels = "gen_ai.request.model=gemini"
+
+        assert f"# TYPE {prefix} histogram" in text
+        assert f"{prefix}_bucket{{{labels},le=10.0}} 1" in text
+        assert f"{prefix}_bucket{{{labels},le=+Inf}} 3" in text
+        assert f"{prefix}_count{{{labels}}} 3" in text
+        assert f"# TYPE {prefix}_quantiles summary" in text
+        assert f"{prefix}_quantiles{{{labels},quantile=0.5}} " in text
+
+
+class TestMerge:
+    def test_merged_shards_match_single_histogram(self):
+        values = lognormal(9_000, seed=11)
+        whole = Histogram(name="x")
+        shards = [Histogram(name="x") for _ in range(3)]
+        for index, value in enumerate(values):
+            whole.observe(value)
+            shards[index % 3].observe(value)
+
+        merged = shards[0]
+        merged.merge(shards[1])
+        merged.merge(shards[2])
+
+        assert merged.count == whole.count
+        assert merged.sum_value == pytest.approx(whole.sum_value)
+        assert merged.counts == whole.counts
+        for p in (50, 95, 99):
+            assert merged.percentile(p) == whole.percentile(p)
+
+    def test_merge_rejects_incompatible(self):
+        with pytest.raises(ValueError):
+            Histogram(name="x").merge(Histogram(name="x", relative_accuracy=0.02))
+        with pytest.raises(ValueError):
+            Histogram(name="x").merge(Histogram(name="x", buckets=[1.0]))
+
+    def test_round_trip_through_json(self):
+        hist = Histogram(name="x")
+        for value in [-1.0, 0.0] + lognormal(500):
+            hist.observe(value)
+
+        restored = Histogram.from_dict(json.loads(json.dumps(hist.to_dict())))
+
+        assert restored.count == hist.count
+        assert restored.counts == hist.counts
+        for p in (0, 50, 99, 100):
+            assert restored.percentile(p) == hist.percentile(p)
+
+    def test_empty_round_trip(self):
+        restored = Histogram.from_dict(Histogram(name="x").to_dict())
+        assert restored.count == 0
+        assert restored.percentile(50) == 0.0
+
+
+class TestBoundHandles:
+    def test_bound_histogram_shares_series(self):
+        collector = MetricsCollector()
+        handle = collector.histogram("op.duration", {"op": "read"})
+        assert isinstance(handle, BoundHistogram)
+
+        handle.observe(10.0)
+        collector.observe_histogram("op.duration", 20.0, labels={"op": "read"})
+
+        stats = collector.get_histogram_stats("op.duration", {"op": "read"})
+        assert stats["count"] == 2
+        assert stats["sum"] == 30.0
+
+    def test_bound_counter(self):
+        collector = MetricsCollector()
+        handle = collector.counter("requests", {"route": "/chat"})
+        assert isinstance(handle, BoundCounter)
+
+        handle.add()
+        handle.add(2)
+        assert collector.get_counter_value("requests", {"route": "/chat"}) == 3
+
+    def test_handles_survive_clear(self):
+        collector = MetricsCollector()
+        handle = collector.histogram("x")
+        handle.observe(1.0)
+        collector.clear()
+        handle.observe(2.0)
+        assert collector.get_histogram_stats("x")["count"] == 1
+
+    def test_record_helpers_reuse_handles(self):
+        collector = MetricsCollector()
+        for _ in range(3):
+            collector.record_latency("chat", 100.0, model="gemini")
+            collector.record_tool_invocation("read_file", True, duration_ms=5.0)
+        collector.record_latency("chat", 100.0)
+
+        assert len(collector._bound_histograms) == 3
+        stats = collector.get_histogram_stats(
+            "gen_ai.client.operation.duration",
+            {"gen_ai.operation.name": "chat", "gen_ai.request.model": "gemini"},
+        )
+        assert stats["count"] == 3
+        assert stats["p95"] == pytest.approx(100.0, rel=0.01)
+        tool_stats = collector.get_histogram_stats(
+            "agent.tool.duration", {"tool_name": "read_file"}
+        )
+        assert tool_stats["count"] == 3
@@ -1,7 +1,10 @@
 """Testes para Open Responses Events na TUI."""
 
+from vertice_core.openresponses_stream import OpenResponsesStreamBuilder
 from vertice_tui.core.openresponses_events import (
     OpenResponsesEvent,
+    OpenResponsesOutputTextDeltaEvent,
+    OpenResponsesResponseCompletedEvent,
     parse_open_responses_event,
 )
 
@@ -84,3 +87,38 @@ class TestOpenResponsesEvent:
             event = parse_open_responses_event(sse_line)
             assert event is not None
             assert event.sequence_number == expected_seq
+
+
+class TestTypedEventChannel:
+    """Testes para o canal in-process (as_events=True), sem SSE."""
+
+    def test_drain_as_events_matches_sse_path(self):
+        """Typed events convert to the same TUI events the SSE parser yields."""
+        builder = OpenResponsesStreamBuilder(model="test")
+        builder.start()
+        item = builder.add_message()
+        builder.text_delta(item, 'say "hi"\n')
+        builder.complete()
+
+        stream_events = builder.drain(as_events=True)
+        assert builder.get_events() == []
+
+        typed = [OpenResponsesEvent.from_stream_event(e) for e in stream_events]
+        parsed = [parse_open_responses_event(e.to_sse()) for e in stream_events]
+
+        assert [type(e) for e in typed] == [type(e) for e in parsed]
+        assert [e.raw_data for e in typed] == [e.raw_data for e in parsed]
+
+        deltas = [e for e in typed if isinstance(e, OpenResponsesOutputTextDeltaEvent)]
+        assert deltas[0].delta == 'say "hi"\n'
+        assert isinstance(typed[-1], OpenResponsesResponseCompletedEvent)
+
+    def test_drain_default_yields_sse(self):
+        """Without as_events, drain keeps the wire format."""
+        builder = OpenResponsesStreamBuilder(model="test")
+        builder.start()
+
+        chunks = builder.drain()
+
+        assert all(c.startswith("event: response.") for c in chunks)
+        assert builder.drain() == []
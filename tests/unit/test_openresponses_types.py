@@ -1,5 +1,7 @@
 """Testes para Open Responses Types."""
 
+from dataclasses import asdict, fields
+
 from vertice_core.openresponses_types import (
     ItemStatus,
     MessageRole,
@@ -179,6 +181,16 @@ class TestOutputTextContent:
         assert d["text"] == "Test"
         assert d["annotations"] == []
 
+    def test_appended_text_is_joined_into_the_text_field(self):
+        content = OutputTextContent(text="a")
+        content.append_text("b")
+        content.append_text("c")
+
+        assert content.get_text() == "abc"
+        assert [f.name for f in fields(content)] == ["type", "text", "annotations"]
+        assert asdict(content) == {"type": "output_text", "text": "abc", "annotations": []}
+        assert content == OutputTextContent("output_text", "abc")
+
 
 class TestFunctionCallOutputItem:
     """Testes para FunctionCallOutputItem."""
@@ -0,0 +1,219 @@
+"""
+Tests for the SemanticRouter exemplar matrix, semantic cache and route_many.
+"""
+
+import asyncio
+
+import pytest
+
+from vertice_core.agents.context import UnifiedContext
+from vertice_core.agents.orchestrator import ActiveOrchestrator, ExecutionStep
+from vertice_core.agents.router import router as router_module
+from vertice_core.agents.router import (
+    AgentType,
+    RouteDefinition,
+    RouteMatrix,
+    SemanticRouter,
+    SimilarityEngine,
+)
+
+VOCAB = ["plan", "code", "review", "design", "chat", "login", "bug", "please", "tests"]
+
+
+def bag_of_words(text):
+    words = text.lower().split()
+    return [float(words.count(word)) for word in VOCAB]
+
+
+ROUTES = [
+    RouteDefinition(
+        name="planner",
+        agent_type=AgentType.PLANNER,
+        description="plan plan",
+        examples=["plan login"],
+    ),
+    RouteDefinition(name="executor", agent_type=AgentType.EXECUTOR, description="code code"),
+    RouteDefinition(name="reviewer", agent_type=AgentType.REVIEWER, description="review review"),
+]
+
+
+class Classifier:
+    def __init__(self, answer="reviewer", fail=False, delay=0.01):
+        self.calls = []
+        self.answer = answer
+        self.fail = fail
+        self.delay = delay
+
+    async def __call__(self, query, options):
+        self.calls.append(query)
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("llm down")
+        return self.answer
+
+
+def make_router(**kwargs):
+    kwargs.setdefault("embed_func", bag_of_words)
+    return SemanticRouter(routes=[*ROUTES], **kwargs)
+
+
+class TestRouteMatrix:
+    def test_scores_match_cosine_similarity(self):
+        exemplars = [
+            ("a", [1.0, 0.0, 1.0]),
+            ("a", [0.0, 2.0, 0.0]),
+            ("b", [3.0, 1.0, 0.0]),
+        ]
+        matrix = RouteMatrix(exemplars)
+        query = [1.0, 1.0, 0.5]
+
+        expected = {
+            name: max(
+                SimilarityEngine.cosine_similarity(query, v) for n, v in exemplars if n == name
+            )
+            for name in ("a", "b")
+        }
+        ranked = matrix.score(query)
+        assert [name for name, _ in ranked] == sorted(expected, key=expected.get, reverse=True)
+        for name, score in ranked:
+            assert score == pytest.approx(expected[name])
+
+    def test_ties_keep_route_order(self):
+        matrix = RouteMatrix([("a", [1.0, 0.0]), ("b", [1.0, 0.0]), ("c", [0.0, 1.0])])
+        assert [name for name, _ in matrix.score([1.0, 1.0])] == ["a", "b", "c"]
+
+    def test_invalid_vectors(self):
+        matrix = RouteMatrix([("a", [0.0, 0.0]), ("b", [1.0, 0.0]), ("c", [1.0])])
+        assert len(matrix) == 1
+        assert matrix.score([0.0, 0.0]) == [("b", 0.0)]
+        assert matrix.score([1.0, 2.0, 3.0]) == [("b", 0.0)]
+        assert RouteMatrix([]).score([1.0]) == []
+
+
+class TestRouting:
+    async def test_examples_are_exemplars(self):
+        decision = await make_router().route("plan login")
+        assert decision.route_name == "planner"
+        assert decision.reasoning == "fast_path"
+        assert decision.confidence == pytest.approx(1.0)
+
+    async def test_route_initializes_lazily(self):
+        router = make_router()
+        decision = await router.route("review")
+        assert router._initialized
+        assert decision.route_name == "reviewer"
+
+    async def test_add_route_rebuilds_matrix(self):
+        calls = []
+
+        def embed(text):
+            calls.append(text)
+            return bag_of_words(text)
+
+        router = make_router(embed_func=embed)
+        await router.initialize()
+        embedded = len(calls)
+
+        router.add_route(
+            RouteDefinition(name="designer", agent_type=AgentType.ARCHITECT, description="design")
+        )
+        decision = await router.route("design")
+        assert decision.route_name == "designer"
+        assert calls[embedded:] == ["design", "design"]  # new exemplar, then the query
+
+    def test_hash_embedding_is_memoized(self):
+        router = SemanticRouter()
+        first = router._hash_based_embedding("memoized text")
+        hits = router_module._hash_embedding.cache_info().hits
+        first.append(1.0)  # callers get their own list
+
+        assert router._hash_based_embedding("memoized text") == first[:-1]
+        assert router_module._hash_embedding.cache_info().hits == hits + 1
+
+
+class TestSemanticCache:
+    async def test_near_duplicate_skips_llm(self):
+        classifier = Classifier()
+        router = make_router(llm_classify_func=classifier)
+
+        first = await router.route("login login login bug bug bug")
+        second = await router.route("login login login bug bug bug please")
+        assert first.reasoning == second.reasoning == "llm_fallback"
+        assert second.route_name == "reviewer"
+        assert len(classifier.calls) == 1
+        assert router.get_cache_stats()["semantic_hits"] == 1
+
+    async def test_distinct_query_reaches_llm(self):
+        classifier = Classifier()
+        router = make_router(llm_classify_func=classifier)
+        await router.route("login bug")
+        await router.route("chat tests")
+        assert classifier.calls == ["login bug", "chat tests"]
+
+    async def test_disabled_for_hash_embeddings(self):
+        router = SemanticRouter(routes=[*ROUTES], llm_classify_func=Classifier())
+        assert not router._semantic_cache_enabled
+
+    async def test_failed_classification_is_not_cached(self):
+        classifier = Classifier(fail=True)
+        router = make_router(llm_classify_func=classifier)
+        assert (await router.route("login bug")).reasoning == "llm_failed"
+        assert (await router.route("login bug")).reasoning == "llm_failed"
+        assert len(classifier.calls) == 2
+        assert router.get_cache_stats()["semantic_entries"] == 0
+
+
+class TestRouteMany:
+    async def test_matches_sequential_routing(self):
+        queries = ["plan login", "code", "review", "login bug", "code", "nothing known"]
+        sequential = make_router(llm_classify_func=Classifier())
+        expected = [await sequential.route(query) for query in queries]
+
+        batched = await make_router(llm_classify_func=Classifier()).route_many(queries)
+        assert [(d.route_name, d.reasoning) for d in batched] == [
+            (d.route_name, d.reasoning) for d in expected
+        ]
+        assert batched[1] is batched[4]
+
+    async def test_batch_embedding_and_concurrent_fallbacks(self):
+        batches = []
+
+        async def embed_batch(texts):
+            batches.append(list(texts))
+            return [bag_of_words(text) for text in texts]
+
+        classifier = Classifier(delay=0.05)
+        router = SemanticRouter(
+            routes=[*ROUTES], embed_batch_func=embed_batch, llm_classify_func=classifier
+        )
+        await router.route("code")  # initialize and warm the exact cache
+        assert batches == [["plan plan", "plan login", "code code", "review review"], ["code"]]
+
+        start = asyncio.get_running_loop().time()
+        decisions = await router.route_many(["code", "login bug", "chat tests", "design bug"])
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert batches[-1] == ["login bug", "chat tests", "design bug"]
+        assert len(classifier.calls) == 3
+        assert elapsed < 0.1  # three 50ms classifications overlapped
+        assert [d.route_name for d in decisions] == ["executor"] + ["reviewer"] * 3
+
+    async def test_errors_become_default_decisions(self):
+        def embed(text):
+            if "bug" in text:
+                return []
+            return bag_of_words(text)
+
+        router = make_router(embed_func=embed)
+        decisions = await router.route_many(["code", "bug"])
+        assert decisions[0].route_name == "executor"
+        assert decisions[1].route_name == "chat"
+
+    async def test_orchestrator_routes_steps(self):
+        router = make_router()
+        orchestrator = ActiveOrchestrator(UnifiedContext(), router=router)
+        steps = [ExecutionStep(description="review"), ExecutionStep(description="plan plan")]
+
+        await orchestrator.route_steps(steps)
+        assert [s.agent_type for s in steps] == [AgentType.REVIEWER, AgentType.PLANNER]
+        assert steps[0].parameters["routing_confidence"] == pytest.approx(1.0)
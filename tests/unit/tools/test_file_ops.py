@@ -0,0 +1,55 @@
+"""Tests for file tools reading through async_utils.files."""
+
+import pytest
+
+from vertice_core.core.blob_store import get_blob_store
+from vertice_core.tools.file_ops import EditFileTool, ReadFileTool
+
+
+class TestReadFileTool:
+    """ReadFileTool range reads and large-file previews."""
+
+    @pytest.mark.asyncio
+    async def test_line_range_reads_only_requested_lines(self, tmp_path):
+        path = tmp_path / "log.txt"
+        path.write_text("".join(f"entry {i}\n" for i in range(1, 1001)))
+
+        result = await ReadFileTool()._execute_validated(path=str(path), line_range=[500, 502])
+
+        assert result.success
+        assert result.data["content"] == "entry 500\nentry 501\nentry 502"
+        assert result.data["lines"] == 3
+        assert result.metadata["total_lines"] == 1001
+
+    @pytest.mark.asyncio
+    async def test_huge_file_returns_bounded_preview(self, tmp_path, monkeypatch):
+        path = tmp_path / "huge.log"
+        path.write_text("".join(f"row {i}\n" for i in range(5000)))
+        monkeypatch.setattr("vertice_core.tools.file_ops.LARGE_FILE_THRESHOLD", 1024)
+        monkeypatch.setattr("vertice_core.tools.file_ops.PREVIEW_BYTES", 512)
+
+        result = await ReadFileTool()._execute_validated(path=str(path))
+
+        assert result.success
+        assert result.data["truncated"] is True
+        assert len(result.data["content"]) <= 512
+        assert result.metadata["total_lines"] == 5001
+
+
+class TestEditFileTool:
+    """EditFileTool writes through atomic ops."""
+
+    @pytest.mark.asyncio
+    async def test_edit_writes_atomically_and_backs_up(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        path = tmp_path / "module.py"
+        path.write_text("def old():\n    pass\n")
+
+        result = await EditFileTool()._execute_validated(
+            path=str(path), edits=[{"search": "def old():", "replace": "def new():"}]
+        )
+
+        assert result.success
+        assert path.read_text() == "def new():\n    pass\n"
+        assert get_blob_store().read_ref(result.metadata["backup"]) == b"def old():\n    pass\n"
+        assert not list(tmp_path.glob(".module.py.*.tmp"))
@@ -0,0 +1,128 @@
+"""Tests for the precompiled tool manifest and lazy tool registration."""
+
+import json
+import sys
+import textwrap
+
+import pytest
+
+from vertice_core.tools import manifest as manifest_module
+from vertice_core.tools.base import ToolRegistry
+from vertice_core.tools.catalog import ToolCatalog
+from vertice_core.tools.manifest import (
+    LazyTool,
+    ToolSpec,
+    check_manifest,
+    describe_tool,
+    register_group,
+)
+
+FAKE_TARGET = "fake_manifest_tool:EchoTool"
+
+FAKE_MODULE = """
+from vertice_core.tools.base import BaseTool, ToolResult
+
+INSTANCES = []
+
+
+class EchoTool(BaseTool):
+    description = "Echo the text back"
+    parameters = {"text": {"type": "string", "required": True}}
+    category = "system"
+
+    def __init__(self):
+        INSTANCES.append(self)
+
+    def execute(self, text):
+        return ToolResult(success=True, data=text)
+"""
+
+
+@pytest.fixture
+def fake_manifest(tmp_path, monkeypatch):
+    """A manifest for one tool whose module has not been imported."""
+    (tmp_path / "fake_manifest_tool.py").write_text(textwrap.dedent(FAKE_MODULE))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setitem(manifest_module.TOOL_GROUPS, "fake", [FAKE_TARGET])
+
+    spec = describe_tool(FAKE_TARGET)
+    sys.modules.pop("fake_manifest_tool")
+
+    path = tmp_path / "tool_manifest.json"
+    path.write_text(
+        json.dumps(
+            {
+                "version": manifest_module.MANIFEST_VERSION,
+                "groups": manifest_module.TOOL_GROUPS,
+                "tools": {FAKE_TARGET: spec.to_dict()},
+            }
+        )
+    )
+    yield path
+    sys.modules.pop("fake_manifest_tool", None)
+    manifest_module._read_manifest.cache_clear()
+
+
+class TestLazyRegistration:
+    @pytest.mark.asyncio
+    async def test_schema_served_without_import_until_first_call(self, fake_manifest):
+        registry = ToolRegistry()
+        assert register_group(registry, "fake", fake_manifest) == []
+
+        tool = registry.get("echo")
+        assert isinstance(tool, LazyTool) and not tool.loaded
+        assert registry.get_schemas()[0]["parameters"]["required"] == ["text"]
+        assert tool.description == "Echo the text back"
+        assert "fake_manifest_tool" not in sys.modules
+
+        result = await tool._execute_validated(text="hi")
+        assert result.success and result.data == "hi"
+        await tool._execute_validated(text="again")
+        assert len(sys.modules["fake_manifest_tool"].INSTANCES) == 1
+
+    @pytest.mark.asyncio
+    async def test_unloadable_tool_fails_at_call(self, fake_manifest, tmp_path):
+        registry = ToolRegistry()
+        register_group(registry, "fake", fake_manifest)
+        (tmp_path / "fake_manifest_tool.py").unlink()
+
+        result = await registry.get("echo")._execute_validated(text="hi")
+        assert not result.success
+        assert "unavailable" in result.error
+
+    def test_missing_requirement_is_a_load_error(self, fake_manifest, monkeypatch):
+        spec = ToolSpec.from_dict(json.loads(fake_manifest.read_text())["tools"][FAKE_TARGET])
+        spec.requires = ["surely_not_installed_pkg"]
+        monkeypatch.setattr(manifest_module, "load_manifest", lambda path: {FAKE_TARGET: spec})
+
+        registry = ToolRegistry()
+        errors = register_group(registry, "fake")
+        assert errors == ["fake/EchoTool: No module named 'surely_not_installed_pkg'"]
+        assert registry.get_all() == {}
+
+    def test_missing_manifest_registers_eagerly(self, fake_manifest, tmp_path):
+        registry = ToolRegistry()
+        assert register_group(registry, "fake", tmp_path / "absent.json") == []
+        assert type(registry.get("echo")).__name__ == "EchoTool"
+
+
+class TestManifestConsistency:
+    def test_shipped_manifest_matches_code(self):
+        assert check_manifest() == []
+
+    def test_drift_is_reported(self, fake_manifest):
+        data = json.loads(fake_manifest.read_text())
+        data["tools"][FAKE_TARGET]["description"] = "outdated"
+        fake_manifest.write_text(json.dumps(data))
+
+        drift = check_manifest(fake_manifest)
+        assert f"{FAKE_TARGET}: stale description" in drift
+
+    def test_catalog_defaults_match_eager_schemas(self):
+        catalog = ToolCatalog().add_defaults()
+        registry = catalog.build()
+
+        assert catalog.load_errors == []
+        assert all(isinstance(tool, LazyTool) for tool in registry.get_all().values())
+        for name, tool in registry.get_all().items():
+            assert tool.get_schema() == tool.load().get_schema(), name